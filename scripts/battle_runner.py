@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Headless Battle Runner
+
+Plays synthetic tactical battles to completion across a process pool and
+reports outcomes, rounds, AI decisions per second and the enemy action mix
+(see src/combat/battle_runner.py). With --baseline, compares against an
+earlier --out file to catch AI slowdowns and behavioural drift.
+
+Usage:
+    python scripts/battle_runner.py [--floors 1-8] [--battles N] [--workers N] [--out PATH]
+
+Options:
+    --floors SPEC      Floors to fight on, e.g. "1-8" or "2,4,6" (default 1-8)
+    --battles N        Battles per floor (default 100)
+    --seed-start N     First battle seed (default 0)
+    --workers N        Worker processes (default: CPU count)
+    --policy NAME      Player policy: aggressive, ability, defensive (default aggressive)
+    --race NAME        Player race (default HUMAN)
+    --class NAME       Player class (default WARRIOR)
+    --max-rounds N     Round cap per battle (default 60)
+    --out PATH         Write compact results (JSON)
+    --baseline PATH    Compare against an earlier results file
+    --max-slowdown F   Fail if decisions/sec drops below F x baseline (default 0.8)
+
+Exit codes:
+    0 = no drift (or no baseline given)
+    1 = battles changed behaviour or AI decisions got slower
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add repo root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.combat.balance_sim import Build
+from src.combat.battle_runner import POLICIES, compare_reports, make_specs, run_battles
+from src.core.constants import Race, PlayerClass
+
+
+def parse_floors(spec: str) -> list:
+    floors = []
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            low, high = part.split("-", 1)
+            floors.extend(range(int(low), int(high) + 1))
+        elif part:
+            floors.append(int(part))
+    return floors
+
+
+def print_drift(drift: dict, max_slowdown: float) -> bool:
+    """Print the baseline comparison; returns True if anything drifted."""
+    print("-" * 60)
+    print(f"Baseline: {drift['compared']} battles compared, {len(drift['changed'])} changed")
+    for floor, stats in drift["floors"].items():
+        outcomes = ", ".join(f"{name} {delta:+.1%}" for name, delta in stats["outcome_delta"].items() if delta)
+        print(f"  Floor {floor}: action mix distance {stats['action_kind_distance']:.3f} "
+              f"(hashes {stats['action_hash_distance']:.3f}), rounds {stats['rounds_avg_delta']:+.2f}"
+              + (f", {outcomes}" if outcomes else ""))
+    for floor, seed, policy in drift["changed"][:10]:
+        print(f"  changed: floor {floor} seed {seed} ({policy})")
+    ratio = drift["decision_rate_ratio"]
+    print(f"  decisions/sec: {ratio:.2f}x baseline")
+    return bool(drift["changed"]) or (ratio and ratio < max_slowdown)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless batch battle runner")
+    parser.add_argument("--floors", default="1-8", help="Floors, e.g. 1-8 or 2,4")
+    parser.add_argument("--battles", type=int, default=100, help="Battles per floor")
+    parser.add_argument("--seed-start", type=int, default=0, help="First battle seed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--policy", default="aggressive", choices=sorted(POLICIES), help="Player policy")
+    parser.add_argument("--race", default="HUMAN", help="Player race")
+    parser.add_argument("--class", dest="player_class", default="WARRIOR", help="Player class")
+    parser.add_argument("--max-rounds", type=int, default=60, help="Round cap per battle")
+    parser.add_argument("--out", default=None, help="Results file (.json)")
+    parser.add_argument("--baseline", default=None, help="Earlier results file to compare against")
+    parser.add_argument("--max-slowdown", type=float, default=0.8, help="Allowed decisions/sec ratio")
+    args = parser.parse_args()
+
+    floors = parse_floors(args.floors)
+    race, player_class = Race[args.race.upper()], PlayerClass[args.player_class.upper()]
+    specs = []
+    for floor in floors:
+        specs.extend(make_specs(
+            [floor],
+            battles=args.battles,
+            seed_start=args.seed_start,
+            policy=args.policy,
+            builds=[Build(race, player_class, level=floor)],
+            max_rounds=args.max_rounds,
+        ))
+
+    print("=" * 60)
+    print(f"Battle Runner: floors {floors}, {args.battles} battles each ({args.policy})")
+    print("=" * 60)
+
+    report = run_battles(specs, workers=args.workers)
+
+    for level, summary in report.floors.items():
+        outcomes = ", ".join(f"{name} {rate:.0%}" for name, rate in summary["outcomes"].items())
+        rounds = summary["rounds"]
+        kinds = ", ".join(f"{name} {count}" for name, count in list(summary["action_kinds"].items())[:5])
+        print(f"  Floor {level}: {outcomes}")
+        print(f"    rounds avg {rounds['avg']:.1f} / p95 {rounds['p95']} / max {rounds['max']}")
+        print(f"    {summary['decisions']} decisions, {summary['decisions_per_second']:.0f}/s")
+        print(f"    actions: {kinds}")
+
+    print("-" * 60)
+    print(f"{len(report.results)} battles in {report.elapsed_seconds:.1f}s "
+          f"({report.battles_per_second:.0f}/s, {report.decisions_per_second:.0f} decisions/s, "
+          f"{report.workers} workers)")
+
+    if args.out:
+        report.write(args.out)
+        print(f"Results written to {args.out}")
+
+    drifted = False
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        drifted = print_drift(compare_reports(baseline, report.to_dict()), args.max_slowdown)
+
+    sys.exit(1 if drifted else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Combat Balance Simulator
+
+Monte Carlo duels of player builds against the enemy and boss rosters,
+using NumPy-batched dice that mirror dnd_combat (see
+src/combat/balance_sim.py). Requires numpy.
+
+Usage:
+    python scripts/combat_balance.py [--races ORC,ELF] [--classes WARRIOR] [--trials N]
+
+Options:
+    --races LIST     Races to sweep (default: all)
+    --classes LIST   Classes to sweep (default: all)
+    --feats LIST     Feats every build takes, e.g. weapon_master,evasion
+    --weapon NAME    Weapon item class, e.g. Sword, Dagger, Axe
+    --armor NAME     Armor item class, e.g. LeatherArmor, ChainMail
+    --shield NAME    Shield item class, e.g. WoodenShield
+    --level N        Player level (default 1)
+    --floor N        Only enemies that spawn on this floor (and its boss)
+    --elites         Include elite versions of each enemy
+    --no-bosses      Leave bosses out of the roster
+    --no-feat-mods   Ignore feat combat modifiers (pure dice resolution)
+    --trials N       Duels per matchup (default 2000)
+    --seed N         RNG seed (default 0)
+    --out PATH       Write full results (win/loss rates, TTK histograms) as JSON
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add repo root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import items
+from src.combat.balance_sim import Build, enemy_roster, run_matrix
+from src.core.constants import Race, PlayerClass
+
+
+def parse_list(spec, enum_cls=None):
+    if not spec:
+        return list(enum_cls) if enum_cls else []
+    names = [part.strip() for part in spec.split(",") if part.strip()]
+    return [enum_cls[name.upper()] for name in names] if enum_cls else names
+
+
+def item_class(name):
+    if not name:
+        return None
+    cls = getattr(items, name, None)
+    if cls is None:
+        raise SystemExit(f"Unknown item class: {name}")
+    return cls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo combat balance simulator")
+    parser.add_argument("--races", default=None, help="Races, e.g. ORC,ELF")
+    parser.add_argument("--classes", default=None, help="Classes, e.g. WARRIOR,MAGE")
+    parser.add_argument("--feats", default=None, help="Feats every build takes")
+    parser.add_argument("--weapon", default=None, help="Weapon item class")
+    parser.add_argument("--armor", default=None, help="Armor item class")
+    parser.add_argument("--shield", default=None, help="Shield item class")
+    parser.add_argument("--level", type=int, default=1, help="Player level")
+    parser.add_argument("--floor", type=int, default=None, help="Restrict roster to a floor")
+    parser.add_argument("--elites", action="store_true", help="Include elite enemies")
+    parser.add_argument("--no-bosses", action="store_true", help="Exclude bosses")
+    parser.add_argument("--no-feat-mods", action="store_true", help="Ignore feat combat modifiers")
+    parser.add_argument("--trials", type=int, default=2000, help="Duels per matchup")
+    parser.add_argument("--seed", type=int, default=0, help="RNG seed")
+    parser.add_argument("--out", default=None, help="Write JSON results")
+    args = parser.parse_args()
+
+    feats = tuple(parse_list(args.feats))
+    builds = [
+        Build(
+            race, player_class, feats=feats,
+            weapon=item_class(args.weapon),
+            armor=item_class(args.armor),
+            off_hand=item_class(args.shield),
+            level=args.level,
+        )
+        for race in parse_list(args.races, Race)
+        for player_class in parse_list(args.classes, PlayerClass)
+    ]
+    roster = enemy_roster(floor=args.floor, elites=args.elites, bosses=not args.no_bosses)
+
+    print("=" * 60)
+    print(f"Combat Balance: {len(builds)} builds x {len(roster)} enemies, {args.trials} trials each")
+    print("=" * 60)
+
+    report = run_matrix(builds, roster, trials=args.trials, seed=args.seed,
+                        apply_feats=not args.no_feat_mods)
+
+    by_enemy = {}
+    for result in report.results:
+        by_enemy.setdefault(result.enemy, []).append(result)
+
+    print(f"{'Enemy':<24} {'avg win':>8} {'worst build':>33} {'TTK p50':>8}")
+    for enemy, results in by_enemy.items():
+        avg = sum(r.win_rate for r in results) / len(results)
+        worst = min(results, key=lambda r: r.win_rate)
+        ttk = sorted(r.ttk_p50 for r in results)[len(results) // 2]
+        print(f"  {enemy:<22} {avg:>7.1%} {worst.player[:24]:>26} {worst.win_rate:>6.1%} {ttk:>8.1f}")
+
+    print("-" * 60)
+    matrix = report.win_matrix()
+    for build, wins in matrix.items():
+        hardest = min(wins, key=wins.get)
+        avg = sum(wins.values()) / len(wins)
+        print(f"  {build:<36} avg win {avg:>6.1%}  hardest: {hardest} ({wins[hardest]:.1%})")
+
+    print("-" * 60)
+    duels = len(report.results) * report.trials
+    print(f"{len(report.results)} matchups ({duels} duels) in {report.elapsed_seconds:.1f}s")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report.to_dict(), f)
+        print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
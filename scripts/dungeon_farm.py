@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Dungeon Generation Farm
+
+Generates many seeds per floor across a process pool and reports zone
+distribution, generation time, room counts and connectivity (see
+src/world/generation_farm.py).
+
+Usage:
+    python scripts/dungeon_farm.py [--floors 1-8] [--seeds N] [--workers N] [--out PATH]
+
+Options:
+    --floors SPEC   Floors to generate, e.g. "1-8" or "2,4,6" (default: all configured)
+    --seeds N       Seeds per floor (default 1000)
+    --seed-start N  First seed (default 0)
+    --workers N     Worker processes (default: CPU count)
+    --out PATH      Write compact results (JSON, gzipped if PATH ends in .gz)
+    --profile       Time each generation stage, feature pass and zone layout
+
+Exit codes:
+    0 = all floors passed
+    1 = zone or connectivity errors found
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add repo root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.world.generation_farm import run_farm
+from src.world.zone_config import FLOOR_ZONE_CONFIGS
+
+
+def parse_floors(spec: str) -> list:
+    floors = []
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            low, high = part.split("-", 1)
+            floors.extend(range(int(low), int(high) + 1))
+        elif part:
+            floors.append(int(part))
+    return floors
+
+
+def print_profile(profile: dict, top: int = 5):
+    stages = sorted(profile["avg_stage_ms"].items(), key=lambda item: -item[1])
+    print("    slowest stages (avg ms): " + ", ".join(
+        f"{name} {ms:.2f}" for name, ms in stages[:top]
+    ))
+    layouts = list(profile["top_layouts"].items())[:top]
+    if layouts:
+        print("    slowest layouts (total ms): " + ", ".join(
+            f"{name} {stats['total_ms']:.1f}" for name, stats in layouts
+        ))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel dungeon generation farm")
+    parser.add_argument("--floors", default=None, help="Floors, e.g. 1-8 or 2,4")
+    parser.add_argument("--seeds", type=int, default=1000, help="Seeds per floor")
+    parser.add_argument("--seed-start", type=int, default=0, help="First seed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--out", default=None, help="Results file (.json or .json.gz)")
+    parser.add_argument("--profile", action="store_true", help="Per-stage timings")
+    args = parser.parse_args()
+
+    if args.floors:
+        floors = parse_floors(args.floors)
+    else:
+        floors = [level for level, config in FLOOR_ZONE_CONFIGS.items() if config.zones]
+
+    print("=" * 60)
+    print(f"Dungeon Farm: floors {floors}, {args.seeds} seeds each")
+    print("=" * 60)
+
+    report = run_farm(
+        floors,
+        seeds=args.seeds,
+        workers=args.workers,
+        seed_start=args.seed_start,
+        profile=args.profile,
+    )
+
+    for level, summary in report.floors.items():
+        status = "PASSED" if summary["passed"] else f"FAILED ({summary['failed_seeds']} seeds)"
+        gen = summary["gen_ms"]
+        conn = summary["connectivity"]
+        print(f"  Floor {level}: {status}")
+        print(f"    gen ms avg {gen['avg']:.1f} / p95 {gen['p95']:.1f} / max {gen['max']:.1f}")
+        print(f"    rooms avg {summary['rooms']['avg']:.1f} "
+              f"({summary['rooms']['min']}-{summary['rooms']['max']})")
+        print(f"    reach avg {conn['avg_reach_pct']:.1f}% (min {conn['min_reach_pct']:.1f}%), "
+              f"stairs unreachable: {conn['stairs_unreachable']}")
+        if "profile" in summary:
+            print_profile(summary["profile"])
+
+    print("-" * 60)
+    print(f"{len(report.results)} floors generated in {report.elapsed_seconds:.1f}s "
+          f"({report.seeds_per_second:.0f}/s, {report.workers} workers)")
+
+    if args.out:
+        report.write(args.out)
+        print(f"Results written to {args.out}")
+
+    sys.exit(0 if report.passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Verify Runs Script
+
+Replays pending game results from their recorded command logs and flags
+any whose reported stats don't match the replay (see
+server/app/services/run_verifier.py).
+
+Usage:
+    python scripts/verify_runs.py [--batch-size N] [--workers N] [--limit N] [--dry-run]
+
+Options:
+    --batch-size N  Results loaded, replayed and written per batch (default 500)
+    --workers N     Replay worker processes (default: CPU count)
+    --limit N       Stop after N results
+    --dry-run       Replay and report without writing verification results
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add server to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "server"))
+
+from app.core.database import AsyncSessionLocal, close_db
+from app.services.run_verifier import RunVerifier
+
+
+async def run(args) -> dict:
+    try:
+        async with AsyncSessionLocal() as db:
+            verifier = RunVerifier(db, workers=args.workers)
+            return await verifier.verify_pending(
+                batch_size=args.batch_size,
+                limit=args.limit,
+                dry_run=args.dry_run,
+            )
+    finally:
+        await close_db()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay-verify submitted runs")
+    parser.add_argument("--batch-size", type=int, default=500, help="Results per batch")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--limit", type=int, default=None, help="Max results to verify")
+    parser.add_argument("--dry-run", action="store_true", help="Don't write results")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Run Verification" + (" (dry run)" if args.dry_run else ""))
+    print("=" * 60)
+
+    started = time.perf_counter()
+    try:
+        counts = asyncio.run(run(args))
+    except Exception as e:
+        print(f"FAILED: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    total = sum(counts.values())
+    for status, count in sorted(counts.items()):
+        print(f"  {status}: {count}")
+    print("-" * 60)
+    rate = total / elapsed * 3600 if elapsed > 0 else 0
+    print(f"Verified {total} runs in {elapsed:.1f}s ({rate:.0f} runs/hour)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Add replay log and verification columns to game_results
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-01-20
+
+Changes:
+- game_results.replay_data: RunRecording command log for deterministic replay
+- game_results.verification_status/notes/verified_at: replay verifier outcome
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('game_results', sa.Column('replay_data', sa.Text(), nullable=True))
+    op.add_column('game_results', sa.Column('verification_status', sa.String(20), nullable=True, server_default='unverified'))
+    op.add_column('game_results', sa.Column('verification_notes', sa.Text(), nullable=True))
+    op.add_column('game_results', sa.Column('verified_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_game_results_verification_status'), 'game_results', ['verification_status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_game_results_verification_status'), table_name='game_results')
+    op.drop_column('game_results', 'verified_at')
+    op.drop_column('game_results', 'verification_notes')
+    op.drop_column('game_results', 'verification_status')
+    op.drop_column('game_results', 'replay_data')
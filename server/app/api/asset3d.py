@@ -2,10 +2,10 @@
 3D Asset Management API - Database-backed asset and job tracking.
 
 Provides CRUD operations for 3D assets and generation jobs stored in PostgreSQL.
-Maintains backward compatibility with JSON file-based jobs for the Docker worker.
+Jobs are mirrored into the shared job queue (tools/3d-pipeline/job_queue.py)
+that the generation workers claim from.
 """
 
-import json
 import os
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from ..core.database import get_db
+from .assets import get_job_queue, job_queue_module
 from ..models.asset3d import Asset3D, GenerationJob
 from ..schemas.asset3d import (
     Asset3DCreate,
@@ -46,19 +47,10 @@ def get_concept_art_dir() -> Path:
     return Path(__file__).parent.parent.parent.parent / "concept_art"
 
 
-def get_jobs_dir() -> Path:
-    """Get the jobs directory path for JSON fallback."""
-    docker_path = Path("/jobs")
-    if docker_path.parent.exists() and docker_path.parent == Path("/"):
-        docker_path.mkdir(exist_ok=True)
-        return docker_path
-    local_path = Path(__file__).parent.parent.parent.parent / "jobs"
-    local_path.mkdir(exist_ok=True)
-    return local_path
-
-
 CONCEPT_ART_DIR = get_concept_art_dir()
-JOBS_DIR = get_jobs_dir()
+
+# Asset priority -> queue priority (higher is claimed first)
+QUEUE_PRIORITIES = {"low": -1, "medium": 0, "high": 1}
 
 
 # =============================================================================
@@ -278,35 +270,17 @@ async def upload_concept_art(
 # Job Endpoints
 # =============================================================================
 
-def write_job_json(job: GenerationJob):
-    """Write job to JSON file for Docker worker compatibility."""
-    JOBS_DIR.mkdir(exist_ok=True)
-    job_path = JOBS_DIR / f"{job.job_id}.json"
-    job_data = {
-        "job_id": job.job_id,
-        "asset_id": job.asset_id,
-        "status": job.status,
-        "created_at": job.created_at.isoformat(),
-        "updated_at": job.updated_at.isoformat(),
-        "source_image": job.source_image,
-        "output_dir": job.output_dir,
-        "texture_resolution": job.texture_resolution,
-        "device": job.device,
-        "error": job.error,
-        "result_path": job.result_path,
-        "progress": job.progress,
-        "progress_pct": job.progress_pct,
-        "logs": job.logs or [],
-    }
-    with open(job_path, "w") as f:
-        json.dump(job_data, f, indent=2)
-
-
-def delete_job_json(job_id: str):
-    """Delete JSON file for a job."""
-    job_path = JOBS_DIR / f"{job_id}.json"
-    if job_path.exists():
-        job_path.unlink()
+def enqueue_job(job: GenerationJob, asset_priority: str):
+    """Add a new job to the worker queue."""
+    get_job_queue().enqueue(
+        job_id=job.job_id,
+        asset_id=job.asset_id,
+        source_image=job.source_image,
+        output_dir=job.output_dir,
+        texture_resolution=job.texture_resolution,
+        device=job.device,
+        priority=QUEUE_PRIORITIES.get(asset_priority, 0),
+    )
 
 
 @router.get("/jobs", response_model=List[JobResponse])
@@ -384,7 +358,7 @@ async def create_job(
     else:
         source_image = asset.source_image
 
-    # Check for existing pending/processing job
+    # Check for existing pending/processing job (the queue enforces this too)
     existing = await db.execute(
         select(GenerationJob).where(
             GenerationJob.asset_id == asset_id,
@@ -418,12 +392,16 @@ async def create_job(
     asset.status = "generating"
     asset.updated_at = now
 
+    # Queue for the workers before committing, so a rejected job isn't recorded
+    try:
+        enqueue_job(job, asset.priority)
+    except job_queue_module().DuplicateJobError as e:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail=str(e))
+
     await db.commit()
     await db.refresh(job)
 
-    # Write JSON file for Docker worker
-    write_job_json(job)
-
     return job
 
 
@@ -486,8 +464,17 @@ async def update_job(
     await db.commit()
     await db.refresh(job)
 
-    # Update JSON file for Docker worker
-    write_job_json(job)
+    # Mirror the change into the worker queue
+    get_job_queue().update(
+        job_id,
+        worker_id=request.worker_id,
+        log_line=request.log_line,
+        status=job.status if request.status else None,
+        error=request.error,
+        result_path=request.result_path,
+        progress=request.progress,
+        progress_pct=request.progress_pct,
+    )
 
     return job
 
@@ -509,8 +496,7 @@ async def delete_job(
     await db.delete(job)
     await db.commit()
 
-    # Delete JSON file
-    delete_job_json(job_id)
+    get_job_queue().delete(job_id)
 
     return {"success": True, "deleted": job_id}
 
@@ -4,14 +4,12 @@ Asset Management API - Upload concept art and manage 3D asset generation jobs.
 Handles file uploads and generation job queue for the 3D asset pipeline dev tool.
 """
 
-import json
 import os
 import shutil
 import subprocess
-from datetime import datetime
+import sys
 from pathlib import Path
-from typing import Optional
-from uuid import uuid4
+from typing import TYPE_CHECKING, Optional
 
 from fastapi import APIRouter, File, UploadFile, HTTPException
 from fastapi.responses import JSONResponse
@@ -151,12 +149,55 @@ def get_jobs_dir() -> Path:
 
 JOBS_DIR = get_jobs_dir()
 
+if TYPE_CHECKING:
+    from job_queue import JobQueue
+
+# The queue module lives with the pipeline workers so both sides share it.
+# In Docker: tools are mounted at /tools, Local: repo/tools
+PIPELINE_DIRS = (
+    Path("/tools/3d-pipeline"),
+    Path(__file__).parent.parent.parent.parent / "tools" / "3d-pipeline",
+)
+
+_job_queue: Optional["JobQueue"] = None
+
+
+def job_queue_module():
+    """Import the pipeline's job_queue module on first use.
+
+    Backends deployed without the tools tree still start; the job routes
+    answer 503 instead.
+    """
+    for pipeline_dir in PIPELINE_DIRS:
+        if pipeline_dir.exists():
+            if str(pipeline_dir) not in sys.path:
+                sys.path.insert(0, str(pipeline_dir))
+            break
+    try:
+        import job_queue
+    except ImportError:
+        raise HTTPException(status_code=503, detail="3D pipeline job queue is not available on this server")
+    return job_queue
+
+
+def get_job_queue() -> "JobQueue":
+    """Open the shared job queue on first use, importing legacy JSON jobs."""
+    global _job_queue
+    if _job_queue is None:
+        job_queue = job_queue_module()
+        _job_queue = job_queue.JobQueue(JOBS_DIR / job_queue.DB_FILENAME)
+        _job_queue.import_json_jobs(JOBS_DIR)
+    return _job_queue
+
 
 class GenerationJob(BaseModel):
     """A 3D model generation job."""
     job_id: str
     asset_id: str
     status: str  # pending, processing, completed, failed
+    priority: int = 0  # Higher is claimed first
+    attempts: int = 0  # Times a worker has claimed it
+    worker_id: Optional[str] = None  # Lease holder while processing
     created_at: str
     updated_at: str
     source_image: str
@@ -168,6 +209,9 @@ class GenerationJob(BaseModel):
     progress: Optional[str] = None  # Current step description
     progress_pct: Optional[int] = None  # 0-100 percentage
     logs: list[str] = []  # Recent log lines
+    cache_key: Optional[str] = None  # Hash of source image + generation parameters
+    cache_hit: bool = False  # Served from the worker's result cache
+    timings: dict[str, float] = {}  # Stage durations in ms (rembg_ms, load_ms, inference_ms, ...)
 
 
 class CreateJobRequest(BaseModel):
@@ -175,45 +219,22 @@ class CreateJobRequest(BaseModel):
     asset_id: str
     texture_resolution: int = 1024
     device: str = "cpu"
+    priority: int = 0
 
 
-def load_jobs() -> list[GenerationJob]:
-    """Load all jobs from the jobs directory."""
-    jobs = []
-    if not JOBS_DIR.exists():
-        return jobs
-
-    for job_file in JOBS_DIR.glob("*.json"):
-        try:
-            with open(job_file, "r") as f:
-                data = json.load(f)
-                jobs.append(GenerationJob(**data))
-        except Exception:
-            pass  # Skip invalid job files
+def to_generation_job(job: dict) -> GenerationJob:
+    return GenerationJob(**{k: v for k, v in job.items() if k in GenerationJob.model_fields})
 
-    # Sort by created_at descending (newest first)
-    jobs.sort(key=lambda j: j.created_at, reverse=True)
-    return jobs
 
-
-def save_job(job: GenerationJob):
-    """Save a job to the jobs directory."""
-    JOBS_DIR.mkdir(exist_ok=True)
-    job_path = JOBS_DIR / f"{job.job_id}.json"
-    with open(job_path, "w") as f:
-        json.dump(job.model_dump(), f, indent=2)
+def load_jobs(status: Optional[str] = None) -> list[GenerationJob]:
+    """Load jobs from the queue, newest first."""
+    return [to_generation_job(job) for job in get_job_queue().list(status=status)]
 
 
 def get_job(job_id: str) -> Optional[GenerationJob]:
     """Get a specific job by ID."""
-    job_path = JOBS_DIR / f"{job_id}.json"
-    if not job_path.exists():
-        return None
-    try:
-        with open(job_path, "r") as f:
-            return GenerationJob(**json.load(f))
-    except Exception:
-        return None
+    job = get_job_queue().get(job_id)
+    return to_generation_job(job) if job else None
 
 
 @router.post("/jobs")
@@ -243,30 +264,19 @@ async def create_generation_job(request: CreateJobRequest):
             detail=f"No concept art found for asset '{asset_id}'. Upload concept art first."
         )
 
-    # Check for existing pending/processing job
-    existing_jobs = load_jobs()
-    for job in existing_jobs:
-        if job.asset_id == asset_id and job.status in ("pending", "processing"):
-            raise HTTPException(
-                status_code=409,
-                detail=f"Job already exists for asset '{asset_id}' (status: {job.status})"
-            )
-
-    # Create new job
-    now = datetime.utcnow().isoformat()
-    job = GenerationJob(
-        job_id=str(uuid4())[:8],
-        asset_id=asset_id,
-        status="pending",
-        created_at=now,
-        updated_at=now,
-        source_image=source_image,
-        output_dir=f"web/public/assets/models/{asset_id}",
-        texture_resolution=request.texture_resolution,
-        device=request.device,
-    )
-
-    save_job(job)
+    # Create new job (the queue rejects a second pending/processing job per asset)
+    queue = get_job_queue()
+    try:
+        job = to_generation_job(queue.enqueue(
+            asset_id=asset_id,
+            source_image=source_image,
+            output_dir=f"web/public/assets/models/{asset_id}",
+            texture_resolution=request.texture_resolution,
+            device=request.device,
+            priority=request.priority,
+        ))
+    except job_queue_module().DuplicateJobError as e:
+        raise HTTPException(status_code=409, detail=str(e))
 
     return {
         "success": True,
@@ -278,10 +288,7 @@ async def create_generation_job(request: CreateJobRequest):
 @router.get("/jobs")
 async def list_jobs(status: Optional[str] = None):
     """List all generation jobs, optionally filtered by status."""
-    jobs = load_jobs()
-
-    if status:
-        jobs = [j for j in jobs if j.status == status]
+    jobs = load_jobs(status)
 
     return {
         "jobs": [j.model_dump() for j in jobs],
@@ -306,6 +313,7 @@ class UpdateJobRequest(BaseModel):
     progress: Optional[str] = None
     progress_pct: Optional[int] = None
     log_line: Optional[str] = None  # Append a single log line
+    worker_id: Optional[str] = None  # Extends the lease if this worker holds it
 
 
 @router.patch("/jobs/{job_id}")
@@ -313,46 +321,30 @@ async def update_job_status(job_id: str, request: UpdateJobRequest):
     """
     Update a job's status and progress. Used by the worker script.
     """
-    job = get_job(job_id)
+    try:
+        job = get_job_queue().update(
+            job_id,
+            worker_id=request.worker_id,
+            log_line=request.log_line,
+            status=request.status,
+            error=request.error,
+            result_path=request.result_path,
+            progress=request.progress,
+            progress_pct=request.progress_pct,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not job:
         raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
 
-    if request.status:
-        if request.status not in ("pending", "processing", "completed", "failed"):
-            raise HTTPException(status_code=400, detail=f"Invalid status: {request.status}")
-        job.status = request.status
-
-    if request.error is not None:
-        job.error = request.error
-
-    if request.result_path is not None:
-        job.result_path = request.result_path
-
-    if request.progress is not None:
-        job.progress = request.progress
-
-    if request.progress_pct is not None:
-        job.progress_pct = max(0, min(100, request.progress_pct))
-
-    if request.log_line is not None:
-        # Keep last 20 log lines
-        job.logs.append(request.log_line)
-        job.logs = job.logs[-20:]
-
-    job.updated_at = datetime.utcnow().isoformat()
-    save_job(job)
-
-    return job.model_dump()
+    return to_generation_job(job).model_dump()
 
 
 @router.delete("/jobs/{job_id}")
 async def delete_job(job_id: str):
     """Delete a job."""
-    job_path = JOBS_DIR / f"{job_id}.json"
-    if not job_path.exists():
+    if not get_job_queue().delete(job_id):
         raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
-
-    job_path.unlink()
     return {"success": True, "deleted": job_id}
 
 
@@ -370,15 +362,17 @@ async def get_worker_status():
     (roguelike_3d_worker) and processes jobs automatically.
     """
     # Check for any processing jobs as indicator that worker is active
-    jobs_list = load_jobs()
-    processing = [j for j in jobs_list if j.status == "processing"]
-    pending = [j for j in jobs_list if j.status == "pending"]
+    queue = get_job_queue()
+    processing = queue.list(status="processing")
+    counts = queue.counts()
 
     return {
         "running": True,  # Worker container runs continuously
         "status": "processing" if processing else "idle",
-        "current_job": processing[0].job_id if processing else None,
-        "pending_count": len(pending),
+        "current_job": processing[0]["job_id"] if processing else None,
+        "current_jobs": [job["job_id"] for job in processing],
+        "pending_count": counts["pending"],
+        "counts": counts,
         "message": "Worker runs automatically via Docker container",
     }
 
@@ -4,7 +4,7 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.database import get_db
-from ..core.security import create_access_token, get_current_user
+from ..core.security import AuthBusyError, create_access_token, get_current_user
 from ..models.user import User
 from ..schemas.user import UserCreate, UserResponse, UserLogin
 from ..schemas.auth import Token
@@ -14,6 +14,15 @@ from ..services.auth_service import AuthService
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
+def auth_busy(e: AuthBusyError) -> HTTPException:
+    """503 for when the password hashing pool is saturated."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
@@ -37,6 +46,8 @@ async def register(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    except AuthBusyError as e:
+        raise auth_busy(e)
 
 
 @router.post("/login", response_model=Token)
@@ -51,10 +62,13 @@ async def login(
     """
     auth_service = AuthService(db)
 
-    user = await auth_service.authenticate_user(
-        form_data.username,
-        form_data.password,
-    )
+    try:
+        user = await auth_service.authenticate_user(
+            form_data.username,
+            form_data.password,
+        )
+    except AuthBusyError as e:
+        raise auth_busy(e)
 
     if not user:
         raise HTTPException(
@@ -79,10 +93,13 @@ async def login_json(
     """
     auth_service = AuthService(db)
 
-    user = await auth_service.authenticate_user(
-        credentials.username,
-        credentials.password,
-    )
+    try:
+        user = await auth_service.authenticate_user(
+            credentials.username,
+            credentials.password,
+        )
+    except AuthBusyError as e:
+        raise auth_busy(e)
 
     if not user:
         raise HTTPException(
@@ -10,13 +10,21 @@ Features:
 - Procedural 3D model coverage status
 """
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request
 
+from ..core.startup_profile import lazy_module
+from ..core.static_response import static_responses
+from ..services.search_index import (
+    search_indexes, SearchIndex, TITLE_WEIGHT, TAG_WEIGHT, BODY_WEIGHT,
+)
 from .bestiary_models import Creature
-from .bestiary_data import CREATURES, CATEGORIES, FLOOR_THEMES
+
+# Creature data is large; import it on first bestiary request, not at startup
+bestiary_data = lazy_module(".bestiary_data", __package__)
 
 router = APIRouter(prefix="/api/bestiary", tags=["bestiary"])
 
@@ -151,44 +159,95 @@ def enrich_creature_with_model(creature_dict: dict, model_info: Optional[dict])
     return creature_dict
 
 
-# Cache the model info (refreshed on each request for now)
+# Parsed coverage, reused until index.ts changes
+_model_coverage_cache: dict = {"mtime": None, "coverage": {}}
+
+
+def get_models_index_mtime() -> Optional[float]:
+    """Modification time of index.ts, or None if it doesn't exist."""
+    try:
+        return get_models_index_path().stat().st_mtime
+    except OSError:
+        return None
+
+
 def get_model_coverage() -> dict[str, dict]:
-    """Get current procedural model coverage."""
-    return parse_procedural_models()
+    """Get current procedural model coverage (re-parsed when index.ts changes)."""
+    mtime = get_models_index_mtime()
+    if mtime is None:
+        return {}
+    if _model_coverage_cache["mtime"] != mtime:
+        _model_coverage_cache["coverage"] = parse_procedural_models()
+        _model_coverage_cache["mtime"] = mtime
+    return _model_coverage_cache["coverage"]
+
+
+def creature_with_model(creature: Creature, model_coverage: dict[str, dict]) -> dict:
+    """Dump a creature with its procedural model info attached."""
+    return enrich_creature_with_model(creature.model_dump(), model_coverage.get(creature.name))
+
+
+def creature_on_floor(creature: Creature, floor: int) -> bool:
+    """Whether a creature's floor range includes the given floor."""
+    floor_range = creature.floors
+
+    if floor_range == "Any" or floor_range == "All":
+        return True
+    elif "only" in floor_range.lower():
+        # Single floor like "8 only"
+        try:
+            return int(floor_range.split()[0]) == floor
+        except ValueError:
+            return False
+    elif "(Boss)" in floor_range or "(Final Boss)" in floor_range:
+        # Boss floor
+        try:
+            return int(floor_range.split()[0]) == floor
+        except ValueError:
+            return False
+    elif "-" in floor_range:
+        # Handle ranges like "1-5"
+        parts = floor_range.split("-")
+        try:
+            min_floor, max_floor = int(parts[0]), int(parts[1])
+            return min_floor <= floor <= max_floor
+        except ValueError:
+            return False
+    return False
 
 
-@router.get("")
-async def get_all_creatures():
-    """Get all bestiary entries with procedural model coverage."""
-    model_coverage = get_model_coverage()
+# =============================================================================
+# Response builders (rendered once per index.ts version, see static_response)
+# =============================================================================
 
-    creatures = []
-    for c in CREATURES:
-        creature_dict = c.model_dump()
-        model_info = model_coverage.get(c.name)
-        enrich_creature_with_model(creature_dict, model_info)
-        creatures.append(creature_dict)
+@lru_cache(maxsize=None)
+def get_creatures_by_id() -> Dict[str, Creature]:
+    return {c.id: c for c in bestiary_data.CREATURES}
+
+
+def build_all_creatures() -> dict:
+    model_coverage = get_model_coverage()
+    all_creatures = bestiary_data.CREATURES
+    creatures = [creature_with_model(c, model_coverage) for c in all_creatures]
 
     # Calculate coverage stats
     with_models = sum(1 for c in creatures if c["proceduralModel"]["hasModel"])
 
     return {
         "creatures": creatures,
-        "total": len(CREATURES),
-        "categories": CATEGORIES,
+        "total": len(all_creatures),
+        "categories": bestiary_data.CATEGORIES,
         "modelCoverage": {
             "withModels": with_models,
-            "withoutModels": len(CREATURES) - with_models,
-            "percentage": round(with_models / len(CREATURES) * 100, 1) if CREATURES else 0,
+            "withoutModels": len(all_creatures) - with_models,
+            "percentage": round(with_models / len(all_creatures) * 100, 1) if all_creatures else 0,
         },
     }
 
 
-@router.get("/categories")
-async def get_categories():
-    """Get creature categories."""
+def build_categories() -> dict:
     category_counts = {}
-    for creature in CREATURES:
+    for creature in bestiary_data.CREATURES:
         cat = creature.category
         category_counts[cat] = category_counts.get(cat, 0) + 1
 
@@ -199,132 +258,52 @@ async def get_categories():
                 **cat_info,
                 "count": category_counts.get(cat_id, 0),
             }
-            for cat_id, cat_info in CATEGORIES.items()
+            for cat_id, cat_info in bestiary_data.CATEGORIES.items()
         ]
     }
 
 
-@router.get("/category/{category_id}")
-async def get_creatures_by_category(category_id: str):
-    """Get creatures in a specific category with model coverage."""
+def build_category(category_id: str) -> dict:
     model_coverage = get_model_coverage()
-    creatures = []
-
-    for c in CREATURES:
-        if c.category == category_id:
-            creature_dict = c.model_dump()
-            model_info = model_coverage.get(c.name)
-            enrich_creature_with_model(creature_dict, model_info)
-            creatures.append(creature_dict)
+    creatures = [
+        creature_with_model(c, model_coverage)
+        for c in bestiary_data.CREATURES
+        if c.category == category_id
+    ]
 
     return {
-        "category": CATEGORIES.get(category_id),
+        "category": bestiary_data.CATEGORIES.get(category_id),
         "creatures": creatures,
         "count": len(creatures),
     }
 
 
-@router.get("/creature/{creature_id}")
-async def get_creature(creature_id: str):
-    """Get a specific creature with model coverage."""
-    model_coverage = get_model_coverage()
-
-    for creature in CREATURES:
-        if creature.id == creature_id:
-            creature_dict = creature.model_dump()
-            model_info = model_coverage.get(creature.name)
-            enrich_creature_with_model(creature_dict, model_info)
-            return creature_dict
-
-    return {"error": "Creature not found"}
-
-
-@router.get("/search")
-async def search_creatures(q: str):
-    """Search creatures by name or description with model coverage."""
-    model_coverage = get_model_coverage()
-    query = q.lower()
-
-    results = []
-    for c in CREATURES:
-        if (query in c.name.lower()
-            or query in c.description.lower()
-            or (c.title and query in c.title.lower())):
-            creature_dict = c.model_dump()
-            model_info = model_coverage.get(c.name)
-            enrich_creature_with_model(creature_dict, model_info)
-            results.append(creature_dict)
-
-    return {
-        "query": q,
-        "results": results,
-        "count": len(results),
-    }
-
-
-@router.get("/floors/{floor}")
-async def get_creatures_by_floor(floor: int):
-    """Get creatures that appear on a specific floor with model coverage."""
+def build_floor(floor: int) -> dict:
     model_coverage = get_model_coverage()
-    matched = []
-
-    for creature in CREATURES:
-        floor_range = creature.floors
-        include = False
-
-        if floor_range == "Any" or floor_range == "All":
-            include = True
-        elif "only" in floor_range.lower():
-            # Single floor like "8 only"
-            try:
-                floor_num = int(floor_range.split()[0])
-                if floor_num == floor:
-                    include = True
-            except ValueError:
-                pass
-        elif "(Boss)" in floor_range or "(Final Boss)" in floor_range:
-            # Boss floor
-            try:
-                floor_num = int(floor_range.split()[0])
-                if floor_num == floor:
-                    include = True
-            except ValueError:
-                pass
-        elif "-" in floor_range:
-            # Handle ranges like "1-5"
-            parts = floor_range.split("-")
-            try:
-                min_floor, max_floor = int(parts[0]), int(parts[1])
-                if min_floor <= floor <= max_floor:
-                    include = True
-            except ValueError:
-                pass
-
-        if include:
-            creature_dict = creature.model_dump()
-            model_info = model_coverage.get(creature.name)
-            enrich_creature_with_model(creature_dict, model_info)
-            matched.append(creature_dict)
+    matched = [
+        creature_with_model(c, model_coverage)
+        for c in bestiary_data.CREATURES
+        if creature_on_floor(c, floor)
+    ]
 
     return {
         "floor": floor,
-        "theme": FLOOR_THEMES.get(floor, "Unknown"),
+        "theme": bestiary_data.FLOOR_THEMES.get(floor, "Unknown"),
         "creatures": matched,
         "count": len(matched),
     }
 
 
-@router.get("/stats")
-async def get_bestiary_stats():
-    """Get bestiary statistics including model coverage."""
+def build_stats() -> dict:
     model_coverage = get_model_coverage()
+    creatures = bestiary_data.CREATURES
 
     category_counts = {}
     total_health = 0
     max_damage = 0
     with_models = 0
 
-    for creature in CREATURES:
+    for creature in creatures:
         cat = creature.category
         category_counts[cat] = category_counts.get(cat, 0) + 1
         total_health += creature.health
@@ -334,15 +313,116 @@ async def get_bestiary_stats():
             with_models += 1
 
     return {
-        "total_creatures": len(CREATURES),
+        "total_creatures": len(creatures),
         "by_category": category_counts,
-        "average_health": total_health // len(CREATURES) if CREATURES else 0,
+        "average_health": total_health // len(creatures) if creatures else 0,
         "max_damage": max_damage,
-        "floor_themes": FLOOR_THEMES,
+        "floor_themes": bestiary_data.FLOOR_THEMES,
         "modelCoverage": {
             "withModels": with_models,
-            "withoutModels": len(CREATURES) - with_models,
-            "percentage": round(with_models / len(CREATURES) * 100, 1) if CREATURES else 0,
+            "withoutModels": len(creatures) - with_models,
+            "percentage": round(with_models / len(creatures) * 100, 1) if creatures else 0,
             "coveredCreatures": list(model_coverage.keys()),
         },
     }
+
+
+static_responses.register("bestiary:all", build_all_creatures, get_models_index_mtime)
+static_responses.register("bestiary:categories", build_categories)
+static_responses.register("bestiary:stats", build_stats, get_models_index_mtime)
+
+
+@router.get("")
+async def get_all_creatures(request: Request):
+    """Get all bestiary entries with procedural model coverage."""
+    return static_responses.respond(
+        request, "bestiary:all", build_all_creatures, get_models_index_mtime()
+    )
+
+
+@router.get("/categories")
+async def get_categories(request: Request):
+    """Get creature categories."""
+    return static_responses.respond(request, "bestiary:categories", build_categories)
+
+
+@router.get("/category/{category_id}")
+async def get_creatures_by_category(category_id: str, request: Request):
+    """Get creatures in a specific category with model coverage."""
+    if category_id not in bestiary_data.CATEGORIES:
+        return build_category(category_id)
+    return static_responses.respond(
+        request,
+        f"bestiary:category:{category_id}",
+        lambda: build_category(category_id),
+        get_models_index_mtime(),
+    )
+
+
+@router.get("/creature/{creature_id}")
+async def get_creature(creature_id: str, request: Request):
+    """Get a specific creature with model coverage."""
+    creature = get_creatures_by_id().get(creature_id)
+    if not creature:
+        return {"error": "Creature not found"}
+    return static_responses.respond(
+        request,
+        f"bestiary:creature:{creature_id}",
+        lambda: creature_with_model(creature, get_model_coverage()),
+        get_models_index_mtime(),
+    )
+
+
+def build_creature_index(index: SearchIndex):
+    for c in bestiary_data.CREATURES:
+        index.add(c, [
+            (c.name, TITLE_WEIGHT),
+            (c.title, TAG_WEIGHT),
+            (c.category, TAG_WEIGHT),
+            (" ".join(a.name for a in c.abilities), TAG_WEIGHT),
+            (c.description, BODY_WEIGHT),
+        ])
+
+
+search_indexes.register("bestiary", build_creature_index)
+
+
+@router.get("/search")
+async def search_creatures(
+    q: str,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=200),
+):
+    """Search creatures by name or description with model coverage."""
+    page = search_indexes.get("bestiary").search(q, offset=offset, limit=limit)
+    model_coverage = get_model_coverage()
+    results = [creature_with_model(c, model_coverage) for c in page.docs]
+
+    return {
+        "query": q,
+        "results": results,
+        "count": len(results),
+        "total": page.total,
+        "offset": offset,
+    }
+
+
+@router.get("/floors/{floor}")
+async def get_creatures_by_floor(floor: int, request: Request):
+    """Get creatures that appear on a specific floor with model coverage."""
+    if floor not in bestiary_data.FLOOR_THEMES:
+        return build_floor(floor)
+    return static_responses.respond(
+        request,
+        f"bestiary:floor:{floor}",
+        lambda: build_floor(floor),
+        get_models_index_mtime(),
+    )
+
+
+@router.get("/stats")
+async def get_bestiary_stats(request: Request):
+    """Get bestiary statistics including model coverage."""
+    return static_responses.respond(
+        request, "bestiary:stats", build_stats, get_models_index_mtime()
+    )
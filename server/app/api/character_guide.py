@@ -7,52 +7,139 @@ Features:
 - Race/class combinations with synergy notes
 - 3D model preview support
 """
-from fastapi import APIRouter
+from typing import Optional
 
-from .character_guide_data import (
-    RACES, CLASSES, COMBINATIONS,
-    get_race, get_class, get_combination,
-    RACES_BY_ID, CLASSES_BY_ID,
+from fastapi import APIRouter, Query, Request
+
+from ..core.startup_profile import lazy_module
+from ..core.static_response import static_responses
+from ..services.search_index import (
+    search_indexes, SearchIndex, TITLE_WEIGHT, TAG_WEIGHT, BODY_WEIGHT,
 )
 
+# Imported on first character guide request, not at startup
+guide_data = lazy_module(".character_guide_data", __package__)
+
 router = APIRouter(prefix="/api/character-guide", tags=["character-guide"])
 
 
 # =============================================================================
-# Races
+# Response builders (rendered once, see static_response)
 # =============================================================================
 
-@router.get("")
-async def get_overview():
-    """Get overview of all races and classes."""
+def build_overview() -> dict:
     return {
-        "races": [r.model_dump() for r in RACES],
-        "classes": [c.model_dump() for c in CLASSES],
-        "combinations": [combo.model_dump() for combo in COMBINATIONS],
+        "races": [r.model_dump() for r in guide_data.RACES],
+        "classes": [c.model_dump() for c in guide_data.CLASSES],
+        "combinations": [combo.model_dump() for combo in guide_data.COMBINATIONS],
         "stats": {
-            "totalRaces": len(RACES),
-            "totalClasses": len(CLASSES),
-            "totalCombinations": len(COMBINATIONS),
+            "totalRaces": len(guide_data.RACES),
+            "totalClasses": len(guide_data.CLASSES),
+            "totalCombinations": len(guide_data.COMBINATIONS),
         },
     }
 
 
-@router.get("/races")
-async def get_all_races():
-    """Get all playable races."""
+def build_races() -> dict:
+    return {
+        "races": [r.model_dump() for r in guide_data.RACES],
+        "total": len(guide_data.RACES),
+    }
+
+
+def build_classes() -> dict:
+    return {
+        "classes": [c.model_dump() for c in guide_data.CLASSES],
+        "total": len(guide_data.CLASSES),
+    }
+
+
+def build_combinations() -> dict:
+    return {
+        "combinations": [combo.model_dump() for combo in guide_data.COMBINATIONS],
+        "total": len(guide_data.COMBINATIONS),
+    }
+
+
+def build_combination(race_id: str, class_id: str) -> dict:
+    combo = guide_data.get_combination(race_id, class_id)
+
+    # Also include full race and class data
+    race = guide_data.get_race(race_id)
+    player_class = guide_data.get_class(class_id)
+
+    return {
+        "combination": combo.model_dump(),
+        "race": race.model_dump() if race else None,
+        "class": player_class.model_dump() if player_class else None,
+    }
+
+
+def build_race_stats() -> dict:
     return {
-        "races": [r.model_dump() for r in RACES],
-        "total": len(RACES),
+        "races": [
+            {
+                "id": r.id,
+                "name": r.name,
+                "health": r.stat_modifiers.health,
+                "attack": r.stat_modifiers.attack,
+                "defense": r.stat_modifiers.defense,
+                "trait": r.racial_trait.name,
+            }
+            for r in guide_data.RACES
+        ]
     }
 
 
+def build_class_stats() -> dict:
+    return {
+        "classes": [
+            {
+                "id": c.id,
+                "name": c.name,
+                "health": c.stat_modifiers.health,
+                "attack": c.stat_modifiers.attack,
+                "defense": c.stat_modifiers.defense,
+                "abilityCount": len(c.abilities),
+            }
+            for c in guide_data.CLASSES
+        ]
+    }
+
+
+static_responses.register("character-guide:overview", build_overview)
+static_responses.register("character-guide:races", build_races)
+static_responses.register("character-guide:classes", build_classes)
+static_responses.register("character-guide:combinations", build_combinations)
+static_responses.register("character-guide:stats:races", build_race_stats)
+static_responses.register("character-guide:stats:classes", build_class_stats)
+
+
+# =============================================================================
+# Races
+# =============================================================================
+
+@router.get("")
+async def get_overview(request: Request):
+    """Get overview of all races and classes."""
+    return static_responses.respond(request, "character-guide:overview", build_overview)
+
+
+@router.get("/races")
+async def get_all_races(request: Request):
+    """Get all playable races."""
+    return static_responses.respond(request, "character-guide:races", build_races)
+
+
 @router.get("/races/{race_id}")
-async def get_race_by_id(race_id: str):
+async def get_race_by_id(race_id: str, request: Request):
     """Get a specific race by ID."""
-    race = get_race(race_id.upper())
+    race = guide_data.get_race(race_id.upper())
     if not race:
         return {"error": f"Race '{race_id}' not found"}
-    return race.model_dump()
+    return static_responses.respond(
+        request, f"character-guide:race:{race.id}", race.model_dump
+    )
 
 
 # =============================================================================
@@ -60,21 +147,20 @@ async def get_race_by_id(race_id: str):
 # =============================================================================
 
 @router.get("/classes")
-async def get_all_classes():
+async def get_all_classes(request: Request):
     """Get all playable classes."""
-    return {
-        "classes": [c.model_dump() for c in CLASSES],
-        "total": len(CLASSES),
-    }
+    return static_responses.respond(request, "character-guide:classes", build_classes)
 
 
 @router.get("/classes/{class_id}")
-async def get_class_by_id(class_id: str):
+async def get_class_by_id(class_id: str, request: Request):
     """Get a specific class by ID."""
-    player_class = get_class(class_id.upper())
+    player_class = guide_data.get_class(class_id.upper())
     if not player_class:
         return {"error": f"Class '{class_id}' not found"}
-    return player_class.model_dump()
+    return static_responses.respond(
+        request, f"character-guide:class:{player_class.id}", player_class.model_dump
+    )
 
 
 # =============================================================================
@@ -82,60 +168,66 @@ async def get_class_by_id(class_id: str):
 # =============================================================================
 
 @router.get("/combinations")
-async def get_all_combinations():
+async def get_all_combinations(request: Request):
     """Get all race/class combinations with synergy notes."""
-    return {
-        "combinations": [combo.model_dump() for combo in COMBINATIONS],
-        "total": len(COMBINATIONS),
-    }
+    return static_responses.respond(
+        request, "character-guide:combinations", build_combinations
+    )
 
 
 @router.get("/combinations/{race_id}/{class_id}")
-async def get_specific_combination(race_id: str, class_id: str):
+async def get_specific_combination(race_id: str, class_id: str, request: Request):
     """Get a specific race/class combination."""
-    combo = get_combination(race_id.upper(), class_id.upper())
+    combo = guide_data.get_combination(race_id.upper(), class_id.upper())
     if not combo:
         return {"error": f"Combination '{race_id}/{class_id}' not found"}
-
-    # Also include full race and class data
-    race = get_race(race_id.upper())
-    player_class = get_class(class_id.upper())
-
-    return {
-        "combination": combo.model_dump(),
-        "race": race.model_dump() if race else None,
-        "class": player_class.model_dump() if player_class else None,
-    }
+    return static_responses.respond(
+        request,
+        f"character-guide:combination:{combo.race_id}:{combo.class_id}",
+        lambda: build_combination(combo.race_id, combo.class_id),
+    )
 
 
 # =============================================================================
 # Search
 # =============================================================================
 
+def build_character_index(index: SearchIndex):
+    for race in guide_data.RACES:
+        index.add(("race", race.model_dump()), [
+            (race.name, TITLE_WEIGHT),
+            (race.racial_trait.name, TAG_WEIGHT),
+            (race.description, BODY_WEIGHT),
+            (race.lore, BODY_WEIGHT),
+        ])
+    for player_class in guide_data.CLASSES:
+        index.add(("class", player_class.model_dump()), [
+            (player_class.name, TITLE_WEIGHT),
+            (" ".join(a.name for a in player_class.abilities), TAG_WEIGHT),
+            (player_class.description, BODY_WEIGHT),
+            (player_class.lore, BODY_WEIGHT),
+        ])
+
+
+search_indexes.register("character-guide", build_character_index)
+
+
 @router.get("/search")
-async def search(q: str):
-    """Search races and classes by name or description."""
-    query = q.lower()
-
-    matching_races = []
-    for race in RACES:
-        if (query in race.name.lower()
-            or query in race.description.lower()
-            or query in race.lore.lower()):
-            matching_races.append(race.model_dump())
-
-    matching_classes = []
-    for player_class in CLASSES:
-        if (query in player_class.name.lower()
-            or query in player_class.description.lower()
-            or query in player_class.lore.lower()):
-            matching_classes.append(player_class.model_dump())
+async def search(
+    q: str,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=200),
+):
+    """Search races and classes by name or description (paged per kind)."""
+    index = search_indexes.get("character-guide")
+    races = index.search(q, offset, limit, where=lambda doc: doc[0] == "race")
+    classes = index.search(q, offset, limit, where=lambda doc: doc[0] == "class")
 
     return {
         "query": q,
-        "races": matching_races,
-        "classes": matching_classes,
-        "totalResults": len(matching_races) + len(matching_classes),
+        "races": [doc for _, doc in races.docs],
+        "classes": [doc for _, doc in classes.docs],
+        "totalResults": races.total + classes.total,
     }
 
 
@@ -144,36 +236,14 @@ async def search(q: str):
 # =============================================================================
 
 @router.get("/stats/races")
-async def compare_race_stats():
+async def compare_race_stats(request: Request):
     """Get race stats comparison for UI charts."""
-    return {
-        "races": [
-            {
-                "id": r.id,
-                "name": r.name,
-                "health": r.stat_modifiers.health,
-                "attack": r.stat_modifiers.attack,
-                "defense": r.stat_modifiers.defense,
-                "trait": r.racial_trait.name,
-            }
-            for r in RACES
-        ]
-    }
+    return static_responses.respond(request, "character-guide:stats:races", build_race_stats)
 
 
 @router.get("/stats/classes")
-async def compare_class_stats():
+async def compare_class_stats(request: Request):
     """Get class stats comparison for UI charts."""
-    return {
-        "classes": [
-            {
-                "id": c.id,
-                "name": c.name,
-                "health": c.stat_modifiers.health,
-                "attack": c.stat_modifiers.attack,
-                "defense": c.stat_modifiers.defense,
-                "abilityCount": len(c.abilities),
-            }
-            for c in CLASSES
-        ]
-    }
+    return static_responses.respond(
+        request, "character-guide:stats:classes", build_class_stats
+    )
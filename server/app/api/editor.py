@@ -34,11 +34,15 @@ GAME_MODULES_AVAILABLE = False
 Dungeon = None
 get_floor_config = None
 FLOOR_ZONE_CONFIGS = None
+GenerationProfile = None
+run_feature_passes = None
 
 try:
     # Docker: src is mounted as game_src
     from game_src.world.dungeon import Dungeon
     from game_src.world.zone_config import get_floor_config, FLOOR_ZONE_CONFIGS
+    from game_src.world.generation_profile import GenerationProfile
+    from game_src.world.generation_farm import run_feature_passes
     from game_src.core.constants import DungeonTheme, LEVEL_THEMES, THEME_TILES
     from game_src.core.constants.interactive import SetPieceType
     GAME_MODULES_AVAILABLE = True
@@ -47,6 +51,8 @@ except ImportError:
         # Local: use src directly
         from src.world.dungeon import Dungeon
         from src.world.zone_config import get_floor_config, FLOOR_ZONE_CONFIGS
+        from src.world.generation_profile import GenerationProfile
+        from src.world.generation_farm import run_feature_passes
         from src.core.constants import DungeonTheme, LEVEL_THEMES, THEME_TILES
         from src.core.constants.interactive import SetPieceType
         GAME_MODULES_AVAILABLE = True
@@ -124,6 +130,7 @@ class GeneratedDungeonResponse(BaseModel):
     tile_visuals: List[TileVisualModel]
     zone_summary: str
     generated_at: str
+    profile: Optional[Dict[str, Any]] = None
 
 
 class ZoneConfigsResponse(BaseModel):
@@ -255,6 +262,8 @@ def serialize_floor_config(config) -> FloorZoneConfigModel:
 async def generate_dungeon(
     floor: int = Query(1, ge=1, le=8, description="Floor level (1-8)"),
     seed: Optional[int] = Query(None, description="Random seed for deterministic generation"),
+    profile: bool = Query(False, description="Include per-stage generation timings"),
+    allocations: bool = Query(False, description="Also track allocations per stage (slower)"),
     _: None = Depends(require_debug),
 ):
     """
@@ -262,6 +271,7 @@ async def generate_dungeon(
 
     - Use a specific seed for reproducible results
     - Returns tiles, rooms, zones, interactives, and visual data
+    - profile=true adds per-stage, per-layout and feature pass timings
     """
     if not GAME_MODULES_AVAILABLE:
         raise HTTPException(status_code=500, detail="Game modules not available")
@@ -272,7 +282,8 @@ async def generate_dungeon(
 
     # Generate dungeon
     try:
-        dungeon = Dungeon(level=floor, seed=seed)
+        generation_profile = GenerationProfile(track_allocations=allocations) if profile else None
+        dungeon = Dungeon(level=floor, seed=seed, profile=generation_profile)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Dungeon generation failed: {e}")
 
@@ -311,6 +322,12 @@ async def generate_dungeon(
     # Get zone summary
     zone_summary = dungeon.get_zone_summary() if hasattr(dungeon, 'get_zone_summary') else ""
 
+    # Feature passes mutate tiles, so time them after the layout is serialized
+    profile_data = None
+    if generation_profile:
+        run_feature_passes(dungeon)
+        profile_data = generation_profile.to_dict()
+
     return GeneratedDungeonResponse(
         seed=seed,
         floor=floor,
@@ -323,6 +340,7 @@ async def generate_dungeon(
         tile_visuals=tile_visuals,
         zone_summary=zone_summary,
         generated_at=datetime.utcnow().isoformat() + "Z",
+        profile=profile_data,
     )
 
 
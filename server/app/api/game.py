@@ -7,10 +7,10 @@ from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.security import decode_token
-from ..core.database import AsyncSessionLocal
 from ..core.websocket import manager
-from ..services.game_session import session_manager, GAME_ENGINE_AVAILABLE
-from ..services.leaderboard_service import LeaderboardService
+from ..services.game_session import session_manager, ensure_game_engine
+from ..services.ghost_pool import ghost_pool
+from ..services.result_queue import result_queue
 from ..config.achievements import ACHIEVEMENTS
 
 
@@ -25,69 +25,54 @@ async def get_user_from_token(token: str) -> Optional[tuple]:
     return None
 
 
-async def record_game_result(user_id: int, stats: dict) -> Optional[dict]:
+def record_game_result(user_id: int, stats: dict) -> bool:
     """
-    Record a completed game result to the leaderboard and check for achievements.
+    Queue a completed game for leaderboard recording and achievement checks.
+
+    Recording happens in batches on the result queue; the player is sent a
+    "game_recorded" message (see notify_game_recorded) once it commits.
 
     Args:
         user_id: The user's ID
         stats: Game stats from end_session
 
     Returns:
-        The recorded result data with new achievements, or None if recording failed
+        True if the result was queued
     """
-    if not stats:
-        return None
-
-    try:
-        async with AsyncSessionLocal() as db:
-            service = LeaderboardService(db)
-            result, new_achievement_ids = await service.record_game_result_with_achievements(
-                user_id=user_id,
-                victory=stats.get("victory", False),
-                level_reached=stats.get("level_reached", 1),
-                kills=stats.get("kills", 0),
-                damage_dealt=stats.get("damage_dealt", 0),
-                damage_taken=stats.get("damage_taken", 0),
-                final_hp=stats.get("final_hp", 0),
-                max_hp=stats.get("max_hp", 0),
-                player_level=stats.get("player_level", 1),
-                potions_used=stats.get("potions_used", 0),
-                items_collected=stats.get("items_collected", 0),
-                gold_collected=stats.get("gold_collected", 0),
-                cause_of_death=stats.get("cause_of_death"),
-                killed_by=stats.get("killed_by"),
-                game_duration_seconds=stats.get("game_duration_seconds", 0),
-                turns_taken=stats.get("turns_taken", 0),
-                started_at=stats.get("started_at"),
-                ghost_data=stats.get("ghost_data"),
-            )
-
-            # Build achievement details for new unlocks
-            new_achievements = []
-            for ach_id in new_achievement_ids:
-                ach_def = ACHIEVEMENTS.get(ach_id)
-                if ach_def:
-                    new_achievements.append({
-                        "id": ach_def.id,
-                        "name": ach_def.name,
-                        "description": ach_def.description,
-                        "icon": ach_def.icon,
-                        "rarity": ach_def.rarity,
-                        "points": ach_def.points,
-                    })
+    return result_queue.submit(user_id, stats)
+
+
+async def notify_game_recorded(user_id: int, result, new_achievement_ids: List[str]):
+    """Tell a still-connected player their result (and unlocks) were recorded."""
+    # New ghosts are available to other sessions without waiting for a refresh
+    ghost_pool.add_result(result)
+
+    # Build achievement details for new unlocks
+    new_achievements = []
+    for ach_id in new_achievement_ids:
+        ach_def = ACHIEVEMENTS.get(ach_id)
+        if ach_def:
+            new_achievements.append({
+                "id": ach_def.id,
+                "name": ach_def.name,
+                "description": ach_def.description,
+                "icon": ach_def.icon,
+                "rarity": ach_def.rarity,
+                "points": ach_def.points,
+            })
 
-            return {
-                "game_id": result.id,
-                "score": result.score,
-                "victory": result.victory,
-                "new_achievements": new_achievements,
-            }
-    except Exception as e:
-        print(f"Error recording game result: {e}")
-        return None
+    await manager.send_json(user_id, {
+        "type": "game_recorded",
+        "recorded": {
+            "game_id": result.id,
+            "score": result.score,
+            "victory": result.victory,
+            "new_achievements": new_achievements,
+        },
+    })
 
 
+result_queue.set_recorded_callback(notify_game_recorded)
 
 
 @router.websocket("/ws")
@@ -114,6 +99,11 @@ async def game_websocket(
         "action": "quit"
     }
 
+    {
+        "action": "get_messages",
+        "since": 42  # Last message seq seen (0 = everything retained)
+    }
+
     Response format (server -> client):
     {
         "type": "game_state",
@@ -123,9 +113,17 @@ async def game_websocket(
         "enemies": [...],
         "items": [...],
         "messages": [...],
+        "message_seq": 57,  # Newest message's seq; fetch the gap with get_messages
         "events": [...]
     }
 
+    {
+        "type": "messages",
+        "seq": 57,
+        "truncated": false,  # True if messages after "since" were dropped
+        "messages": [{"seq": 43, "text": "...", "category": "COMBAT", "importance": "NORMAL"}, ...]
+    }
+
     {
         "type": "error",
         "message": "Error description"
@@ -139,7 +137,7 @@ async def game_websocket(
     user_id, username = user_info
 
     # Check if game engine is available
-    if not GAME_ENGINE_AVAILABLE:
+    if not await ensure_game_engine():
         await websocket.accept()
         await websocket.send_json({
             "type": "error",
@@ -203,11 +201,11 @@ async def game_websocket(
                         if result.get("type") == "quit_confirmed":
                             # End the session and record result (same as "quit" action)
                             stats = await session_manager.end_session(user_id)
-                            recorded = await record_game_result(user_id, stats)
+                            record_game_result(user_id, stats)
                             await websocket.send_json({
                                 "type": "game_ended",
                                 "stats": stats,
-                                "recorded": recorded,
+                                "recorded": None,
                             })
                         else:
                             await websocket.send_json(result)
@@ -224,14 +222,29 @@ async def game_websocket(
                             "message": "No active game session"
                         })
 
+                elif action == "get_messages":
+                    # Message log entries newer than the client's cursor
+                    session = await session_manager.get_session(user_id)
+                    if session:
+                        try:
+                            since = int(data.get("since", 0))
+                        except (TypeError, ValueError):
+                            since = 0
+                        await websocket.send_json(session_manager.get_messages(session, since))
+                    else:
+                        await websocket.send_json({
+                            "type": "error",
+                            "message": "No active game session"
+                        })
+
                 elif action == "quit":
                     # End the game session and record result
                     stats = await session_manager.end_session(user_id)
-                    recorded = await record_game_result(user_id, stats)
+                    record_game_result(user_id, stats)
                     await websocket.send_json({
                         "type": "game_ended",
                         "stats": stats,
-                        "recorded": recorded,
+                        "recorded": None,
                     })
 
                 elif action == "ping":
@@ -253,7 +266,7 @@ async def game_websocket(
     except WebSocketDisconnect:
         # Clean up on disconnect and record game result
         stats = await session_manager.end_session(user_id)
-        await record_game_result(user_id, stats)
+        record_game_result(user_id, stats)
         await manager.disconnect(user_id)
 
     except Exception as e:
@@ -266,7 +279,7 @@ async def game_websocket(
         except:
             pass
         stats = await session_manager.end_session(user_id)
-        await record_game_result(user_id, stats)
+        record_game_result(user_id, stats)
         await manager.disconnect(user_id)
 
 
@@ -274,9 +287,11 @@ async def game_websocket(
 async def game_status():
     """Get game server status."""
     return {
-        "engine_available": GAME_ENGINE_AVAILABLE,
+        "engine_available": await ensure_game_engine(),
         "active_connections": manager.get_connected_count(),
         "active_sessions": session_manager.get_active_session_count(),
+        "result_queue": result_queue.get_status(),
+        "ghost_pool": ghost_pool.get_status(),
     }
 
 
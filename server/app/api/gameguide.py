@@ -4,10 +4,12 @@ Game Guide API - Races, Classes, Traps, Hazards, Status Effects, Biomes, Element
 Serves all remaining game mechanics data from constants.py
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from pydantic import BaseModel
 from typing import List, Dict, Optional, Any
 
+from ..core.static_response import static_responses
+
 router = APIRouter(prefix="/api/guide", tags=["guide"])
 
 
@@ -422,57 +424,72 @@ ELEMENTS: List[ElementEntry] = [
 
 # === API Endpoints ===
 
+GUIDE_SECTIONS = {
+    "races": RACES,
+    "classes": CLASSES,
+    "traps": TRAPS,
+    "hazards": HAZARDS,
+    "status_effects": STATUS_EFFECTS,
+    "biomes": BIOMES,
+    "elements": ELEMENTS,
+}
+
+
+def guide_section(name: str):
+    """Builder for a single-section response like {"traps": [...]}."""
+    return lambda: {name: GUIDE_SECTIONS[name]}
+
+
+static_responses.register("guide:all", lambda: GUIDE_SECTIONS)
+for _name in GUIDE_SECTIONS:
+    static_responses.register(f"guide:{_name}", guide_section(_name))
+
+
 @router.get("/")
-async def get_all_guide_data():
+async def get_all_guide_data(request: Request):
     """Get all game guide data in one request."""
-    return {
-        "races": RACES,
-        "classes": CLASSES,
-        "traps": TRAPS,
-        "hazards": HAZARDS,
-        "status_effects": STATUS_EFFECTS,
-        "biomes": BIOMES,
-        "elements": ELEMENTS,
-    }
+    return static_responses.respond(request, "guide:all", lambda: GUIDE_SECTIONS)
 
 
 @router.get("/races")
-async def get_races():
+async def get_races(request: Request):
     """Get all playable races."""
-    return {"races": RACES}
+    return static_responses.respond(request, "guide:races", guide_section("races"))
 
 
 @router.get("/classes")
-async def get_classes():
+async def get_classes(request: Request):
     """Get all playable classes."""
-    return {"classes": CLASSES}
+    return static_responses.respond(request, "guide:classes", guide_section("classes"))
 
 
 @router.get("/traps")
-async def get_traps():
+async def get_traps(request: Request):
     """Get all trap types."""
-    return {"traps": TRAPS}
+    return static_responses.respond(request, "guide:traps", guide_section("traps"))
 
 
 @router.get("/hazards")
-async def get_hazards():
+async def get_hazards(request: Request):
     """Get all environmental hazards."""
-    return {"hazards": HAZARDS}
+    return static_responses.respond(request, "guide:hazards", guide_section("hazards"))
 
 
 @router.get("/status-effects")
-async def get_status_effects():
+async def get_status_effects(request: Request):
     """Get all status effects."""
-    return {"status_effects": STATUS_EFFECTS}
+    return static_responses.respond(
+        request, "guide:status_effects", guide_section("status_effects")
+    )
 
 
 @router.get("/biomes")
-async def get_biomes():
+async def get_biomes(request: Request):
     """Get all dungeon biomes/themes."""
-    return {"biomes": BIOMES}
+    return static_responses.respond(request, "guide:biomes", guide_section("biomes"))
 
 
 @router.get("/elements")
-async def get_elements():
+async def get_elements(request: Request):
     """Get element system data."""
-    return {"elements": ELEMENTS}
+    return static_responses.respond(request, "guide:elements", guide_section("elements"))
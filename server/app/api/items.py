@@ -10,9 +10,11 @@ Features:
 """
 
 from typing import Optional
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from pydantic import BaseModel
 
+from ..core.static_response import static_responses
+
 router = APIRouter(prefix="/api/items", tags=["items"])
 
 
@@ -498,36 +500,62 @@ CATEGORIES = [
 ]
 
 
+ITEMS_BY_ID = {item.id: item for item in ITEMS}
+ITEM_CATEGORY_IDS = {cat.id for cat in CATEGORIES}
+ITEM_RARITIES = {item.rarity for item in ITEMS}
+
+
+def build_items(category: Optional[str] = None, rarity: Optional[str] = None) -> dict:
+    filtered = [
+        i for i in ITEMS
+        if (category is None or i.category == category)
+        and (rarity is None or i.rarity == rarity)
+    ]
+    return {"items": filtered, "total": len(filtered)}
+
+
+static_responses.register("items:all", build_items)
+static_responses.register("items:categories", lambda: {"categories": CATEGORIES})
+
+
 @router.get("")
-async def get_items():
+async def get_items(request: Request):
     """Get all items in the compendium."""
-    return {"items": ITEMS, "total": len(ITEMS)}
+    return static_responses.respond(request, "items:all", build_items)
 
 
 @router.get("/categories")
-async def get_categories():
+async def get_categories(request: Request):
     """Get item categories with counts."""
-    return {"categories": CATEGORIES}
+    return static_responses.respond(
+        request, "items:categories", lambda: {"categories": CATEGORIES}
+    )
 
 
 @router.get("/category/{category_id}")
-async def get_items_by_category(category_id: str):
+async def get_items_by_category(category_id: str, request: Request):
     """Get items filtered by category."""
-    filtered = [i for i in ITEMS if i.category == category_id]
-    return {"items": filtered, "total": len(filtered)}
+    if category_id not in ITEM_CATEGORY_IDS:
+        return build_items(category=category_id)
+    return static_responses.respond(
+        request, f"items:category:{category_id}", lambda: build_items(category=category_id)
+    )
 
 
 @router.get("/rarity/{rarity}")
-async def get_items_by_rarity(rarity: str):
+async def get_items_by_rarity(rarity: str, request: Request):
     """Get items filtered by rarity."""
-    filtered = [i for i in ITEMS if i.rarity == rarity]
-    return {"items": filtered, "total": len(filtered)}
+    if rarity not in ITEM_RARITIES:
+        return build_items(rarity=rarity)
+    return static_responses.respond(
+        request, f"items:rarity:{rarity}", lambda: build_items(rarity=rarity)
+    )
 
 
 @router.get("/{item_id}")
-async def get_item(item_id: str):
+async def get_item(item_id: str, request: Request):
     """Get a specific item by ID."""
-    for item in ITEMS:
-        if item.id == item_id:
-            return item
-    return {"error": "Item not found"}
+    item = ITEMS_BY_ID.get(item_id)
+    if not item:
+        return {"error": "Item not found"}
+    return static_responses.respond(request, f"items:item:{item_id}", lambda: item)
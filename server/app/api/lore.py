@@ -8,80 +8,76 @@ Features:
 - The Skyfall Seed canon
 """
 
-from fastapi import APIRouter
-
-from .lore_models import LoreCategory
-from .lore_content import (
-    WORLD_LORE,
-    LOCATION_LORE,
-    WARDEN_LORE,
-    CREATURE_LORE,
-    ARTIFACT_LORE,
-    DISCOVERY_LORE,
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Query, Request
+
+from ..core.startup_profile import lazy_module
+from ..core.static_response import static_responses
+from ..services.search_index import (
+    search_indexes, SearchIndex, TITLE_WEIGHT, TAG_WEIGHT, BODY_WEIGHT,
 )
+from .lore_models import LoreCategory, LoreEntry
+
+# Entries are large; import them on first lore request, not at startup
+lore_content = lazy_module(".lore_content", __package__)
 
 router = APIRouter(prefix="/api/lore", tags=["lore"])
 
 
-# Combine all lore into categories
-LORE_CATEGORIES = [
-    LoreCategory(
-        id="world",
-        name="World & History",
-        description="The Skyfall Seed, the Field, and the rewriting of Valdris",
-        icon="🌍",
-        entries=WORLD_LORE,
-    ),
-    LoreCategory(
-        id="locations",
-        name="The Dungeon Depths",
-        description="Eight floors of stabilized Field reality",
-        icon="🏰",
-        entries=LOCATION_LORE,
-    ),
-    LoreCategory(
-        id="wardens",
-        name="The Wardens",
-        description="Bosses who anchor each pocket of reality",
-        icon="👑",
-        entries=WARDEN_LORE,
-    ),
-    LoreCategory(
-        id="creatures",
-        name="Creatures",
-        description="Patterns stabilized by the Field into recurring forms",
-        icon="👹",
-        entries=CREATURE_LORE,
-    ),
-    LoreCategory(
-        id="artifacts",
-        name="Sky-Touched Artifacts",
-        description="Items that interface with the Field's power",
-        icon="✨",
-        entries=ARTIFACT_LORE,
-    ),
-    LoreCategory(
-        id="discoveries",
-        name="Discoverable Lore",
-        description="Scrolls, journals, and evidence found in the depths",
-        icon="📜",
-        entries=DISCOVERY_LORE,
-    ),
+# (id, name, description, icon, lore_content attribute)
+LORE_CATEGORY_INFO = [
+    ("world", "World & History",
+     "The Skyfall Seed, the Field, and the rewriting of Valdris", "🌍", "WORLD_LORE"),
+    ("locations", "The Dungeon Depths",
+     "Eight floors of stabilized Field reality", "🏰", "LOCATION_LORE"),
+    ("wardens", "The Wardens",
+     "Bosses who anchor each pocket of reality", "👑", "WARDEN_LORE"),
+    ("creatures", "Creatures",
+     "Patterns stabilized by the Field into recurring forms", "👹", "CREATURE_LORE"),
+    ("artifacts", "Sky-Touched Artifacts",
+     "Items that interface with the Field's power", "✨", "ARTIFACT_LORE"),
+    ("discoveries", "Discoverable Lore",
+     "Scrolls, journals, and evidence found in the depths", "📜", "DISCOVERY_LORE"),
 ]
 
 
-@router.get("")
-async def get_all_lore():
-    """Get all lore categories and entries."""
+@lru_cache(maxsize=None)
+def get_lore_category_list() -> List[LoreCategory]:
+    """Combine all lore into categories (built once)."""
+    return [
+        LoreCategory(
+            id=cat_id,
+            name=name,
+            description=description,
+            icon=icon,
+            entries=getattr(lore_content, attr),
+        )
+        for cat_id, name, description, icon, attr in LORE_CATEGORY_INFO
+    ]
+
+
+@lru_cache(maxsize=None)
+def get_lore_categories_by_id() -> Dict[str, LoreCategory]:
+    return {cat.id: cat for cat in get_lore_category_list()}
+
+
+@lru_cache(maxsize=None)
+def get_lore_entries_by_id() -> Dict[str, LoreEntry]:
     return {
-        "categories": [cat.model_dump() for cat in LORE_CATEGORIES],
-        "total_entries": sum(len(cat.entries) for cat in LORE_CATEGORIES),
+        entry.id: entry for cat in get_lore_category_list() for entry in cat.entries
     }
 
 
-@router.get("/categories")
-async def get_lore_categories():
-    """Get lore category list (without full entries)."""
+def build_all_lore() -> dict:
+    return {
+        "categories": [cat.model_dump() for cat in get_lore_category_list()],
+        "total_entries": sum(len(cat.entries) for cat in get_lore_category_list()),
+    }
+
+
+def build_lore_categories() -> dict:
     return {
         "categories": [
             {
@@ -91,46 +87,75 @@ async def get_lore_categories():
                 "icon": cat.icon,
                 "entry_count": len(cat.entries),
             }
-            for cat in LORE_CATEGORIES
+            for cat in get_lore_category_list()
         ]
     }
 
 
+static_responses.register("lore:all", build_all_lore)
+static_responses.register("lore:categories", build_lore_categories)
+
+
+@router.get("")
+async def get_all_lore(request: Request):
+    """Get all lore categories and entries."""
+    return static_responses.respond(request, "lore:all", build_all_lore)
+
+
+@router.get("/categories")
+async def get_lore_categories(request: Request):
+    """Get lore category list (without full entries)."""
+    return static_responses.respond(request, "lore:categories", build_lore_categories)
+
+
 @router.get("/category/{category_id}")
-async def get_lore_category(category_id: str):
+async def get_lore_category(category_id: str, request: Request):
     """Get a specific lore category with all entries."""
-    for cat in LORE_CATEGORIES:
-        if cat.id == category_id:
-            return cat.model_dump()
-    return {"error": "Category not found"}
+    cat = get_lore_categories_by_id().get(category_id)
+    if not cat:
+        return {"error": "Category not found"}
+    return static_responses.respond(request, f"lore:category:{category_id}", cat.model_dump)
 
 
 @router.get("/entry/{entry_id}")
-async def get_lore_entry(entry_id: str):
+async def get_lore_entry(entry_id: str, request: Request):
     """Get a specific lore entry."""
-    for cat in LORE_CATEGORIES:
+    entry = get_lore_entries_by_id().get(entry_id)
+    if not entry:
+        return {"error": "Entry not found"}
+    return static_responses.respond(request, f"lore:entry:{entry_id}", entry.model_dump)
+
+
+def build_lore_index(index: SearchIndex):
+    for cat in get_lore_category_list():
         for entry in cat.entries:
-            if entry.id == entry_id:
-                return entry.model_dump()
-    return {"error": "Entry not found"}
+            index.add(
+                {**entry.model_dump(), "category_name": cat.name},
+                [
+                    (entry.title, TITLE_WEIGHT),
+                    (entry.subtitle, TAG_WEIGHT),
+                    (cat.name, TAG_WEIGHT),
+                    (entry.content, BODY_WEIGHT),
+                ],
+            )
 
 
-@router.get("/search")
-async def search_lore(q: str):
-    """Search lore entries by title or content."""
-    query = q.lower()
-    results = []
+search_indexes.register("lore", build_lore_index)
 
-    for cat in LORE_CATEGORIES:
-        for entry in cat.entries:
-            if query in entry.title.lower() or query in entry.content.lower():
-                results.append({
-                    **entry.model_dump(),
-                    "category_name": cat.name,
-                })
+
+@router.get("/search")
+async def search_lore(
+    q: str,
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=200),
+):
+    """Search lore entries by title or content (ranked, prefix-matching)."""
+    page = search_indexes.get("lore").search(q, offset=offset, limit=limit)
 
     return {
         "query": q,
-        "results": results,
-        "count": len(results),
+        "results": page.docs,
+        "count": len(page.docs),
+        "total": page.total,
+        "offset": offset,
     }
@@ -22,6 +22,7 @@ from pydantic import BaseModel
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from ..api.dbexplorer import require_debug
+from ..core.security import auth_metrics, password_hasher, token_cache
 
 router = APIRouter(prefix="/api/metrics", tags=["metrics"])
 
@@ -417,6 +418,7 @@ async def reset_metrics(
 ):
     """Reset all metrics."""
     metrics_collector.reset()
+    auth_metrics.reset()
     return {"status": "reset", "message": "All metrics have been reset"}
 
 
@@ -443,3 +445,15 @@ async def get_metrics_summary(
             for e in top_endpoints
         ],
     }
+
+
+@router.get("/auth")
+async def get_auth_metrics(
+    _: None = Depends(require_debug),
+):
+    """Password hashing and token validation latencies."""
+    return {
+        **auth_metrics.get_stats(),
+        "hash_pool": password_hasher.get_stats(),
+        "token_cache_entries": len(token_cache),
+    }
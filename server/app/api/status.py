@@ -21,7 +21,9 @@ from pydantic import BaseModel
 from ..core.config import settings
 from ..core.database import async_session_maker
 from ..core.redis import get_redis
+from ..core.startup_profile import startup_profile
 from ..api.dbexplorer import require_debug
+from ..services.search_index import search_indexes
 
 router = APIRouter(prefix="/api/status", tags=["status"])
 
@@ -68,6 +70,8 @@ class StatusResponse(BaseModel):
     services: list[ServiceStatus]
     system: SystemInfo
     app: AppInfo
+    search_indexes: dict  # name -> {documents, terms, build_ms} (None until built)
+    startup: dict  # ready_ms, phases, lazy_loads, slowest imports (see startup_profile)
 
 
 def format_uptime(seconds: float) -> str:
@@ -218,6 +222,8 @@ async def get_system_status(_: None = Depends(require_debug)):
         services=services,
         system=get_system_info(),
         app=get_app_info(),
+        search_indexes=search_indexes.get_stats(),
+        startup=startup_profile.get_stats(),
     )
 
 
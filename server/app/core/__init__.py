@@ -1,10 +1,14 @@
 """Core module - configuration and utilities."""
+# Imported first so opt-in import timing covers everything after it
+from .startup_profile import startup_profile, lazy_module
 from .config import settings
 from .database import Base, get_db, init_db, close_db, async_session_maker
 from .redis import get_redis, close_redis
 from .cache import cache, CacheService, CacheKeys, CacheTTL, cached
 
 __all__ = [
+    "startup_profile",
+    "lazy_module",
     "settings",
     "Base",
     "get_db",
@@ -61,6 +61,31 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 60 * 24 * 7  # 1 week
 
+    # Password hashing pool and verified-token cache (core/security.py)
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
+    token_cache_ttl_seconds: float = 60.0
+    token_cache_max_entries: int = 10000
+
+    # Game result recording queue (services/result_queue.py)
+    result_queue_batch_size: int = 50
+    result_queue_flush_seconds: float = 0.5
+    result_queue_max_pending: int = 10000
+    result_queue_spool_path: str = "pending_game_results.jsonl"
+    result_queue_dead_letter_path: str = "failed_game_results.jsonl"
+    result_queue_max_attempts: int = 5
+
+    # Recorded ghosts handed to game sessions (services/ghost_pool.py)
+    ghost_pool_per_floor: int = 5
+    ghost_pool_refresh_seconds: float = 300.0
+    ghost_pool_scan_limit: int = 500
+
+    # Startup (core/startup_profile.py). With warming off, static content
+    # responses and search indexes are built on first request instead, and
+    # the game engine is imported by the first game session.
+    warm_content_on_startup: bool = True
+    warm_game_engine_on_startup: bool = True
+
     # CORS - allow common development ports
     cors_origins: list[str] = [
         "http://localhost:3000",
@@ -1,6 +1,19 @@
-"""JWT authentication and security utilities."""
+"""JWT authentication and security utilities.
+
+Password hashing (bcrypt, ~100ms of CPU) runs on a small thread pool so it
+never stalls the event loop, with a cap on how many logins may wait for it.
+Decoded JWTs are cached briefly by token hash so websocket reconnects and
+chatty clients don't re-verify the same token. Both report latencies to
+``auth_metrics`` (served at /api/metrics/auth).
+"""
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -11,7 +24,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from .config import settings
 from .database import get_db
-from ..models.user import User
+from ..models.user import User, pwd_context
 
 
 # OAuth2 scheme for token extraction
@@ -53,16 +66,226 @@ def create_access_token(user: User) -> str:
     )
 
 
+# =============================================================================
+# Auth latency metrics
+# =============================================================================
+
+class AuthMetrics:
+    """Latency samples and counters for hashing and token validation."""
+
+    def __init__(self, max_samples: int = 1000):
+        self.max_samples = max_samples
+        self.samples: Dict[str, deque] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, elapsed_ms: float):
+        with self._lock:
+            samples = self.samples.get(operation)
+            if samples is None:
+                samples = self.samples[operation] = deque(maxlen=self.max_samples)
+            samples.append(elapsed_ms)
+            self.counters[operation] = self.counters.get(operation, 0) + 1
+
+    def increment(self, counter: str):
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + 1
+
+    @staticmethod
+    def _percentile(sorted_data: list, percentile: int) -> float:
+        if not sorted_data:
+            return 0.0
+        return sorted_data[min(len(sorted_data) - 1, len(sorted_data) * percentile // 100)]
+
+    def get_stats(self) -> dict:
+        """Per-operation count/avg/p50/p95/max (ms) plus raw counters."""
+        with self._lock:
+            samples = {op: sorted(values) for op, values in self.samples.items()}
+            counters = dict(self.counters)
+
+        operations = {}
+        for op, values in samples.items():
+            operations[op] = {
+                "count": counters.get(op, 0),
+                "avg_ms": round(sum(values) / len(values), 2) if values else 0.0,
+                "p50_ms": round(self._percentile(values, 50), 2),
+                "p95_ms": round(self._percentile(values, 95), 2),
+                "max_ms": round(values[-1], 2) if values else 0.0,
+            }
+        return {
+            "operations": operations,
+            "counters": {k: v for k, v in counters.items() if k not in samples},
+        }
+
+    def reset(self):
+        with self._lock:
+            self.samples.clear()
+            self.counters.clear()
+
+
+auth_metrics = AuthMetrics()
+
+
+# =============================================================================
+# Off-loop password hashing
+# =============================================================================
+
+class AuthBusyError(Exception):
+    """Too many password operations are already waiting for the hash pool."""
+
+
+class PasswordHasher:
+    """Runs bcrypt on a bounded thread pool.
+
+    At most ``workers`` hashes run at once (bcrypt releases the GIL, so they
+    run in parallel); at most ``max_pending`` may be running or queued.
+    Beyond that, callers get AuthBusyError instead of an ever-growing queue.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def _run(self, operation: str, fn, *args):
+        if self.pending >= self.max_pending:
+            auth_metrics.increment(f"{operation}_rejected")
+            raise AuthBusyError("Authentication is busy, try again shortly")
+
+        self.pending += 1
+        queued = time.perf_counter()
+        started = []
+
+        def timed():
+            started.append(time.perf_counter())
+            return fn(*args)
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), timed)
+        finally:
+            self.pending -= 1
+            done = time.perf_counter()
+            if started:
+                auth_metrics.record(f"{operation}_wait", (started[0] - queued) * 1000)
+                auth_metrics.record(operation, (done - started[0]) * 1000)
+
+    async def hash(self, plain_password: str) -> str:
+        """Hash a plain password off the event loop."""
+        return await self._run("password_hash", pwd_context.hash, plain_password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Check a plain password against its hash off the event loop."""
+        return await self._run(
+            "password_verify", pwd_context.verify, plain_password, hashed_password
+        )
+
+    def get_stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
+
+
+# =============================================================================
+# Verified token cache
+# =============================================================================
+
+class TokenCache:
+    """Recently verified tokens, keyed by SHA-256 of the token.
+
+    Entries live for ``ttl`` seconds but never past the token's own ``exp``,
+    so a cached token can't outlive its validity. Only valid tokens are
+    cached; oldest entries are evicted beyond ``max_entries``.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[TokenData, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[TokenData]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            token_data, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            return token_data
+
+    def put(self, key: str, token_data: TokenData, exp: Optional[float]):
+        if self.ttl <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, exp)
+        with self._lock:
+            self._entries[key] = (token_data, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+token_cache = TokenCache(
+    ttl=settings.token_cache_ttl_seconds,
+    max_entries=settings.token_cache_max_entries,
+)
+
+
 def decode_token(token: str) -> Optional[TokenData]:
     """
     Decode and validate a JWT token.
 
+    Recently verified tokens are served from ``token_cache``.
+
     Args:
         token: The JWT token string
 
     Returns:
         TokenData if valid, None otherwise
     """
+    key = TokenCache.key(token)
+    cached = token_cache.get(key)
+    if cached is not None:
+        auth_metrics.increment("token_cache_hit")
+        return cached
+    auth_metrics.increment("token_cache_miss")
+
+    start = time.perf_counter()
     try:
         payload = jwt.decode(
             token,
@@ -73,9 +296,14 @@ def decode_token(token: str) -> Optional[TokenData]:
         username = payload.get("username")
         if user_id is None or username is None:
             return None
-        return TokenData(user_id=user_id, username=username)
+        token_data = TokenData(user_id=user_id, username=username)
+        token_cache.put(key, token_data, payload.get("exp"))
+        return token_data
     except JWTError:
+        auth_metrics.increment("token_invalid")
         return None
+    finally:
+        auth_metrics.record("token_decode", (time.perf_counter() - start) * 1000)
 
 
 async def get_current_user(
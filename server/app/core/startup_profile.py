@@ -0,0 +1,232 @@
+"""
+Startup Profile
+
+Records where cold start time goes so it can be read back from /api/status:
+
+- phases: time between marks (imports, app creation, each lifespan step)
+- ready_ms: process start until lifespan startup finished
+- lazy_loads: heavy modules imported on first use instead of at startup
+- imports: per-module self/cumulative import times, like
+  ``python -X importtime`` (opt-in, see below)
+
+Import timing wraps module loaders, so it is only enabled when the process
+runs with ``STARTUP_PROFILE_IMPORTS=1`` or ``python -X importtime``. It
+starts when ``app.core`` is first imported, which is the first thing
+``app.main`` does.
+
+Heavy modules that only some endpoints need are wrapped in ``lazy_module``:
+
+    bestiary_data = lazy_module(".bestiary_data", __package__)
+
+    def build_stats():
+        return len(bestiary_data.CREATURES)  # imported here, once
+"""
+import importlib
+import importlib.abc
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Modules shown per ranking in get_stats()
+TOP_IMPORTS = 20
+
+
+def _process_start() -> float:
+    """Wall-clock time the interpreter started (falls back to now)."""
+    if psutil is not None:
+        try:
+            return psutil.Process().create_time()
+        except Exception:
+            pass
+    return time.time()
+
+
+class _TimedLoader:
+    """Loader proxy that times exec_module for the import timer."""
+
+    def __init__(self, loader, timer: "_ImportTimer"):
+        self._loader = loader
+        self._timer = timer
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._timer.enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.leave(module.__name__)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path hook wrapping every newly found module's loader."""
+
+    def __init__(self, profile: "StartupProfile"):
+        self._profile = profile
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def _stack(self) -> List[List[float]]:
+        """Per-thread [start, child time] frames of in-progress imports."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def enter(self):
+        self._stack().append([time.perf_counter(), 0.0])
+
+    def leave(self, name: str):
+        stack = self._stack()
+        started, children = stack.pop()
+        cumulative = time.perf_counter() - started
+        if stack:
+            stack[-1][1] += cumulative
+        self._profile.imports[name] = (
+            (cumulative - children) * 1000,
+            cumulative * 1000,
+        )
+
+
+class StartupProfile:
+    """Process-wide record of startup phases and import costs."""
+
+    def __init__(self):
+        self.process_start = _process_start()
+        self.phases: List[Tuple[str, float]] = []
+        self.imports: Dict[str, Tuple[float, float]] = {}  # name -> (self ms, cumulative ms)
+        self.lazy_loads: Dict[str, float] = {}
+        self.ready_ms: Optional[float] = None
+        self._last_mark = time.perf_counter()
+        self._timer: Optional[_ImportTimer] = None
+
+    @property
+    def import_timing(self) -> bool:
+        return self._timer is not None
+
+    def enable_import_timing(self):
+        """Start timing module imports (until disable_import_timing)."""
+        if self._timer is None:
+            self._timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._timer)
+
+    def disable_import_timing(self):
+        if self._timer is not None:
+            sys.meta_path.remove(self._timer)
+            self._timer = None
+
+    def mark(self, phase: str):
+        """Record the time since the previous mark as ``phase``."""
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self._last_mark) * 1000))
+        self._last_mark = now
+
+    def mark_ready(self):
+        """The app is about to serve requests; import timing stops here."""
+        self.ready_ms = (time.time() - self.process_start) * 1000
+        self.disable_import_timing()
+
+    def record_lazy_load(self, name: str, elapsed_ms: float):
+        self.lazy_loads[name] = elapsed_ms
+
+    def get_stats(self, top: int = TOP_IMPORTS) -> dict:
+        """Summary for /api/status."""
+        imports = list(self.imports.items())
+        by_cumulative = sorted(imports, key=lambda item: -item[1][1])[:top]
+        by_self = sorted(imports, key=lambda item: -item[1][0])[:top]
+
+        packages: Dict[str, float] = {}
+        for name, (self_ms, _) in imports:
+            root = name.split(".", 1)[0]
+            packages[root] = packages.get(root, 0.0) + self_ms
+        top_packages = sorted(packages.items(), key=lambda item: -item[1])[:top]
+
+        return {
+            "ready_ms": round(self.ready_ms, 1) if self.ready_ms is not None else None,
+            "phases": {name: round(ms, 1) for name, ms in self.phases},
+            "lazy_loads": {name: round(ms, 1) for name, ms in self.lazy_loads.items()},
+            "import_timing": self.import_timing or bool(self.imports),
+            "modules_timed": len(imports),
+            "slowest_imports": [
+                {"module": name, "self_ms": round(s, 2), "cumulative_ms": round(c, 2)}
+                for name, (s, c) in by_cumulative
+            ],
+            "slowest_self": [
+                {"module": name, "self_ms": round(s, 2)} for name, (s, _) in by_self
+            ],
+            "packages_ms": {name: round(ms, 1) for name, ms in top_packages},
+        }
+
+
+class LazyModule:
+    """Module proxy that imports on first attribute access."""
+
+    __slots__ = ("_name", "_package", "_module", "_lock")
+
+    def __init__(self, name: str, package: Optional[str] = None):
+        self._name = name
+        self._package = package
+        self._module = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self):
+        module = self._module
+        if module is not None:
+            return module
+        with self._lock:
+            if self._module is None:
+                start = time.perf_counter()
+                self._module = importlib.import_module(self._name, self._package)
+                startup_profile.record_lazy_load(
+                    self._module.__name__, (time.perf_counter() - start) * 1000
+                )
+            return self._module
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+
+def lazy_module(name: str, package: Optional[str] = None) -> LazyModule:
+    """Defer importing ``name`` until one of its attributes is used."""
+    return LazyModule(name, package)
+
+
+# Global profile instance
+startup_profile = StartupProfile()
+
+if os.environ.get("STARTUP_PROFILE_IMPORTS") or "importtime" in sys._xoptions:
+    startup_profile.enable_import_timing()
@@ -0,0 +1,222 @@
+"""
+Precompiled Static Responses
+
+Serves read-only content endpoints (bestiary, items, lore, guides) from
+pre-rendered byte buffers instead of re-serializing pydantic models on
+every request.
+
+Each response is rendered once into:
+- identity JSON bytes (same encoding as FastAPI's JSONResponse)
+- gzip and (when the ``brotli`` package is installed) brotli variants
+- a strong ETag derived from the identity bytes, suffixed per encoding
+  (``"<hash>"``, ``"<hash>-gz"``, ``"<hash>-br"``) since the encoded bodies
+  are different byte sequences
+
+Conditional requests whose ``If-None-Match`` lists any of the entry's tags
+get a 304, so a client that switches encodings still revalidates.
+
+Usage:
+    @router.get("/categories")
+    async def get_categories(request: Request):
+        return static_responses.respond(request, "items:categories", build_categories)
+
+Builders are plain functions returning JSON-able data. Entries that depend
+on something that can change (e.g. a source file) pass a ``version``; the
+entry is re-rendered when the version differs from the cached one.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Static content only changes on deploy; let clients revalidate cheaply
+CACHE_CONTROL = "public, max-age=300, must-revalidate"
+
+# Don't bother compressing tiny bodies (headers would outweigh savings)
+MIN_COMPRESS_BYTES = 512
+
+# ETag suffix per Content-Encoding (identity bodies use the bare hash)
+ETAG_SUFFIXES = {"gzip": "-gz", "br": "-br"}
+
+
+@dataclass(frozen=True)
+class PrecompiledResponse:
+    """One rendered response body with its encodings."""
+    body: bytes
+    etag: str
+    gzip_body: Optional[bytes] = None
+    brotli_body: Optional[bytes] = None
+    version: Hashable = None
+
+    @classmethod
+    def render(cls, data: Any, version: Hashable = None) -> "PrecompiledResponse":
+        body = json.dumps(
+            jsonable_encoder(data),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+        gzip_body = brotli_body = None
+        if len(body) >= MIN_COMPRESS_BYTES:
+            gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+            if brotli is not None:
+                brotli_body = brotli.compress(body, quality=11)
+
+        return cls(body, etag, gzip_body, brotli_body, version)
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """The ETag of the body sent with this Content-Encoding (None: identity)."""
+        if encoding is None:
+            return self.etag
+        return self.etag[:-1] + ETAG_SUFFIXES[encoding] + '"'
+
+    def to_response(self, request: Request) -> Response:
+        """Pick the best encoding for the request, or 304 if unchanged."""
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        body, encoding = self.body, None
+        if self.brotli_body is not None and "br" in accepted:
+            body, encoding = self.brotli_body, "br"
+        elif self.gzip_body is not None and "gzip" in accepted:
+            body, encoding = self.gzip_body, "gzip"
+
+        headers = {
+            "ETag": self.etag_for(encoding),
+            "Cache-Control": CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+
+        if _etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _accepted_encodings(header: str) -> set:
+    """Parse Accept-Encoding into the set of encodings with q > 0."""
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name)
+    return accepted
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    """Whether If-None-Match lists ``etag`` under any encoding suffix."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison: proxies may add W/ to tags they re-encode
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    variants = {etag} | {etag[:-1] + suffix + '"' for suffix in ETAG_SUFFIXES.values()}
+    return not candidates.isdisjoint(variants)
+
+
+class StaticResponseCache:
+    """Process-wide store of precompiled responses, keyed by name."""
+
+    def __init__(self):
+        self._entries: Dict[str, PrecompiledResponse] = {}
+        self._startup: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        key: str,
+        builder: Callable[[], Any],
+        version: Optional[Callable[[], Hashable]] = None,
+    ):
+        """Register an entry to render during prerender() at startup.
+
+        ``version`` is a callable returning the entry's current version, so
+        the prerendered entry matches what the route will ask for.
+        """
+        self._startup[key] = (builder, version)
+
+    def get(
+        self,
+        key: str,
+        builder: Callable[[], Any],
+        version: Hashable = None,
+    ) -> PrecompiledResponse:
+        """Return the rendered entry, building it on first use or version change."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            return entry
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                entry = PrecompiledResponse.render(builder(), version)
+                self._entries[key] = entry
+        return entry
+
+    def respond(
+        self,
+        request: Request,
+        key: str,
+        builder: Callable[[], Any],
+        version: Hashable = None,
+    ) -> Response:
+        """Serve a precompiled entry for this request."""
+        return self.get(key, builder, version).to_response(request)
+
+    def prerender(self) -> int:
+        """Render every registered entry. Returns the number rendered."""
+        rendered = 0
+        for key, (builder, version) in self._startup.items():
+            try:
+                self.get(key, builder, version() if version else None)
+                rendered += 1
+            except Exception as e:
+                logger.warning("Prerendering %s failed: %s", key, e)
+        return rendered
+
+    def invalidate(self, prefix: str = ""):
+        """Drop rendered entries whose key starts with prefix."""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+    def get_stats(self) -> dict:
+        """Entry count and total rendered bytes per encoding."""
+        entries = list(self._entries.values())
+        return {
+            "entries": len(entries),
+            "identity_bytes": sum(len(e.body) for e in entries),
+            "gzip_bytes": sum(len(e.gzip_body or e.body) for e in entries),
+            "brotli_bytes": sum(len(e.brotli_body or e.body) for e in entries),
+            "brotli_available": brotli is not None,
+        }
+
+
+# Global cache instance
+static_responses = StaticResponseCache()
@@ -3,12 +3,19 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .core.startup_profile import startup_profile
 from .core.config import settings
 from .core.database import init_db, close_db, async_session_maker
 from .core.redis import close_redis
 from .core.cache import cache
+from .core.security import password_hasher
+from .core.static_response import static_responses
 from .services.auth_service import AuthService
 from .services.cache_warmer import warm_game_constants_cache
+from .services.game_session import warm_game_engine
+from .services.ghost_pool import ghost_pool
+from .services.result_queue import result_queue
+from .services.search_index import search_indexes
 from .api.auth import router as auth_router
 from .api.game import router as game_router
 from .api.leaderboard import router as leaderboard_router
@@ -42,16 +49,20 @@ from .api.assets import router as assets_router
 from .api.asset3d import router as asset3d_router
 from .api.editor import router as editor_router
 
+startup_profile.mark("imports")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown."""
     # Startup
+    startup_profile.mark("server_start")
     print(f"Starting {settings.app_name} v{settings.app_version}")
     print(f"Debug mode: {settings.debug}")
     print("Initializing database...")
     await init_db()
     print("Database initialized.")
+    startup_profile.mark("database")
 
     # Seed demo account
     print("Ensuring demo account exists...")
@@ -60,6 +71,7 @@ async def lifespan(app: FastAPI):
         await auth_service.ensure_demo_account()
         await db.commit()
     print("Demo account ready (username: demo, password: DemoPass123)")
+    startup_profile.mark("demo_account")
 
     # Warm game constants cache from database
     print("Warming game constants cache...")
@@ -72,9 +84,37 @@ async def lifespan(app: FastAPI):
             print(f"Cache warmed with {total} records")
     except Exception as e:
         print(f"Cache warming failed (non-fatal): {e}")
+    startup_profile.mark("cache_warm")
+
+    # Render static content responses (bestiary, items, lore, guides)
+    if settings.warm_content_on_startup:
+        rendered = static_responses.prerender()
+        print(f"Prerendered {rendered} static content responses")
+        build_ms = search_indexes.build_all()
+        print(f"Built content search indexes in {build_ms:.1f}ms")
+        startup_profile.mark("static_content")
+
+    print("Starting game result queue...")
+    await result_queue.start()
+    startup_profile.mark("result_queue")
+
+    # Loads recorded ghosts in the background; sessions don't wait for it
+    await ghost_pool.start()
+
+    startup_profile.mark_ready()
+    print(f"Ready in {startup_profile.ready_ms:.0f}ms since process start")
+
+    # Import the game engine off the event loop so the first game doesn't wait.
+    # Game routes await the same future, and import errors are logged.
+    if settings.warm_game_engine_on_startup:
+        warm_game_engine()
 
     yield
     # Shutdown
+    print("Flushing game result queue...")
+    await result_queue.stop()
+    await ghost_pool.stop()
+    password_hasher.shutdown()
     print("Closing Redis connections...")
     await close_redis()
     print("Closing database connections...")
@@ -213,6 +253,7 @@ async def readiness_check():
 
 # Create app instance
 app = create_app()
+startup_profile.mark("app_created")
 
 
 if __name__ == "__main__":
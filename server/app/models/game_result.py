@@ -47,6 +47,16 @@ class GameResult(Base):
     # Ghost data (serialized game state for ghost replay)
     ghost_data = Column(Text, nullable=True)
 
+    # Command log for deterministic replay (RunRecording JSON)
+    replay_data = Column(Text, nullable=True)
+
+    # Replay verification (see services/run_verifier.py)
+    # unverified: no replay log, pending: awaiting verifier,
+    # verified / mismatch / unreplayable / unverifiable: verifier outcome
+    verification_status = Column(String(20), default="unverified", index=True)
+    verification_notes = Column(Text, nullable=True)
+    verified_at = Column(DateTime, nullable=True)
+
     # Timestamps
     started_at = Column(DateTime, default=datetime.utcnow)
     ended_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -150,6 +150,7 @@ class JobUpdate(BaseModel):
     progress: Optional[str] = Field(None, description="Current progress description")
     progress_pct: Optional[int] = Field(None, ge=0, le=100, description="Progress percentage")
     log_line: Optional[str] = Field(None, description="Log line to append")
+    worker_id: Optional[str] = Field(None, description="Reporting worker (extends its queue lease)")
 
 
 class JobResponse(BaseModel):
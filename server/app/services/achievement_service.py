@@ -1,6 +1,6 @@
 """Achievement service for checking and awarding achievements."""
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
@@ -76,6 +76,66 @@ class AchievementService:
 
         return newly_unlocked
 
+    async def check_achievements_batch(
+        self,
+        game_results: List[GameResult],
+        users: Dict[int, User],
+        apply_stats: Optional[Callable[[User, GameResult], None]] = None,
+    ) -> List[List[str]]:
+        """
+        Check achievements for a batch of flushed game results.
+
+        Loads unlocked achievements for every user in one query and adds the
+        new UserAchievement rows without committing (the caller commits).
+        Returns newly unlocked achievement IDs per result, in order.
+
+        ``apply_stats(user, result)`` is called for each result right before
+        its checks, so cumulative achievements (games played, total kills)
+        unlock on the game that actually crossed the threshold.
+        """
+        user_ids = {result.user_id for result in game_results}
+        unlocked_query = select(
+            UserAchievement.user_id, UserAchievement.achievement_id
+        ).where(UserAchievement.user_id.in_(user_ids))
+        unlocked_result = await self.db.execute(unlocked_query)
+
+        unlocked_ids: Dict[int, set] = {user_id: set() for user_id in user_ids}
+        for user_id, achievement_id in unlocked_result.all():
+            unlocked_ids[user_id].add(achievement_id)
+
+        newly_unlocked: List[List[str]] = []
+        new_rows = []
+        for game_result in game_results:
+            user = users.get(game_result.user_id)
+            awarded = []
+            if user:
+                if apply_stats:
+                    apply_stats(user, game_result)
+                already = unlocked_ids[game_result.user_id]
+                for achievement_id, checker in ACHIEVEMENT_CHECKERS.items():
+                    if achievement_id in already:
+                        continue
+                    try:
+                        if checker(game_result, user):
+                            new_rows.append(UserAchievement(
+                                user_id=user.id,
+                                achievement_id=achievement_id,
+                                unlocked_at=datetime.utcnow(),
+                                game_id=game_result.id,
+                            ))
+                            # Same user may appear twice in one batch
+                            already.add(achievement_id)
+                            awarded.append(achievement_id)
+                    except Exception:
+                        # Skip on any checker error
+                        continue
+            newly_unlocked.append(awarded)
+
+        if new_rows:
+            self.db.add_all(new_rows)
+
+        return newly_unlocked
+
     async def get_user_achievements(
         self,
         user_id: int,
@@ -5,6 +5,7 @@ from typing import Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.security import password_hasher
 from ..models.user import User
 from ..schemas.user import UserCreate
 
@@ -48,6 +49,7 @@ class AuthService:
 
         Raises:
             ValueError: If username or email already exists
+            AuthBusyError: If the password hashing pool is saturated
         """
         # Check if username exists
         existing = await self.get_user_by_username(user_data.username)
@@ -63,7 +65,7 @@ class AuthService:
         user = User(
             username=user_data.username.lower(),
             email=user_data.email.lower(),
-            hashed_password=User.hash_password(user_data.password),
+            hashed_password=await password_hasher.hash(user_data.password),
             display_name=user_data.display_name,
         )
 
@@ -85,11 +87,14 @@ class AuthService:
 
         Returns:
             The User if authentication succeeds, None otherwise
+
+        Raises:
+            AuthBusyError: If the password hashing pool is saturated
         """
         user = await self.get_user_by_username(username)
         if not user:
             return None
-        if not user.verify_password(password):
+        if not await password_hasher.verify(password, user.hashed_password):
             return None
         if not user.is_active:
             return None
@@ -163,7 +168,7 @@ class AuthService:
         user = User(
             username=demo_username,
             email=demo_email,
-            hashed_password=User.hash_password(demo_password),
+            hashed_password=await password_hasher.hash(demo_password),
             display_name=demo_display_name,
         )
 
@@ -8,7 +8,7 @@ This package contains:
 """
 
 from .session import GameSession
-from .manager import GameSessionManager, GAME_ENGINE_AVAILABLE
+from .manager import GameSessionManager, load_game_engine, warm_game_engine, ensure_game_engine
 
 # Global session manager instance
 session_manager = GameSessionManager()
@@ -17,5 +17,7 @@ __all__ = [
     'GameSession',
     'GameSessionManager',
     'session_manager',
-    'GAME_ENGINE_AVAILABLE',
+    'load_game_engine',
+    'warm_game_engine',
+    'ensure_game_engine',
 ]
@@ -1,17 +1,24 @@
 """GameSessionManager - manages active game sessions for all connected users."""
 import sys
 import os
+import logging
 from typing import Dict, Optional, Any, List
 from datetime import datetime
 import asyncio
+import threading
+import time
 import uuid
 
+from ...core.startup_profile import startup_profile
+from ..ghost_pool import ghost_pool
 from ..ghost_recorder import GhostRecorder
 from .session import GameSession
 from .view import serialize_visible_tiles, serialize_first_person_view
 from .cheats import process_cheat
 from . import manager_serialization
 
+logger = logging.getLogger(__name__)
+
 # Add game source parent to path for importing engine as a package
 # In Docker: /app (parent of game_src), Local: ../../../.. (parent of src)
 # The src directory is mounted as game_src, so we import from game_src.core
@@ -24,35 +31,96 @@ for path in game_parent_paths:
     if os.path.exists(abs_path) and abs_path not in sys.path:
         sys.path.insert(0, abs_path)
 
-# Import game engine components - try both package names
-try:
-    # Docker: src is mounted as game_src
-    from game_src.core.engine import GameEngine
-    from game_src.core.commands import Command, CommandType
-    from game_src.core.constants import GameState, UIMode, Race, PlayerClass, RACE_STATS, CLASS_STATS
-    GAME_ENGINE_AVAILABLE = True
-except ImportError:
-    try:
-        # Local: use src directly
-        from src.core.engine import GameEngine
-        from src.core.commands import Command, CommandType
-        from src.core.constants import GameState, UIMode, Race, PlayerClass, RACE_STATS, CLASS_STATS
-        GAME_ENGINE_AVAILABLE = True
-    except ImportError as e:
-        print(f"Warning: Could not import game engine: {e}")
-        GAME_ENGINE_AVAILABLE = False
-        GameEngine = None
-        Command = None
-        CommandType = None
-        GameState = None
-        UIMode = None
-        Race = None
-        PlayerClass = None
-        RACE_STATS = {}
-        CLASS_STATS = {}
-
-# Initialize serialization module with game constants
-manager_serialization.set_game_constants(RACE_STATS, CLASS_STATS, UIMode)
+# Game engine components, imported by load_game_engine() on first use so
+# the server can start (and serve non-game routes) without paying for the
+# whole src tree up front
+GAME_ENGINE_AVAILABLE = False
+GameEngine = None
+Command = None
+CommandType = None
+GameState = None
+UIMode = None
+Race = None
+PlayerClass = None
+RACE_STATS = {}
+CLASS_STATS = {}
+RunRecording = None
+new_run_seed = None
+
+_engine_loaded = False
+_engine_lock = threading.Lock()
+_engine_warmup: Optional[asyncio.Future] = None
+
+
+def load_game_engine() -> bool:
+    """Import the game engine on first call. Returns whether it is available."""
+    global _engine_loaded, GAME_ENGINE_AVAILABLE
+    global GameEngine, Command, CommandType, GameState, UIMode, Race, PlayerClass
+    global RACE_STATS, CLASS_STATS, RunRecording, new_run_seed
+
+    if _engine_loaded:
+        return GAME_ENGINE_AVAILABLE
+
+    with _engine_lock:
+        if _engine_loaded:
+            return GAME_ENGINE_AVAILABLE
+
+        start = time.perf_counter()
+        # Try both package names
+        try:
+            # Docker: src is mounted as game_src
+            from game_src.core.engine import GameEngine
+            from game_src.core.commands import Command, CommandType
+            from game_src.core.constants import GameState, UIMode, Race, PlayerClass, RACE_STATS, CLASS_STATS
+            from game_src.core.replay import RunRecording, new_run_seed
+            GAME_ENGINE_AVAILABLE = True
+        except ImportError:
+            try:
+                # Local: use src directly
+                from src.core.engine import GameEngine
+                from src.core.commands import Command, CommandType
+                from src.core.constants import GameState, UIMode, Race, PlayerClass, RACE_STATS, CLASS_STATS
+                from src.core.replay import RunRecording, new_run_seed
+                GAME_ENGINE_AVAILABLE = True
+            except ImportError as e:
+                print(f"Warning: Could not import game engine: {e}")
+                GAME_ENGINE_AVAILABLE = False
+
+        # Initialize serialization module with game constants
+        manager_serialization.set_game_constants(RACE_STATS, CLASS_STATS, UIMode)
+        startup_profile.record_lazy_load("game_engine", (time.perf_counter() - start) * 1000)
+        _engine_loaded = True
+        return GAME_ENGINE_AVAILABLE
+
+
+def warm_game_engine() -> asyncio.Future:
+    """Start importing the game engine in the default executor (once).
+
+    Returns the pending import; a failed import is logged and forgotten so
+    the next caller tries again.
+    """
+    global _engine_warmup
+    if _engine_warmup is None:
+        _engine_warmup = asyncio.get_running_loop().run_in_executor(None, load_game_engine)
+        _engine_warmup.add_done_callback(_warmup_done)
+    return _engine_warmup
+
+
+def _warmup_done(future: asyncio.Future):
+    global _engine_warmup
+    if future.cancelled() or future.exception() is None:
+        return
+    logger.error("Game engine import failed", exc_info=future.exception())
+    if _engine_warmup is future:
+        _engine_warmup = None
+
+
+async def ensure_game_engine() -> bool:
+    """load_game_engine() for async callers, without blocking the event loop."""
+    if _engine_loaded:
+        return GAME_ENGINE_AVAILABLE
+    # Shielded so a caller that goes away doesn't cancel the shared import
+    return await asyncio.shield(warm_game_engine())
 
 
 class GameSessionManager:
@@ -85,7 +153,7 @@ class GameSessionManager:
         Returns:
             The created GameSession, or None if engine not available
         """
-        if not GAME_ENGINE_AVAILABLE:
+        if not await ensure_game_engine():
             return None
 
         async with self._lock:
@@ -109,18 +177,22 @@ class GameSessionManager:
                 except (KeyError, AttributeError):
                     pass  # Invalid class, use defaults
 
-            # Create new engine and session
+            # Create new engine and session (seeded so the run can be replayed)
+            seed = new_run_seed()
             engine = GameEngine()
-            engine.start_new_game(race=parsed_race, player_class=parsed_class)
 
-            # Get dungeon seed if available
-            dungeon_seed = getattr(engine.dungeon, 'seed', None) if engine.dungeon else None
+            # v7.2: Command log for deterministic replay / verification
+            recording = RunRecording(
+                seed=seed,
+                race=parsed_race.name if parsed_race else None,
+                player_class=parsed_class.name if parsed_class else None,
+            )
 
             # Create ghost recorder
             ghost_recorder = GhostRecorder(
                 user_id=user_id,
                 username=username,
-                dungeon_seed=dungeon_seed,
+                dungeon_seed=seed,
             )
 
             session = GameSession(
@@ -129,11 +201,40 @@ class GameSessionManager:
                 username=username,
                 engine=engine,
                 ghost_recorder=ghost_recorder,
+                recording=recording,
             )
 
+            # Floor ghosts come from the in-memory ghost pool; floor 1's are
+            # already there, later floors are prefetched during play
+            session.ghost_floors[1] = ghost_pool.get(1)
+            engine.ghost_manager.ghost_provider = session.ghosts_for_floor
+            engine.start_new_game(race=parsed_race, player_class=parsed_class, seed=seed)
+            self.prefetch_ghosts(session)
+
             self.sessions[user_id] = session
             return session
 
+    def prefetch_ghosts(self, session: GameSession):
+        """Start fetching the next floor's ghosts if they aren't ready yet.
+
+        Runs in the background so descending never waits on the database;
+        a floor reached before its ghosts arrive falls back to procedural
+        ghosts.
+        """
+        engine = session.engine
+        next_floor = engine.current_level + 1
+        if next_floor in session.ghost_floors:
+            return
+        if session.ghost_prefetch and not session.ghost_prefetch.done():
+            return
+
+        async def fetch():
+            ghosts = await ghost_pool.fetch(next_floor)
+            # Doesn't replace ghosts a floor was already built with
+            session.ghost_floors.setdefault(next_floor, ghosts)
+
+        session.ghost_prefetch = asyncio.create_task(fetch())
+
     async def get_session(self, user_id: int) -> Optional[GameSession]:
         """Get the active session for a user."""
         return self.sessions.get(user_id)
@@ -150,6 +251,8 @@ class GameSessionManager:
         """
         async with self._lock:
             session = self.sessions.pop(user_id, None)
+            if session and session.ghost_prefetch:
+                session.ghost_prefetch.cancel()
             if session and session.engine:
                 # Extract comprehensive final stats
                 engine = session.engine
@@ -206,6 +309,7 @@ class GameSessionManager:
                     "turns_taken": session.turn_count,
                     "started_at": session.created_at.isoformat() if session.created_at else None,
                     "ghost_data": ghost_data,
+                    "replay_data": session.recording.to_json() if session.recording else None,
                 }
 
                 return stats
@@ -255,56 +359,37 @@ class GameSessionManager:
         if cmd_type == CommandType.SELECT_FEAT:
             feat_id = data.get("feat_id") if data else None
             if feat_id and engine.player and engine.player.pending_feat_selection:
-                # Get feat name from player's available feats list
-                available = engine.player.get_available_feats_info()
-                feat_name = feat_id
-                for f in available:
-                    if f['id'] == feat_id:
-                        feat_name = f['name']
-                        break
-                if engine.player.add_feat(feat_id):
-                    engine.add_message(f"You learned the {feat_name} feat!")
-                else:
+                if not engine.select_feat(feat_id):
                     return {"error": f"Cannot select feat: {feat_id}"}
+                if session.recording:
+                    session.recording.record(cmd_type.name, {"feat_id": feat_id})
             return self.serialize_game_state(session, [])
 
         # Handle cheat commands (dev/testing)
         if command_type.upper().startswith("CHEAT_"):
             process_cheat(engine, cmd_type)
+            if session.recording:
+                session.recording.cheated = True
             return self.serialize_game_state(session, [])
 
         command = Command(cmd_type, data=data)
 
-        # Process based on current game state
-        player_acted = False
-        if engine.state == GameState.PLAYING:
-            if engine.ui_mode == UIMode.GAME:
-                player_acted = engine.process_game_command(command)
-                if player_acted:
-                    session.turn_count += 1
-                    session.last_action = command_type.upper()
-            elif engine.ui_mode == UIMode.INVENTORY:
-                engine.process_inventory_command(command)
-            elif engine.ui_mode == UIMode.DIALOG:
-                engine.process_dialog_command(command)
-            elif engine.ui_mode == UIMode.MESSAGE_LOG:
-                engine.process_message_log_command(command)
-            elif engine.ui_mode == UIMode.CHARACTER:
-                engine.process_character_command(command)
-            elif engine.ui_mode in (UIMode.HELP, UIMode.READING):
-                # These close on any command
-                if cmd_type == CommandType.CLOSE_SCREEN:
-                    engine.ui_mode = UIMode.GAME
-            elif engine.ui_mode == UIMode.BATTLE:
-                # v6.0: Process tactical battle commands
-                player_acted = engine.process_battle_command(command)
-                if player_acted:
-                    session.turn_count += 1
-                    session.last_action = command_type.upper()
+        # v7.2: Record exactly what the engine processes (after input lock)
+        if session.recording:
+            session.recording.record(cmd_type.name, data)
+
+        # Process based on current game state and UI mode
+        player_acted = engine.dispatch_command(command)
+        if player_acted:
+            session.turn_count += 1
+            session.last_action = command_type.upper()
 
         # Get events generated by the command
         events = engine.flush_events()
 
+        # Have the next floor's ghosts ready before the player gets there
+        self.prefetch_ghosts(session)
+
         # Record ghost frame if player acted
         if player_acted and session.ghost_recorder and engine.player:
             # Extract damage info from events
@@ -406,8 +491,9 @@ class GameSessionManager:
             state["enemies"] = manager_serialization.serialize_enemies(engine)
             state["items"] = manager_serialization.serialize_items(engine)
 
-        # Add messages
+        # Add messages (clients fetch older/full history with get_messages)
         state["messages"] = engine.messages[-10:] if engine.messages else []
+        state["message_seq"] = engine.message_log.latest_seq
 
         # Add events for animations
         state["events"] = manager_serialization.serialize_events(
@@ -460,6 +546,10 @@ class GameSessionManager:
 
         return state
 
+    def get_messages(self, session: GameSession, since: int = 0) -> dict:
+        """Messages logged after a client's last seen sequence number."""
+        return manager_serialization.serialize_messages_since(session.engine, since)
+
     def get_active_session_count(self) -> int:
         """Get the number of active game sessions."""
         return len(self.sessions)
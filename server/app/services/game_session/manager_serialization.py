@@ -146,6 +146,27 @@ def serialize_events(events: List, sanitize_func) -> List[dict]:
     return events_list
 
 
+def serialize_messages_since(engine, since: int) -> dict:
+    """Messages newer than a client's cursor (MessageLog sequence number)."""
+    log = engine.message_log
+    messages = log.get_since(since)
+    return {
+        "type": "messages",
+        "seq": log.latest_seq,
+        # Older messages than the cursor asked for were already dropped
+        "truncated": bool(messages) and messages[0].seq > since + 1,
+        "messages": [
+            {
+                "seq": m.seq,
+                "text": m.text,
+                "category": m.category.name,
+                "importance": m.importance.name,
+            }
+            for m in messages
+        ],
+    }
+
+
 def serialize_inventory(engine) -> dict:
     """Serialize inventory UI data."""
     inventory_items = []
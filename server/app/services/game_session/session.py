@@ -1,5 +1,5 @@
 """GameSession dataclass - represents an active game session."""
-from typing import Optional, Any, List
+from typing import Optional, Any, Dict, List
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -12,12 +12,27 @@ class GameSession:
     username: str
     engine: Any  # GameEngine instance
     ghost_recorder: Optional['GhostRecorder'] = None
+    recording: Optional[Any] = None  # RunRecording command log for replay
     created_at: datetime = field(default_factory=datetime.utcnow)
     last_activity: datetime = field(default_factory=datetime.utcnow)
     turn_count: int = 0
     last_action: str = ""  # Last action taken for ghost recording
     allow_spectators: bool = True  # Whether this session allows spectators
     spectator_websockets: List[Any] = field(default_factory=list)  # WebSocket connections
+    ghost_floors: Dict[int, List[dict]] = field(default_factory=dict)  # Prefetched ghost pool entries
+    ghost_prefetch: Optional[Any] = None  # asyncio.Task fetching the next floor's ghosts
+
+    def ghosts_for_floor(self, floor: int) -> Optional[List[dict]]:
+        """GhostManager provider: prefetched ghosts for a floor, never blocks.
+
+        A floor's ghosts are fixed the first time it is built (empty if the
+        prefetch hadn't finished) and added to the replay recording, so the
+        run still replays deterministically.
+        """
+        ghost_data = self.ghost_floors.setdefault(floor, [])
+        if self.recording:
+            self.recording.record_ghosts(floor, ghost_data)
+        return ghost_data
 
     def update_activity(self):
         """Update last activity timestamp."""
@@ -156,6 +156,7 @@ def serialize_first_person_view(engine, facing: tuple) -> dict:
 
     rows = []
     entities_in_view = []
+    visible_positions = []
 
     # Start from depth 0 (tiles beside player) for accurate side wall detection
     for d in range(0, depth + 1):
@@ -310,6 +311,7 @@ def serialize_first_person_view(engine, facing: tuple) -> dict:
                     tile_data["visual"] = visual_data
 
                 row.append(tile_data)
+                visible_positions.append((tile_x, tile_y))
             elif in_bounds and dungeon.explored[tile_y][tile_x]:
                 # Get actual tile for geometry even though display shows fog
                 actual_tile = dungeon.tiles[tile_y][tile_x]
@@ -334,7 +336,11 @@ def serialize_first_person_view(engine, facing: tuple) -> dict:
     # Serialize torches in view
     torches_in_view = []
     if hasattr(engine, 'torch_manager') and engine.torch_manager:
-        for torch in engine.torch_manager.torches:
+        # Only torches within view distance (the cone check below is Euclidean)
+        nearby_torches = engine.torch_manager.get_torches_in_rect(
+            player.x - depth, player.y - depth, player.x + depth, player.y + depth
+        )
+        for torch in nearby_torches:
             if not torch.is_lit:
                 continue
 
@@ -488,6 +494,8 @@ def serialize_first_person_view(engine, facing: tuple) -> dict:
         "rows": rows,
         "entities": entities_in_view,
         "torches": torches_in_view,
+        # Hazards on visible tiles: {type: [x, y, intensity, ...]}
+        "hazards": engine.hazard_manager.to_compact(visible_positions) if getattr(engine, 'hazard_manager', None) else {},
         "lighting": lighting,
         "facing": {"dx": facing_dx, "dy": facing_dy},
         "depth": depth,
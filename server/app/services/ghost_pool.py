@@ -0,0 +1,210 @@
+"""In-memory pool of recorded ghosts per floor.
+
+GhostService.get_ghosts_for_level joins users, scans results by score and
+parses every candidate's full frame log on each call - far too slow for the
+floor-change path. This pool is built once from completed runs, refreshed in
+the background, and updated incrementally as new results are recorded, so
+picking a floor's ghosts is a dict lookup.
+
+Entries hold only what GhostManager's spawner reads (victory, cause of
+death, killer, username), not the frames, so a pool entry can be handed to
+the engine and stored in a run's replay recording as-is.
+
+Each server process keeps its own pool; game sessions live in-process too.
+Sessions prefetch the next floor's ghosts with ``fetch`` while the player is
+still on the current one (see GameSessionManager.prefetch_ghosts).
+"""
+import asyncio
+import bisect
+import json
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import desc, select
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..models.game_result import GameResult
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+# (score, game_id, user_id, username, ghost_data JSON) for one result
+GhostRow = Tuple[int, int, int, str, str]
+
+
+def index_ghost(row: GhostRow) -> List[Tuple[int, dict]]:
+    """(floor, pool entry) for each floor a recorded run has frames on."""
+    score, game_id, user_id, username, ghost_json = row
+    try:
+        data = json.loads(ghost_json)
+    except (TypeError, ValueError):
+        return []
+    floors = {frame.get("dungeon_level") for frame in data.get("frames", ())}
+    floors.discard(None)
+    entry = {
+        "game_id": game_id,
+        "user_id": user_id,
+        "username": username or data.get("username", "Unknown"),
+        "score": score or 0,
+        "victory": bool(data.get("victory")),
+        "cause_of_death": data.get("cause_of_death"),
+        "killed_by": data.get("killed_by"),
+        "final_level": data.get("final_level", 1),
+    }
+    return [(floor, entry) for floor in sorted(floors)]
+
+
+def build_floors(rows: List[GhostRow], per_floor: int) -> Dict[int, List[dict]]:
+    """Group rows (best score first) into per-floor lists of per_floor entries."""
+    floors: Dict[int, List[dict]] = {}
+    for row in rows:
+        for floor, entry in index_ghost(row):
+            entries = floors.setdefault(floor, [])
+            if len(entries) < per_floor:
+                entries.append(entry)
+    return floors
+
+
+class GhostPool:
+    """Per-floor ghost entries, best scores first."""
+
+    def __init__(
+        self,
+        per_floor: int = settings.ghost_pool_per_floor,
+        refresh_seconds: float = settings.ghost_pool_refresh_seconds,
+        scan_limit: int = settings.ghost_pool_scan_limit,
+    ):
+        self.per_floor = per_floor
+        self.refresh_seconds = refresh_seconds
+        self.scan_limit = scan_limit
+        self._floors: Dict[int, List[dict]] = {}
+        # Rows added while a refresh query runs, replayed onto its result
+        self._added_during_refresh: Optional[List[GhostRow]] = None
+        self._ready = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+
+        # Counters for status reporting
+        self.refreshes = 0
+        self.failed_refreshes = 0
+        self.last_refresh_ms = 0.0
+        self.last_refresh_at: Optional[float] = None
+        self.added = 0
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self):
+        """Start the background refresher (first refresh runs immediately)."""
+        if self._worker and not self._worker.done():
+            return
+        self._worker = asyncio.create_task(self._run(), name="ghost-pool")
+
+    async def stop(self):
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.failed_refreshes += 1
+                logger.warning("Ghost pool refresh failed: %s", e)
+            await asyncio.sleep(self.refresh_seconds)
+
+    async def refresh(self):
+        """Rebuild every floor from the highest-scoring recorded runs."""
+        started = time.perf_counter()
+        query = (
+            select(GameResult.score, GameResult.id, GameResult.user_id,
+                   User.username, GameResult.ghost_data)
+            .join(User, User.id == GameResult.user_id)
+            .where(GameResult.ghost_data.isnot(None))
+            .order_by(desc(GameResult.score))
+            .limit(self.scan_limit)
+        )
+        self._added_during_refresh = added = []
+        try:
+            async with AsyncSessionLocal() as db:
+                rows = [tuple(row) for row in (await db.execute(query)).all()]
+
+            # Parsing ghost JSON is CPU work; keep it off the event loop
+            loop = asyncio.get_running_loop()
+            floors = await loop.run_in_executor(None, build_floors, rows, self.per_floor)
+        finally:
+            if self._added_during_refresh is added:
+                self._added_during_refresh = None
+
+        # Results recorded since the query ran may be missing from its rows
+        for row in added:
+            self._insert(floors, row)
+        self._floors = floors
+
+        self.refreshes += 1
+        self.last_refresh_ms = (time.perf_counter() - started) * 1000
+        self.last_refresh_at = time.time()
+        self._ready.set()
+
+    # =========================================================================
+    # Updates and lookups
+    # =========================================================================
+
+    def add_result(self, result, username: Optional[str] = None):
+        """Index a newly recorded GameResult without waiting for a refresh."""
+        if not getattr(result, "ghost_data", None):
+            return
+        row = (result.score or 0, result.id, result.user_id, username, result.ghost_data)
+        self._insert(self._floors, row)
+        if self._added_during_refresh is not None:
+            self._added_during_refresh.append(row)
+        self.added += 1
+
+    def _insert(self, floors: Dict[int, List[dict]], row: GhostRow):
+        """Place a row's entries by score, skipping floors that already list it."""
+        for floor, entry in index_ghost(row):
+            current = floors.get(floor, ())
+            if any(e["game_id"] == entry["game_id"] for e in current):
+                continue
+            # Copy-on-write so lists already handed to sessions never change
+            entries = list(current)
+            scores = [-e["score"] for e in entries]
+            entries.insert(bisect.bisect_right(scores, -entry["score"]), entry)
+            floors[floor] = entries[:self.per_floor]
+
+    def get(self, floor: int) -> List[dict]:
+        """A floor's ghost entries (don't mutate). Empty until loaded."""
+        return self._floors.get(floor, [])
+
+    async def fetch(self, floor: int, timeout: float = 30.0) -> List[dict]:
+        """A floor's entries, waiting (up to timeout) for the first load."""
+        if not self._ready.is_set():
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self.get(floor)
+
+    def get_status(self) -> dict:
+        return {
+            "running": bool(self._worker and not self._worker.done()),
+            "ready": self._ready.is_set(),
+            "floors": len(self._floors),
+            "ghosts": sum(len(entries) for entries in self._floors.values()),
+            "refreshes": self.refreshes,
+            "failed_refreshes": self.failed_refreshes,
+            "added": self.added,
+            "last_refresh_ms": round(self.last_refresh_ms, 2),
+            "last_refresh_at": self.last_refresh_at,
+        }
+
+
+# Global pool instance (started/stopped by the app lifespan)
+ghost_pool = GhostPool()
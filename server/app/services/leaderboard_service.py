@@ -1,6 +1,6 @@
 """Leaderboard service for querying game results and rankings."""
 from datetime import datetime, timedelta
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 from sqlalchemy import select, func, desc, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
@@ -38,11 +38,12 @@ class LeaderboardService:
         turns_taken: int = 0,
         ghost_data: Optional[str] = None,
         started_at: Optional[datetime] = None,
+        replay_data: Optional[str] = None,
     ) -> GameResult:
         """Record a completed game and update user stats."""
 
         # Create game result
-        result = GameResult(
+        result = self._build_result(
             user_id=user_id,
             victory=victory,
             level_reached=level_reached,
@@ -60,13 +61,10 @@ class LeaderboardService:
             game_duration_seconds=game_duration_seconds,
             turns_taken=turns_taken,
             ghost_data=ghost_data,
-            started_at=started_at or datetime.utcnow(),
-            ended_at=datetime.utcnow(),
+            replay_data=replay_data,
+            started_at=started_at,
         )
 
-        # Calculate score
-        result.score = result.calculate_score()
-
         self.db.add(result)
 
         # Update user stats
@@ -75,25 +73,92 @@ class LeaderboardService:
         user = user_result.scalar_one_or_none()
 
         if user:
-            user.games_played += 1
-            user.total_kills += kills
+            self._apply_user_stats(user, result)
 
-            if victory:
-                user.victories += 1
+        await self.db.commit()
+        await self.db.refresh(result)
+
+        return result
 
-            if not victory:
-                user.total_deaths += 1
+    @staticmethod
+    def _build_result(
+        user_id: int,
+        replay_data: Optional[str] = None,
+        started_at: Optional[datetime] = None,
+        ended_at: Optional[datetime] = None,
+        **stats,
+    ) -> GameResult:
+        """Create a scored GameResult row (not yet added to the session)."""
+        result = GameResult(
+            user_id=user_id,
+            replay_data=replay_data,
+            verification_status="pending" if replay_data else "unverified",
+            started_at=started_at or datetime.utcnow(),
+            ended_at=ended_at or datetime.utcnow(),
+            **stats,
+        )
 
-            if level_reached > user.max_level_reached:
-                user.max_level_reached = level_reached
+        # Calculate score
+        result.score = result.calculate_score()
+        return result
 
-            if result.score > user.high_score:
-                user.high_score = result.score
+    @staticmethod
+    def _apply_user_stats(user: User, result: GameResult):
+        """Fold a finished game into the user's lifetime stats."""
+        user.games_played += 1
+        user.total_kills += result.kills
+
+        if result.victory:
+            user.victories += 1
+
+        if not result.victory:
+            user.total_deaths += 1
+
+        if result.level_reached > user.max_level_reached:
+            user.max_level_reached = result.level_reached
+
+        if result.score > user.high_score:
+            user.high_score = result.score
+
+    async def record_game_results_batch(
+        self,
+        entries: List[dict],
+    ) -> List[Tuple[GameResult, List[str]]]:
+        """Record many finished games in one transaction.
+
+        Results are bulk-inserted, users are loaded with a single query and
+        achievements are evaluated for the whole batch before one commit.
+        Each result's stats are folded into its user just before that
+        result's achievements are checked, so a user with two games in the
+        batch is judged on each game with only the stats up to it.
+
+        Args:
+            entries: Dicts of record_game_result keyword arguments
+
+        Returns:
+            (game_result, newly unlocked achievement IDs) per entry, in order
+        """
+        if not entries:
+            return []
+
+        results = [self._build_result(**entry) for entry in entries]
+
+        user_ids = {result.user_id for result in results}
+        user_rows = await self.db.execute(select(User).where(User.id.in_(user_ids)))
+        users = {user.id: user for user in user_rows.scalars().all()}
+
+        self.db.add_all(results)
+        await self.db.flush()  # Assign result IDs for achievement rows
+
+        from .achievement_service import AchievementService
+        achievement_service = AchievementService(self.db)
+        unlocked = await achievement_service.check_achievements_batch(
+            results, users, apply_stats=self._apply_user_stats
+        )
 
         await self.db.commit()
-        await self.db.refresh(result)
 
-        return result
+        return list(zip(results, unlocked))
 
     async def record_game_result_with_achievements(
         self,
@@ -115,6 +180,7 @@ class LeaderboardService:
         turns_taken: int = 0,
         ghost_data: Optional[str] = None,
         started_at: Optional[datetime] = None,
+        replay_data: Optional[str] = None,
     ) -> tuple[GameResult, List[str]]:
         """Record a game and check for new achievements.
 
@@ -140,6 +206,7 @@ class LeaderboardService:
             turns_taken=turns_taken,
             ghost_data=ghost_data,
             started_at=started_at,
+            replay_data=replay_data,
         )
 
         # Check for achievements
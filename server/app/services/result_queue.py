@@ -0,0 +1,363 @@
+"""Background queue for recording finished runs.
+
+Ending a run used to insert the result, update user stats and evaluate every
+achievement inline on the websocket path. Finished runs are now submitted to
+an in-process asyncio queue and written in batches (one transaction per
+batch), so the player's final screen never waits on the database and bursts
+of deaths don't serialize on it.
+
+Records that can't be written (database down, queue full, shutdown) are
+appended to a local JSONL spool file and re-queued on the next start or
+after the next successful batch. When a batch fails its records are retried
+one at a time, so a single bad record can't hold back the rest; a record
+that still fails alone counts an attempt, and after max_attempts it moves
+to a dead-letter file instead of cycling through the spool forever.
+Failures that mean the database is unreachable (connection and
+operational errors) are never held against a record: the records are
+spooled as they are.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, List, Optional
+
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from .leaderboard_service import LeaderboardService
+
+logger = logging.getLogger(__name__)
+
+# Stats keys copied from end_session() into GameResult columns
+RESULT_FIELDS = {
+    "victory": False,
+    "level_reached": 1,
+    "kills": 0,
+    "damage_dealt": 0,
+    "damage_taken": 0,
+    "final_hp": 0,
+    "max_hp": 0,
+    "player_level": 1,
+    "potions_used": 0,
+    "items_collected": 0,
+    "gold_collected": 0,
+    "cause_of_death": None,
+    "killed_by": None,
+    "game_duration_seconds": 0,
+    "turns_taken": 0,
+    "ghost_data": None,
+    "replay_data": None,
+}
+
+# Minimum seconds between spool re-reads after a successful batch
+SPOOL_RETRY_INTERVAL = 30.0
+
+# Bookkeeping key on spooled records: failed solo writes so far
+ATTEMPTS_KEY = "attempts"
+
+# Called after a batch commits: (user_id, game_result, new achievement IDs)
+RecordedCallback = Callable[[int, object, List[str]], Awaitable[None]]
+
+
+def _is_outage(error: Exception) -> bool:
+    """Whether a write failed because the database is unreachable."""
+    if isinstance(error, (OperationalError, InterfaceError, OSError, asyncio.TimeoutError)):
+        return True
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
+
+def _parse_datetime(value) -> Optional[datetime]:
+    if isinstance(value, datetime) or value is None:
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class GameResultQueue:
+    """Batched, non-blocking writer for finished game results."""
+
+    def __init__(
+        self,
+        batch_size: int = settings.result_queue_batch_size,
+        flush_seconds: float = settings.result_queue_flush_seconds,
+        max_pending: int = settings.result_queue_max_pending,
+        spool_path: str = settings.result_queue_spool_path,
+        dead_letter_path: str = settings.result_queue_dead_letter_path,
+        max_attempts: int = settings.result_queue_max_attempts,
+    ):
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.spool_path = spool_path
+        self.dead_letter_path = dead_letter_path
+        self.max_attempts = max_attempts
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._worker: Optional[asyncio.Task] = None
+        self._on_recorded: Optional[RecordedCallback] = None
+        self._last_spool_retry = 0.0
+
+        # Counters for /api/status style reporting
+        self.recorded = 0
+        self.batches = 0
+        self.spooled = 0
+        self.dead_lettered = 0
+        self.failed_batches = 0
+        self.last_batch_ms = 0.0
+
+    def set_recorded_callback(self, callback: Optional[RecordedCallback]):
+        """Register a coroutine notified once each record is committed."""
+        self._on_recorded = callback
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self):
+        """Re-queue spooled records and start the background writer."""
+        if self._worker and not self._worker.done():
+            return
+        self._requeue_spool()
+        self._worker = asyncio.create_task(self._run(), name="game-result-queue")
+
+    async def stop(self):
+        """Flush what we can, then spool anything left for the next start."""
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        remaining = self._drain(self._queue.qsize())
+        if remaining:
+            try:
+                recorded = await self._write_batch(remaining)
+            except Exception as e:
+                logger.warning("Final result flush failed, spooling: %s", e)
+                self._spool(remaining)
+            else:
+                await self._notify(recorded)
+
+    # =========================================================================
+    # Producer API
+    # =========================================================================
+
+    def submit(self, user_id: int, stats: Optional[dict]) -> bool:
+        """
+        Queue a finished run for recording. Never blocks.
+
+        Args:
+            user_id: The user's ID
+            stats: Game stats from end_session
+
+        Returns:
+            True if queued (or spooled), False if there was nothing to record
+        """
+        if not stats:
+            return False
+
+        record = {"user_id": user_id, "ended_at": datetime.utcnow().isoformat()}
+        for key, default in RESULT_FIELDS.items():
+            record[key] = stats.get(key, default)
+        record["started_at"] = stats.get("started_at")
+
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            self._spool([record])
+        return True
+
+    def get_status(self) -> dict:
+        """Queue depth and throughput counters."""
+        return {
+            "running": bool(self._worker and not self._worker.done()),
+            "pending": self._queue.qsize(),
+            "recorded": self.recorded,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "spooled": self.spooled,
+            "dead_lettered": self.dead_lettered,
+            "last_batch_ms": round(self.last_batch_ms, 2),
+        }
+
+    # =========================================================================
+    # Worker
+    # =========================================================================
+
+    async def _run(self):
+        # Records taken off the queue but not yet committed or spooled.
+        # stop() cancels the worker, and CancelledError bypasses the
+        # except-Exception below, so they are spooled on the way out.
+        pending: List[dict] = []
+        try:
+            while True:
+                # Wait for the first record, then give stragglers a short window
+                pending = [await self._queue.get()]
+                deadline = time.monotonic() + self.flush_seconds
+                while len(pending) < self.batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        pending.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                try:
+                    recorded = await self._write_batch(pending)
+                except Exception as e:
+                    self.failed_batches += 1
+                    logger.warning("Recording %d results failed: %s", len(pending), e)
+                    await self._write_singly(pending, e)
+                    pending = []
+                    continue
+                pending = []
+                await self._notify(recorded)
+
+                if time.monotonic() - self._last_spool_retry > SPOOL_RETRY_INTERVAL:
+                    self._requeue_spool()
+        except asyncio.CancelledError:
+            if pending:
+                self._spool(pending)
+            raise
+
+    async def _write_singly(self, batch: List[dict], error: Exception):
+        """Retry a failed batch one record at a time, setting failures aside.
+
+        Records are popped as they are handled, so a cancelled worker spools
+        only the ones not yet tried. If the database turns out to be down,
+        the rest are spooled without counting an attempt.
+        """
+        if _is_outage(error):
+            self._spool(batch[:])
+            batch.clear()
+            return
+        if len(batch) == 1:
+            self._record_failed(batch.pop(), error)
+            return
+        while batch:
+            try:
+                recorded = await self._write_batch(batch[:1])
+            except Exception as e:
+                if _is_outage(e):
+                    logger.warning("Database unavailable, spooling %d results: %s", len(batch), e)
+                    self._spool(batch[:])
+                    batch.clear()
+                    return
+                self._record_failed(batch.pop(0), e)
+                continue
+            batch.pop(0)
+            await self._notify(recorded)
+
+    def _record_failed(self, record: dict, error: Exception):
+        """Spool a record that failed on its own, or dead-letter it past max_attempts."""
+        record = {**record, ATTEMPTS_KEY: record.get(ATTEMPTS_KEY, 0) + 1}
+        if record[ATTEMPTS_KEY] >= self.max_attempts:
+            logger.error("Game result for user %s failed %d times, dead-lettering: %s",
+                         record.get("user_id"), record[ATTEMPTS_KEY], error)
+            self._dead_letter(record)
+        else:
+            self._spool([record])
+
+    async def _write_batch(self, batch: List[dict]) -> list:
+        """Record a batch in one transaction; returns (result, achievement IDs) pairs."""
+        started = time.perf_counter()
+        entries = []
+        for record in batch:
+            entry = dict(record)
+            entry.pop(ATTEMPTS_KEY, None)
+            entry["started_at"] = _parse_datetime(entry.get("started_at"))
+            entry["ended_at"] = _parse_datetime(entry.get("ended_at"))
+            entries.append(entry)
+
+        async with AsyncSessionLocal() as db:
+            service = LeaderboardService(db)
+            recorded = await service.record_game_results_batch(entries)
+
+        self.batches += 1
+        self.recorded += len(recorded)
+        self.last_batch_ms = (time.perf_counter() - started) * 1000
+        return recorded
+
+    async def _notify(self, recorded: list):
+        if self._on_recorded:
+            for result, achievement_ids in recorded:
+                try:
+                    await self._on_recorded(result.user_id, result, achievement_ids)
+                except Exception as e:
+                    logger.debug("Result notification failed: %s", e)
+
+    def _drain(self, limit: int) -> List[dict]:
+        items = []
+        while len(items) < limit:
+            try:
+                items.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return items
+
+    # =========================================================================
+    # Durable spool
+    # =========================================================================
+
+    def _spool(self, records: List[dict]):
+        try:
+            with open(self.spool_path, "a", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+            self.spooled += len(records)
+        except OSError as e:
+            logger.error("Could not spool %d game results: %s", len(records), e)
+
+    def _dead_letter(self, record: dict):
+        """Set a record aside for good; it is never re-queued."""
+        try:
+            with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+            self.dead_lettered += 1
+        except OSError as e:
+            logger.error("Could not dead-letter game result: %s", e)
+
+    def _requeue_spool(self):
+        """Move spooled records back into the queue."""
+        self._last_spool_retry = time.monotonic()
+        if not os.path.exists(self.spool_path):
+            return
+
+        # Rename first so records spooled meanwhile go to a fresh file
+        claimed = f"{self.spool_path}.{os.getpid()}.requeue"
+        try:
+            os.replace(self.spool_path, claimed)
+            with open(claimed, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError as e:
+            logger.error("Could not read result spool: %s", e)
+            return
+
+        overflow = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            try:
+                self._queue.put_nowait(record)
+            except asyncio.QueueFull:
+                overflow.append(record)
+
+        if overflow:
+            self._spool(overflow)
+        os.remove(claimed)
+
+
+# Global queue instance (started/stopped by the app lifespan)
+result_queue = GameResultQueue()
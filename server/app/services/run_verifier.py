@@ -0,0 +1,191 @@
+"""Replay verifier for submitted game results (anti-cheat).
+
+Each finished run stores its command log (``replay_data``). The verifier
+replays those logs through headless GameEngine instances in a process pool
+and compares the replayed final stats with what the session reported.
+Results are written back to ``game_results`` in batched UPDATEs.
+
+Usage (CLI):
+    python scripts/verify_runs.py --batch-size 500 --workers 8
+"""
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.game_result import GameResult
+# Importing the session manager puts the game source on sys.path
+from .game_session.manager import load_game_engine
+
+try:
+    from game_src.core.replay import ISOLATED_RNG_VERSION, RunRecording, replay_run
+except ImportError:
+    try:
+        from src.core.replay import ISOLATED_RNG_VERSION, RunRecording, replay_run
+    except ImportError:
+        ISOLATED_RNG_VERSION = None
+        RunRecording = None
+        replay_run = None
+
+
+# Reported columns that must match the replayed run exactly
+VERIFIED_FIELDS = (
+    "victory",
+    "level_reached",
+    "kills",
+    "final_hp",
+    "max_hp",
+    "player_level",
+    "turns_taken",
+)
+
+STATUS_PENDING = "pending"
+STATUS_VERIFIED = "verified"
+STATUS_MISMATCH = "mismatch"
+STATUS_UNREPLAYABLE = "unreplayable"
+# Not compared: a mismatch would prove nothing (shared-RNG recordings)
+STATUS_UNVERIFIABLE = "unverifiable"
+
+
+def verify_replay(job: dict) -> dict:
+    """
+    Replay one run and compare it to its reported stats.
+
+    Runs inside a worker process; takes and returns plain dicts so it
+    pickles cheaply.
+
+    Args:
+        job: {"id", "replay_data", "reported": {field: value}}
+
+    Returns:
+        {"id", "verification_status", "verification_notes"}
+    """
+    result_id = job["id"]
+    try:
+        recording = RunRecording.from_json(job["replay_data"])
+        if recording.cheated:
+            return {
+                "id": result_id,
+                "verification_status": STATUS_UNREPLAYABLE,
+                "verification_notes": "cheat commands used",
+            }
+        if recording.version < ISOLATED_RNG_VERSION:
+            # Other sessions drew from the same RNG mid-run, so an honest
+            # run need not replay to its reported stats
+            return {
+                "id": result_id,
+                "verification_status": STATUS_UNVERIFIABLE,
+                "verification_notes": f"recorded on the shared RNG (replay v{recording.version})",
+            }
+        replayed = replay_run(recording)
+    except Exception as e:
+        return {
+            "id": result_id,
+            "verification_status": STATUS_UNREPLAYABLE,
+            "verification_notes": f"replay failed: {e}",
+        }
+
+    reported = job["reported"]
+    mismatches = [
+        f"{name}: reported={reported.get(name)} replayed={replayed.get(name)}"
+        for name in VERIFIED_FIELDS
+        if reported.get(name) != replayed.get(name)
+    ]
+    return {
+        "id": result_id,
+        "verification_status": STATUS_MISMATCH if mismatches else STATUS_VERIFIED,
+        "verification_notes": "; ".join(mismatches) or None,
+    }
+
+
+class RunVerifier:
+    """Batch replay verification over pending game results."""
+
+    def __init__(self, db: AsyncSession, workers: Optional[int] = None):
+        self.db = db
+        self.workers = workers or os.cpu_count() or 1
+
+    async def _load_pending(self, batch_size: int, after_id: int) -> List[dict]:
+        """Load the next batch of pending results as worker jobs."""
+        columns = [GameResult.id, GameResult.replay_data] + [
+            getattr(GameResult, name) for name in VERIFIED_FIELDS
+        ]
+        query = (
+            select(*columns)
+            .where(GameResult.verification_status == STATUS_PENDING)
+            .where(GameResult.replay_data.isnot(None))
+            .where(GameResult.id > after_id)
+            .order_by(GameResult.id)
+            .limit(batch_size)
+        )
+        rows = (await self.db.execute(query)).all()
+        return [
+            {
+                "id": row.id,
+                "replay_data": row.replay_data,
+                "reported": {name: getattr(row, name) for name in VERIFIED_FIELDS},
+            }
+            for row in rows
+        ]
+
+    async def _write_results(self, results: List[dict]):
+        """Write a batch of outcomes with one executemany UPDATE."""
+        if not results:
+            return
+        now = datetime.utcnow()
+        for result in results:
+            result["verified_at"] = now
+        await self.db.execute(update(GameResult), results)
+        await self.db.commit()
+
+    async def verify_pending(
+        self,
+        batch_size: int = 500,
+        limit: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Verify pending results in batches until none remain.
+
+        Args:
+            batch_size: Results loaded, replayed and written per batch
+            limit: Optional cap on the number of results processed
+            dry_run: Replay and count outcomes without writing them
+
+        Returns:
+            Count of results per verification status
+        """
+        if not load_game_engine() or replay_run is None:
+            raise RuntimeError("Game engine not available for replay verification")
+
+        counts: Dict[str, int] = {}
+        processed = 0
+        after_id = 0
+        loop = asyncio.get_running_loop()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while limit is None or processed < limit:
+                size = batch_size if limit is None else min(batch_size, limit - processed)
+                jobs = await self._load_pending(size, after_id)
+                if not jobs:
+                    break
+                after_id = jobs[-1]["id"]
+
+                chunksize = max(1, len(jobs) // (self.workers * 4))
+                results = await loop.run_in_executor(
+                    None, lambda: list(pool.map(verify_replay, jobs, chunksize=chunksize))
+                )
+
+                for result in results:
+                    status = result["verification_status"]
+                    counts[status] = counts.get(status, 0) + 1
+
+                if not dry_run:
+                    await self._write_results(results)
+                processed += len(jobs)
+
+        return counts
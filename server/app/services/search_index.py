@@ -0,0 +1,209 @@
+"""
+In-memory inverted index for static content search.
+
+The lore, bestiary and character-guide search endpoints used to scan every
+entry with substring checks per request. Each now registers a SearchIndex
+that is built once (at startup via build_all(), or on first search) from
+weighted text fields:
+
+    index = search_indexes.register("lore", build_lore_index)
+
+    def build_lore_index(index: SearchIndex):
+        for entry in entries:
+            index.add(entry, [(entry.title, TITLE_WEIGHT), (entry.content, 1.0)])
+
+Queries are tokenized the same way as documents. Every query token must
+match (AND); a token matches a term exactly or as a prefix, so "gob kin"
+finds "Goblin King". Results are ranked by field weight x term frequency
+x inverse document frequency, exact matches scoring above prefix matches,
+with ties kept in insertion order.
+"""
+import bisect
+import math
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+TOKEN_RE = re.compile(r"\w+")
+
+# Common field weights
+TITLE_WEIGHT = 5.0
+TAG_WEIGHT = 3.0
+BODY_WEIGHT = 1.0
+
+# Score multiplier for a term matched only by prefix
+PREFIX_FACTOR = 0.5
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase word tokens."""
+    if not text:
+        return []
+    return TOKEN_RE.findall(text.casefold())
+
+
+@dataclass
+class SearchPage:
+    """One page of ranked search results."""
+    docs: List[Any]
+    total: int
+    offset: int
+    limit: Optional[int]
+
+
+class SearchIndex:
+    """Inverted index over a fixed set of documents."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._docs: List[Any] = []
+        # term -> {doc index: weighted term frequency}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._terms: List[str] = []
+        self.build_ms = 0.0
+
+    def add(self, doc: Any, fields: Iterable[Tuple[Optional[str], float]]):
+        """Index a document from (text, weight) pairs."""
+        doc_index = len(self._docs)
+        self._docs.append(doc)
+        for text, weight in fields:
+            for token in tokenize(text):
+                postings = self._postings.setdefault(token, {})
+                postings[doc_index] = postings.get(doc_index, 0.0) + weight
+
+    def finalize(self):
+        """Sort the term dictionary for prefix lookups."""
+        self._terms = sorted(self._postings)
+
+    @property
+    def doc_count(self) -> int:
+        return len(self._docs)
+
+    @property
+    def term_count(self) -> int:
+        return len(self._terms)
+
+    def _matching_terms(self, token: str) -> List[str]:
+        """Terms equal to or starting with token (sorted, so a slice)."""
+        start = bisect.bisect_left(self._terms, token)
+        end = start
+        while end < len(self._terms) and self._terms[end].startswith(token):
+            end += 1
+        return self._terms[start:end]
+
+    def _score_token(self, token: str) -> Dict[int, float]:
+        """Best score per document for one query token."""
+        scores: Dict[int, float] = {}
+        for term in self._matching_terms(token):
+            postings = self._postings[term]
+            idf = math.log(1 + len(self._docs) / len(postings))
+            factor = idf if term == token else idf * PREFIX_FACTOR
+            for doc_index, tf in postings.items():
+                score = tf * factor
+                if score > scores.get(doc_index, 0.0):
+                    scores[doc_index] = score
+        return scores
+
+    def search(
+        self,
+        query: str,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        where: Optional[Callable[[Any], bool]] = None,
+    ) -> SearchPage:
+        """
+        Rank documents matching every token of the query.
+
+        An empty query (no word characters) matches every document in
+        insertion order.
+
+        Args:
+            query: Free-text query
+            offset: Number of ranked results to skip
+            limit: Page size (None for all remaining)
+            where: Optional document filter applied before paging
+
+        Returns:
+            The requested page and the total number of matches
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+
+        if not tokens:
+            ranked = list(range(len(self._docs)))
+        else:
+            totals: Optional[Dict[int, float]] = None
+            for token in tokens:
+                scores = self._score_token(token)
+                if totals is None:
+                    totals = scores
+                else:
+                    totals = {
+                        doc_index: total + scores[doc_index]
+                        for doc_index, total in totals.items()
+                        if doc_index in scores
+                    }
+                if not totals:
+                    break
+            ranked = sorted(totals, key=lambda i: (-totals[i], i))
+
+        docs = [self._docs[i] for i in ranked]
+        if where is not None:
+            docs = [doc for doc in docs if where(doc)]
+
+        end = None if limit is None else offset + limit
+        return SearchPage(docs=docs[offset:end], total=len(docs), offset=offset, limit=limit)
+
+    def get_stats(self) -> dict:
+        return {
+            "documents": self.doc_count,
+            "terms": self.term_count,
+            "build_ms": round(self.build_ms, 3),
+        }
+
+
+@dataclass
+class _Registration:
+    builder: Callable[[SearchIndex], None]
+    index: Optional[SearchIndex] = None
+
+
+class SearchIndexRegistry:
+    """Named indexes, each built once from its builder."""
+
+    def __init__(self):
+        self._indexes: Dict[str, _Registration] = {}
+
+    def register(self, name: str, builder: Callable[[SearchIndex], None]):
+        """Register a builder that fills a fresh SearchIndex."""
+        self._indexes[name] = _Registration(builder)
+
+    def get(self, name: str) -> SearchIndex:
+        """Return the named index, building it on first use."""
+        registration = self._indexes[name]
+        if registration.index is None:
+            registration.index = self._build(name, registration.builder)
+        return registration.index
+
+    def _build(self, name: str, builder: Callable[[SearchIndex], None]) -> SearchIndex:
+        started = time.perf_counter()
+        index = SearchIndex(name)
+        builder(index)
+        index.finalize()
+        index.build_ms = (time.perf_counter() - started) * 1000
+        return index
+
+    def build_all(self) -> float:
+        """Build every registered index. Returns total build time in ms."""
+        return sum(self.get(name).build_ms for name in self._indexes)
+
+    def get_stats(self) -> Dict[str, dict]:
+        """Per-index stats; unbuilt indexes report None."""
+        return {
+            name: registration.index.get_stats() if registration.index else None
+            for name, registration in self._indexes.items()
+        }
+
+
+# Global registry instance
+search_indexes = SearchIndexRegistry()
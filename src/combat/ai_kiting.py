@@ -10,10 +10,11 @@ Integrates with ai_scoring.py for RANGED_KITE and ELEMENTAL AI types.
 """
 from typing import List, Tuple, Optional, TYPE_CHECKING
 
+from .arena_templates import get_arena_grid
 from .battle_types import BattleState, BattleEntity
 from .battle_actions import manhattan_distance
 from .ai_scoring import (
-    is_tile_hazard, HAZARD_COST, CandidateAction, CandidateType
+    is_tile_hazard, CandidateAction, CandidateType
 )
 from ..core.constants import AIBehavior
 
@@ -107,35 +108,17 @@ def actor_safe_escape_count(
     Returns:
         Number of safe escape tiles for actor
     """
-    ax, ay = actor_pos
+    grid = get_arena_grid(battle)
     safe_count = 0
 
-    # Check all adjacent tiles (actor's movement options)
-    directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-
-    for dx, dy in directions:
-        nx, ny = ax + dx, ay + dy
-
-        # Check bounds
-        if nx < 0 or nx >= battle.arena_width or ny < 0 or ny >= battle.arena_height:
-            continue
-
-        # Check walkable
-        tile = battle.arena_tiles[ny][nx]
-        if tile == '#':
-            continue
-
+    # Check all adjacent in-bounds, non-wall tiles (actor's movement options)
+    for nx, ny in grid.open_neighbors(*actor_pos):
         # Check not a hazard
-        if tile in HAZARD_COST:
+        if (nx, ny) in grid.hazards:
             continue
 
-        # Check not occupied by another enemy
-        occupied = False
-        for enemy in battle.enemies:
-            if enemy.hp > 0 and enemy.arena_x == nx and enemy.arena_y == ny:
-                occupied = True
-                break
-        if occupied:
+        # Check not occupied by a living enemy (any footprint tile)
+        if battle.is_enemy_at(nx, ny):
             continue
 
         # Check not adjacent to player (want to maintain range)
@@ -466,9 +466,9 @@ def get_enemy_ai_type(enemy_entity_id: str, engine) -> AIBehavior:
     if not hasattr(engine, 'entity_manager'):
         return AIBehavior.CHASE
 
-    for enemy in engine.entity_manager.enemies:
-        if str(id(enemy)) == enemy_entity_id:
-            return getattr(enemy, 'ai_type', AIBehavior.CHASE)
+    enemy = engine.entity_manager.get_enemy_by_id(enemy_entity_id)
+    if enemy is not None:
+        return getattr(enemy, 'ai_type', AIBehavior.CHASE)
 
     return AIBehavior.CHASE
 
@@ -6,6 +6,7 @@ and player escape analysis for tactical positioning.
 import heapq
 from typing import Tuple, TYPE_CHECKING
 
+from .arena_templates import get_arena_grid
 from .battle_types import BattleState, BattleEntity
 from .battle_actions import manhattan_distance
 from ..core.constants import AIBehavior
@@ -42,10 +43,7 @@ SAFE_ESCAPE_BASE = 6        # "Normal" number of safe escapes
 
 def get_tile_hazard(battle: BattleState, x: int, y: int) -> str:
     """Get hazard type at tile, or empty string if none."""
-    if y < 0 or y >= battle.arena_height or x < 0 or x >= battle.arena_width:
-        return ''
-    tile = battle.arena_tiles[y][x]
-    return tile if tile in HAZARD_COST else ''
+    return get_arena_grid(battle).hazard_at(x, y)
 
 
 def get_hazard_cost(tile: str) -> float:
@@ -55,10 +53,7 @@ def get_hazard_cost(tile: str) -> float:
 
 def is_tile_hazard(battle: BattleState, x: int, y: int) -> bool:
     """Check if a tile is a hazard."""
-    if y < 0 or y >= battle.arena_height or x < 0 or x >= battle.arena_width:
-        return False
-    tile = battle.arena_tiles[y][x]
-    return tile in HAZARD_COST
+    return (x, y) in get_arena_grid(battle).hazards
 
 
 # =============================================================================
@@ -90,14 +85,15 @@ def min_cost_path_hazard(
     if start == goal:
         return 0.0
 
+    grid = get_arena_grid(battle)
+    neighbors = grid.neighbors
+    hazards = grid.hazards
+
     # Priority queue: (cost, x, y)
     # Use (cost, y, x) for deterministic tie-break
     pq = [(0.0, start[1], start[0])]
     visited = set()
 
-    # Neighbor expansion order: N, E, S, W (deterministic)
-    directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-
     while pq:
         cost, y, x = heapq.heappop(pq)
 
@@ -108,24 +104,16 @@ def min_cost_path_hazard(
             continue
         visited.add((x, y))
 
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-
-            # Check bounds
-            if nx < 0 or nx >= battle.arena_width or ny < 0 or ny >= battle.arena_height:
-                continue
-
-            # Check walkable (allow hazards, they just cost more)
-            tile = battle.arena_tiles[ny][nx]
-            if tile == '#':
-                continue
-
+        # In-bounds non-wall neighbours in N, E, S, W order (hazards
+        # allowed, they just cost more)
+        for nx, ny in neighbors.get((x, y), ()):
             if (nx, ny) in visited:
                 continue
 
             # Calculate step cost
             step_cost = 0.0
-            if tile in HAZARD_COST:
+            tile = hazards.get((nx, ny))
+            if tile is not None:
                 step_cost = HAZARD_COST[tile] * pulse_mult
 
             heapq.heappush(pq, (cost + step_cost, ny, nx))
@@ -164,35 +152,17 @@ def player_safe_escape_count(
     if player is None:
         return 0
 
-    px, py = player.arena_x, player.arena_y
+    grid = get_arena_grid(battle)
     safe_count = 0
 
-    # Check all adjacent tiles (player's movement options)
-    directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
-
-    for dx, dy in directions:
-        nx, ny = px + dx, py + dy
-
-        # Check bounds
-        if nx < 0 or nx >= battle.arena_width or ny < 0 or ny >= battle.arena_height:
-            continue
-
-        # Check walkable
-        tile = battle.arena_tiles[ny][nx]
-        if tile == '#':
-            continue
-
+    # Check all adjacent in-bounds, non-wall tiles (player's movement options)
+    for nx, ny in grid.open_neighbors(player.arena_x, player.arena_y):
         # Check not a hazard
-        if tile in HAZARD_COST:
+        if (nx, ny) in grid.hazards:
             continue
 
-        # Check not occupied by enemy
-        occupied = False
-        for enemy in battle.enemies:
-            if enemy.hp > 0 and enemy.arena_x == nx and enemy.arena_y == ny:
-                occupied = True
-                break
-        if occupied:
+        # Check not occupied by a living enemy (any footprint tile)
+        if battle.is_enemy_at(nx, ny):
             continue
 
         # Check not adjacent to enemy (melee threat)
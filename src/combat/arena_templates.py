@@ -21,14 +21,25 @@ Tile legend:
 
 Templates define layout + spawn regions. compile_template() converts
 spawn markers to floor tiles and returns spawn coordinates.
+
+Each template is compiled once into an immutable CompiledTemplate (tiles,
+spawn lists, edge tiles and an ArenaGrid with the walkable mask, hazard
+map and neighbour table); compile_template() only copies the base per
+battle. The grid rides along on BattleState.arena_grid so AI scoring can
+walk neighbours without rescanning tiles (see get_arena_grid).
 """
 import random
+import zlib
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional, Any
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Tuple, Optional, Any, TYPE_CHECKING
 from enum import Enum
 
 from ..core.constants import DungeonTheme
 
+if TYPE_CHECKING:
+    from .battle_types import BattleState
+
 
 # Arena dimensions
 REGULAR_ARENA_WIDTH = 9
@@ -37,6 +48,15 @@ BOSS_ARENA_WIDTH = 11
 BOSS_ARENA_HEIGHT = 9
 
 
+# Tile classes (BattleState.is_tile_walkable / ai_scoring_hazards.HAZARD_COST)
+WALKABLE_TILES = frozenset({'.', '>', '<'})
+HAZARD_TILES = frozenset({'~', '=', '!', '\u2248'})
+WALL_TILE = '#'
+
+# Neighbour expansion order: N, E, S, W (AI tie-breaks depend on it)
+NEIGHBOR_DIRECTIONS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+
 class ArenaBucket(Enum):
     """Arena template categories."""
     DEFAULT = "default"
@@ -369,6 +389,172 @@ TEMPLATES: Dict[Tuple[DungeonTheme, ArenaBucket], ArenaTemplate] = {
 }
 
 
+# =============================================================================
+# Compiled Arenas
+# =============================================================================
+
+@dataclass(frozen=True)
+class ArenaGrid:
+    """
+    Immutable lookup tables for an arena's tiles.
+
+    Grids are shared between battles (see build_arena_grid), so the
+    mappings are read-only views.
+
+    Attributes:
+        width, height: Arena size
+        tiles: Tile rows as strings
+        walkable: Tiles entities can stand on
+        hazards: Hazard tile character by position
+        neighbors: In-bounds non-wall neighbours of every tile, N/E/S/W order
+    """
+    width: int
+    height: int
+    tiles: Tuple[str, ...]
+    walkable: FrozenSet[Tuple[int, int]]
+    hazards: Mapping[Tuple[int, int], str]
+    neighbors: Mapping[Tuple[int, int], Tuple[Tuple[int, int], ...]]
+
+    def hazard_at(self, x: int, y: int) -> str:
+        """Hazard character at a tile, or '' (also for out of bounds)."""
+        return self.hazards.get((x, y), '')
+
+    def open_neighbors(self, x: int, y: int) -> Tuple[Tuple[int, int], ...]:
+        """Non-wall neighbours of a tile (hazards and obstacles included)."""
+        return self.neighbors.get((x, y), ())
+
+    def __reduce__(self):
+        # Mapping proxies can't be pickled; copies and saved battles look
+        # the grid up again by its tiles (and so share the cached one)
+        return (build_arena_grid, (self.tiles,))
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """A template with spawn markers resolved; shared by every battle."""
+    grid: ArenaGrid
+    player_spawn: Tuple[Tuple[int, int], ...]
+    enemy_spawn: Tuple[Tuple[int, int], ...]
+    reinforcement_edges: Tuple[Tuple[int, int], ...]
+    hazard_density: float
+    description: str
+
+
+# Grids by tile rows, so battles restored from saves share them too
+_GRID_CACHE: Dict[Tuple[str, ...], ArenaGrid] = {}
+
+# Compiled bases by template identity (templates are mutable dataclasses)
+_COMPILED_CACHE: Dict[int, Tuple[ArenaTemplate, CompiledTemplate]] = {}
+
+
+def build_arena_grid(rows) -> ArenaGrid:
+    """Get the (cached) grid for a tile matrix (list of rows or strings)."""
+    key = tuple(''.join(row) for row in rows)
+    grid = _GRID_CACHE.get(key)
+    if grid is not None:
+        return grid
+
+    height = len(key)
+    width = len(key[0]) if key else 0
+    walkable = set()
+    hazards = {}
+    neighbors = {}
+    for y, row in enumerate(key):
+        for x, tile in enumerate(row):
+            if tile in WALKABLE_TILES:
+                walkable.add((x, y))
+            elif tile in HAZARD_TILES:
+                hazards[(x, y)] = tile
+            adjacent = []
+            for dx, dy in NEIGHBOR_DIRECTIONS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height and key[ny][nx] != WALL_TILE:
+                    adjacent.append((nx, ny))
+            neighbors[(x, y)] = tuple(adjacent)
+
+    grid = ArenaGrid(
+        width=width,
+        height=height,
+        tiles=key,
+        walkable=frozenset(walkable),
+        hazards=MappingProxyType(hazards),
+        neighbors=MappingProxyType(neighbors),
+    )
+    _GRID_CACHE[key] = grid
+    return grid
+
+
+def get_arena_grid(battle: 'BattleState') -> ArenaGrid:
+    """
+    Get the lookup grid for a battle's arena.
+
+    Battles started by BattleManager carry their template's grid; battles
+    restored from a save or built by hand get one on first use. Arena tiles
+    never change during a battle, so the grid stays valid.
+    """
+    grid = battle.arena_grid
+    if grid is None:
+        grid = build_arena_grid(battle.arena_tiles)
+        battle.arena_grid = grid
+    return grid
+
+
+def get_compiled_template(template: ArenaTemplate) -> CompiledTemplate:
+    """Compile a template's immutable base once and cache it."""
+    cached = _COMPILED_CACHE.get(id(template))
+    if cached is not None and cached[0] is template:
+        return cached[1]
+
+    rows = []
+    player_spawn = []
+    enemy_spawn = []
+    reinforcement_edges = []
+
+    for y, row in enumerate(template.layout):
+        tile_row = []
+        for x, char in enumerate(row):
+            if char == 'P':
+                # Player spawn region
+                tile_row.append('.')
+                player_spawn.append((x, y))
+            elif char == 'E':
+                # Enemy spawn region
+                tile_row.append('.')
+                enemy_spawn.append((x, y))
+            elif char == 'R':
+                # Reinforcement entry edge
+                tile_row.append('.')
+                reinforcement_edges.append((x, y))
+            else:
+                tile_row.append(char)
+        rows.append(''.join(tile_row))
+
+    # Add reinforcement edges along arena borders (excluding corners)
+    # These are the tiles just inside the walls where reinforcements can spawn
+    if not reinforcement_edges:
+        # Top edge (excluding corners)
+        for x in range(2, template.width - 2):
+            if rows[1][x] == '.':
+                reinforcement_edges.append((x, 1))
+        # Left and right edges
+        for y in range(2, template.height - 2):
+            if rows[y][1] == '.':
+                reinforcement_edges.append((1, y))
+            if rows[y][template.width - 2] == '.':
+                reinforcement_edges.append((template.width - 2, y))
+
+    compiled = CompiledTemplate(
+        grid=build_arena_grid(rows),
+        player_spawn=tuple(player_spawn),
+        enemy_spawn=tuple(enemy_spawn),
+        reinforcement_edges=tuple(reinforcement_edges),
+        hazard_density=template.hazard_density,
+        description=template.description,
+    )
+    _COMPILED_CACHE[id(template)] = (template, compiled)
+    return compiled
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
@@ -419,7 +605,8 @@ def compile_template(
     Compile a template into concrete arena data.
 
     Converts spawn markers (P, E, R) to floor tiles and extracts
-    spawn coordinates.
+    spawn coordinates. The marker scan happens once per template (see
+    get_compiled_template); each call returns fresh mutable copies.
 
     Args:
         template: The ArenaTemplate to compile
@@ -434,57 +621,23 @@ def compile_template(
         - 'player_spawn': List of (x, y) for player placement
         - 'enemy_spawn': List of (x, y) for enemy placement
         - 'reinforcement_edges': List of (x, y) for reinforcement entry
+        - 'grid': Shared ArenaGrid for the tiles
     """
     if rng is None:
         rng = random.Random(seed)
 
-    tiles = []
-    player_spawn = []
-    enemy_spawn = []
-    reinforcement_edges = []
-
-    for y, row in enumerate(template.layout):
-        tile_row = []
-        for x, char in enumerate(row):
-            if char == 'P':
-                # Player spawn region
-                tile_row.append('.')
-                player_spawn.append((x, y))
-            elif char == 'E':
-                # Enemy spawn region
-                tile_row.append('.')
-                enemy_spawn.append((x, y))
-            elif char == 'R':
-                # Reinforcement entry edge
-                tile_row.append('.')
-                reinforcement_edges.append((x, y))
-            else:
-                tile_row.append(char)
-        tiles.append(tile_row)
-
-    # Add reinforcement edges along arena borders (excluding corners)
-    # These are the tiles just inside the walls where reinforcements can spawn
-    if not reinforcement_edges:
-        # Top edge (excluding corners)
-        for x in range(2, template.width - 2):
-            if tiles[1][x] == '.':
-                reinforcement_edges.append((x, 1))
-        # Left and right edges
-        for y in range(2, template.height - 2):
-            if tiles[y][1] == '.':
-                reinforcement_edges.append((1, y))
-            if tiles[y][template.width - 2] == '.':
-                reinforcement_edges.append((template.width - 2, y))
+    base = get_compiled_template(template)
 
     return {
-        'tiles': tiles,
+        'tiles': [list(row) for row in base.grid.tiles],
         'width': template.width,
         'height': template.height,
-        'player_spawn': player_spawn,
-        'enemy_spawn': enemy_spawn,
-        'reinforcement_edges': reinforcement_edges,
-        'hazard_density': template.hazard_density,
-        'description': template.description,
+        'player_spawn': list(base.player_spawn),
+        'enemy_spawn': list(base.enemy_spawn),
+        'reinforcement_edges': list(base.reinforcement_edges),
+        'hazard_density': base.hazard_density,
+        'description': base.description,
+        'grid': base.grid,
     }
 
 
@@ -510,6 +663,7 @@ def generate_deterministic_seed(
     Returns:
         Deterministic seed integer
     """
-    # Combine all factors into a reproducible hash
+    # Combine all factors into a reproducible hash. crc32 is used instead of
+    # hash() because str hashing is salted per process (PYTHONHASHSEED).
     seed_str = f"{dungeon_seed}:{floor}:{zone_id or ''}:{encounter_index}:{enemy_signature}"
-    return hash(seed_str) & 0x7FFFFFFF  # Ensure positive 32-bit int
+    return zlib.crc32(seed_str.encode('utf-8')) & 0x7FFFFFFF  # Ensure positive 32-bit int
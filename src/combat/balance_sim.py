@@ -0,0 +1,536 @@
+"""Vectorized Monte Carlo combat balance simulator.
+
+Resolves thousands of one-on-one duels per (player build, enemy) matchup
+with NumPy-batched dice that mirror dnd_combat:
+
+- make_attack_roll: d20 + mod + proficiency vs AC, nat 20 crits, nat 1 misses
+- make_damage_roll: weapon dice (doubled on crit) + mod, minimum 1
+- make_saving_throw: d20 + mod vs DC, nat 20/1 auto success/failure
+- roll_die LUCK: |luck| * 10% chance to reroll, keeping the higher (luck > 0)
+  or lower (luck < 0) die
+
+Player numbers follow battle_player_actions.execute_attack (weapon stat,
+proficiency by level, LUCK mod * 0.05); enemy numbers follow
+enemy_turns._execute_enemy_attack (attack // 3 to hit, 1d6 + attack // 4).
+Feat combat modifiers from the player's stat sheet (damage multiplier,
+dodge, damage reduction, life steal, thorns) are applied on top unless
+disabled, so feat picks show up in the results.
+
+All duels of a build against the whole roster run in lockstep: each round
+is a handful of array operations over every still-running trial, so a full
+roster-by-build sweep takes seconds. Requires numpy (pip install numpy);
+the game itself does not.
+
+Run from repo root:
+    python scripts/combat_balance.py --trials 5000 --classes WARRIOR,ROGUE
+
+Or from Python:
+    from src.combat.balance_sim import Build, Combatant, enemy_roster, run_matrix
+    report = run_matrix([Build(Race.ORC, PlayerClass.WARRIOR)], enemy_roster())
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from ..core.constants import (
+    Race, PlayerClass, ENEMY_STATS, BOSS_STATS,
+    ELITE_HP_MULTIPLIER, ELITE_DAMAGE_MULTIPLIER,
+)
+from ..core.dice import parse_dice_notation
+from ..entities.ability_scores import AbilityScores, create_ability_scores
+from .dnd_combat import calculate_proficiency_bonus, TRAP_DCS
+
+# Mirrors battle_player_actions: 5% of a LUCK point feeds roll_die
+PLAYER_LUCK_SCALE = 0.05
+
+# Duels still running after this many rounds count as timeouts
+DEFAULT_MAX_ROUNDS = 100
+
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise ImportError("The combat balance simulator requires numpy (pip install numpy)")
+
+
+# =============================================================================
+# Batched dice
+# =============================================================================
+
+def _uniform_dice(rng, shape, sides):
+    if np.ndim(sides) == 0:
+        return rng.integers(1, int(sides) + 1, size=shape, dtype=np.int32)
+    # Generator.integers is slow with per-element bounds; scale floats instead
+    return (rng.random(shape) * sides).astype(np.int32) + 1
+
+
+def roll_dice_array(rng, shape, sides, luck: float = 0.0):
+    """Roll independent dice like core.dice.roll_die, LUCK reroll included.
+
+    sides may be an array broadcastable to shape (per-row dice).
+    """
+    rolls = _uniform_dice(rng, shape, sides)
+    if luck:
+        reroll = rng.random(shape) < abs(luck) * 0.10
+        second = _uniform_dice(rng, shape, sides)
+        kept = np.maximum(rolls, second) if luck > 0 else np.minimum(rolls, second)
+        rolls = np.where(reroll, kept, rolls)
+    return rolls
+
+
+def roll_attacks(rng, n: int, attack_mod, target_ac,
+                 luck: float = 0.0, proficiency_bonus=0):
+    """Batched make_attack_roll. Returns (is_hit, is_critical) arrays.
+
+    Modifiers and AC may be scalars or per-row arrays of length n.
+    """
+    d20 = roll_dice_array(rng, n, 20, luck)
+    is_critical = d20 == 20
+    is_hit = is_critical | ((d20 != 1) & (d20 + attack_mod + proficiency_bonus >= target_ac))
+    return is_hit, is_critical
+
+
+def roll_damage(rng, is_critical, dice_count, dice_sides,
+                damage_mod=0, luck: float = 0.0):
+    """Batched make_damage_roll: dice doubled on crit, minimum 1.
+
+    Dice count/sides and the modifier may be scalars or per-row arrays.
+    """
+    n = len(is_critical)
+    count = _uniform_or_column(dice_count, n)
+    sides = _uniform_or_column(dice_sides, n)
+
+    if np.ndim(count) == 0:
+        rolls = roll_dice_array(rng, (n, 2 * count), sides, luck)
+        total = rolls[:, :count].sum(axis=1)
+        total += np.where(is_critical, rolls[:, count:].sum(axis=1), 0)
+    else:
+        width = int(count.max()) * 2
+        rolls = roll_dice_array(rng, (n, width), sides, luck)
+        columns = np.arange(width)
+        base = columns < count
+        doubled = ~base & (columns < 2 * count)
+        total = np.where(base, rolls, 0).sum(axis=1)
+        total += np.where(is_critical, np.where(doubled, rolls, 0).sum(axis=1), 0)
+    return np.maximum(1, total + damage_mod)
+
+
+def _uniform_or_column(values, n: int):
+    """A scalar when every row shares the value, else an (n, 1) column."""
+    values = np.asarray(values)
+    if values.ndim == 0:
+        return int(values)
+    if n == 0 or (values == values[0]).all():
+        return int(values[0]) if n else 1
+    return values[:, None]
+
+
+def roll_saving_throws(rng, n: int, ability_mod: int, dc: int, luck: float = 0.0):
+    """Batched make_saving_throw. Returns a success array."""
+    d20 = roll_dice_array(rng, n, 20, luck)
+    return (d20 == 20) | ((d20 != 1) & (d20 + ability_mod >= dc))
+
+
+# =============================================================================
+# Combatants
+# =============================================================================
+
+@dataclass(frozen=True)
+class Combatant:
+    """Flat combat numbers for one side of a duel."""
+    name: str
+    hp: int
+    ac: int
+    attack_mod: int
+    damage_mod: int
+    dice_count: int = 1
+    dice_sides: int = 6
+    luck: float = 0.0
+    proficiency_bonus: int = 0
+    damage_mult: float = 1.0
+    # Feat modifiers (player only)
+    dodge_chance: float = 0.0
+    damage_reduction: float = 0.0
+    life_steal: float = 0.0
+    thorns: float = 0.0
+    # Used for DEX saves against traps
+    save_mod: int = 0
+
+    @classmethod
+    def from_player(cls, player, name: str = "Player", apply_feats: bool = True) -> 'Combatant':
+        """Numbers a battle would use for this Player (see execute_attack)."""
+        scores = player.ability_scores
+        weapon = player.equipped_weapon
+        if weapon:
+            notation = getattr(weapon, 'damage_dice', None) or "1d6"
+            use_dex = getattr(weapon, 'stat_used', 'STR') == "DEX"
+        else:
+            notation = "1d4"  # Unarmed
+            use_dex = False
+        mod = scores.dex_mod if use_dex else scores.str_mod
+        spec = parse_dice_notation(notation) or parse_dice_notation("1d6")
+
+        stats = player.stats
+        return cls(
+            name=name,
+            hp=player.max_health,
+            ac=player.armor_class,
+            attack_mod=mod,
+            damage_mod=mod + spec.modifier,
+            dice_count=spec.count,
+            dice_sides=spec.sides,
+            luck=player.get_luck_mod() * PLAYER_LUCK_SCALE,
+            proficiency_bonus=calculate_proficiency_bonus(player.level),
+            damage_mult=stats.damage_multiplier if apply_feats else 1.0,
+            dodge_chance=stats.dodge_chance if apply_feats else 0.0,
+            damage_reduction=stats.damage_reduction if apply_feats else 0.0,
+            life_steal=stats.life_steal if apply_feats else 0.0,
+            thorns=stats.thorns if apply_feats else 0.0,
+            save_mod=scores.dex_mod,
+        )
+
+    @classmethod
+    def from_enemy(cls, name: str, hp: int, attack: int, defense: int = 0) -> 'Combatant':
+        """Numbers enemy_turns uses for an enemy attack (no dice weapon data)."""
+        return cls(
+            name=name,
+            hp=hp,
+            ac=10 + defense,
+            attack_mod=attack // 3,
+            damage_mod=attack // 4,
+        )
+
+
+def enemy_roster(floor: Optional[int] = None, elites: bool = False,
+                 bosses: bool = True) -> List[Combatant]:
+    """Enemies (and bosses) from ENEMY_STATS / BOSS_STATS.
+
+    Args:
+        floor: Only enemies that spawn on this floor (and its boss)
+        elites: Also include the elite version of each enemy
+        bosses: Include bosses
+    """
+    roster = []
+    for stats in ENEMY_STATS.values():
+        if floor is not None and not (stats.get('min_level', 1) <= floor <= stats.get('max_level', 99)):
+            continue
+        roster.append(Combatant.from_enemy(stats['name'], stats['hp'], stats['damage']))
+        if elites:
+            roster.append(Combatant.from_enemy(
+                f"Elite {stats['name']}",
+                stats['hp'] * ELITE_HP_MULTIPLIER,
+                stats['damage'] * ELITE_DAMAGE_MULTIPLIER,
+            ))
+    if bosses:
+        for stats in BOSS_STATS.values():
+            if floor is None or stats.get('level') == floor:
+                roster.append(Combatant.from_enemy(stats['name'], stats['hp'], stats['damage']))
+    return roster
+
+
+@dataclass(frozen=True)
+class Build:
+    """A player build: race, class, feats, gear and level.
+
+    Ability scores default to an average 10 roll with race/class modifiers
+    so builds are deterministic.
+    """
+    race: Race
+    player_class: PlayerClass
+    feats: Tuple[str, ...] = ()
+    weapon: Optional[type] = None      # Item classes, e.g. Sword
+    armor: Optional[type] = None
+    off_hand: Optional[type] = None
+    ring: Optional[type] = None
+    level: int = 1
+    scores: Optional[AbilityScores] = None
+
+    @property
+    def name(self) -> str:
+        parts = [f"{self.race.name} {self.player_class.name}"]
+        if self.level > 1:
+            parts.append(f"L{self.level}")
+        for item in (self.weapon, self.armor, self.off_hand, self.ring):
+            if item is not None:
+                parts.append(item.__name__)
+        parts.extend(self.feats)
+        return " ".join(parts)
+
+    def create_player(self):
+        """Build a real Player so the numbers go through the game's own rules."""
+        from ..entities.entity import Player
+
+        scores = self.scores or create_ability_scores(
+            self.race.name, self.player_class.name, rolled_scores=AbilityScores()
+        )
+        player = Player(0, 0, self.race, self.player_class, ability_scores=scores)
+        player.inventory.max_size = 99
+        while player.level < self.level:
+            player.gain_xp(player.xp_to_next_level - player.xp)
+        for item_cls in (self.weapon, self.armor, self.off_hand, self.ring):
+            if item_cls is not None:
+                item = item_cls(0, 0)
+                player.inventory.add_item(item)
+                player.equip(item)
+        for feat_id in self.feats:
+            player.add_feat(feat_id)
+        return player
+
+    def combatant(self, apply_feats: bool = True) -> Combatant:
+        return Combatant.from_player(self.create_player(), name=self.name, apply_feats=apply_feats)
+
+
+# =============================================================================
+# Simulation
+# =============================================================================
+
+@dataclass
+class MatchupResult:
+    """Outcome distribution of one build vs one enemy."""
+    player: str
+    enemy: str
+    trials: int
+    win_rate: float
+    loss_rate: float
+    timeout_rate: float
+    ttk_mean: float          # Rounds to kill the enemy, over wins
+    ttk_p50: float
+    ttk_p90: float
+    hp_left_pct: float       # Player HP remaining on wins
+    ttk_histogram: Dict[int, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            'player': self.player,
+            'enemy': self.enemy,
+            'trials': self.trials,
+            'win_rate': round(self.win_rate, 4),
+            'loss_rate': round(self.loss_rate, 4),
+            'timeout_rate': round(self.timeout_rate, 4),
+            'ttk_mean': round(self.ttk_mean, 2),
+            'ttk_p50': self.ttk_p50,
+            'ttk_p90': self.ttk_p90,
+            'hp_left_pct': round(self.hp_left_pct, 2),
+            'ttk_histogram': {str(k): v for k, v in self.ttk_histogram.items()},
+        }
+
+
+class _RosterArrays:
+    """Per-row enemy parameters for a lockstep batch over a whole roster."""
+
+    def __init__(self, roster: List[Combatant], trials: int):
+        def column(attr, dtype=np.int64):
+            return np.repeat(np.array([getattr(e, attr) for e in roster], dtype=dtype), trials)
+
+        self.hp = column('hp')
+        self.ac = column('ac')
+        self.attack_mod = column('attack_mod')
+        self.damage_mod = column('damage_mod')
+        self.dice_count = column('dice_count')
+        self.dice_sides = column('dice_sides')
+        self.proficiency_bonus = column('proficiency_bonus')
+        # Enemy LUCK is per roster entry; batches are split by luck value
+        self.luck = column('luck', np.float64)
+
+
+def _player_strike(rng, player: Combatant, enemies: _RosterArrays, rows):
+    is_hit, is_critical = roll_attacks(
+        rng, rows.size, player.attack_mod, enemies.ac[rows], player.luck, player.proficiency_bonus
+    )
+    total = roll_damage(rng, is_critical, player.dice_count, player.dice_sides,
+                        player.damage_mod, player.luck)
+    damage = np.maximum(1, (total * player.damage_mult).astype(np.int64))
+    return np.where(is_hit, damage, 0)
+
+
+def _enemy_strike(rng, enemies: _RosterArrays, player: Combatant, rows):
+    n = rows.size
+    is_hit = np.zeros(n, dtype=bool)
+    damage = np.zeros(n, dtype=np.int64)
+    for luck in np.unique(enemies.luck[rows]):
+        part = np.nonzero(enemies.luck[rows] == luck)[0]
+        sel = rows[part]
+        hit, crit = roll_attacks(
+            rng, sel.size, enemies.attack_mod[sel], player.ac, float(luck), enemies.proficiency_bonus[sel]
+        )
+        is_hit[part] = hit
+        damage[part] = roll_damage(rng, crit, enemies.dice_count[sel], enemies.dice_sides[sel],
+                                   enemies.damage_mod[sel], float(luck))
+    if player.damage_reduction:
+        damage = np.maximum(1, (damage * (1 - player.damage_reduction)).astype(np.int64))
+    if player.dodge_chance:
+        is_hit &= rng.random(n) >= player.dodge_chance
+    return np.where(is_hit, damage, 0)
+
+
+def simulate_roster(player: Combatant, roster: List[Combatant], trials: int = 2000,
+                    rng=None, max_rounds: int = DEFAULT_MAX_ROUNDS,
+                    player_first: bool = True) -> List[MatchupResult]:
+    """Run `trials` independent duels against every roster entry in lockstep.
+
+    All duels for all enemies share one set of arrays, so a round costs a
+    few array operations regardless of roster size. Each round the player
+    attacks, then the enemy (if still alive) attacks back; player_first=False
+    swaps the order.
+    """
+    _require_numpy()
+    rng = rng if rng is not None else np.random.default_rng()
+    roster = list(roster)
+    if not roster:
+        return []
+
+    enemies = _RosterArrays(roster, trials)
+    total = len(roster) * trials
+    player_hp = np.full(total, player.hp, dtype=np.int64)
+    enemy_hp = enemies.hp.copy()
+    rounds = np.zeros(total, dtype=np.int64)
+    running = np.arange(total)
+
+    for _ in range(max_rounds):
+        if running.size == 0:
+            break
+        rounds[running] += 1
+
+        for attacker_is_player in ((True, False) if player_first else (False, True)):
+            # Only duels where both sides are still standing get this swing
+            running = running[(player_hp[running] > 0) & (enemy_hp[running] > 0)]
+            if running.size == 0:
+                break
+            if attacker_is_player:
+                damage = _player_strike(rng, player, enemies, running)
+                enemy_hp[running] -= damage
+                if player.life_steal:
+                    heal = (damage * player.life_steal).astype(np.int64)
+                    player_hp[running] = np.minimum(player_hp[running] + heal, player.hp)
+            else:
+                damage = _enemy_strike(rng, enemies, player, running)
+                player_hp[running] -= damage
+                if player.thorns:
+                    enemy_hp[running] -= (damage * player.thorns).astype(np.int64)
+
+        running = running[(player_hp[running] > 0) & (enemy_hp[running] > 0)]
+
+    results = []
+    for index, enemy in enumerate(roster):
+        rows = slice(index * trials, (index + 1) * trials)
+        results.append(_summarize_duels(player, enemy, player_hp[rows], enemy_hp[rows], rounds[rows]))
+    return results
+
+
+def simulate_matchup(player: Combatant, enemy: Combatant, trials: int = 2000,
+                     rng=None, max_rounds: int = DEFAULT_MAX_ROUNDS,
+                     player_first: bool = True) -> MatchupResult:
+    """Run `trials` duels of one build against one enemy."""
+    return simulate_roster(player, [enemy], trials, rng, max_rounds, player_first)[0]
+
+
+def _summarize_duels(player: Combatant, enemy: Combatant, player_hp, enemy_hp, rounds) -> MatchupResult:
+    wins = (enemy_hp <= 0) & (player_hp > 0)
+    losses = player_hp <= 0
+    timeouts = ~(wins | losses)
+
+    win_rounds = rounds[wins]
+    if win_rounds.size:
+        ttk_mean = float(win_rounds.mean())
+        ttk_p50 = round(float(np.percentile(win_rounds, 50)), 1)
+        ttk_p90 = round(float(np.percentile(win_rounds, 90)), 1)
+        hp_left = float(player_hp[wins].mean()) / player.hp * 100
+        values, counts = np.unique(win_rounds, return_counts=True)
+        histogram = {int(v): int(c) for v, c in zip(values, counts)}
+    else:
+        ttk_mean = ttk_p50 = ttk_p90 = hp_left = 0.0
+        histogram = {}
+
+    return MatchupResult(
+        player=player.name,
+        enemy=enemy.name,
+        trials=len(rounds),
+        win_rate=float(wins.mean()),
+        loss_rate=float(losses.mean()),
+        timeout_rate=float(timeouts.mean()),
+        ttk_mean=ttk_mean,
+        ttk_p50=ttk_p50,
+        ttk_p90=ttk_p90,
+        hp_left_pct=hp_left,
+        ttk_histogram=histogram,
+    )
+
+
+def trap_save_rates(player: Combatant, trials: int = 2000, rng=None,
+                    dcs: Optional[Dict[str, int]] = None) -> Dict[str, float]:
+    """DEX save success rate against each trap DC (see resolve_trap_save)."""
+    _require_numpy()
+    rng = rng if rng is not None else np.random.default_rng()
+    return {
+        trap: float(roll_saving_throws(rng, trials, player.save_mod, dc, player.luck).mean())
+        for trap, dc in (dcs or TRAP_DCS).items()
+    }
+
+
+@dataclass
+class BalanceReport:
+    """Results of a build-by-roster sweep."""
+    results: List[MatchupResult]
+    trap_saves: Dict[str, Dict[str, float]]
+    trials: int
+    seed: Optional[int]
+    elapsed_seconds: float = 0.0
+
+    def win_matrix(self) -> Dict[str, Dict[str, float]]:
+        """{build: {enemy: win_rate}}"""
+        matrix: Dict[str, Dict[str, float]] = {}
+        for result in self.results:
+            matrix.setdefault(result.player, {})[result.enemy] = result.win_rate
+        return matrix
+
+    def to_dict(self) -> dict:
+        return {
+            'trials': self.trials,
+            'seed': self.seed,
+            'elapsed_seconds': round(self.elapsed_seconds, 3),
+            'matchups': [r.to_dict() for r in self.results],
+            'trap_saves': {
+                build: {trap: round(rate, 4) for trap, rate in rates.items()}
+                for build, rates in self.trap_saves.items()
+            },
+        }
+
+
+def run_matrix(builds: Iterable, roster: Iterable[Combatant], trials: int = 2000,
+               seed: Optional[int] = None, max_rounds: int = DEFAULT_MAX_ROUNDS,
+               apply_feats: bool = True) -> BalanceReport:
+    """Simulate every build against every roster entry.
+
+    Args:
+        builds: Build or Combatant instances
+        roster: Enemy combatants (see enemy_roster)
+        trials: Duels per matchup
+        seed: Seed for the NumPy generator (None = fresh entropy)
+        max_rounds: Rounds before a duel counts as a timeout
+        apply_feats: Apply feat combat modifiers from the stat sheet
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    roster = list(roster)
+
+    started = time.perf_counter()
+    results = []
+    trap_saves = {}
+    for build in builds:
+        player = build if isinstance(build, Combatant) else build.combatant(apply_feats)
+        trap_saves[player.name] = trap_save_rates(player, trials, rng)
+        results.extend(simulate_roster(player, roster, trials, rng, max_rounds))
+
+    return BalanceReport(
+        results=results,
+        trap_saves=trap_saves,
+        trials=trials,
+        seed=seed,
+        elapsed_seconds=time.perf_counter() - started,
+    )
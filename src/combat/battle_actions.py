@@ -356,15 +356,8 @@ def get_valid_move_tiles(
     """Get all tiles an entity can move to (supports multi-tile entities)."""
     valid = []
 
-    # Check speed modifier from status effects
-    speed_mod = 1.0
-    for effect_name in entity.status_effects:
-        effect = create_status_effect(effect_name)
-        if effect:
-            speed_mod *= effect.speed_mod
-
-    # Adjust range based on speed
-    effective_range = max(1, int(max_range * speed_mod))
+    # Adjust range based on speed from status effects (slow, freeze, stun)
+    effective_range = max(1, int(max_range * entity.status_modifiers.speed_mod))
 
     for dy in range(-effective_range, effective_range + 1):
         for dx in range(-effective_range, effective_range + 1):
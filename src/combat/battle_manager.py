@@ -96,7 +96,13 @@ class BattleManager:
         # Generate deterministic seed
         dungeon_seed = getattr(self.engine.dungeon, 'seed', 0) if self.engine.dungeon else 0
         encounter_index = len([e for e in self.engine.entity_manager.enemies if not e.is_alive()])
-        enemy_signature = ",".join(sorted(enemy_ids))
+        # Signature uses names/positions, not ids, so replays get the same arena
+        signature_parts = []
+        for enemy_id in enemy_ids:
+            enemy = self._get_enemy_by_id(enemy_id)
+            if enemy is not None:
+                signature_parts.append(f"{getattr(enemy, 'name', '')}@{enemy.x},{enemy.y}")
+        enemy_signature = ",".join(sorted(signature_parts))
 
         if seed is None:
             seed = generate_deterministic_seed(
@@ -122,6 +128,7 @@ class BattleManager:
             zone_id=None,
             floor_level=floor_level,
             seed=seed,
+            arena_grid=compiled['grid'],
         )
 
         # Place player in arena using spawn region
@@ -599,10 +606,15 @@ class BattleManager:
 
     def _get_enemy_by_id(self, enemy_id: str):
         """Get enemy entity by ID from entity manager."""
-        for enemy in self.engine.entity_manager.enemies:
-            if id(enemy) == int(enemy_id):
-                return enemy
-        return None
+        return self.engine.entity_manager.get_enemy_by_id(enemy_id)
+
+    def set_action_observer(self, observer) -> None:
+        """Observe enemy AI decisions (headless battle runner, profiling).
+
+        Args:
+            observer: Callable(enemy, action, seconds), or None to detach
+        """
+        self._enemy_processor.set_action_observer(observer)
 
     # Public API for reinforcement summary (used by UI)
     def get_reinforcement_summary(self) -> List[Dict]:
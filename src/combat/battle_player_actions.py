@@ -424,10 +424,7 @@ class PlayerActionHandler:
 
     def _get_enemy_by_id(self, enemy_id: str):
         """Get enemy entity by ID from entity manager."""
-        for enemy in self.engine.entity_manager.enemies:
-            if id(enemy) == int(enemy_id):
-                return enemy
-        return None
+        return self.engine.entity_manager.get_enemy_by_id(enemy_id)
 
     def try_use_item(self, battle: BattleState, item_index: int,
                      end_turn_callback) -> bool:
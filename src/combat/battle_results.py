@@ -103,9 +103,11 @@ class BattleResultHandler:
             if battle.floor_level >= 8:
                 self.engine.add_message("*** THE DRAGON EMPEROR HAS FALLEN! ***")
                 # v6.0.5: Preserve ledger/codex before clearing autosave
-                self._persist_victory_data()
-                from ..data import delete_save
-                delete_save()
+                # (headless replays never touch local files)
+                if not getattr(self.engine, 'headless', False):
+                    self._persist_victory_data()
+                    from ..data import delete_save
+                    delete_save()
                 self.engine.state = GameState.VICTORY
 
     def apply_defeat_results(self, battle: BattleState) -> None:
@@ -280,18 +282,13 @@ class BattleResultHandler:
 
     def _get_enemy_by_id(self, enemy_id: str):
         """Get enemy entity by ID from entity manager."""
-        for enemy in self.engine.entity_manager.enemies:
-            if id(enemy) == int(enemy_id):
-                return enemy
-        return None
+        return self.engine.entity_manager.get_enemy_by_id(enemy_id)
 
     def _remove_enemy_from_world(self, enemy_id: str) -> None:
         """Remove an enemy from the world after battle defeat."""
-        enemies = self.engine.entity_manager.enemies
-        for i, enemy in enumerate(enemies):
-            if id(enemy) == int(enemy_id):
-                enemies.pop(i)
-                break
+        enemy = self._get_enemy_by_id(enemy_id)
+        if enemy is not None:
+            self.engine.entity_manager.remove_enemy(enemy)
 
 
 class GhostAssistHandler:
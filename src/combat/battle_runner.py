@@ -0,0 +1,511 @@
+"""Headless batch battle runner.
+
+Plays tactical battles to completion without a client: each battle gets a
+fresh headless GameEngine, a synthetic roster of world enemies, an arena
+from arena_templates (via BattleManager.start_battle) and a scripted or
+policy-driven player. Battles fan out across a process pool and report
+rounds, outcome, AI decision time and the compute_action_hash stream of
+every enemy decision.
+
+Two uses:
+- AI performance: decisions per second over thousands of battles, so a
+  slow scoring change shows up before it reaches players.
+- Behavioural drift: each battle's ordered action stream is fingerprinted.
+  Battles depend only on their spec (roster, build, policy, seed), so a
+  baseline run compared against a later one lists exactly which battles
+  now play out differently and how the action mix moved.
+
+Battles draw dice and AI tie-breaks from their engine's own RNG (see
+core/rng.py), seeded from the spec, so results never depend on job
+scheduling.
+
+Run from repo root:
+    python scripts/battle_runner.py --floors 1-8 --battles 200 --workers 8 --out battles.json
+    python scripts/battle_runner.py --floors 1-8 --battles 200 --baseline battles.json
+
+Or from Python:
+    from src.combat.battle_runner import make_specs, run_battles
+    report = run_battles(make_specs([1, 2], battles=50), workers=4)
+"""
+import hashlib
+import json
+import os
+import random
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..core.rng import use_rng
+from ..core.constants import (
+    Race, PlayerClass, EnemyType, BossType, ENEMY_STATS, LEVEL_BOSS_MAP,
+)
+from .ai_scoring import compute_action_hash
+from .battle_types import BattleOutcome
+from .battle_actions import BATTLE_MOVE_RANGE, get_class_abilities, get_valid_attack_targets
+from .balance_sim import Build
+
+RESULTS_FORMAT_VERSION = 1
+
+# Battles still running after this many rounds count as timeouts
+DEFAULT_MAX_ROUNDS = 60
+
+# Synthetic roster shape
+MAX_ROSTER_SIZE = 3
+ELITE_CHANCE = 0.15
+BOSS_EVERY = 10             # Every Nth battle on a floor is its boss fight
+REINFORCEMENT_CHANCE = 0.25
+
+# Roster prefix for elite enemies, e.g. "elite:ORC"
+ELITE_PREFIX = "elite:"
+
+MOVE_COMMANDS = (('MOVE_UP', (0, -1)), ('MOVE_DOWN', (0, 1)),
+                 ('MOVE_LEFT', (-1, 0)), ('MOVE_RIGHT', (1, 0)))
+
+# Row layout of the compact results file
+RESULT_COLUMNS = ("floor", "seed", "policy", "outcome", "rounds", "decisions",
+                  "decide_ms", "hp_left", "fingerprint")
+
+
+# =============================================================================
+# Battle specs
+# =============================================================================
+
+@dataclass(frozen=True)
+class BattleSpec:
+    """Everything a battle depends on; equal specs play out identically.
+
+    Enemy names are EnemyType or BossType names, with ELITE_PREFIX for
+    elites. Reinforcements start off-arena near the encounter and arrive
+    through the normal reinforcement system.
+    """
+    floor: int
+    enemies: Tuple[str, ...]
+    seed: int
+    build: Build = Build(Race.HUMAN, PlayerClass.WARRIOR)
+    policy: str = "aggressive"
+    reinforcements: Tuple[str, ...] = ()
+    script: Tuple[Tuple[str, ...], ...] = ()    # Per-turn commands for "script"
+    max_rounds: int = DEFAULT_MAX_ROUNDS
+
+
+def floor_enemy_types(floor: int) -> List[EnemyType]:
+    """Enemy types that spawn on a floor."""
+    return [
+        enemy_type for enemy_type, stats in ENEMY_STATS.items()
+        if stats.get('min_level', 1) <= floor <= stats.get('max_level', 99)
+    ]
+
+
+def make_specs(
+    floors: Iterable[int],
+    battles: int = 100,
+    seed_start: int = 0,
+    policy: str = "aggressive",
+    builds: Optional[List[Build]] = None,
+    max_rounds: int = DEFAULT_MAX_ROUNDS,
+) -> List[BattleSpec]:
+    """
+    Synthetic battles for each floor: 1-3 floor enemies (some elite), the
+    occasional reinforcement, and the floor boss every BOSS_EVERY battles.
+
+    Args:
+        floors: Floors to build rosters for
+        battles: Battles per floor
+        seed_start: First battle seed
+        policy: Player policy name (see POLICIES)
+        builds: Player builds to cycle through (default: Human Warrior at
+            the floor's level)
+        max_rounds: Round cap per battle
+
+    Returns:
+        Specs in (floor, seed) order
+    """
+    specs = []
+    for floor in floors:
+        enemy_types = floor_enemy_types(floor) or list(ENEMY_STATS)
+        boss_type = LEVEL_BOSS_MAP.get(floor)
+        floor_builds = builds or [Build(Race.HUMAN, PlayerClass.WARRIOR, level=floor)]
+        for seed in range(seed_start, seed_start + battles):
+            rng = random.Random(f"{floor}:{seed}")
+            if boss_type is not None and seed % BOSS_EVERY == BOSS_EVERY - 1:
+                enemies = (boss_type.name,)
+            else:
+                enemies = tuple(
+                    (ELITE_PREFIX if rng.random() < ELITE_CHANCE else "") + rng.choice(enemy_types).name
+                    for _ in range(rng.randint(1, MAX_ROSTER_SIZE))
+                )
+            reinforcements = ()
+            if rng.random() < REINFORCEMENT_CHANCE:
+                reinforcements = (rng.choice(enemy_types).name,)
+            specs.append(BattleSpec(
+                floor=floor,
+                enemies=enemies,
+                seed=seed,
+                build=floor_builds[seed % len(floor_builds)],
+                policy=policy,
+                reinforcements=reinforcements,
+                max_rounds=max_rounds,
+            ))
+    return specs
+
+
+def create_enemy(name: str, x: int, y: int):
+    """World enemy for a roster name (EnemyType, BossType or elite:TYPE)."""
+    from ..entities.entity import Enemy
+
+    if name in BossType.__members__:
+        enemy = Enemy(x, y)
+        enemy.make_boss(BossType[name])
+        return enemy
+    is_elite = name.startswith(ELITE_PREFIX)
+    if is_elite:
+        name = name[len(ELITE_PREFIX):]
+    return Enemy(x, y, enemy_type=EnemyType[name], is_elite=is_elite)
+
+
+# =============================================================================
+# Player policies
+# =============================================================================
+
+def _basic_attack(engine):
+    return get_class_abilities(engine.player.player_class.name)[0]
+
+
+def _basic_targets(engine, battle):
+    return get_valid_attack_targets(battle.player, battle, _basic_attack(engine))
+
+
+def _path_to_range(battle, attack_range: int) -> List[str]:
+    """Shortest MOVE_* path to a tile with a living enemy in attack range."""
+    enemy_tiles = [tile for enemy in battle.get_living_enemies() for tile in enemy.get_occupied_tiles()]
+    if not enemy_tiles:
+        return []
+
+    def in_range(x, y):
+        return any(abs(ex - x) + abs(ey - y) <= attack_range for ex, ey in enemy_tiles)
+
+    start = (battle.player.arena_x, battle.player.arena_y)
+    came_from = {start: None}
+    frontier = deque([start])
+    while frontier:
+        x, y = frontier.popleft()
+        if in_range(x, y):
+            path = []
+            node = (x, y)
+            while came_from[node] is not None:
+                node, command = came_from[node]
+                path.append(command)
+            return path[::-1]
+        for command, (dx, dy) in MOVE_COMMANDS:
+            nxt = (x + dx, y + dy)
+            if nxt in came_from or not battle.is_tile_walkable(*nxt):
+                continue
+            if battle.get_entity_at(*nxt) is not None:
+                continue
+            came_from[nxt] = ((x, y), command)
+            frontier.append(nxt)
+    return []
+
+
+def _step_toward_enemies(engine, battle) -> None:
+    """Walk up to BATTLE_MOVE_RANGE tiles toward attack range of an enemy."""
+    for command in _path_to_range(battle, _basic_attack(engine).range)[:BATTLE_MOVE_RANGE]:
+        if not engine.battle_manager.process_battle_command(command):
+            return
+
+
+def aggressive_policy(engine, battle, turn: int) -> None:
+    """Close in and basic-attack the first target in range."""
+    _step_toward_enemies(engine, battle)
+    if _basic_targets(engine, battle):
+        engine.battle_manager.process_battle_command('ATTACK')
+
+
+def ability_policy(engine, battle, turn: int) -> None:
+    """Close in and use the first ready class ability, else basic attack."""
+    _step_toward_enemies(engine, battle)
+    player = battle.player
+    abilities = get_class_abilities(engine.player.player_class.name)
+    for index, ability in enumerate(abilities[1:], start=2):
+        if player.cooldowns.get(ability.name, 0) > 0:
+            continue
+        if ability.self_buff or get_valid_attack_targets(player, battle, ability):
+            if engine.battle_manager.process_battle_command(f'ABILITY_{index}'):
+                return
+    if _basic_targets(engine, battle):
+        engine.battle_manager.process_battle_command('ATTACK')
+
+
+def defensive_policy(engine, battle, turn: int) -> None:
+    """Stand still and brace; attack only what comes into range."""
+    if _basic_targets(engine, battle):
+        engine.battle_manager.process_battle_command('ATTACK')
+    else:
+        engine.battle_manager.process_battle_command('WAIT')
+
+
+POLICIES: Dict[str, Callable] = {
+    'aggressive': aggressive_policy,
+    'ability': ability_policy,
+    'defensive': defensive_policy,
+}
+
+
+def _play_turn(engine, battle, spec: BattleSpec, turn: int) -> None:
+    if spec.policy == 'script':
+        if turn < len(spec.script):
+            for command in spec.script[turn]:
+                if engine.battle is None:
+                    return
+                engine.battle_manager.process_battle_command(command)
+            return
+        # Scripts fall back to the aggressive policy once exhausted
+        aggressive_policy(engine, battle, turn)
+        return
+    POLICIES[spec.policy](engine, battle, turn)
+
+
+# =============================================================================
+# Running battles
+# =============================================================================
+
+def _fingerprint(actions: List[str]) -> str:
+    return hashlib.sha1("|".join(actions).encode("utf-8")).hexdigest()[:16]
+
+
+def _action_kind(action_hash: str) -> str:
+    """Collapse MOVE(x,y) to MOVE; keep ATTACK, WAIT and ABILITY(name)."""
+    return "MOVE" if action_hash.startswith("MOVE(") else action_hash
+
+
+def run_battle(spec: BattleSpec) -> dict:
+    """
+    Play one battle to completion. Runs inside a worker process.
+
+    Args:
+        spec: The battle to play
+
+    Returns:
+        Plain dict of results (see RESULT_COLUMNS) plus action counts
+    """
+    from ..core.engine import GameEngine
+
+    engine = GameEngine()
+    engine.headless = True
+    engine.rng.seed(spec.seed)
+    # The battle manager is driven directly, so bind the engine's RNG here
+    with use_rng(engine.rng):
+        engine.current_level = spec.floor
+        player = spec.build.create_player()
+        engine.player = player
+
+        enemies = [create_enemy(name, player.x + 1 + i, player.y) for i, name in enumerate(spec.enemies)]
+        for i, name in enumerate(spec.reinforcements):
+            enemies.append(create_enemy(name, player.x - 3 - i, player.y + 2))
+        engine.entity_manager.enemies.extend(enemies)
+        engaged = [engine.entity_manager.enemy_id(enemy) for enemy in enemies[:len(spec.enemies)]]
+
+        actions: List[str] = []
+        decide_seconds = [0.0]
+
+        def observe(enemy, action, seconds):
+            actions.append(compute_action_hash(action))
+            decide_seconds[0] += seconds
+
+        engine.battle_manager.set_action_observer(observe)
+        started = time.perf_counter()
+        battle = engine.battle_manager.start_battle(
+            engaged, player.x, player.y, seed=spec.seed,
+            is_boss=any(name in BossType.__members__ for name in spec.enemies),
+        )
+
+        turn = 0
+        while engine.battle is not None and battle.turn_number < spec.max_rounds:
+            _play_turn(engine, battle, spec, turn)
+            if engine.battle is not None:
+                engine.battle_manager.process_battle_command('END_TURN')
+            turn += 1
+        elapsed = time.perf_counter() - started
+
+    outcome = "TIMEOUT" if battle.outcome == BattleOutcome.PENDING else battle.outcome.name
+    return {
+        "floor": spec.floor,
+        "seed": spec.seed,
+        "policy": spec.policy,
+        "enemies": list(spec.enemies),
+        "outcome": outcome,
+        "rounds": battle.turn_number,
+        "decisions": len(actions),
+        "decide_ms": round(decide_seconds[0] * 1000, 3),
+        "battle_ms": round(elapsed * 1000, 3),
+        "hp_left": battle.player.hp if battle.player else 0,
+        "fingerprint": _fingerprint(actions),
+        "actions": dict(Counter(actions)),
+    }
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * pct))
+    return sorted_values[index]
+
+
+def summarize_battles(results: List[dict]) -> dict:
+    """Aggregate stats for a group of battles (usually one floor)."""
+    outcomes = Counter(r["outcome"] for r in results)
+    rounds = sorted(r["rounds"] for r in results)
+    decisions = sum(r["decisions"] for r in results)
+    decide_ms = sum(r["decide_ms"] for r in results)
+    actions: Counter = Counter()
+    kinds: Counter = Counter()
+    for r in results:
+        actions.update(r["actions"])
+        for action_hash, count in r["actions"].items():
+            kinds[_action_kind(action_hash)] += count
+    return {
+        "battles": len(results),
+        "outcomes": {name: round(count / len(results), 4) for name, count in sorted(outcomes.items())},
+        "rounds": {
+            "avg": round(sum(rounds) / len(rounds), 2),
+            "p50": _percentile(rounds, 0.50),
+            "p95": _percentile(rounds, 0.95),
+            "max": rounds[-1],
+        },
+        "decisions": decisions,
+        "decide_ms": round(decide_ms, 3),
+        "decisions_per_second": round(decisions / (decide_ms / 1000), 1) if decide_ms else 0.0,
+        "action_kinds": dict(kinds.most_common()),
+        "action_hashes": dict(actions.most_common()),
+    }
+
+
+@dataclass
+class BattleReport:
+    """Results of a batch run, in spec order."""
+    results: List[dict]
+    floors: Dict[int, dict] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+    workers: int = 1
+
+    @property
+    def decisions_per_second(self) -> float:
+        decisions = sum(r["decisions"] for r in self.results)
+        decide_ms = sum(r["decide_ms"] for r in self.results)
+        return decisions / (decide_ms / 1000) if decide_ms else 0.0
+
+    @property
+    def battles_per_second(self) -> float:
+        return len(self.results) / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        """Compact form: per-floor summaries plus one row per battle."""
+        return {
+            "version": RESULTS_FORMAT_VERSION,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "workers": self.workers,
+            "decisions_per_second": round(self.decisions_per_second, 1),
+            "floors": {str(level): summary for level, summary in self.floors.items()},
+            "columns": list(RESULT_COLUMNS),
+            "rows": [[r[column] for column in RESULT_COLUMNS] for r in self.results],
+        }
+
+    def write(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+
+def run_battles(specs: Iterable[BattleSpec], workers: Optional[int] = None) -> BattleReport:
+    """
+    Play every battle and collect results.
+
+    Args:
+        specs: Battles to play (see make_specs)
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+
+    Returns:
+        BattleReport with per-battle results and per-floor summaries
+    """
+    specs = list(specs)
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = [run_battle(spec) for spec in specs]
+    else:
+        chunksize = max(1, len(specs) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_battle, specs, chunksize=chunksize))
+    elapsed = time.perf_counter() - started
+
+    report = BattleReport(results=results, elapsed_seconds=elapsed, workers=workers)
+    for level in sorted({spec.floor for spec in specs}):
+        report.floors[level] = summarize_battles([r for r in results if r["floor"] == level])
+    return report
+
+
+# =============================================================================
+# Drift detection
+# =============================================================================
+
+def _distribution_distance(a: Dict[str, int], b: Dict[str, int]) -> float:
+    """Total variation distance between two count distributions (0..1)."""
+    total_a, total_b = sum(a.values()), sum(b.values())
+    if not total_a or not total_b:
+        return 0.0 if total_a == total_b else 1.0
+    keys = set(a) | set(b)
+    return 0.5 * sum(abs(a.get(k, 0) / total_a - b.get(k, 0) / total_b) for k in keys)
+
+
+def compare_reports(baseline: dict, current: dict) -> dict:
+    """
+    Compare two BattleReport.to_dict() results.
+
+    Returns:
+        Per-floor action-mix distance and outcome deltas, the battles whose
+        action stream changed, and the decision-rate ratio (current / baseline)
+    """
+    columns = baseline["columns"]
+    key_columns = (columns.index("floor"), columns.index("seed"), columns.index("policy"))
+    fp_index = columns.index("fingerprint")
+    baseline_rows = {tuple(row[i] for i in key_columns): row for row in baseline["rows"]}
+
+    current_columns = current["columns"]
+    current_keys = tuple(current_columns.index(columns[i]) for i in key_columns)
+    current_fp = current_columns.index("fingerprint")
+    changed = []
+    compared = 0
+    for row in current["rows"]:
+        key = tuple(row[i] for i in current_keys)
+        old = baseline_rows.get(key)
+        if old is None:
+            continue
+        compared += 1
+        if old[fp_index] != row[current_fp]:
+            changed.append(list(key))
+
+    floors = {}
+    for level, summary in current["floors"].items():
+        old = baseline["floors"].get(level)
+        if old is None:
+            continue
+        outcomes = set(old["outcomes"]) | set(summary["outcomes"])
+        floors[level] = {
+            "action_kind_distance": round(_distribution_distance(old["action_kinds"], summary["action_kinds"]), 4),
+            "action_hash_distance": round(_distribution_distance(old["action_hashes"], summary["action_hashes"]), 4),
+            "outcome_delta": {
+                name: round(summary["outcomes"].get(name, 0.0) - old["outcomes"].get(name, 0.0), 4)
+                for name in sorted(outcomes)
+            },
+            "rounds_avg_delta": round(summary["rounds"]["avg"] - old["rounds"]["avg"], 2),
+        }
+
+    old_rate = baseline.get("decisions_per_second", 0.0)
+    return {
+        "compared": compared,
+        "changed": changed,
+        "floors": floors,
+        "decision_rate_ratio": round(current.get("decisions_per_second", 0.0) / old_rate, 3) if old_rate else 0.0,
+    }
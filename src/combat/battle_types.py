@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import List, Optional, Dict, Any, Tuple
 
+from .arena_templates import get_arena_grid
+
 
 class BattleOutcome(Enum):
     """Possible outcomes when a battle ends."""
@@ -23,6 +25,47 @@ class BattlePhase(Enum):
     END_OF_ROUND = auto()   # Processing end-of-round effects
 
 
+@dataclass(frozen=True)
+class BattleStatusModifiers:
+    """A BattleEntity's status effect dicts folded into flat modifiers."""
+    speed_mod: float = 1.0                  # Product of movement multipliers
+    defense_mods: Tuple[float, ...] = ()    # Applied in order (int after each)
+    damage_per_tick: int = 0                # DoT total at end of round
+    is_hidden: bool = False
+    is_stunned: bool = False                # speed_mod of 0 (can't move)
+
+
+NO_BATTLE_MODIFIERS = BattleStatusModifiers()
+
+
+def compile_battle_modifiers(effects: List[Dict[str, Any]]) -> BattleStatusModifiers:
+    """Fold status effect dicts ({name, duration, speed_mod, ...}) into one bundle."""
+    if not effects:
+        return NO_BATTLE_MODIFIERS
+    speed_mod = 1.0
+    defense_mods = []
+    damage = 0
+    hidden = False
+    for effect in effects:
+        speed_mod *= effect.get('speed_mod', 1.0)
+        defense_mod = effect.get('defense_mod', 1.0)
+        if defense_mod != 1.0:
+            defense_mods.append(defense_mod)
+        damage += effect.get('damage_per_tick', 0)
+        hidden = hidden or effect.get('is_hidden', False)
+    return BattleStatusModifiers(
+        speed_mod=speed_mod,
+        defense_mods=tuple(defense_mods),
+        damage_per_tick=damage,
+        is_hidden=hidden,
+        is_stunned=speed_mod == 0.0,
+    )
+
+
+# BattleEntity fields that change which tiles it covers
+FOOTPRINT_FIELDS = frozenset({'arena_x', 'arena_y', 'size_width', 'size_height', 'hp'})
+
+
 @dataclass
 class BattleEntity:
     """
@@ -138,17 +181,39 @@ class BattleEntity:
         """Remove a status effect by name."""
         self.status_effects = [e for e in self.status_effects if e.get('name') != name]
 
+    @property
+    def status_modifiers(self) -> BattleStatusModifiers:
+        """Cached modifier bundle for the current status effects.
+
+        add_status/remove_status and the round tick replace the effects
+        list, and appends change its length; either rebuilds the bundle.
+        """
+        effects = self.status_effects
+        cached = self.__dict__.get('_status_modifiers')
+        if cached is None or cached[0] is not effects or cached[1] != len(effects):
+            cached = (effects, len(effects), compile_battle_modifiers(effects))
+            self.__dict__['_status_modifiers'] = cached
+        return cached[2]
+
     def get_effective_defense(self) -> int:
         """Get defense after status modifiers."""
         defense = self.defense
-        for effect in self.status_effects:
-            mod = effect.get('defense_mod', 1.0)
+        for mod in self.status_modifiers.defense_mods:
             defense = int(defense * mod)
         return defense
 
     def is_hidden(self) -> bool:
         """Check if entity is hidden/invisible."""
-        return any(e.get('is_hidden', False) for e in self.status_effects)
+        return self.status_modifiers.is_hidden
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Keep the owning battle's occupancy grid in step with moves,
+        # resizes, deaths and revivals
+        if name in FOOTPRINT_FIELDS:
+            grid = self.__dict__.get('_occupancy')
+            if grid is not None:
+                grid.refresh(self, alive_only=(name == 'hp'))
 
     def occupies_tile(self, x: int, y: int) -> bool:
         """Check if this entity occupies a specific tile (multi-tile support)."""
@@ -225,6 +290,108 @@ class PendingReinforcement:
 Reinforcement = PendingReinforcement
 
 
+class OccupancyGrid:
+    """
+    Which combatants cover each arena tile (multi-tile footprints included).
+
+    Attached entities report moves, resizes, deaths and revivals through
+    BattleEntity.__setattr__; BattleState.occupancy picks up appended or
+    replaced combatants. Living enemies and the player (alive or not, as
+    get_entity_at always did) are placed; dead enemies stay attached so a
+    revival puts them back.
+    """
+
+    def __init__(self):
+        self.cells: Dict[Tuple[int, int], List[BattleEntity]] = {}
+        self.player: Optional[BattleEntity] = None
+        self.enemies: Optional[List[BattleEntity]] = None
+        self.enemy_count = 0
+        self._placed: Dict[int, Tuple[Tuple[int, int], ...]] = {}
+        self._attached: List[BattleEntity] = []
+
+    def sync(self, player: Optional[BattleEntity], enemies: List[BattleEntity]) -> None:
+        """Index new enemies appended to the list, or rebuild if replaced."""
+        if player is self.player and enemies is self.enemies and len(enemies) >= self.enemy_count:
+            new = enemies[self.enemy_count:]
+        else:
+            self.clear()
+            self.player = player
+            self.enemies = enemies
+            new = ([player] if player is not None else []) + list(enemies)
+        for entity in new:
+            object.__setattr__(entity, '_occupancy', self)
+            self._attached.append(entity)
+            self.refresh(entity)
+        self.enemy_count = len(enemies)
+
+    def clear(self) -> None:
+        """Detach every entity and empty the grid."""
+        for entity in self._attached:
+            if entity.__dict__.get('_occupancy') is self:
+                del entity.__dict__['_occupancy']
+        self.cells.clear()
+        self._placed.clear()
+        self._attached = []
+        self.player = None
+        self.enemies = None
+        self.enemy_count = 0
+
+    def refresh(self, entity: BattleEntity, alive_only: bool = False) -> None:
+        """Re-place an entity after its position, size or hp changed.
+
+        Args:
+            entity: The changed entity
+            alive_only: Only hp changed; skip unless it died or revived
+        """
+        key = id(entity)
+        placed = self._placed.get(key)
+        should_place = entity.is_player or entity.hp > 0
+        if alive_only and (placed is not None) == should_place:
+            return
+
+        if placed is not None:
+            del self._placed[key]
+            for tile in placed:
+                cell = self.cells[tile]
+                for i, occupant in enumerate(cell):
+                    if occupant is entity:
+                        del cell[i]
+                        break
+                if not cell:
+                    del self.cells[tile]
+
+        if should_place:
+            tiles = tuple(entity.get_occupied_tiles())
+            self._placed[key] = tiles
+            for tile in tiles:
+                self.cells.setdefault(tile, []).append(entity)
+
+    def entity_at(self, x: int, y: int) -> Optional[BattleEntity]:
+        """The player if on the tile, else the first living enemy in roster order."""
+        cell = self.cells.get((x, y))
+        if not cell:
+            return None
+        if len(cell) == 1:
+            return cell[0]
+        for occupant in cell:
+            if occupant.is_player:
+                return occupant
+        return min(cell, key=lambda e: next(i for i, enemy in enumerate(self.enemies) if enemy is e))
+
+    def has_enemy_at(self, x: int, y: int) -> bool:
+        """Whether a living enemy covers the tile."""
+        return any(not occupant.is_player for occupant in self.cells.get((x, y), ()))
+
+    # =========================================================================
+    # Copying (placements are keyed by id(), so rebuild rather than copy keys)
+    # =========================================================================
+
+    def __reduce__(self):
+        # Copies and unpickled battles start from an empty grid; the next
+        # BattleState.occupancy sees a different roster and re-syncs
+        return (OccupancyGrid, ())
+
+
 @dataclass
 class BattleState:
     """
@@ -278,6 +445,13 @@ class BattleState:
     woundglass_reveal_active: bool = False  # True if reinforcement ETAs revealed
     safe_tiles_revealed: List[Tuple[int, int]] = field(default_factory=list)  # Woundglass revealed tiles
 
+    # Cached arena lookup tables (arena_templates.ArenaGrid); not serialized,
+    # rebuilt on demand by get_arena_grid()
+    arena_grid: Optional[Any] = field(default=None, repr=False, compare=False)
+
+    # Tile -> combatant index (see occupancy); rebuilt from player/enemies
+    _occupancy: OccupancyGrid = field(default_factory=OccupancyGrid, init=False, repr=False, compare=False)
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize entire battle state for save/load."""
         return {
@@ -342,27 +516,39 @@ class BattleState:
         state.turn_order = list(data.get('turn_order', []))
         state.active_entity_index = data.get('active_entity_index', 0)
 
+        # Index the restored combatants up front
+        state.occupancy
+
         return state
 
+    @property
+    def occupancy(self) -> OccupancyGrid:
+        """Occupancy grid, synced with newly added or replaced combatants.
+
+        Enemies join by appending to (or replacing) the enemies list;
+        removing one in place is not tracked.
+        """
+        grid = self._occupancy
+        if (grid.player is not self.player or grid.enemies is not self.enemies
+                or grid.enemy_count != len(self.enemies)):
+            grid.sync(self.player, self.enemies)
+        return grid
+
     def get_living_enemies(self) -> List[BattleEntity]:
         """Return enemies that are still alive."""
         return [e for e in self.enemies if e.hp > 0]
 
     def is_tile_walkable(self, x: int, y: int) -> bool:
-        """Check if an arena tile is walkable."""
-        if x < 0 or x >= self.arena_width or y < 0 or y >= self.arena_height:
-            return False
-        tile = self.arena_tiles[y][x]
-        return tile in ('.', '>', '<')  # Floor, stairs
+        """Check if an arena tile is walkable (floor or stairs)."""
+        return (x, y) in get_arena_grid(self).walkable
 
     def get_entity_at(self, x: int, y: int) -> Optional[BattleEntity]:
         """Get entity at arena position, if any (supports multi-tile entities)."""
-        if self.player and self.player.occupies_tile(x, y):
-            return self.player
-        for enemy in self.enemies:
-            if enemy.hp > 0 and enemy.occupies_tile(x, y):
-                return enemy
-        return None
+        return self.occupancy.entity_at(x, y)
+
+    def is_enemy_at(self, x: int, y: int) -> bool:
+        """Check if a living enemy covers an arena tile."""
+        return self.occupancy.has_enemy_at(x, y)
 
     def is_position_valid_for_entity(self, x: int, y: int, entity: BattleEntity,
                                       exclude_self: bool = True) -> bool:
@@ -410,9 +596,11 @@ class BattleState:
             if enemy.hp > 0:
                 all_entities.append(enemy)
 
-        # Sort by initiative (descending), then player priority, then entity_id
+        # Sort by initiative (descending), then player priority. The sort is
+        # stable, so ties keep roster order (reproducible across processes,
+        # unlike the id()-based entity ids).
         all_entities.sort(
-            key=lambda e: (-e.initiative, not e.is_player, e.entity_id)
+            key=lambda e: (-e.initiative, not e.is_player)
         )
 
         self.turn_order = [e.entity_id for e in all_entities]
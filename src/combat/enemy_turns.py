@@ -5,7 +5,8 @@ Handles:
 - Boss ability execution
 - Enemy attack resolution
 """
-from typing import TYPE_CHECKING, Optional
+import time
+from typing import TYPE_CHECKING, Callable, Optional
 
 from .battle_types import BattleState, BattleEntity
 from .battle_actions import BattleAction, create_status_effect
@@ -27,11 +28,17 @@ class EnemyTurnProcessor:
         self.engine = engine
         self.events = events
         self._hazard_handler = None  # Set by BattleManager
+        # Called as observer(enemy, action, seconds) after each AI decision
+        self._action_observer: Optional[Callable] = None
 
     def set_hazard_handler(self, handler):
         """Set the hazard handler for tile effects."""
         self._hazard_handler = handler
 
+    def set_action_observer(self, observer: Optional[Callable]):
+        """Set a callback that sees every AI decision and how long it took."""
+        self._action_observer = observer
+
     def get_pulse_amplification(self) -> float:
         """Get current field pulse amplification (v6.0.5)."""
         if hasattr(self.engine, 'field_pulse_manager') and self.engine.field_pulse_manager:
@@ -79,6 +86,10 @@ class EnemyTurnProcessor:
         # v6.2: Get AI type for this enemy
         ai_type = get_enemy_ai_type(enemy.entity_id, self.engine)
 
+        observer = self._action_observer
+        if observer is not None:
+            started = time.perf_counter()
+
         # v6.2 Slice 3: Check if this is a boss and use boss heuristics
         boss_type = self._get_boss_type(enemy)
         if boss_type is not None:
@@ -87,6 +98,9 @@ class EnemyTurnProcessor:
             # Regular enemy: use standard AI scoring
             action = choose_action(battle, enemy, ai_type)
 
+        if observer is not None:
+            observer(enemy, action, time.perf_counter() - started)
+
         # Execute the chosen action
         self._execute_enemy_action(battle, enemy, player, action)
 
@@ -95,10 +109,9 @@ class EnemyTurnProcessor:
         if not hasattr(self.engine, 'entity_manager'):
             return None
 
-        for world_enemy in self.engine.entity_manager.enemies:
-            if str(id(world_enemy)) == enemy.entity_id:
-                if getattr(world_enemy, 'is_boss', False):
-                    return getattr(world_enemy, 'boss_type', None)
+        world_enemy = self.engine.entity_manager.get_enemy_by_id(enemy.entity_id)
+        if world_enemy is not None and getattr(world_enemy, 'is_boss', False):
+            return getattr(world_enemy, 'boss_type', None)
         return None
 
     def _execute_enemy_action(
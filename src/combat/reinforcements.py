@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING, Optional, Tuple, List, Dict
 
 from .battle_types import BattleState, BattleEntity, PendingReinforcement
 from .battle_actions import manhattan_distance
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from ..core.engine import GameEngine
@@ -110,7 +111,7 @@ class ReinforcementManager:
         reinforcements = []
 
         for enemy in self.engine.entity_manager.enemies:
-            enemy_id = str(id(enemy))
+            enemy_id = self.engine.entity_manager.enemy_id(enemy)
 
             # Skip enemies already in battle
             if enemy_id in engaged_enemy_ids:
@@ -226,7 +227,7 @@ class ReinforcementManager:
 
                 if spawn_pos:
                     # v6.11: Roll initiative for reinforcement (5 + d20, +5 for elite)
-                    enemy_initiative = 5 + random.randint(1, 20)
+                    enemy_initiative = 5 + rng.randint(1, 20)
                     if reinforcement.is_elite:
                         enemy_initiative += 5
 
@@ -30,7 +30,7 @@ class RoundProcessor:
 
     def tick_status_effects(self, entity: BattleEntity) -> None:
         """Process status effect ticks for an entity."""
-        if entity is None or entity.hp <= 0:
+        if entity is None or entity.hp <= 0 or not entity.status_effects:
             return
 
         remaining_effects = []
@@ -62,7 +62,9 @@ class RoundProcessor:
                 if entity.is_player:
                     self.engine.add_message(f"{name.title()} wore off.")
 
-        entity.status_effects = remaining_effects
+        # Keep the same list (and its cached modifiers) unless something expired
+        if len(remaining_effects) != len(entity.status_effects):
+            entity.status_effects = remaining_effects
 
         # Check death from DOT
         if entity.hp <= 0:
@@ -1,6 +1,7 @@
 """Core game module - game loop and constants."""
 from .game import Game
 from .engine import GameEngine
+from .replay import RunRecording, RunReplayer, replay_run
 from .messages import GameMessage, MessageCategory, MessageImportance, MessageLog
 from .events import (
     EventType, GameEvent, EventQueue,
@@ -45,7 +46,8 @@ from .constants import (
 )
 
 __all__ = [
-    'Game', 'TileType', 'GameState', 'UIMode', 'DungeonTheme', 'RoomType', 'EnemyType',
+    'Game', 'GameEngine', 'RunRecording', 'RunReplayer', 'replay_run',
+    'TileType', 'GameState', 'UIMode', 'DungeonTheme', 'RoomType', 'EnemyType',
     'EventType', 'GameEvent', 'EventQueue', 'get_event_queue', 'reset_event_queue',
     'Command', 'CommandType', 'get_movement_delta', 'get_item_index',
     'DiceRoll', 'DiceSpec', 'roll_die', 'roll_dice', 'roll_notation',
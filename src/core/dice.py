@@ -2,10 +2,10 @@
 
 Supports standard dice notation (e.g., "2d6+3") and LUCK-influenced rolls.
 """
-import random
 import re
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional
+from .rng import rng
 
 
 @dataclass
@@ -62,14 +62,14 @@ def roll_die(sides: int, luck_modifier: float = 0.0) -> int:
     Returns:
         Result of the die roll
     """
-    first_roll = random.randint(1, sides)
+    first_roll = rng.randint(1, sides)
 
     # LUCK influence: chance to "advantage" or "disadvantage"
     # Each point of luck modifier = 10% chance of reroll
     if luck_modifier != 0:
         reroll_chance = abs(luck_modifier) * 0.10
-        if random.random() < reroll_chance:
-            second_roll = random.randint(1, sides)
+        if rng.random() < reroll_chance:
+            second_roll = rng.randint(1, sides)
             if luck_modifier > 0:
                 # Good luck: take the higher roll
                 return max(first_roll, second_roll)
@@ -235,7 +235,7 @@ def roll_stat() -> DiceRoll:
 
 def roll_ability_score_4d6_drop_lowest() -> DiceRoll:
     """Roll 4d6, drop lowest die (alternative character creation method)."""
-    rolls = [random.randint(1, 6) for _ in range(4)]
+    rolls = [rng.randint(1, 6) for _ in range(4)]
     rolls.sort(reverse=True)
     kept_rolls = rolls[:3]  # Keep highest 3
 
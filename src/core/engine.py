@@ -4,6 +4,7 @@ The GameEngine class contains all game state and logic, completely
 decoupled from any rendering or input system. It processes Commands
 and emits Events, making it usable by terminal, web, or any other client.
 """
+import random
 from typing import List, Optional, Tuple, Callable
 
 from .constants import GameState, UIMode, AUTO_SAVE_INTERVAL, MAX_DUNGEON_LEVELS, Race, PlayerClass, RACE_STATS, CLASS_STATS
@@ -14,6 +15,7 @@ from .commands import (
     MOVEMENT_COMMANDS, ITEM_COMMANDS, SCROLL_COMMANDS, INTERACTION_COMMANDS,
     get_movement_delta, get_item_index
 )
+from .rng import uses_engine_rng
 
 # Turn commands set
 TURN_COMMANDS = {CommandType.TURN_LEFT, CommandType.TURN_RIGHT}
@@ -61,6 +63,11 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
         self.ui_mode = UIMode.GAME
         self.current_level = 1
 
+        # v7.2: Run seed (set when a new game is started with a seed) and the
+        # run's own RNG, bound while the engine handles a call (see rng.py)
+        self.seed: Optional[int] = None
+        self.rng = random.Random()
+
         # Game world (initialized on new game)
         self.dungeon: Optional[Dungeon] = None
         self.player: Optional[Player] = None
@@ -71,6 +78,9 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
         # Message system
         self.message_log = MessageLog()
 
+        # v7.2: Headless mode (replay/verification)
+        self._headless = False
+
         # Managers
         self.entity_manager = EntityManager()
         self.combat_manager = CombatManager(self, event_queue=self.event_queue)
@@ -144,13 +154,33 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
     # Public API
     # =========================================================================
 
-    def start_new_game(self, race: Race = None, player_class: PlayerClass = None):
+    @property
+    def headless(self) -> bool:
+        """Whether the engine runs without a client (replay/verification)."""
+        return self._headless
+
+    @headless.setter
+    def headless(self, value: bool):
+        """Headless engines skip disk saves and drop renderer events."""
+        self._headless = value
+        self.event_queue.muted = value
+
+    @uses_engine_rng
+    def start_new_game(self, race: Race = None, player_class: PlayerClass = None,
+                       seed: Optional[int] = None):
         """Initialize a new game with optional character configuration.
 
         Args:
             race: Player race (Human, Elf, Dwarf, Halfling, Orc)
             player_class: Player class (Warrior, Mage, Rogue)
+            seed: Optional run seed. When given, the engine's own RNG is seeded
+                so the run can be rebuilt from (seed, race, class, commands).
         """
+        # v7.2: Seed the run so it can be replayed deterministically
+        self.seed = seed
+        if seed is not None:
+            self.rng.seed(seed)
+
         self.current_level = 1
         self.max_level_reached = 1
         self.kills_count = 0
@@ -160,7 +190,7 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
         self.completion_ledger = CompletionLedger()
 
         # Generate first dungeon
-        self.dungeon = Dungeon(level=self.current_level, has_stairs_up=False)
+        self.dungeon = Dungeon(level=self.current_level, has_stairs_up=False, rng=self.rng)
 
         # Spawn player with race/class
         player_pos = self.dungeon.get_random_floor_position()
@@ -219,6 +249,7 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
         self.state = GameState.PLAYING
         self.ui_mode = UIMode.GAME
 
+    @uses_engine_rng
     def load_game(self) -> bool:
         """Load a saved game. Returns True if successful."""
         if self.save_manager.load_game():
@@ -314,8 +345,8 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
 
     @property
     def messages(self) -> List[str]:
-        """Get recent messages as strings."""
-        return [msg.text for msg in self.message_log.get_recent(5)]
+        """Get recent messages as strings (cached by the log; don't mutate)."""
+        return self.message_log.recent_texts(5)
 
     @property
     def enemies(self) -> List:
@@ -327,10 +358,74 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
         """Alias for entity_manager.items."""
         return self.entity_manager.items
 
+    # =========================================================================
+    # Command Processing - Dispatch
+    # =========================================================================
+
+    @uses_engine_rng
+    def dispatch_command(self, command: Command) -> bool:
+        """
+        Route a command to the handler for the current state and UI mode.
+
+        Shared by the web server and the replay engine so a recorded
+        command stream is applied exactly as it was during play.
+
+        Returns:
+            True if the player took a turn-consuming action
+        """
+        cmd_type = command.type
+
+        if cmd_type == CommandType.SELECT_FEAT:
+            feat_id = command.data.get('feat_id') if command.data else None
+            self.select_feat(feat_id)
+            return False
+
+        if self.state != GameState.PLAYING:
+            return False
+
+        if self.ui_mode == UIMode.GAME:
+            return self.process_game_command(command)
+        elif self.ui_mode == UIMode.INVENTORY:
+            self.process_inventory_command(command)
+        elif self.ui_mode == UIMode.DIALOG:
+            self.process_dialog_command(command)
+        elif self.ui_mode == UIMode.MESSAGE_LOG:
+            self.process_message_log_command(command)
+        elif self.ui_mode == UIMode.CHARACTER:
+            self.process_character_command(command)
+        elif self.ui_mode in (UIMode.HELP, UIMode.READING):
+            # These close on any command
+            if cmd_type == CommandType.CLOSE_SCREEN:
+                self.ui_mode = UIMode.GAME
+        elif self.ui_mode == UIMode.BATTLE:
+            # v6.0: Process tactical battle commands
+            return self.process_battle_command(command)
+
+        return False
+
+    @uses_engine_rng
+    def select_feat(self, feat_id: Optional[str]) -> bool:
+        """Learn a feat while a feat selection is pending. Returns True if learned."""
+        if not feat_id or not self.player or not self.player.pending_feat_selection:
+            return False
+
+        # Get feat name from player's available feats list
+        feat_name = feat_id
+        for f in self.player.get_available_feats_info():
+            if f['id'] == feat_id:
+                feat_name = f['name']
+                break
+
+        if self.player.add_feat(feat_id):
+            self.add_message(f"You learned the {feat_name} feat!")
+            return True
+        return False
+
     # =========================================================================
     # Command Processing - Main Game
     # =========================================================================
 
+    @uses_engine_rng
     def process_game_command(self, command: Command) -> bool:
         """
         Process a command during normal gameplay.
@@ -383,7 +478,8 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
 
                 # v4.0: Tick spreading hazards
                 if self.dungeon:
-                    new_hazards = self.hazard_manager.tick_spreading(self.dungeon.is_walkable)
+                    new_hazards = self.hazard_manager.tick_spreading(
+                        self.dungeon.is_walkable, self.dungeon.revision)
                     for hazard in new_hazards:
                         if hazard and hasattr(hazard, 'name') and hazard.name:
                             self.add_message(f"The {hazard.name.lower()} spreads!")
@@ -605,7 +701,7 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
             for door in detected_doors:
                 self.add_message("You found a secret door!", importance=MessageImportance.IMPORTANT)
                 # Reveal the secret door on the map - change wall to floor
-                self.dungeon.tiles[door.y][door.x] = TileType.FLOOR
+                self.dungeon.set_tile(door.x, door.y, TileType.FLOOR)
                 found_something = True
 
         if not found_something:
@@ -741,7 +837,7 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
                         target_interactive.reveal()
                         self.add_message("A hidden passage is revealed!")
                         # Make the hidden door walkable
-                        self.dungeon.tiles[ty][tx] = TileType.FLOOR
+                        self.dungeon.set_tile(tx, ty, TileType.FLOOR)
 
             # v7.0: Check puzzle state if switch is part of a puzzle
             if interactive.puzzle_id and self.puzzle_manager:
@@ -821,7 +917,7 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
         if interactive.state == InteractiveState.INACTIVE:
             # Door is revealed but not opened - open it
             interactive.state = InteractiveState.ACTIVE
-            self.dungeon.tiles[y][x] = TileType.FLOOR
+            self.dungeon.set_tile(x, y, TileType.FLOOR)
 
             if interactive.activate_text:
                 self.add_message(interactive.activate_text)
@@ -841,7 +937,7 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
                 # Consume the key
                 self.player.inventory.remove_by_name(interactive.required_item)
                 interactive.state = InteractiveState.INACTIVE
-                self.dungeon.tiles[y][x] = TileType.FLOOR
+                self.dungeon.set_tile(x, y, TileType.FLOOR)
 
                 self.add_message(f"You use the {interactive.required_item} to unlock the door!")
                 return True
@@ -861,14 +957,18 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
             self.completion_ledger.record_turn()
 
         if self.turns_since_save >= AUTO_SAVE_INTERVAL:
+            if self.headless:
+                self.turns_since_save = 0
+                return
             self.save_manager.auto_save()
             self.add_message("Game saved.")
 
     def _check_player_death(self):
         """Check if player died and update state."""
         if self.player and not self.player.is_alive():
-            from ..data import delete_save
-            delete_save()
+            if not self.headless:
+                from ..data import delete_save
+                delete_save()
             self.state = GameState.DEAD
 
     # =========================================================================
@@ -885,7 +985,7 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
     def _handle_quit_confirm(self, confirmed: bool):
         """Handle quit confirmation dialog result."""
         if confirmed:
-            if self.save_manager.save_game():
+            if not self.headless and self.save_manager.save_game():
                 self.add_message("Game saved!")
             self.state = GameState.QUIT
 
@@ -906,6 +1006,7 @@ class GameEngine(EnvironmentMixin, UICommandsMixin):
     # Item Usage
     # =========================================================================
 
+    @uses_engine_rng
     def use_item(self, item_index: int) -> bool:
         """Use an item from inventory. Returns True if used."""
         if not self.player:
@@ -286,23 +286,13 @@ class EnvironmentMixin:
         px, py = self.player.x, self.player.y
 
         # Check if player is on any zone evidence tile
-        evidence_at_pos = None
-        evidence_index = None
-        for i, (ex, ey, char, color, evidence_type) in enumerate(self.dungeon.zone_evidence):
-            if ex == px and ey == py:
-                evidence_at_pos = (ex, ey, char, color, evidence_type)
-                evidence_index = i
-                break
-
+        # Always remove evidence when stepped on (one-time interaction)
+        evidence_at_pos = self.dungeon.pop_zone_evidence_at(px, py)
         if not evidence_at_pos:
             return
 
         _, _, char, _, evidence_type = evidence_at_pos
 
-        # Always remove evidence when stepped on (one-time interaction)
-        if evidence_index is not None:
-            self.dungeon.zone_evidence.pop(evidence_index)
-
         # Get evidence-specific lore IDs for current floor
         from ..story.lore_items import get_evidence_ids_for_floor
         evidence_lore_ids = get_evidence_ids_for_floor(self.current_level)
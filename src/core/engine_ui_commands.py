@@ -8,6 +8,7 @@ from typing import Optional, Tuple
 
 from .constants import UIMode, ItemRarity, EquipmentSlot
 from .commands import Command, CommandType
+from .rng import uses_engine_rng
 
 
 class UICommandsMixin:
@@ -17,6 +18,7 @@ class UICommandsMixin:
     # Inventory Commands
     # =========================================================================
 
+    @uses_engine_rng
     def process_inventory_command(self, command: Command):
         """Process a command while in inventory screen."""
         from ..items import LoreScroll, LoreBook
@@ -129,6 +131,7 @@ class UICommandsMixin:
     # Other UI Mode Commands
     # =========================================================================
 
+    @uses_engine_rng
     def process_character_command(self, command: Command):
         """Process a command in character screen."""
         cmd_type = command.type
@@ -194,6 +197,7 @@ class UICommandsMixin:
         if command.type == CommandType.CLOSE_SCREEN:
             self.ui_mode = UIMode.GAME
 
+    @uses_engine_rng
     def process_dialog_command(self, command: Command) -> Optional[bool]:
         """Process a command in dialog. Returns True/False/None."""
         if command.type == CommandType.CONFIRM:
@@ -212,6 +216,7 @@ class UICommandsMixin:
 
         return None
 
+    @uses_engine_rng
     def process_message_log_command(self, command: Command, visible_lines: int = 20):
         """Process a command in message log screen."""
         cmd_type = command.type
@@ -231,6 +236,7 @@ class UICommandsMixin:
         elif cmd_type == CommandType.PAGE_DOWN:
             self.message_log.scroll_down(visible_lines, visible_lines)
 
+    @uses_engine_rng
     def process_battle_command(self, command: Command) -> bool:
         """
         Process a command during tactical battle mode (v6.0.4).
@@ -184,8 +184,10 @@ class EventQueue:
 
     def __init__(self):
         self._events: List[GameEvent] = []
+        # v7.2: Muted queues drop events (headless replay/verification)
+        self.muted = False
 
-    def emit(self, event_type: EventType, **data) -> GameEvent:
+    def emit(self, event_type: EventType, **data) -> Optional[GameEvent]:
         """
         Emit an event to the queue.
 
@@ -194,8 +196,10 @@ class EventQueue:
             **data: Event-specific data as keyword arguments
 
         Returns:
-            The created event
+            The created event, or None if the queue is muted
         """
+        if self.muted:
+            return None
         event = GameEvent(type=event_type, data=data)
         self._events.append(event)
         return event
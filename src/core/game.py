@@ -201,6 +201,11 @@ class Game:
     def run(self):
         """Main game loop."""
         while self.engine.state != GameState.QUIT:
+            # Only the map view draws through the renderer's screen buffer;
+            # every other screen writes to stdscr, so repaint in full after one
+            if not self._showing_map():
+                self.renderer.invalidate()
+
             if self.engine.state == GameState.TITLE:
                 self._title_loop()
             elif self.engine.state == GameState.INTRO:
@@ -212,6 +217,12 @@ class Game:
             elif self.engine.state == GameState.VICTORY:
                 self._victory_loop()
 
+    def _showing_map(self) -> bool:
+        """Whether this tick draws the plain map view (no overlay or other screen)."""
+        return (self.engine.state == GameState.PLAYING
+                and self.engine.ui_mode == UIMode.GAME
+                and not self.engine.transition.active)
+
     # =========================================================================
     # Event Processing
     # =========================================================================
@@ -1,7 +1,8 @@
 """Message system for game feedback."""
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List
+from typing import Deque, Dict, List, Optional
 import time
 
 
@@ -28,54 +29,150 @@ class GameMessage:
     category: MessageCategory = MessageCategory.SYSTEM
     importance: MessageImportance = MessageImportance.NORMAL
     timestamp: float = field(default_factory=time.time)
+    seq: int = 0  # Position in the log (1-based, never reused); set by MessageLog
 
     def __str__(self) -> str:
         return self.text
 
 
 class MessageLog:
-    """Manages the game's message history."""
+    """Manages the game's message history.
+
+    Messages live in a fixed-capacity ring buffer; the oldest is dropped
+    once MAX_MESSAGES is reached. Every message gets a sequence number
+    that keeps counting across drops and clear(), so clients can ask for
+    "everything after seq N" (get_since) instead of re-reading the log.
+
+    Category/importance lookups use per-key seq queues, and the recent-N
+    views are cached until the next add, since the renderer and the
+    server's state serializer read them far more often than messages
+    arrive. Returned lists are shared: don't mutate them.
+    """
 
     MAX_MESSAGES = 100  # Keep last 100 messages
 
-    def __init__(self):
-        self.messages: List[GameMessage] = []
+    def __init__(self, capacity: int = MAX_MESSAGES):
+        self.capacity = capacity
+        self._ring: List[Optional[GameMessage]] = [None] * capacity
+        self._first_seq = 1  # Oldest retained message
+        self._next_seq = 1
+        self._by_category: Dict[MessageCategory, Deque[int]] = {c: deque() for c in MessageCategory}
+        self._by_importance: Dict[MessageImportance, Deque[int]] = {i: deque() for i in MessageImportance}
+        self._recent: Dict[int, List[GameMessage]] = {}
+        self._recent_text: Dict[int, List[str]] = {}
         self.scroll_offset = 0  # For message log screen scrolling
 
     def add(self, text: str, category: MessageCategory = MessageCategory.SYSTEM,
-            importance: MessageImportance = MessageImportance.NORMAL):
+            importance: MessageImportance = MessageImportance.NORMAL) -> GameMessage:
         """Add a new message to the log."""
-        msg = GameMessage(text=text, category=category, importance=importance)
-        self.messages.append(msg)
-
-        # Trim old messages
-        if len(self.messages) > self.MAX_MESSAGES:
-            self.messages = self.messages[-self.MAX_MESSAGES:]
+        seq = self._next_seq
+        slot = seq % self.capacity
+
+        # Drop the oldest message once full (it's first in its index queues)
+        if seq - self._first_seq >= self.capacity:
+            oldest = self._ring[slot]
+            self._by_category[oldest.category].popleft()
+            self._by_importance[oldest.importance].popleft()
+            self._first_seq += 1
+
+        msg = GameMessage(text=text, category=category, importance=importance, seq=seq)
+        self._ring[slot] = msg
+        self._by_category[category].append(seq)
+        self._by_importance[importance].append(seq)
+        self._next_seq += 1
+
+        if self._recent or self._recent_text:
+            self._recent.clear()
+            self._recent_text.clear()
+        return msg
+
+    def _range(self, start: int, end: int) -> List[GameMessage]:
+        """Messages with start <= seq < end (clamped to what's retained)."""
+        ring, capacity = self._ring, self.capacity
+        start = max(start, self._first_seq)
+        return [ring[seq % capacity] for seq in range(start, min(end, self._next_seq))]
+
+    @property
+    def messages(self) -> List[GameMessage]:
+        """All retained messages, oldest first."""
+        return self.get_all()
+
+    @property
+    def latest_seq(self) -> int:
+        """Sequence number of the newest message (0 if none yet)."""
+        return self._next_seq - 1
+
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest retained message."""
+        return self._first_seq
+
+    def __len__(self) -> int:
+        return self._next_seq - self._first_seq
+
+    # =========================================================================
+    # Views
+    # =========================================================================
 
     def get_recent(self, count: int = 5) -> List[GameMessage]:
-        """Get the most recent messages."""
-        return self.messages[-count:] if self.messages else []
+        """Get the most recent messages (cached until the next add)."""
+        recent = self._recent.get(count)
+        if recent is None:
+            recent = self._range(self._next_seq - count, self._next_seq) if count > 0 else []
+            self._recent[count] = recent
+        return recent
+
+    def recent_texts(self, count: int = 5) -> List[str]:
+        """Text of the most recent messages (cached until the next add)."""
+        texts = self._recent_text.get(count)
+        if texts is None:
+            texts = [msg.text for msg in self.get_recent(count)]
+            self._recent_text[count] = texts
+        return texts
+
+    def get_since(self, seq: int) -> List[GameMessage]:
+        """Messages newer than seq, oldest first.
+
+        If messages after seq have already been dropped, this starts at
+        the oldest retained one (compare its seq to spot the gap).
+        """
+        return self._range(seq + 1, self._next_seq)
 
     def get_all(self) -> List[GameMessage]:
         """Get all messages."""
-        return self.messages
+        return self._range(self._first_seq, self._next_seq)
 
     def get_by_category(self, category: MessageCategory) -> List[GameMessage]:
         """Get messages filtered by category."""
-        return [m for m in self.messages if m.category == category]
+        ring, capacity = self._ring, self.capacity
+        return [ring[seq % capacity] for seq in self._by_category[category]]
+
+    def get_by_importance(self, importance: MessageImportance) -> List[GameMessage]:
+        """Get messages filtered by importance."""
+        ring, capacity = self._ring, self.capacity
+        return [ring[seq % capacity] for seq in self._by_importance[importance]]
 
     def clear(self):
-        """Clear all messages."""
-        self.messages.clear()
+        """Clear all messages (sequence numbers keep counting)."""
+        self._ring = [None] * self.capacity
+        self._first_seq = self._next_seq
+        for index in (*self._by_category.values(), *self._by_importance.values()):
+            index.clear()
+        self._recent.clear()
+        self._recent_text.clear()
         self.scroll_offset = 0
 
+    # =========================================================================
+    # Scrolling (message log screen)
+    # =========================================================================
+
     def scroll_up(self, amount: int = 1):
         """Scroll up in the message log."""
         self.scroll_offset = max(0, self.scroll_offset - amount)
 
     def scroll_down(self, amount: int = 1, visible_lines: int = 20):
         """Scroll down in the message log."""
-        max_offset = max(0, len(self.messages) - visible_lines)
+        max_offset = max(0, len(self) - visible_lines)
         self.scroll_offset = min(max_offset, self.scroll_offset + amount)
 
     def reset_scroll(self):
@@ -84,4 +181,4 @@ class MessageLog:
 
     def to_string_list(self) -> List[str]:
         """Convert messages to simple string list (for compatibility)."""
-        return [msg.text for msg in self.messages]
+        return [msg.text for msg in self.get_all()]
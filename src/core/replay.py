@@ -0,0 +1,266 @@
+"""Deterministic command replay for GameEngine (v7.2).
+
+A run is fully described by its seed, race, class and the ordered list of
+commands the engine actually processed. Replaying that list through a fresh
+headless GameEngine rebuilds the exact same run, so recordings can be stored
+as compact command logs instead of per-turn frame dumps and re-verified
+server-side.
+
+Each engine draws from its own seeded generator (see rng.py), so replays
+and live sessions can interleave freely in one process.
+
+Usage:
+    recording = RunRecording(seed=1234, race='ELF', player_class='MAGE')
+    recording.record('MOVE_UP')
+    ...
+    replayer = RunReplayer(recording)
+    engine = replayer.fast_forward()      # Play to the end
+    engine = replayer.seek_turn(250)      # Jump via nearest checkpoint
+"""
+import copy
+import json
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Any
+
+from .constants import GameState, Race, PlayerClass
+from .commands import Command, CommandType
+from .engine import GameEngine
+
+
+# Bump when the command log format or engine semantics change incompatibly:
+# v2: hazard frontier; v3: far or unreachable enemies sleep; v4: floors
+# generated with the walkable-tile index (sampling consumes the RNG
+# differently, so older seeds build other floors); v5: each engine draws
+# from its own RNG (see rng.py); v6: walled-in gas stops rolling to spread
+REPLAY_FORMAT_VERSION = 6
+
+# Recordings older than this were played on the shared global RNG, where
+# other sessions' draws could change the run, so they can't be verified
+ISOLATED_RNG_VERSION = 5
+
+# Player turns between engine snapshots when seeking
+DEFAULT_CHECKPOINT_INTERVAL = 100
+
+
+def new_run_seed() -> int:
+    """Generate a fresh positive 31-bit run seed from OS entropy."""
+    return random.SystemRandom().randrange(1, 0x7FFFFFFF)
+
+
+@dataclass
+class RunRecording:
+    """Compact command log for a single run.
+
+    Commands are stored as ``"MOVE_UP"`` or ``["SELECT_FEAT", {...}]`` so the
+    JSON form stays small for long runs.
+    """
+    seed: int
+    race: Optional[str] = None
+    player_class: Optional[str] = None
+    commands: List[Any] = field(default_factory=list)
+    cheated: bool = False  # Cheat commands can't be replayed
+    version: int = REPLAY_FORMAT_VERSION
+    # Recorded ghosts the run was given per floor (server ghost pool)
+    ghosts: Dict[int, List[dict]] = field(default_factory=dict)
+
+    def record(self, command_type: str, data: Optional[dict] = None):
+        """Append a command that the engine processed."""
+        if data:
+            self.commands.append([command_type, data])
+        else:
+            self.commands.append(command_type)
+
+    def record_ghosts(self, floor: int, ghost_data: Optional[List[dict]]):
+        """Remember the ghost recordings a floor was initialized with."""
+        if ghost_data:
+            self.ghosts[floor] = list(ghost_data)
+
+    def iter_commands(self):
+        """Yield (command_type, data) pairs."""
+        for entry in self.commands:
+            if isinstance(entry, str):
+                yield entry, None
+            else:
+                yield entry[0], entry[1] if len(entry) > 1 else None
+
+    def to_dict(self) -> dict:
+        return {
+            'version': self.version,
+            'seed': self.seed,
+            'race': self.race,
+            'player_class': self.player_class,
+            'cheated': self.cheated,
+            'commands': self.commands,
+            'ghosts': self.ghosts,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'RunRecording':
+        return cls(
+            seed=data['seed'],
+            race=data.get('race'),
+            player_class=data.get('player_class'),
+            commands=list(data.get('commands', [])),
+            cheated=data.get('cheated', False),
+            version=data.get('version', REPLAY_FORMAT_VERSION),
+            ghosts={int(floor): ghosts for floor, ghosts in data.get('ghosts', {}).items()},
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, json_str: str) -> 'RunRecording':
+        return cls.from_dict(json.loads(json_str))
+
+
+@dataclass
+class _Checkpoint:
+    """Engine snapshot taken between commands."""
+    command_index: int
+    turn: int
+    engine: GameEngine  # Carries its own RNG state
+
+
+def summarize_run(engine: GameEngine, turns: int = 0) -> dict:
+    """Final-stat summary used to compare a replay against reported stats."""
+    player = engine.player
+    return {
+        'victory': engine.state == GameState.VICTORY,
+        'dead': engine.state == GameState.DEAD,
+        'level_reached': engine.current_level,
+        'kills': player.kills if player else 0,
+        'final_hp': player.health if player else 0,
+        'max_hp': player.max_health if player else 0,
+        'player_level': player.level if player else 1,
+        'turns_taken': turns,
+    }
+
+
+class RunReplayer:
+    """
+    Rebuilds a run from a RunRecording.
+
+    Fast-forwarding applies commands directly to a headless engine with no
+    serialization. Snapshots are taken every ``checkpoint_interval`` player
+    turns (0 disables them) so ``seek_turn`` can jump back and forth without
+    replaying from the start.
+    """
+
+    def __init__(self, recording: RunRecording,
+                 checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL):
+        if recording.version != REPLAY_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported replay version {recording.version} "
+                f"(expected {REPLAY_FORMAT_VERSION})"
+            )
+        self.recording = recording
+        self.checkpoint_interval = checkpoint_interval
+        self._commands: List[Tuple[str, Optional[dict]]] = list(recording.iter_commands())
+        self._checkpoints: Dict[int, _Checkpoint] = {}
+
+        self.engine: Optional[GameEngine] = None
+        self.command_index = 0  # Next command to apply
+        self.turn = 0           # Player turns taken so far
+        self.reset()
+
+    @property
+    def total_commands(self) -> int:
+        return len(self._commands)
+
+    @property
+    def finished(self) -> bool:
+        return self.command_index >= len(self._commands)
+
+    def reset(self):
+        """Start the run over from its seed."""
+        race = Race[self.recording.race] if self.recording.race else None
+        player_class = (PlayerClass[self.recording.player_class]
+                        if self.recording.player_class else None)
+
+        engine = GameEngine()
+        engine.headless = True
+        ghosts = self.recording.ghosts
+        engine.ghost_manager.ghost_provider = lambda floor: ghosts.get(floor)
+        engine.start_new_game(race=race, player_class=player_class,
+                              seed=self.recording.seed)
+        engine.flush_events()
+
+        self.engine = engine
+        self.command_index = 0
+        self.turn = 0
+        if self.checkpoint_interval and 0 not in self._checkpoints:
+            self._save_checkpoint()
+
+    def step(self) -> bool:
+        """Apply the next command. Returns True if the player took a turn."""
+        if self.finished:
+            return False
+
+        command_type, data = self._commands[self.command_index]
+        self.command_index += 1
+
+        engine = self.engine
+        # Transitions only gate live input by wall-clock time; the recorded
+        # stream already excludes commands that were dropped while locked.
+        if engine.transition.active:
+            engine.end_transition()
+
+        acted = engine.dispatch_command(Command(CommandType[command_type], data=data))
+        engine.flush_events()
+
+        if acted:
+            self.turn += 1
+            if (self.checkpoint_interval
+                    and self.turn % self.checkpoint_interval == 0
+                    and self.turn not in self._checkpoints):
+                self._save_checkpoint()
+        return acted
+
+    def fast_forward(self, to_turn: Optional[int] = None) -> GameEngine:
+        """Apply commands until the end of the log (or until ``to_turn``)."""
+        while not self.finished:
+            if to_turn is not None and self.turn >= to_turn:
+                break
+            self.step()
+            if self.engine.state in (GameState.DEAD, GameState.VICTORY, GameState.QUIT):
+                # Nothing after a terminal state can change the run
+                if to_turn is None:
+                    self.command_index = len(self._commands)
+                break
+        return self.engine
+
+    def seek_turn(self, turn: int) -> GameEngine:
+        """Jump to the state right after player turn ``turn``."""
+        candidates = [t for t in self._checkpoints if t <= turn]
+        best = max(candidates) if candidates else None
+        if best is not None and (turn < self.turn or best > self.turn):
+            self._restore_checkpoint(self._checkpoints[best])
+        elif turn < self.turn:
+            self.reset()
+        return self.fast_forward(to_turn=turn)
+
+    def summary(self) -> dict:
+        """Summarize the engine at the current replay position."""
+        return summarize_run(self.engine, self.turn)
+
+    def _save_checkpoint(self):
+        self._checkpoints[self.turn] = _Checkpoint(
+            command_index=self.command_index,
+            turn=self.turn,
+            engine=copy.deepcopy(self.engine),
+        )
+
+    def _restore_checkpoint(self, checkpoint: _Checkpoint):
+        # Copy again so the checkpoint stays reusable
+        self.engine = copy.deepcopy(checkpoint.engine)
+        self.command_index = checkpoint.command_index
+        self.turn = checkpoint.turn
+
+
+def replay_run(recording: RunRecording) -> dict:
+    """Replay a recording to the end and return its final summary."""
+    replayer = RunReplayer(recording, checkpoint_interval=0)
+    replayer.fast_forward()
+    return replayer.summary()
@@ -0,0 +1,76 @@
+"""Per-run random number generators (v7.2).
+
+Every GameEngine owns a ``random.Random`` seeded from its run seed. The
+server hosts many sessions in one process, so drawing from the global
+``random`` module let other sessions' draws leak into a run between its
+commands, and the run no longer replayed from its seed.
+
+Game code draws through ``rng`` instead of the ``random`` module. While an
+engine handles a call (methods decorated with ``uses_engine_rng``), ``rng``
+forwards to that engine's generator; Dungeon generation binds the
+generator it was given the same way. Outside any binding (tools, tests,
+standalone battles) ``rng`` falls back to the global ``random`` module, so
+seeding that still works as before.
+
+The binding is a ContextVar, so threads and asyncio tasks each see only
+their own engine's generator.
+
+Usage:
+    from ..core.rng import rng
+    damage = rng.randint(1, 6)
+
+    with use_rng(random.Random(seed)):
+        dungeon_features()
+"""
+import functools
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+_active: ContextVar[Optional[random.Random]] = ContextVar('active_rng', default=None)
+
+
+def active_rng():
+    """The generator bound in this context, else the global ``random`` module."""
+    generator = _active.get()
+    return random if generator is None else generator
+
+
+@contextmanager
+def use_rng(generator: Optional[random.Random]):
+    """Bind ``generator`` for the duration of the block (None keeps the current one)."""
+    if generator is None:
+        yield active_rng()
+        return
+    token = _active.set(generator)
+    try:
+        yield generator
+    finally:
+        _active.reset(token)
+
+
+def uses_engine_rng(method):
+    """Run an engine method with the engine's own ``rng`` bound."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        token = _active.set(self.rng)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            _active.reset(token)
+    return wrapper
+
+
+class _BoundRandom:
+    """Forwards random.Random methods to the generator bound in this context."""
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        return getattr(active_rng(), name)
+
+    def __repr__(self) -> str:
+        return f"<bound rng -> {active_rng()!r}>"
+
+
+rng = _BoundRandom()
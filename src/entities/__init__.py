@@ -1,14 +1,14 @@
 """Entity modules - Player, Enemy, and combat."""
 from .entity import Entity, Player, Enemy
 from .combat import attack, get_combat_message, player_attack, enemy_attack_player
-from .status_effects import StatusEffect, StatusEffectManager
+from .status_effects import StatusEffect, StatusEffectManager, StatusModifiers
 from .ai_behaviors import get_ai_action, tick_enemy_cooldowns
 from .ghosts import Ghost, GhostType, GhostPath, GhostManager, GHOST_ZONE_BIAS, GHOST_LIMITS
 
 __all__ = [
     'Entity', 'Player', 'Enemy',
     'attack', 'get_combat_message', 'player_attack', 'enemy_attack_player',
-    'StatusEffect', 'StatusEffectManager',
+    'StatusEffect', 'StatusEffectManager', 'StatusModifiers',
     'get_ai_action', 'tick_enemy_cooldowns',
     # Ghosts
     'Ghost', 'GhostType', 'GhostPath', 'GhostManager',
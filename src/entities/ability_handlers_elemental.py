@@ -2,10 +2,10 @@
 
 Contains fire, ice, lightning, dark magic, and ranged spell abilities.
 """
-import random
 from typing import TYPE_CHECKING, Tuple
 
 from .ability_definitions import BossAbility
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from .entities import Enemy, Player
@@ -154,7 +154,7 @@ def execute_chain_lightning(
         damage = player.take_damage(final_damage)
         msg = f"The {caster.name} unleashes chain lightning for {damage} damage{element_msg}!"
 
-        if random.random() < 0.3:
+        if rng.random() < 0.3:
             stun_msg = player.apply_status_effect(StatusEffectType.STUN, caster.name)
             msg += f" {stun_msg}"
 
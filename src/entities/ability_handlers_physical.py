@@ -2,10 +2,10 @@
 
 Contains melee attacks, AOE slams, status-inflicting bites, and utility abilities.
 """
-import random
 from typing import TYPE_CHECKING, Tuple
 
 from .ability_definitions import BossAbility
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from .entities import Enemy, Player
@@ -223,8 +223,8 @@ def execute_burrow(
 ) -> Tuple[bool, str, int]:
     """Burrows underground and repositions."""
     for _ in range(10):
-        dx = random.randint(-3, 3)
-        dy = random.randint(-3, 3)
+        dx = rng.randint(-3, 3)
+        dy = rng.randint(-3, 3)
         nx, ny = player.x + dx, player.y + dy
         if (dungeon.is_walkable(nx, ny) and
             not entity_manager.get_enemy_at(nx, ny) and
@@ -2,10 +2,10 @@
 
 Contains all abilities that spawn minions or allies.
 """
-import random
 from typing import TYPE_CHECKING, Tuple
 
 from .ability_definitions import BossAbility
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from .entities import Enemy, Player
@@ -24,7 +24,7 @@ def execute_summon_goblins(
     from .entities import Enemy
     from ..core.constants import EnemyType
 
-    num_goblins = random.randint(2, 3)
+    num_goblins = rng.randint(2, 3)
     spawned = 0
 
     for _ in range(num_goblins):
@@ -120,7 +120,7 @@ def execute_summon_spiders(
     from .entities import Enemy
     from ..core.constants import EnemyType
 
-    num_spiders = random.randint(2, 3)
+    num_spiders = rng.randint(2, 3)
     spawned = 0
 
     for _ in range(num_spiders):
@@ -157,7 +157,7 @@ def execute_summon_swarm(
     from .entities import Enemy
     from ..core.constants import EnemyType
 
-    num_rats = random.randint(3, 5)
+    num_rats = rng.randint(3, 5)
     spawned = 0
 
     for _ in range(num_rats):
@@ -207,9 +207,9 @@ def execute_royal_decree(
         (current_room.x + current_room.width - 2, current_room.y + current_room.height - 2),
     ]
 
-    num_guards = random.randint(1, 2)
+    num_guards = rng.randint(1, 2)
     spawned = 0
-    random.shuffle(corners)
+    rng.shuffle(corners)
 
     for cx, cy in corners:
         if spawned >= num_guards:
@@ -229,7 +229,7 @@ def execute_royal_decree(
             "The Regent rewrites reality - guards materialize!",
             "It was always thus - guards appear from the corners!",
         ]
-        return True, f"The Regent issues a decree: '{random.choice(decree_messages)}' ({spawned} guards summoned)", 0
+        return True, f"The Regent issues a decree: '{rng.choice(decree_messages)}' ({spawned} guards summoned)", 0
 
     return False, "", 0
 
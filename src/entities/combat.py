@@ -1,8 +1,8 @@
 """Combat system for the roguelike."""
-import random
 from typing import Tuple, Optional
 
 from .entities import Entity, Player
+from ..core.rng import rng
 
 
 def calculate_player_attack_damage(player: Player, base_damage: int) -> Tuple[int, bool, str]:
@@ -15,14 +15,15 @@ def calculate_player_attack_damage(player: Player, base_damage: int) -> Tuple[in
     damage = float(base_damage)
     was_critical = False
     bonus_message = ""
+    stats = player.stats
 
     # Apply combat mastery passive (+15% melee damage for warriors)
-    melee_bonus = player.get_melee_damage_bonus() if hasattr(player, 'get_melee_damage_bonus') else 0
+    melee_bonus = stats.melee_damage_bonus
     if melee_bonus > 0:
         damage *= (1 + melee_bonus)
 
     # Apply feat damage multiplier (weapon_master, berserker, etc.)
-    feat_mult = player.get_total_damage_multiplier() if hasattr(player, 'get_total_damage_multiplier') else 1.0
+    feat_mult = stats.damage_multiplier
     if feat_mult > 1.0:
         damage *= feat_mult
 
@@ -33,8 +34,8 @@ def calculate_player_attack_damage(player: Player, base_damage: int) -> Tuple[in
         bonus_message = "RAGE! "
 
     # Apply critical strike passive (20% chance for 2x damage for rogues) + feat crit bonus
-    crit_chance = player.get_crit_chance() if hasattr(player, 'get_crit_chance') else 0
-    if crit_chance > 0 and random.random() < crit_chance:
+    crit_chance = stats.crit_chance
+    if crit_chance > 0 and rng.random() < crit_chance:
         damage *= 2.0
         was_critical = True
         bonus_message += "CRITICAL! "
@@ -52,15 +53,16 @@ def calculate_player_defense(player: Player, incoming_damage: int) -> Tuple[int,
     damage = float(incoming_damage)
     was_dodged = False
     defense_message = ""
+    stats = player.stats
 
     # Apply lucky trait (15% dodge for halflings)
-    dodge_chance = player.get_dodge_chance() if hasattr(player, 'get_dodge_chance') else 0
-    if dodge_chance > 0 and random.random() < dodge_chance:
+    dodge_chance = stats.dodge_chance
+    if dodge_chance > 0 and rng.random() < dodge_chance:
         was_dodged = True
         return (0, True, "Dodged! ")
 
     # Apply mana shield passive (25% damage reduction for mages)
-    damage_reduction = player.get_damage_reduction() if hasattr(player, 'get_damage_reduction') else 0
+    damage_reduction = stats.damage_reduction
     if damage_reduction > 0:
         damage *= (1 - damage_reduction)
         defense_message = "Mana shield absorbed some damage. "
@@ -96,7 +98,7 @@ def player_attack(player: Player, enemy: Entity) -> Tuple[int, bool, str]:
     enemy_died = not enemy.is_alive()
 
     # Apply life steal feat (heal % of damage dealt)
-    life_steal = player.get_life_steal() if hasattr(player, 'get_life_steal') else 0
+    life_steal = player.stats.life_steal
     if life_steal > 0 and actual_damage > 0:
         heal_amount = int(actual_damage * life_steal)
         if heal_amount > 0:
@@ -127,7 +129,7 @@ def enemy_attack_player(enemy: Entity, player: Player) -> Tuple[int, bool, str,
 
     # Apply thorns damage (reflect % of melee damage back)
     thorns_damage = 0
-    thorns_pct = player.get_thorns_damage() if hasattr(player, 'get_thorns_damage') else 0
+    thorns_pct = player.stats.thorns
     if thorns_pct > 0 and actual_damage > 0:
         thorns_damage = int(actual_damage * thorns_pct)
         if thorns_damage > 0:
@@ -68,6 +68,9 @@ class Enemy(Entity):
         # v4.0 Stealth attributes
         self.is_invisible = False
 
+        # Stable id, assigned by EntityManager's registry (see entity_registry.py)
+        self.entity_id = None
+
         # v4.0 Element cycling attributes (for ELEMENTAL AI)
         self.current_element = self.element  # Start with base element
         self.element_cycle_turns = 0  # Turns until next cycle
@@ -1,7 +1,7 @@
 """Player entity class.
 
 Delegates to:
-- player_feats.py: Feat bonus aggregators
+- player_stats.py: Compiled stat sheet read by combat and serialization
 """
 from typing import List, Optional
 
@@ -11,15 +11,15 @@ from ...core.constants import (
 )
 from ...items import Inventory
 from ..player_abilities import (
-    PlayerAbility, AbilityCategory, get_abilities_for_class, PLAYER_ABILITIES
+    PlayerAbility, AbilityCategory, get_abilities_for_class
 )
 from ..feats import Feat, FEATS, get_feat, get_available_feats, should_gain_feat_at_level, FEAT_LEVELS
 from ..ability_scores import (
     AbilityScores, create_ability_scores, roll_ability_scores,
     get_hit_die, get_primary_stat
 )
-from . import player_feats
 from .base import Entity
+from .player_stats import PlayerStatSheet, build_stat_sheet
 
 
 class Player(Entity):
@@ -148,6 +148,9 @@ class Player(Entity):
         self.duplicate_next_consumable = False  # Set by Duplicate Seal
         self.guaranteed_rare_from_boss = False  # Set by Oathstone vow
 
+        # Derived stats, rebuilt lazily after feats/equipment/level change
+        self._stat_sheet: Optional[PlayerStatSheet] = None
+
     def _calculate_xp_for_next_level(self) -> int:
         """Calculate XP required to reach next level."""
         from ...core.constants import XP_BASE_REQUIREMENT
@@ -184,6 +187,7 @@ class Player(Entity):
 
             # Calculate next level requirement
             self.xp_to_next_level = self._calculate_xp_for_next_level()
+            self.invalidate_stats()
 
             return True
 
@@ -251,6 +255,7 @@ class Player(Entity):
             self.inventory.add_item(old_item)
             message += f", unequipped {old_item.name}"
 
+        self.invalidate_stats()
         return message
 
     def _recalculate_defense(self):
@@ -297,6 +302,7 @@ class Player(Entity):
             self.equipped_weapon = None
             self.attack_damage = self.base_attack
             self._apply_ring_bonuses()  # Reapply ring bonuses
+            self.invalidate_stats()
             self.inventory.add_item(item)
             return f"Unequipped {item.name}"
         elif slot == EquipmentSlot.ARMOR:
@@ -307,6 +313,7 @@ class Player(Entity):
             item = self.equipped_armor
             self.equipped_armor = None
             self._recalculate_defense()
+            self.invalidate_stats()
             self.inventory.add_item(item)
             return f"Unequipped {item.name}"
         elif slot == EquipmentSlot.OFF_HAND:
@@ -318,6 +325,7 @@ class Player(Entity):
             self.equipped_off_hand = None
             self._recalculate_defense()
             self.block_chance = 0.0
+            self.invalidate_stats()
             self.inventory.add_item(item)
             return f"Unequipped {item.name}"
         elif slot == EquipmentSlot.RING:
@@ -329,6 +337,7 @@ class Player(Entity):
             self.equipped_ring = None
             self._recalculate_defense()
             self._apply_ring_bonuses()
+            self.invalidate_stats()
             self.inventory.add_item(item)
             return f"Unequipped {item.name}"
         elif slot == EquipmentSlot.AMULET:
@@ -338,6 +347,7 @@ class Player(Entity):
                 return "Inventory full, cannot unequip!"
             item = self.equipped_amulet
             self.equipped_amulet = None
+            self.invalidate_stats()
             self.inventory.add_item(item)
             return f"Unequipped {item.name}"
 
@@ -410,43 +420,41 @@ class Player(Entity):
                 })
         return passive_list
 
+    # ========== Stat Sheet ==========
+
+    @property
+    def stats(self) -> PlayerStatSheet:
+        """Compiled derived stats (feats, traits, passives, equipment).
+
+        Rebuilt on first access after invalidate_stats(); also rebuilt if the
+        feat list or level was changed directly without invalidating.
+        """
+        sheet = self._stat_sheet
+        if sheet is None or sheet.feat_count != len(self.feats) or sheet.level != self.level:
+            sheet = self._stat_sheet = build_stat_sheet(self)
+        return sheet
+
+    def invalidate_stats(self):
+        """Mark derived stats stale after feats, equipment, level or scores change."""
+        self._stat_sheet = None
+
     # ========== Race Trait Methods ==========
 
     def get_xp_multiplier(self) -> float:
-        """Get XP multiplier from race trait + feats."""
-        multiplier = 1.0
-        # Human's Adaptive trait gives +10%
-        if self.race_trait == 'adaptive':
-            multiplier += 0.10
-        # Add feat XP bonus
-        multiplier += self.get_xp_feat_bonus()
-        return multiplier
+        """Get XP multiplier from race trait (Human +10%) + feats."""
+        return self.stats.xp_multiplier
 
     def get_vision_bonus(self) -> int:
-        """Get vision range bonus from race trait + feats."""
-        bonus = 0
-        # Elf's Keen Sight gives +2
-        if self.race_trait == 'keen_sight':
-            bonus += 2
-        # Add feat vision bonus
-        bonus += self.get_vision_feat_bonus()
-        return bonus
+        """Get vision range bonus from race trait (Elf +2) + feats."""
+        return self.stats.vision_bonus
 
     def get_dodge_chance(self) -> float:
-        """Get dodge chance from race trait + feats."""
-        chance = 0.0
-        # Halfling's Lucky gives 15%
-        if self.race_trait == 'lucky':
-            chance += 0.15
-        # Add feat dodge bonus
-        chance += self.get_total_dodge_bonus()
-        return min(chance, 0.50)  # Cap at 50%
+        """Get dodge chance from race trait (Halfling 15%) + feats, capped at 50%."""
+        return self.stats.dodge_chance
 
     def get_poison_resistance(self) -> float:
         """Get poison resistance (Dwarf's Poison Resist gives 50%)."""
-        if self.race_trait == 'poison_resist':
-            return 0.50
-        return 0.0
+        return self.stats.poison_resistance
 
     def get_rage_multiplier(self) -> float:
         """Get damage multiplier from Orc's Rage (50% bonus when below 25% HP)."""
@@ -459,29 +467,15 @@ class Player(Entity):
 
     def get_melee_damage_bonus(self) -> float:
         """Get melee damage bonus from Combat Mastery passive."""
-        if 'combat_mastery' in self.passive_abilities:
-            return PLAYER_ABILITIES['combat_mastery'].passive_bonus
-        return 0.0
+        return self.stats.melee_damage_bonus
 
     def get_damage_reduction(self) -> float:
-        """Get damage reduction from class passive + feats."""
-        reduction = 0.0
-        # Mage's Mana Shield passive
-        if 'mana_shield' in self.passive_abilities:
-            reduction += PLAYER_ABILITIES['mana_shield'].passive_bonus
-        # Add feat resistance
-        reduction += self.get_total_resistance()
-        return min(reduction, 0.75)  # Cap at 75%
+        """Get damage reduction from Mana Shield passive + feats, capped at 75%."""
+        return self.stats.damage_reduction
 
     def get_crit_chance(self) -> float:
-        """Get critical strike chance from class passive + feats."""
-        chance = 0.0
-        # Rogue's Critical Strike passive
-        if 'critical_strike' in self.passive_abilities:
-            chance += PLAYER_ABILITIES['critical_strike'].passive_bonus
-        # Add feat crit bonus
-        chance += self.get_total_crit_bonus()
-        return min(chance, 0.75)  # Cap at 75%
+        """Get critical strike chance from Critical Strike passive + feats, capped at 75%."""
+        return self.stats.crit_chance
 
     # ========== Feat Methods ==========
 
@@ -517,22 +511,13 @@ class Player(Entity):
 
         # Clear pending selection
         self.pending_feat_selection = False
+        self.invalidate_stats()
 
         return True
 
     def get_feat_info(self) -> list:
         """Get serializable info about player's feats."""
-        feat_list = []
-        for feat_id in self.feats:
-            feat = get_feat(feat_id)
-            if feat:
-                feat_list.append({
-                    'id': feat_id,
-                    'name': feat.name,
-                    'description': feat.description,
-                    'category': feat.category.name,
-                })
-        return feat_list
+        return list(self.stats.feat_info)
 
     def get_available_feats_info(self) -> list:
         """Get serializable info about feats available for selection."""
@@ -547,51 +532,51 @@ class Player(Entity):
             for f in available
         ]
 
-    # ========== Feat Bonus Aggregators (delegated to player_feats) ==========
+    # ========== Feat Bonus Aggregators (read from the stat sheet) ==========
 
     def get_total_damage_multiplier(self) -> float:
         """Get total damage multiplier from all feats."""
-        return player_feats.get_total_damage_multiplier(self.feats)
+        return self.stats.damage_multiplier
 
     def get_total_crit_bonus(self) -> float:
         """Get total crit bonus from feats."""
-        return player_feats.get_total_crit_bonus(self.feats)
+        return self.stats.crit_bonus
 
     def get_total_dodge_bonus(self) -> float:
         """Get total dodge bonus from feats."""
-        return player_feats.get_total_dodge_bonus(self.feats)
+        return self.stats.dodge_bonus
 
     def get_total_block_bonus(self) -> float:
         """Get total block bonus from feats."""
-        return player_feats.get_total_block_bonus(self.feats)
+        return self.stats.block_bonus
 
     def get_total_resistance(self) -> float:
         """Get total damage resistance from feats."""
-        return player_feats.get_total_resistance(self.feats)
+        return self.stats.resistance
 
     def get_life_steal(self) -> float:
         """Get life steal percentage from feats."""
-        return player_feats.get_life_steal(self.feats)
+        return self.stats.life_steal
 
     def get_thorns_damage(self) -> float:
         """Get thorns damage percentage from feats."""
-        return player_feats.get_thorns_damage(self.feats)
+        return self.stats.thorns
 
     def get_xp_feat_bonus(self) -> float:
         """Get XP bonus from feats (not race trait)."""
-        return player_feats.get_xp_feat_bonus(self.feats)
+        return self.stats.xp_feat_bonus
 
     def get_vision_feat_bonus(self) -> int:
         """Get vision bonus from feats."""
-        return player_feats.get_vision_feat_bonus(self.feats)
+        return self.stats.vision_feat_bonus
 
     def get_heal_bonus(self) -> float:
         """Get healing effectiveness bonus from feats."""
-        return player_feats.get_heal_bonus(self.feats)
+        return self.stats.heal_bonus
 
     def has_first_strike(self) -> bool:
         """Check if player has first strike feat."""
-        return player_feats.has_first_strike(self.feats)
+        return self.stats.first_strike
 
     # ========== Ability Score Methods ==========
 
@@ -617,35 +602,21 @@ class Player(Entity):
 
         Base AC = 10 + DEX modifier + armor bonus + shield bonus
         """
-        base_ac = 10 + self.ability_scores.dex_mod
-
-        # Add armor bonus
-        if self.equipped_armor:
-            base_ac += getattr(self.equipped_armor, 'armor_class_bonus', 0)
-
-        # Add shield bonus
-        if self.equipped_off_hand:
-            base_ac += getattr(self.equipped_off_hand, 'shield_ac_bonus', 0)
-
-        return base_ac
+        return self.stats.armor_class
 
     def get_attack_modifier(self) -> int:
         """Get attack roll modifier based on weapon type.
 
         Melee weapons use STR, ranged weapons use DEX.
         """
-        if self.equipped_weapon and getattr(self.equipped_weapon, 'is_ranged', False):
-            return self.ability_scores.dex_mod
-        return self.ability_scores.str_mod
+        return self.stats.attack_modifier
 
     def get_damage_modifier(self) -> int:
         """Get damage roll modifier based on weapon type.
 
         Melee weapons use STR, ranged weapons use DEX.
         """
-        if self.equipped_weapon and getattr(self.equipped_weapon, 'is_ranged', False):
-            return self.ability_scores.dex_mod
-        return self.ability_scores.str_mod
+        return self.stats.damage_modifier
 
     def get_ability_scores_info(self) -> dict:
         """Get serializable info about player's ability scores for frontend."""
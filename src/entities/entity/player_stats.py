@@ -0,0 +1,153 @@
+"""Compiled player stat sheet.
+
+Combat and serialization used to re-walk the feat list (and look up each
+feat definition) on every hit, dodge roll and state push. The sheet folds
+feats, race trait, class passives and equipment into flat attributes once;
+Player rebuilds it only after feats, equipment, level or ability scores
+change (see Player.stats / Player.invalidate_stats).
+
+Values that depend on current health (Orc rage) are not cached.
+"""
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List
+
+from ..feats import get_feat
+from ..player_abilities import PLAYER_ABILITIES
+
+if TYPE_CHECKING:
+    from .player import Player
+
+# Caps shared with the old per-call getters
+MAX_DODGE_CHANCE = 0.50
+MAX_CRIT_CHANCE = 0.75
+MAX_DAMAGE_REDUCTION = 0.75
+MAX_FEAT_RESISTANCE = 0.75
+
+
+@dataclass(frozen=True)
+class PlayerStatSheet:
+    """Derived player stats, valid until the next invalidate_stats()."""
+
+    # Feat totals
+    damage_multiplier: float = 1.0
+    crit_bonus: float = 0.0
+    dodge_bonus: float = 0.0
+    block_bonus: float = 0.0
+    resistance: float = 0.0
+    life_steal: float = 0.0
+    thorns: float = 0.0
+    xp_feat_bonus: float = 0.0
+    vision_feat_bonus: int = 0
+    heal_bonus: float = 0.0
+    first_strike: bool = False
+
+    # Combined with race trait / class passives
+    xp_multiplier: float = 1.0
+    vision_bonus: int = 0
+    dodge_chance: float = 0.0
+    crit_chance: float = 0.0
+    damage_reduction: float = 0.0
+    melee_damage_bonus: float = 0.0
+    poison_resistance: float = 0.0
+
+    # Equipment
+    block_chance: float = 0.0
+    armor_class: int = 10
+    attack_modifier: int = 0
+    damage_modifier: int = 0
+
+    # Serialized feat list for the web client
+    feat_info: tuple = ()
+
+    # Staleness guard for direct edits that bypass invalidate_stats()
+    feat_count: int = 0
+    level: int = 1
+
+
+def build_stat_sheet(player: 'Player') -> PlayerStatSheet:
+    """Fold feats, traits, passives and equipment into one sheet."""
+    damage_multiplier = 1.0
+    crit = dodge = block = resistance = life_steal = thorns = xp = heal = 0.0
+    vision = 0
+    first_strike = False
+    feat_info: List[dict] = []
+
+    for feat_id in player.feats:
+        feat = get_feat(feat_id)
+        if not feat:
+            continue
+        if feat.damage_multiplier > 0:
+            damage_multiplier *= (1 + feat.damage_multiplier)
+        crit += feat.crit_bonus
+        dodge += feat.dodge_bonus
+        block += feat.block_bonus
+        resistance += feat.resistance_all
+        life_steal += feat.life_steal
+        thorns += feat.thorns
+        xp += feat.xp_bonus
+        vision += feat.vision_bonus
+        heal += feat.heal_bonus
+        first_strike = first_strike or feat.first_strike
+        feat_info.append({
+            'id': feat_id,
+            'name': feat.name,
+            'description': feat.description,
+            'category': feat.category.name,
+        })
+    resistance = min(resistance, MAX_FEAT_RESISTANCE)
+
+    trait = player.race_trait
+    passives = player.passive_abilities
+
+    # Human's Adaptive trait gives +10% XP, Elf's Keen Sight +2 vision,
+    # Halfling's Lucky 15% dodge, Dwarf's Poison Resist 50%
+    xp_multiplier = 1.0 + (0.10 if trait == 'adaptive' else 0.0) + xp
+    vision_bonus = (2 if trait == 'keen_sight' else 0) + vision
+    dodge_chance = min((0.15 if trait == 'lucky' else 0.0) + dodge, MAX_DODGE_CHANCE)
+    poison_resistance = 0.50 if trait == 'poison_resist' else 0.0
+
+    def passive_bonus(ability_id: str) -> float:
+        if ability_id in passives:
+            return PLAYER_ABILITIES[ability_id].passive_bonus
+        return 0.0
+
+    crit_chance = min(passive_bonus('critical_strike') + crit, MAX_CRIT_CHANCE)
+    damage_reduction = min(passive_bonus('mana_shield') + resistance, MAX_DAMAGE_REDUCTION)
+
+    scores = player.ability_scores
+    ranged = bool(player.equipped_weapon and getattr(player.equipped_weapon, 'is_ranged', False))
+    roll_mod = scores.dex_mod if ranged else scores.str_mod
+
+    armor_class = 10 + scores.dex_mod
+    if player.equipped_armor:
+        armor_class += getattr(player.equipped_armor, 'armor_class_bonus', 0)
+    if player.equipped_off_hand:
+        armor_class += getattr(player.equipped_off_hand, 'shield_ac_bonus', 0)
+
+    return PlayerStatSheet(
+        damage_multiplier=damage_multiplier,
+        crit_bonus=crit,
+        dodge_bonus=dodge,
+        block_bonus=block,
+        resistance=resistance,
+        life_steal=life_steal,
+        thorns=thorns,
+        xp_feat_bonus=xp,
+        vision_feat_bonus=vision,
+        heal_bonus=heal,
+        first_strike=first_strike,
+        xp_multiplier=xp_multiplier,
+        vision_bonus=vision_bonus,
+        dodge_chance=dodge_chance,
+        crit_chance=crit_chance,
+        damage_reduction=damage_reduction,
+        melee_damage_bonus=passive_bonus('combat_mastery'),
+        poison_resistance=poison_resistance,
+        block_chance=player.block_chance + block,
+        armor_class=armor_class,
+        attack_modifier=roll_mod,
+        damage_modifier=roll_mod,
+        feat_info=tuple(feat_info),
+        feat_count=len(player.feats),
+        level=player.level,
+    )
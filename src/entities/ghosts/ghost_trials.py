@@ -125,12 +125,12 @@ class GhostTrialHandler:
         trial_enemy.name = "Champion's Challenger"
         trial_enemy.xp_reward = int(trial_enemy.xp_reward * 1.5)  # Bonus XP
 
-        # Track the trial enemy by its id
-        trial_id = id(trial_enemy)
+        entity_manager.enemies.append(trial_enemy)
+
+        # Track the trial enemy by its stable id (survives save/load)
+        trial_id = int(entity_manager.enemy_id(trial_enemy))
         ghost.trial_enemy_id = trial_id
         self._trial_enemies.add(trial_id)
-
-        entity_manager.enemies.append(trial_enemy)
         messages.append(f"A {trial_enemy.name} materializes!")
 
         return messages
@@ -159,11 +159,8 @@ class GhostTrialHandler:
                 continue
 
             # Check if trial enemy is still alive
-            trial_alive = False
-            for enemy in entity_manager.enemies:
-                if id(enemy) == ghost.trial_enemy_id and enemy.is_alive():
-                    trial_alive = True
-                    break
+            enemy = entity_manager.get_enemy_by_id(ghost.trial_enemy_id)
+            trial_alive = enemy is not None and enemy.is_alive()
 
             if not trial_alive:
                 # Trial completed! Grant reward
@@ -188,7 +185,7 @@ class GhostTrialHandler:
 
     def is_trial_enemy(self, enemy) -> bool:
         """Check if an enemy is a champion trial enemy."""
-        return id(enemy) in self._trial_enemies
+        return getattr(enemy, 'entity_id', None) in self._trial_enemies
 
     def clear(self):
         """Clear trial state."""
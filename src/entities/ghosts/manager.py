@@ -8,13 +8,14 @@ Delegates to specialized modules:
 - ghost_behaviors.py: Per-turn behavior processing
 - ghost_trials.py: Champion trial system and Hollowed spawning
 """
-from typing import TYPE_CHECKING, Optional, List, Tuple, Set
+from typing import TYPE_CHECKING, Callable, Optional, List, Tuple, Set
 
 from .types import GhostType
 from .ghost import Ghost, GhostPath
 from .ghost_spawning import GhostSpawner
 from .ghost_behaviors import GhostBehaviorProcessor
 from .ghost_trials import GhostTrialHandler
+from ...world.spatial_hash import SpatialHash
 
 if TYPE_CHECKING:
     from ...world import Dungeon
@@ -35,11 +36,15 @@ class GhostManager:
 
     def __init__(self):
         self.ghosts: List[Ghost] = []
+        self._index: SpatialHash[Ghost] = SpatialHash()
         self.floor = 0
         self.seed = 0
         self._silence_positions: Set[Tuple[int, int]] = set()
         # Anti-spam: track which message types shown this floor
         self._messages_shown: Set[GhostType] = set()
+        # Optional source of recorded ghosts per floor (server ghost pool,
+        # or a replay's recorded ghosts); must return without blocking
+        self.ghost_provider: Optional[Callable[[int], Optional[List[dict]]]] = None
 
         # Delegate to specialized handlers
         self._spawner = GhostSpawner()
@@ -55,6 +60,7 @@ class GhostManager:
             floor: Current floor number
             dungeon: The dungeon instance
             ghost_data: Optional list of ghost recordings to use
+                (defaults to ghost_provider's recordings for the floor)
             seed: Optional seed for determinism
             victory_legacy: Optional VictoryLegacyResult for derived victory imprints
         """
@@ -65,6 +71,9 @@ class GhostManager:
         self._messages_shown.clear()
         self._trial_handler.clear()
 
+        if ghost_data is None and self.ghost_provider is not None:
+            ghost_data = self.ghost_provider(floor)
+
         # Delegate spawning to GhostSpawner
         self.ghosts, self._silence_positions = self._spawner.initialize_floor(
             floor=floor,
@@ -73,6 +82,19 @@ class GhostManager:
             seed=self.seed,
             victory_legacy=victory_legacy
         )
+        self._reindex()
+
+    def _reindex(self):
+        """Rebuild the spatial index from self.ghosts."""
+        self._index.clear()
+        for ghost in self.ghosts:
+            self._index.insert(ghost)
+
+    def _ghost_index(self) -> SpatialHash:
+        """The spatial index, rebuilt if ghosts were added or removed directly."""
+        if len(self._index) != len(self.ghosts):
+            self._reindex()
+        return self._index
 
     def tick(self, player: 'Player', dungeon: 'Dungeon') -> List[str]:
         """Process ghost behaviors for this turn.
@@ -80,13 +102,18 @@ class GhostManager:
         Returns:
             List of messages to display
         """
-        return self._behavior_processor.tick(
+        messages = self._behavior_processor.tick(
             ghosts=self.ghosts,
             player=player,
             dungeon=dungeon,
             messages_shown=self._messages_shown,
             pending_trial_callback=self._trial_handler.set_pending_trial
         )
+        # Echo ghosts walk their paths
+        index = self._ghost_index()
+        for ghost in self.ghosts:
+            index.update(ghost)
+        return messages
 
     def check_silence_debuff(self, x: int, y: int) -> Optional[str]:
         """Check if position is in a Silence zone.
@@ -100,22 +127,18 @@ class GhostManager:
 
     def get_ghost_at(self, x: int, y: int) -> Optional[Ghost]:
         """Get ghost at position (for rendering)."""
-        for ghost in self.ghosts:
-            if ghost.active and ghost.x == x and ghost.y == y:
+        for ghost in self._ghost_index().at(x, y):
+            if ghost.active:
                 return ghost
         return None
 
     def get_visible_ghosts(self, player_x: int, player_y: int,
                            view_distance: int = 8) -> List[Ghost]:
         """Get ghosts visible to player."""
-        visible = []
-        for ghost in self.ghosts:
-            if not ghost.active:
-                continue
-            dist = abs(ghost.x - player_x) + abs(ghost.y - player_y)
-            if dist <= view_distance:
-                visible.append(ghost)
-        return visible
+        return [
+            ghost for ghost in self._ghost_index().query_radius(player_x, player_y, view_distance)
+            if ghost.active
+        ]
 
     def spawn_hollowed_enemy(self, dungeon: 'Dungeon', entity_manager) -> bool:
         """Spawn Hollowed ghosts as actual enemies.
@@ -240,10 +263,12 @@ class GhostManager:
                 )
 
             self.ghosts.append(ghost)
+        self._reindex()
 
     def clear(self):
         """Clear ghost state for new floor."""
         self.ghosts.clear()
+        self._index.clear()
         self._silence_positions.clear()
         self._messages_shown.clear()
         self._trial_handler.clear()
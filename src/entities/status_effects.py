@@ -41,11 +41,59 @@ class StatusEffect:
         return self.duration <= 0
 
 
+@dataclass(frozen=True)
+class StatusModifiers:
+    """Active effects folded into the numbers movement and turns need."""
+    movement_penalty: float = 0.0   # 0.0 to 1.0
+    damage_per_turn: int = 0        # DoT total for the next tick
+    stunned: bool = False
+    frozen: bool = False
+
+
+NO_MODIFIERS = StatusModifiers()
+
+
+def compile_modifiers(effects: List[StatusEffect]) -> StatusModifiers:
+    """Fold a list of effects into one StatusModifiers."""
+    if not effects:
+        return NO_MODIFIERS
+    penalty = 0.0
+    damage = 0
+    for effect in effects:
+        penalty += effect.stats.get('movement_penalty', 0.0)
+        damage += effect.damage_per_turn
+    types = {effect.effect_type for effect in effects}
+    return StatusModifiers(
+        movement_penalty=min(penalty, 1.0),  # Cap at 100% penalty
+        damage_per_turn=damage,
+        stunned=StatusEffectType.STUN in types,
+        frozen=StatusEffectType.FREEZE in types,
+    )
+
+
 class StatusEffectManager:
-    """Manages status effects for an entity."""
+    """Manages status effects for an entity.
+
+    Getters read a cached StatusModifiers that apply/tick/remove/clear
+    invalidate (and that is rebuilt if effects is appended to directly).
+    """
 
     def __init__(self):
         self.effects: List[StatusEffect] = []
+        self._modifiers: Optional[StatusModifiers] = None
+        self._modifiers_count = 0
+
+    @property
+    def modifiers(self) -> StatusModifiers:
+        """Cached modifier bundle for the active effects."""
+        if self._modifiers is None or self._modifiers_count != len(self.effects):
+            self._modifiers = compile_modifiers(self.effects)
+            self._modifiers_count = len(self.effects)
+        return self._modifiers
+
+    def invalidate(self):
+        """Drop the cached modifiers after effects change."""
+        self._modifiers = None
 
     def apply_effect(self, effect_type: StatusEffectType, source: Optional[str] = None) -> str:
         """Apply a status effect with proper stacking rules.
@@ -59,6 +107,7 @@ class StatusEffectManager:
 
         # Check if effect already exists
         existing = self.get_effect(effect_type)
+        self.invalidate()
 
         if existing:
             if stacking == 'intensity':
@@ -103,18 +152,23 @@ class StatusEffectManager:
         for i, effect in enumerate(self.effects):
             if effect.effect_type == effect_type:
                 self.effects.pop(i)
+                self.invalidate()
                 return True
         return False
 
     def clear_all(self):
         """Remove all status effects."""
         self.effects.clear()
+        self.invalidate()
 
     def tick(self) -> List[dict]:
         """Process all effects for one turn.
 
         Returns a list of effect results with damage and messages.
         """
+        if not self.effects:
+            return []
+
         results = []
         expired = []
 
@@ -151,23 +205,22 @@ class StatusEffectManager:
         # Remove expired effects
         for effect in expired:
             self.effects.remove(effect)
+        if expired:
+            self.invalidate()
 
         return results
 
     def get_movement_penalty(self) -> float:
         """Get total movement penalty from effects (0.0 to 1.0)."""
-        penalty = 0.0
-        for effect in self.effects:
-            penalty += effect.stats.get('movement_penalty', 0.0)
-        return min(penalty, 1.0)  # Cap at 100% penalty
+        return self.modifiers.movement_penalty
 
     def is_stunned(self) -> bool:
         """Check if entity is currently stunned."""
-        return self.has_effect(StatusEffectType.STUN)
+        return self.modifiers.stunned
 
     def is_frozen(self) -> bool:
         """Check if entity is currently frozen."""
-        return self.has_effect(StatusEffectType.FREEZE)
+        return self.modifiers.frozen
 
     def get_active_effect_names(self) -> List[str]:
         """Get list of active effect names for display."""
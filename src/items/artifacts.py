@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Optional, List, Tuple
 import random
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from ..entities import Player
@@ -584,7 +585,7 @@ def _spawn_phantom_ally(engine: 'GameEngine') -> bool:
                     spawn_positions.append((nx, ny))
 
     if spawn_positions:
-        pos = random.choice(spawn_positions)
+        pos = rng.choice(spawn_positions)
         # Create a friendly "phantom" - uses skeleton base but marked as ally
         phantom = Enemy(pos[0], pos[1], enemy_type=EnemyType.SKELETON)
         phantom.name = "Phantom Ally"
@@ -629,7 +630,7 @@ def _spawn_witness_enemy(engine: 'GameEngine'):
 
     if spawn_positions:
         # Spawn a skeleton (thematic for "paperwork witness")
-        pos = random.choice(spawn_positions)
+        pos = rng.choice(spawn_positions)
         witness = Enemy(pos[0], pos[1], enemy_type=EnemyType.SKELETON)
         witness.name = "Oath-Bound Witness"
         engine.entity_manager.enemies.append(witness)
@@ -1,13 +1,14 @@
 """Combat orchestration and damage flow."""
-import random
 from typing import TYPE_CHECKING, Optional
 
 from ..entities import attack, get_combat_message, player_attack, enemy_attack_player
-from ..entities.ai_behaviors import get_ai_action, tick_enemy_cooldowns
+from ..entities.ai_behaviors import get_ai_action
 from ..core.constants import GameState, ELITE_XP_MULTIPLIER, BOSS_LOOT, AIBehavior
 from ..core.events import EventType, EventQueue
 from ..core.messages import MessageImportance
 from ..items import ItemType, create_item
+from .enemy_activity import ActivityTier, EnemyTurnBatch
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from ..core.game import Game
@@ -33,6 +34,8 @@ class CombatManager:
     def __init__(self, game: 'Game', event_queue: EventQueue = None):
         self.game = game
         self.events = event_queue
+        # Awake/asleep counts from the last enemy turn (for debugging/profiling)
+        self.last_activity = {tier.value: 0 for tier in ActivityTier}
 
     def try_move_or_attack(self, dx: int, dy: int) -> bool:
         """
@@ -49,7 +52,7 @@ class CombatManager:
         enemy = self.game.entity_manager.get_enemy_at(new_x, new_y)
         if enemy:
             # v6.0: Start tactical battle instead of exploration damage
-            enemy_id = str(id(enemy))
+            enemy_id = self.game.entity_manager.enemy_id(enemy)
             self.game.battle_manager.start_battle(
                 enemy_ids=[enemy_id],
                 trigger_x=new_x,
@@ -357,13 +360,18 @@ class CombatManager:
                 dropped_count += 1
 
     def process_enemy_turns(self):
-        """Process all enemy turns."""
-        for enemy in self.game.entity_manager.enemies:
-            if not enemy.is_alive():
-                continue
+        """Process all enemy turns.
+
+        Status effects and cooldowns tick for every living enemy; only
+        awake enemies (see enemy_activity.py) take an AI turn.
+        """
+        batch = EnemyTurnBatch(
+            self.game.entity_manager.enemies, self.game.player, self.game.dungeon
+        )
+        self.last_activity = {tier.value: batch.count(tier) for tier in ActivityTier}
 
-            # v4.0: Process status effects first
-            effect_results = enemy.process_status_effects()
+        # v4.0: Process status effects first
+        for enemy, effect_results in batch.tick_status_effects():
             for result in effect_results:
                 if result.get('message'):
                     enemy_name = self._get_enemy_name(enemy)
@@ -373,16 +381,19 @@ class CombatManager:
             if not enemy.is_alive():
                 self.game.player.kills += 1
                 self.game.add_message(f"{self._get_enemy_name(enemy)} succumbed to their wounds!")
+
+        # Tick ability cooldowns (stunned enemies' stay frozen)
+        batch.tick_cooldowns()
+
+        for enemy, stunned in batch.awake():
+            if not enemy.is_alive():
                 continue
 
             # v4.0: Check if stunned (skip turn)
-            if enemy.is_stunned():
+            if stunned:
                 self.game.add_message(f"{self._get_enemy_name(enemy)} is stunned!")
                 continue
 
-            # Tick ability cooldowns
-            tick_enemy_cooldowns(enemy)
-
             # Tick element cycling for elemental enemies
             cycled, new_element, cycle_message = enemy.tick_element_cycle()
             if cycled and cycle_message:
@@ -441,7 +452,7 @@ class CombatManager:
                         # Check if moving into player
                         if new_x == self.game.player.x and new_y == self.game.player.y:
                             # v6.3.1: Start tactical battle instead of direct attack
-                            enemy_id = str(id(enemy))
+                            enemy_id = self.game.entity_manager.enemy_id(enemy)
                             self.game.battle_manager.start_battle(
                                 enemy_ids=[enemy_id],
                                 trigger_x=enemy.x,
@@ -470,7 +481,7 @@ class CombatManager:
             # Check if moving into player
             if new_x == self.game.player.x and new_y == self.game.player.y:
                 # v6.3.1: Start tactical battle instead of direct attack
-                enemy_id = str(id(enemy))
+                enemy_id = self.game.entity_manager.enemy_id(enemy)
                 self.game.battle_manager.start_battle(
                     enemy_ids=[enemy_id],
                     trigger_x=enemy.x,
@@ -503,10 +514,8 @@ class CombatManager:
             enemy_name = enemy.name
 
         # v4.0: Check for shield block (includes feat block bonus)
-        total_block_chance = player.block_chance
-        feat_block_bonus = player.get_total_block_bonus() if hasattr(player, 'get_total_block_bonus') else 0
-        total_block_chance += feat_block_bonus
-        if total_block_chance > 0 and random.random() < total_block_chance:
+        total_block_chance = player.stats.block_chance
+        if total_block_chance > 0 and rng.random() < total_block_chance:
             self.game.add_message(f"You block {enemy_name}'s attack with your shield!")
             # Emit blocked event (no damage)
             if self.events is not None:
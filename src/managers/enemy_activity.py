@@ -0,0 +1,115 @@
+"""Per-turn activity tiers for exploration enemies.
+
+CombatManager.process_enemy_turns used to run the full per-enemy pipeline
+(status effects, cooldowns, element cycling, shadow concealment, AI) for
+every enemy on the floor, although most of them can't do anything: an
+enemy beyond its chase range never moves, and one walled off from the
+player can't reach them.
+
+EnemyTurnBatch sorts the living enemies into tiers once per turn:
+- AWAKE: within chase range and in the player's walkable region; gets
+  the full AI turn
+- ASLEEP: everything else; skipped by the AI
+
+Bookkeeping that must keep running off-screen (damage over time, ability
+cooldowns) is done in batched passes over parallel per-enemy lists, which
+only touch the enemies that actually have something to tick.
+
+Tiers are recomputed from positions every turn, so nothing is saved.
+"""
+from enum import Enum
+from typing import TYPE_CHECKING, List, Tuple
+
+from ..core.constants import BOSS_CHASE_RANGE, ENEMY_CHASE_RANGE
+from ..world.dungeon_index import NO_REGION
+
+if TYPE_CHECKING:
+    from ..entities import Enemy, Player
+    from ..world import Dungeon
+
+
+class ActivityTier(Enum):
+    """How much of a turn an enemy gets."""
+    AWAKE = 'awake'
+    ASLEEP = 'asleep'
+
+
+def wake_radius(enemy: 'Enemy') -> int:
+    """Distance within which an enemy acts (its chase range)."""
+    return BOSS_CHASE_RANGE if enemy.is_boss else ENEMY_CHASE_RANGE
+
+
+class EnemyTurnBatch:
+    """Living enemies for one turn, with parallel tier/stun columns."""
+
+    def __init__(self, enemies: List['Enemy'], player: 'Player', dungeon: 'Dungeon'):
+        self.enemies: List['Enemy'] = [enemy for enemy in enemies if enemy.is_alive()]
+        self.tiers: List[ActivityTier] = self._classify(player, dungeon)
+        self.stunned: List[bool] = [False] * len(self.enemies)
+
+    def _classify(self, player: 'Player', dungeon: 'Dungeon') -> List[ActivityTier]:
+        index = getattr(dungeon, 'index', None)
+        region_at = index.region_at if index is not None else None
+        player_region = region_at(player.x, player.y) if region_at else NO_REGION
+        px, py = player.x, player.y
+
+        tiers = []
+        for enemy in self.enemies:
+            # Squared Euclidean, matching Enemy.distance_to without the sqrt
+            radius = wake_radius(enemy)
+            dx, dy = enemy.x - px, enemy.y - py
+            if dx * dx + dy * dy > radius * radius:
+                tiers.append(ActivityTier.ASLEEP)
+                continue
+            if player_region != NO_REGION:
+                region = region_at(enemy.x, enemy.y)
+                if region != NO_REGION and region != player_region:
+                    tiers.append(ActivityTier.ASLEEP)
+                    continue
+            tiers.append(ActivityTier.AWAKE)
+        return tiers
+
+    # =========================================================================
+    # Batched passes (all tiers)
+    # =========================================================================
+
+    def tick_status_effects(self) -> List[Tuple['Enemy', List[dict]]]:
+        """Tick status effects for every enemy that has any.
+
+        Records who is stunned for this turn. Returns (enemy, results)
+        for each enemy ticked, in list order.
+        """
+        ticked = []
+        stunned = self.stunned
+        for i, enemy in enumerate(self.enemies):
+            if not enemy.status_effects.effects:
+                continue
+            ticked.append((enemy, enemy.process_status_effects()))
+            stunned[i] = enemy.is_stunned()
+        return ticked
+
+    def tick_cooldowns(self):
+        """Count down ability cooldowns for every enemy that isn't stunned."""
+        stunned = self.stunned
+        for i, enemy in enumerate(self.enemies):
+            cooldowns = enemy.ability_cooldowns
+            if not cooldowns or stunned[i] or not enemy.is_alive():
+                continue
+            for ability_name, turns in cooldowns.items():
+                if turns > 0:
+                    cooldowns[ability_name] = turns - 1
+
+    # =========================================================================
+    # Tier views
+    # =========================================================================
+
+    def awake(self) -> List[Tuple['Enemy', bool]]:
+        """(enemy, stunned) for each awake enemy, in list order."""
+        return [
+            (enemy, self.stunned[i])
+            for i, enemy in enumerate(self.enemies)
+            if self.tiers[i] is ActivityTier.AWAKE
+        ]
+
+    def count(self, tier: ActivityTier) -> int:
+        return sum(1 for t in self.tiers if t is tier)
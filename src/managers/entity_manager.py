@@ -6,6 +6,8 @@ from ..entities import Player, Enemy
 from ..items import Item, ItemType, create_item, ArtifactManager, ArtifactInstance
 from . import entity_spawning
 from . import lore_spawning
+from .entity_registry import EntityRegistry
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from ..world import Dungeon
@@ -21,10 +23,14 @@ class EntityManager:
         self.boss_defeated: bool = False
         # v5.5: Artifact system
         self.artifact_manager = ArtifactManager()
+        # Stable enemy ids for battles, reinforcements and ghost trials
+        self.registry = EntityRegistry()
 
     def spawn_enemies(self, dungeon: 'Dungeon', player: Player):
         """Spawn enemies in random rooms with weighted type selection."""
         entity_spawning.spawn_enemies(self.enemies, dungeon, player)
+        # The list is refilled in place; re-index the new floor's enemies
+        self.registry.clear()
 
     def spawn_items(self, dungeon: 'Dungeon', player: Player):
         """Spawn items in random locations."""
@@ -41,22 +47,22 @@ class EntityManager:
                 self.items.append(item)
 
         # RANDOM: 0-2 additional consumable items
-        num_consumables = random.randint(0, 2)
+        num_consumables = rng.randint(0, 2)
         for _ in range(num_consumables):
             pos = dungeon.get_random_floor_position()
             if pos[0] != player.x or pos[1] != player.y:
-                item_type = random.choice(CONSUMABLE_TYPES)
+                item_type = rng.choice(CONSUMABLE_TYPES)
                 item = create_item(item_type, pos[0], pos[1])
                 self.items.append(item)
 
         # RANDOM: 0-2 equipment items per level (rarer than consumables)
-        num_equipment = random.randint(0, 2)
+        num_equipment = rng.randint(0, 2)
         for _ in range(num_equipment):
             pos = dungeon.get_random_floor_position()
             if pos[0] != player.x or pos[1] != player.y:
                 # Weight equipment by rarity (common more likely than rare)
                 equipment_weights = [3, 2, 1, 3, 2, 1]  # Dagger, Sword, Axe, Leather, Chain, Plate
-                item_type = random.choices(EQUIPMENT_TYPES, weights=equipment_weights)[0]
+                item_type = rng.choices(EQUIPMENT_TYPES, weights=equipment_weights)[0]
                 item = create_item(item_type, pos[0], pos[1])
                 self.items.append(item)
 
@@ -143,7 +149,7 @@ class EntityManager:
                 boss_room.y <= e.y < boss_room.y + boss_room.height)
         ]
         for enemy in boss_room_enemies:
-            self.enemies.remove(enemy)
+            self.remove_enemy(enemy)
 
         # Create boss enemy
         boss = Enemy(cx, cy)
@@ -160,6 +166,32 @@ class EntityManager:
                 return enemy
         return None
 
+    def enemy_id(self, enemy: Enemy) -> str:
+        """Stable id for an enemy in self.enemies (as used by battles)."""
+        self.registry.sync(self.enemies)
+        if enemy.entity_id is None:
+            # Not in the list (yet); it keeps this id once added
+            self.registry.assign(enemy)
+        return str(enemy.entity_id)
+
+    def get_enemy_by_id(self, enemy_id) -> Optional[Enemy]:
+        """Resolve an id from enemy_id() (str or int), or None."""
+        try:
+            entity_id = int(enemy_id)
+        except (TypeError, ValueError):
+            return None  # e.g. 'player'
+        self.registry.sync(self.enemies)
+        return self.registry.get(entity_id)
+
+    def remove_enemy(self, enemy: Enemy) -> bool:
+        """Remove an enemy from the floor."""
+        for i, other in enumerate(self.enemies):
+            if other is enemy:
+                self.enemies.pop(i)
+                self.registry.discard(enemy)
+                return True
+        return False
+
     def get_living_enemies(self) -> List[Enemy]:
         """Get all living enemies."""
         return [e for e in self.enemies if e.is_alive()]
@@ -0,0 +1,95 @@
+"""Stable ids for world enemies.
+
+Battles, reinforcements and ghost trials refer to enemies by id. Those
+ids used to be str(id(enemy)), resolved by scanning the enemy list, and
+changed on every save/load. The registry hands out monotonically
+increasing ids instead, stored on the enemy as ``entity_id`` (and saved
+with it), and resolves them with a dict lookup.
+
+Enemies are appended to EntityManager.enemies from many places (spawning,
+summons, artifacts, ghosts), so rather than every caller registering,
+the registry re-syncs with the list whenever it has changed (a different
+list object or length, or different first/last enemies) before answering.
+Code that empties and refills the list in place (spawning a new floor)
+must call clear(); removals must go through EntityManager.remove_enemy.
+"""
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from ..entities import Enemy
+
+
+class EntityRegistry:
+    """Maps stable integer ids to the enemies in a list."""
+
+    def __init__(self):
+        self.next_id = 1
+        self._by_id: Dict[int, 'Enemy'] = {}
+        self._source: Optional[list] = None
+        self._source_len = 0
+        self._source_ends: tuple = ()
+
+    def sync(self, enemies: List['Enemy'], force: bool = False):
+        """Index enemies, assigning ids to any that don't have one yet."""
+        if (not force and enemies is self._source and len(enemies) == self._source_len
+                and self._ends_match(enemies)):
+            return
+
+        # Keep ids already assigned (including loaded ones) and never reuse one
+        for enemy in enemies:
+            entity_id = getattr(enemy, 'entity_id', None)
+            if entity_id is not None and entity_id >= self.next_id:
+                self.next_id = entity_id + 1
+
+        by_id: Dict[int, 'Enemy'] = {}
+        for enemy in enemies:
+            entity_id = getattr(enemy, 'entity_id', None)
+            if entity_id is None or by_id.get(entity_id, enemy) is not enemy:
+                # New, or a copy sharing another enemy's id
+                entity_id = self.assign(enemy)
+            by_id[entity_id] = enemy
+
+        self._by_id = by_id
+        self._source = enemies
+        self._source_len = len(enemies)
+        self._source_ends = (enemies[0], enemies[-1]) if enemies else ()
+
+    def _ends_match(self, enemies: List['Enemy']) -> bool:
+        """Cheap check that the list wasn't emptied and refilled in place."""
+        if not enemies:
+            return not self._source_ends
+        return (bool(self._source_ends) and enemies[0] is self._source_ends[0]
+                and enemies[-1] is self._source_ends[1])
+
+    def assign(self, enemy: 'Enemy') -> int:
+        """Give an enemy the next id without indexing it."""
+        enemy.entity_id = self.next_id
+        self.next_id += 1
+        return enemy.entity_id
+
+    def get(self, entity_id: int) -> Optional['Enemy']:
+        return self._by_id.get(entity_id)
+
+    def discard(self, enemy: 'Enemy'):
+        """Forget an enemy that was removed from the list."""
+        entity_id = getattr(enemy, 'entity_id', None)
+        if self._by_id.get(entity_id) is enemy:
+            del self._by_id[entity_id]
+            self._source_len -= 1
+
+    def clear(self):
+        """Forget every enemy (ids keep counting up)."""
+        self._by_id.clear()
+        self._source = None
+        self._source_len = 0
+        self._source_ends = ()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def get_state(self) -> dict:
+        return {'next_id': self.next_id}
+
+    def load_state(self, state: dict):
+        self.clear()
+        self.next_id = max(self.next_id, state.get('next_id', 1))
@@ -3,10 +3,10 @@
 Handles spawning enemies with theme-appropriate types and zone biases.
 Supports multi-tile enemies (2x2, 3x3) by restricting them to rooms.
 """
-import random
 from typing import TYPE_CHECKING, List, Tuple, Optional
 
 from ..entities import Player, Enemy
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from ..world import Dungeon
@@ -49,11 +49,11 @@ def _find_room_spawn_position(
 
     for _ in range(max_attempts):
         # Pick a random room that can fit the enemy
-        room = random.choice(valid_rooms)
+        room = rng.choice(valid_rooms)
 
         # Pick a random position inside the room (leaving 1-tile margin from walls)
-        x = random.randint(room.x + 1, room.x + room.width - size_w - 1)
-        y = random.randint(room.y + 1, room.y + room.height - size_h - 1)
+        x = rng.randint(room.x + 1, room.x + room.width - size_w - 1)
+        y = rng.randint(room.y + 1, room.y + room.height - size_h - 1)
 
         # Check distance from player
         if abs(x - player.x) <= 5 and abs(y - player.y) <= 5:
@@ -124,13 +124,13 @@ def spawn_enemies(enemies: List[Enemy], dungeon: 'Dungeon', player: Player):
         )
 
         # Select enemy type using zone-modified weights
-        enemy_type = random.choices(base_enemy_types, weights=zone_weights)[0]
+        enemy_type = rng.choices(base_enemy_types, weights=zone_weights)[0]
 
         # Floor 8: Max 1 dragon constraint (spicy but fair)
         if current_level == 8 and enemy_type == EnemyType.DRAGON:
             if dragon_spawned:
                 # Already have a dragon - reroll once
-                enemy_type = random.choices(base_enemy_types, weights=zone_weights)[0]
+                enemy_type = rng.choices(base_enemy_types, weights=zone_weights)[0]
                 if enemy_type == EnemyType.DRAGON:
                     # Still dragon - fallback to Crystal Sentinel
                     enemy_type = EnemyType.CRYSTAL_SENTINEL
@@ -152,7 +152,7 @@ def spawn_enemies(enemies: List[Enemy], dungeon: 'Dungeon', player: Player):
                         zone_weights[i] for i, t in enumerate(base_enemy_types)
                         if _get_enemy_size(t) == (1, 1)
                     ]
-                    enemy_type = random.choices(small_types, weights=small_weights)[0]
+                    enemy_type = rng.choices(small_types, weights=small_weights)[0]
                     pos = dungeon.get_random_floor_position()
                     # Make sure not too close to player
                     if abs(pos[0] - player.x) <= 5 and abs(pos[1] - player.y) <= 5:
@@ -173,7 +173,7 @@ def spawn_enemies(enemies: List[Enemy], dungeon: 'Dungeon', player: Player):
         elite_rate = ELITE_SPAWN_RATE
         if zone == "intake_hall":
             elite_rate = 0.0
-        is_elite = random.random() < elite_rate
+        is_elite = rng.random() < elite_rate
 
         enemy = Enemy(pos[0], pos[1], enemy_type=enemy_type, is_elite=is_elite)
         enemies.append(enemy)
@@ -30,8 +30,9 @@ class LevelManager:
 
     def _handle_victory(self):
         """Handle player reaching the final level."""
-        from ..data import delete_save
-        delete_save()
+        if not getattr(self.game, 'headless', False):
+            from ..data import delete_save
+            delete_save()
         self.game.add_message("You've reached the deepest level!")
         self.game.add_message("Congratulations! You win!")
         self.game.state = GameState.VICTORY
@@ -60,7 +61,8 @@ class LevelManager:
         self.game.dungeon = Dungeon(
             level=self.game.current_level,
             has_stairs_up=has_up,
-            puzzle_manager=puzzle_manager
+            puzzle_manager=puzzle_manager,
+            rng=self.game.rng
         )
 
         # Place player at stairs up if they exist, otherwise random position
@@ -133,9 +135,10 @@ class LevelManager:
             boss_name = boss.name if hasattr(boss, 'name') and boss.name else "Boss"
             self.game.add_message(f"You sense a powerful presence... The {boss_name} awaits.")
 
-        # Auto-save on level transition
-        self.game.save_manager.auto_save()
-        self.game.add_message("Game saved.")
+        # Auto-save on level transition (skipped for headless replays)
+        if not getattr(self.game, 'headless', False):
+            self.game.save_manager.auto_save()
+            self.game.add_message("Game saved.")
 
     def initialize_level(self, level: int = 1):
         """Initialize a new game level."""
@@ -155,7 +158,8 @@ class LevelManager:
         self.game.dungeon = Dungeon(
             level=level,
             has_stairs_up=has_up,
-            puzzle_manager=puzzle_manager
+            puzzle_manager=puzzle_manager,
+            rng=self.game.rng
         )
 
         # Spawn player at random position
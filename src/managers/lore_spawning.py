@@ -5,11 +5,11 @@ Handles spawning lore items based on floor-specific zone configurations.
 Note: The floor lore configurations are candidates for database migration
 to allow easier content updates without code changes.
 """
-import random
 from typing import TYPE_CHECKING, List
 
 from ..entities import Player
 from ..items import Item
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from ..world import Dungeon
@@ -44,7 +44,7 @@ def spawn_zone_lore(items: List[Item], dungeon: 'Dungeon', player: Player):
     else:
         # Default behavior for other floors
         for lore_id, entry in lore_entries:
-            if random.random() < 0.7:
+            if rng.random() < 0.7:
                 pos = dungeon.get_random_floor_position()
                 if pos[0] != player.x or pos[1] != player.y:
                     try:
@@ -178,13 +178,13 @@ def _spawn_floor_lore(items: List[Item], dungeon: 'Dungeon', player: Player, lor
         if zone_lore_counts[zone] >= max_lore:
             continue
 
-        if random.random() > spawn_chance:
+        if rng.random() > spawn_chance:
             continue
 
         if not lore_pool:
             break
 
-        lore_id, entry = random.choice(lore_pool)
+        lore_id, entry = rng.choice(lore_pool)
         pos = _get_floor_in_room(dungeon, room, player)
         if pos:
             try:
@@ -200,8 +200,8 @@ def _get_floor_in_room(dungeon: 'Dungeon', room, player: Player):
     """Find a random walkable floor position within a room."""
     attempts = 20
     for _ in range(attempts):
-        x = random.randint(room.x + 1, room.x + room.width - 2)
-        y = random.randint(room.y + 1, room.y + room.height - 2)
+        x = rng.randint(room.x + 1, room.x + room.width - 2)
+        y = rng.randint(room.y + 1, room.y + room.height - 2)
         if (dungeon.is_walkable(x, y) and
             (x != player.x or y != player.y)):
             return (x, y)
@@ -36,17 +36,22 @@ class SaveManager:
         Returns:
             True if save succeeded, False otherwise
         """
+        # Give every enemy its stable id so battles and ghost trials resolve after load
+        self.game.entity_manager.registry.sync(self.game.entity_manager.enemies)
+
         game_state = {
             'current_level': self.game.current_level,
             'messages': self.game.messages,
             'player': self._serialize_player(self.game.player),
             'enemies': [self._serialize_enemy(e) for e in self.game.entity_manager.enemies],
+            'entity_registry': self.game.entity_manager.registry.get_state(),
             'items': [self._serialize_item(i) for i in self.game.entity_manager.items],
             'dungeon': self._serialize_dungeon(self.game.dungeon),
             'story_manager': self.game.story_manager.to_dict() if self.game.story_manager else None,
             'field_pulse_manager': self.game.field_pulse_manager.get_state() if hasattr(self.game, 'field_pulse_manager') and self.game.field_pulse_manager else None,
             'artifact_manager': self.game.entity_manager.artifact_manager.get_state() if hasattr(self.game.entity_manager, 'artifact_manager') else None,
             'ghost_manager': self.game.ghost_manager.get_state() if hasattr(self.game, 'ghost_manager') and self.game.ghost_manager else None,
+            'hazard_manager': self.game.hazard_manager.get_state() if hasattr(self.game, 'hazard_manager') and self.game.hazard_manager else None,
             'completion_ledger': self.game.completion_ledger.to_dict() if hasattr(self.game, 'completion_ledger') and self.game.completion_ledger else None,
             # v6.0: Save UI mode and battle state
             'ui_mode': self.game.ui_mode.name if hasattr(self.game, 'ui_mode') else 'GAME',
@@ -80,8 +85,9 @@ class SaveManager:
         """
         try:
             self.game.current_level = game_state['current_level']
-            self.game.messages = game_state['messages']
+            self._restore_messages(game_state['messages'])
             self.game.player = self._deserialize_player(game_state['player'])
+            self.game.entity_manager.registry.load_state(game_state.get('entity_registry', {}))
             self.game.entity_manager.enemies = [self._deserialize_enemy(e) for e in game_state['enemies']]
             self.game.entity_manager.items = [item for item in (self._deserialize_item(i) for i in game_state['items']) if item is not None]
             self.game.dungeon = self._deserialize_dungeon(game_state['dungeon'])
@@ -99,6 +105,10 @@ class SaveManager:
                     ledger=self.game.completion_ledger if hasattr(self.game, 'completion_ledger') else None
                 )
 
+            # Restore hazards (older saves have none; pulses re-sync amplification below)
+            if game_state.get('hazard_manager') and hasattr(self.game, 'hazard_manager') and self.game.hazard_manager:
+                self.game.hazard_manager.load_state(game_state['hazard_manager'])
+
             # Restore field_pulse_manager state if present
             if game_state.get('field_pulse_manager') and hasattr(self.game, 'field_pulse_manager') and self.game.field_pulse_manager:
                 self.game.field_pulse_manager.load_state(game_state['field_pulse_manager'])
@@ -219,9 +229,20 @@ class SaveManager:
         player.artifacts = [self._deserialize_artifact(a) for a in data.get('artifacts', [])]
         player.duplicate_next_consumable = data.get('duplicate_next_consumable', False)
         player.guaranteed_rare_from_boss = data.get('guaranteed_rare_from_boss', False)
+        player.invalidate_stats()
 
         return player
 
+    def _restore_messages(self, messages: List[str]):
+        """Restore saved messages (GameEngine keeps them in a MessageLog)."""
+        message_log = getattr(self.game, 'message_log', None)
+        if message_log is None:
+            self.game.messages = messages
+            return
+        message_log.clear()
+        for text in messages:
+            message_log.add(text)
+
     def _serialize_enemy(self, enemy: Enemy) -> dict:
         """Serialize enemy to dictionary."""
         # Handle bosses which have enemy_type = None
@@ -236,7 +257,8 @@ class SaveManager:
             'enemy_type': enemy_type_name,
             'is_boss': getattr(enemy, 'is_boss', False),
             'boss_type': getattr(enemy, 'boss_type', None).name if getattr(enemy, 'boss_type', None) else None,
-            'name': enemy.name if hasattr(enemy, 'name') and enemy.name else None
+            'name': enemy.name if hasattr(enemy, 'name') and enemy.name else None,
+            'entity_id': enemy.entity_id,
         }
 
     def _deserialize_enemy(self, data: dict) -> Enemy:
@@ -255,6 +277,7 @@ class SaveManager:
             enemy.make_boss(boss_type)
             enemy.health = data['health']  # Re-apply health after make_boss
 
+        enemy.entity_id = data.get('entity_id')
         return enemy
 
     def _serialize_item(self, item: Item) -> dict:
@@ -355,5 +378,6 @@ class SaveManager:
         dungeon.visible = data['visible']
         dungeon.stairs_up_pos = data['stairs_up_pos']
         dungeon.stairs_down_pos = data['stairs_down_pos']
+        dungeon.rebuild_index()
 
         return dungeon
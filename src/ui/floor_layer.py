@@ -0,0 +1,116 @@
+"""Cached static layers of the map view.
+
+Dungeon tiles, terrain features, zone evidence and decorations only
+change when the floor itself does or when the player's field of view
+moves, yet render_dungeon and friends rebuilt them for every viewport
+cell (and walked every feature list) each frame. FloorLayer composes
+those four layers into one (char, attr) cell per tile, in the same
+stacking order, and keeps whole rows cached per floor.
+
+Each frame the viewport rows are compared against the visible/explored
+rows seen when they were cached; only cells whose FOV state changed are
+recomposed. Floor edits (Dungeon.revision, or feature lists changing
+length) drop the cache, as does a different Dungeon object.
+"""
+import curses
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .screen_buffer import BLANK, Cell, ScreenBuffer
+
+if TYPE_CHECKING:
+    from ..world import Dungeon
+
+
+class FloorLayer:
+    """Per-floor cache of composed tile/terrain/evidence/decoration cells."""
+
+    def __init__(self, use_unicode: bool, use_color: bool):
+        self.use_unicode = use_unicode
+        self.use_color = use_color
+        self._dim = curses.color_pair(7) if use_color else 0
+
+        self._dungeon: Optional['Dungeon'] = None
+        self._key: Optional[tuple] = None
+        self._features: Dict[Tuple[int, int], tuple] = {}
+        self._rows: Dict[int, List[Cell]] = {}
+        self._seen_visible: Dict[int, List[bool]] = {}
+        self._seen_explored: Dict[int, List[bool]] = {}
+        self.rebuilt = 0  # Cells composed by the last render()
+
+    def invalidate(self):
+        """Drop every cached row."""
+        self._dungeon = None
+
+    def render(self, screen: ScreenBuffer, dungeon: 'Dungeon', vp_x: int, vp_y: int, vp_w: int, vp_h: int):
+        """Blit the cached layers for the viewport into the screen buffer."""
+        self._sync(dungeon)
+        self.rebuilt = 0
+
+        x0, x1 = max(vp_x, 0), min(vp_x + vp_w, dungeon.width)
+        if x0 >= x1:
+            return
+        for screen_y in range(vp_h):
+            world_y = vp_y + screen_y
+            if 0 <= world_y < dungeon.height:
+                screen.blit(screen_y, x0 - vp_x, self._row(dungeon, world_y)[x0:x1])
+
+    def _sync(self, dungeon: 'Dungeon'):
+        key = (
+            getattr(dungeon, 'revision', 0),
+            len(dungeon.terrain_features),
+            len(dungeon.zone_evidence),
+            len(dungeon.decorations),
+        )
+        if dungeon is self._dungeon and key == self._key:
+            return
+
+        # Later entries and higher layers win, matching the old draw order:
+        # terrain, then zone evidence, then decorations
+        features: Dict[Tuple[int, int], tuple] = {}
+        for layer in (dungeon.terrain_features, dungeon.zone_evidence, dungeon.decorations):
+            for entry in layer:
+                features[(entry[0], entry[1])] = entry
+
+        self._dungeon = dungeon
+        self._key = key
+        self._features = features
+        self._rows.clear()
+        self._seen_visible.clear()
+        self._seen_explored.clear()
+
+    def _row(self, dungeon: 'Dungeon', y: int) -> List[Cell]:
+        visible, explored = dungeon.visible[y], dungeon.explored[y]
+        row = self._rows.get(y)
+
+        if row is None:
+            row = [self._cell(dungeon, x, y, visible[x], explored[x]) for x in range(dungeon.width)]
+            self._rows[y] = row
+            self.rebuilt += len(row)
+        else:
+            seen_visible, seen_explored = self._seen_visible[y], self._seen_explored[y]
+            if visible == seen_visible and explored == seen_explored:
+                return row
+            for x in range(dungeon.width):
+                if visible[x] != seen_visible[x] or explored[x] != seen_explored[x]:
+                    row[x] = self._cell(dungeon, x, y, visible[x], explored[x])
+                    self.rebuilt += 1
+
+        self._seen_visible[y] = visible[:]
+        self._seen_explored[y] = explored[:]
+        return row
+
+    def _cell(self, dungeon: 'Dungeon', x: int, y: int, visible: bool, explored: bool) -> Cell:
+        if not explored:
+            return BLANK
+
+        feature = self._features.get((x, y))
+        if feature is None:
+            char, color_pair = dungeon.get_visual_char(x, y, self.use_unicode), 0
+        else:
+            char, color_pair = feature[2], feature[3]
+
+        if not visible:
+            return (char, self._dim)
+        if color_pair and self.use_color:
+            return (char, curses.color_pair(color_pair))
+        return (char, 0)
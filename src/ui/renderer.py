@@ -17,6 +17,8 @@ from ..entities import Player, Enemy
 from ..items import Item
 from .animation_manager import AnimationManager
 from .render_colors import get_element_color, get_message_color
+from .screen_buffer import ScreenBuffer
+from .floor_layer import FloorLayer
 from . import renderer_world
 from . import renderer_ui_panel
 
@@ -50,6 +52,10 @@ class Renderer:
             curses.init_pair(10, curses.COLOR_GREEN, curses.COLOR_BLACK)  # Bright green (healing)
             curses.init_pair(11, curses.COLOR_BLUE, curses.COLOR_BLACK)   # Blue (rare items)
 
+        # The map view draws into a diffing screen buffer, its static layers from a per-floor cache
+        self.screen = ScreenBuffer(stdscr)
+        self._floor_layer = FloorLayer(self.use_unicode, curses.has_colors())
+
     def _detect_unicode_support(self) -> bool:
         """
         Detect if the terminal properly supports Unicode box-drawing characters.
@@ -82,7 +88,7 @@ class Renderer:
             Tuple of (viewport_x, viewport_y, viewport_width, viewport_height)
             viewport_x/y are the top-left corner of the visible area in world coordinates
         """
-        max_y, max_x = self.stdscr.getmaxyx()
+        max_y, max_x = self.screen.getmaxyx()
 
         # Available space for dungeon (screen minus UI panel, shortcut bar, and message area)
         viewport_width = max_x - STATS_PANEL_WIDTH - 1
@@ -156,27 +162,19 @@ class Renderer:
         # Clean up expired animations
         self._anim_mgr.cleanup_expired()
 
-        self.stdscr.clear()
+        self.screen.begin()
 
         # Calculate viewport centered on player
         vp_x, vp_y, vp_w, vp_h = self._calculate_viewport(player, dungeon)
 
-        # Render dungeon
-        self._render_dungeon(dungeon, vp_x, vp_y, vp_w, vp_h)
-
-        # Render terrain features (water, blood, grass)
-        self._render_terrain(dungeon, vp_x, vp_y, vp_w, vp_h)
+        # Render dungeon tiles, terrain, zone evidence and decorations (cached per floor)
+        self._floor_layer.render(self.screen, dungeon, vp_x, vp_y, vp_w, vp_h)
 
-        # Render zone evidence (trail tells, lore markers)
-        self._render_zone_evidence(dungeon, vp_x, vp_y, vp_w, vp_h)
-
-        # v4.0: Render hazards (lava, ice, poison gas, deep water)
+        # v4.0: Render hazards (lava, ice, poison gas, deep water) - decorations stay on top
         if hazards:
+            hazards = [h for h in hazards if not dungeon.has_decoration_at(h.x, h.y)]
             self._render_hazards(hazards, dungeon, vp_x, vp_y, vp_w, vp_h)
 
-        # Render decorations (after dungeon, before entities)
-        self._render_decorations(dungeon, vp_x, vp_y, vp_w, vp_h)
-
         # v4.0: Render visible traps (before items/enemies)
         if visible_traps:
             self._render_traps(visible_traps, dungeon, vp_x, vp_y, vp_w, vp_h)
@@ -205,7 +203,12 @@ class Renderer:
         # Render message log at bottom of screen
         self._render_bottom_messages(messages, vp_h)
 
-        self.stdscr.refresh()
+        # Write only the cells that changed since the last frame
+        self.screen.present()
+
+    def invalidate(self):
+        """Repaint the whole map view next frame (after drawing on stdscr directly)."""
+        self.screen.invalidate()
 
     # Public animation methods (delegate to AnimationManager)
 
@@ -225,67 +228,48 @@ class Renderer:
         """Add a brief death flash where an enemy died."""
         self._anim_mgr.add_death_flash(x, y, duration)
 
-    def _render_dungeon(self, dungeon: Dungeon, vp_x: int, vp_y: int, vp_w: int, vp_h: int):
-        """Render the dungeon tiles within the viewport."""
-        renderer_world.render_dungeon(self.stdscr, dungeon, vp_x, vp_y, vp_w, vp_h, self.use_unicode)
-
-    def _render_terrain(self, dungeon: Dungeon, vp_x: int, vp_y: int, vp_w: int, vp_h: int):
-        """Render terrain features (water, blood, grass) in explored/visible tiles."""
-        renderer_world.render_terrain(self.stdscr, dungeon, vp_x, vp_y, vp_w, vp_h,
-                                       self._is_in_viewport, self._world_to_screen)
-
-    def _render_zone_evidence(self, dungeon: Dungeon, vp_x: int, vp_y: int, vp_w: int, vp_h: int):
-        """Render zone evidence (trail tells, lore markers) in explored/visible tiles."""
-        renderer_world.render_zone_evidence(self.stdscr, dungeon, vp_x, vp_y, vp_w, vp_h,
-                                             self._is_in_viewport, self._world_to_screen)
-
     def _render_hazards(self, hazards: List[Hazard], dungeon: Dungeon, vp_x: int, vp_y: int, vp_w: int, vp_h: int):
         """Render environmental hazards (lava, ice, poison gas, deep water)."""
-        renderer_world.render_hazards(self.stdscr, hazards, dungeon, vp_x, vp_y, vp_w, vp_h,
+        renderer_world.render_hazards(self.screen, hazards, dungeon, vp_x, vp_y, vp_w, vp_h,
                                        self._is_in_viewport, self._world_to_screen)
 
     def _render_traps(self, visible_traps: List[Trap], dungeon: Dungeon, vp_x: int, vp_y: int, vp_w: int, vp_h: int):
         """Render visible (detected) traps."""
-        renderer_world.render_traps(self.stdscr, visible_traps, dungeon, vp_x, vp_y, vp_w, vp_h,
+        renderer_world.render_traps(self.screen, visible_traps, dungeon, vp_x, vp_y, vp_w, vp_h,
                                      self._is_in_viewport, self._world_to_screen)
 
-    def _render_decorations(self, dungeon: Dungeon, vp_x: int, vp_y: int, vp_w: int, vp_h: int):
-        """Render decorations in explored/visible tiles."""
-        renderer_world.render_decorations(self.stdscr, dungeon, vp_x, vp_y, vp_w, vp_h,
-                                           self._is_in_viewport, self._world_to_screen)
-
     def _render_items(self, items: List[Item], dungeon: Dungeon, vp_x: int, vp_y: int, vp_w: int, vp_h: int):
         """Render all items on the ground (only if visible)."""
-        renderer_world.render_items(self.stdscr, items, dungeon, vp_x, vp_y, vp_w, vp_h,
+        renderer_world.render_items(self.screen, items, dungeon, vp_x, vp_y, vp_w, vp_h,
                                      self._is_in_viewport, self._world_to_screen)
 
     def _render_enemies(self, enemies: List[Enemy], dungeon: Dungeon, player: Player, vp_x: int, vp_y: int, vp_w: int, vp_h: int):
         """Render all living enemies (only if visible)."""
-        renderer_world.render_enemies(self.stdscr, enemies, dungeon, player, vp_x, vp_y, vp_w, vp_h,
+        renderer_world.render_enemies(self.screen, enemies, dungeon, player, vp_x, vp_y, vp_w, vp_h,
                                        self._is_in_viewport, self._world_to_screen,
                                        self._get_element_color, self._anim_mgr.is_entity_animated)
 
     def _render_player(self, player: Player, vp_x: int, vp_y: int, vp_w: int, vp_h: int):
         """Render the player."""
-        renderer_world.render_player(self.stdscr, player, vp_x, vp_y, vp_w, vp_h,
+        renderer_world.render_player(self.screen, player, vp_x, vp_y, vp_w, vp_h,
                                       self._is_in_viewport, self._world_to_screen,
                                       self._anim_mgr.is_entity_animated)
 
     def _render_damage_numbers(self, dungeon: Dungeon, vp_x: int, vp_y: int, vp_w: int, vp_h: int):
         """Render floating damage numbers above entities."""
-        renderer_world.render_damage_numbers(self.stdscr, dungeon, vp_x, vp_y, vp_w, vp_h,
+        renderer_world.render_damage_numbers(self.screen, dungeon, vp_x, vp_y, vp_w, vp_h,
                                               self._anim_mgr.damage_numbers,
                                               self._is_in_viewport, self._world_to_screen)
 
     def _render_direction_indicators(self, dungeon: Dungeon, vp_x: int, vp_y: int, vp_w: int, vp_h: int):
         """Render attack direction arrows."""
-        renderer_world.render_direction_indicators(self.stdscr, dungeon, vp_x, vp_y, vp_w, vp_h,
+        renderer_world.render_direction_indicators(self.screen, dungeon, vp_x, vp_y, vp_w, vp_h,
                                                     self._anim_mgr.direction_indicators,
                                                     self._is_in_viewport, self._world_to_screen)
 
     def _render_shortcut_bar(self, viewport_height: int):
         """Render the shortcut key bar between dungeon and messages."""
-        max_y, max_x = self.stdscr.getmaxyx()
+        max_y, max_x = self.screen.getmaxyx()
 
         # Shortcut bar is right below the viewport
         bar_y = viewport_height
@@ -307,7 +291,7 @@ class Renderer:
                 start_x = 1
 
             # Clear the bar area first (full width to prevent panel border bleed-through)
-            self.stdscr.addstr(bar_y, 0, " " * bar_width)
+            self.screen.addstr(bar_y, 0, " " * bar_width)
 
             # Render each shortcut with highlighted key
             x_pos = start_x
@@ -317,13 +301,13 @@ class Renderer:
 
                 # Render the key in yellow/bold
                 if curses.has_colors():
-                    self.stdscr.addstr(bar_y, x_pos, key, curses.color_pair(2) | curses.A_BOLD)
+                    self.screen.addstr(bar_y, x_pos, key, curses.color_pair(2) | curses.A_BOLD)
                 else:
-                    self.stdscr.addstr(bar_y, x_pos, key, curses.A_BOLD)
+                    self.screen.addstr(bar_y, x_pos, key, curses.A_BOLD)
                 x_pos += len(key)
 
                 # Render the label normally
-                self.stdscr.addstr(bar_y, x_pos, label)
+                self.screen.addstr(bar_y, x_pos, label)
                 x_pos += len(label) + 2  # +2 for spacing between shortcuts
 
         except curses.error:
@@ -331,7 +315,7 @@ class Renderer:
 
     def _render_bottom_messages(self, messages: List[str], viewport_height: int):
         """Render the message log at the bottom of the screen."""
-        max_y, max_x = self.stdscr.getmaxyx()
+        max_y, max_x = self.screen.getmaxyx()
 
         # Message area starts below the viewport and shortcut bar
         msg_area_y = viewport_height + SHORTCUT_BAR_HEIGHT
@@ -350,10 +334,10 @@ class Renderer:
 
         try:
             # Draw top border of message area (use addstr for Unicode compatibility)
-            self.stdscr.addstr(msg_area_y, 0, tl)
+            self.screen.addstr(msg_area_y, 0, tl)
             for x in range(1, msg_width - 1):
-                self.stdscr.addstr(msg_area_y, x, h_char)
-            self.stdscr.addstr(msg_area_y, msg_width - 1, tr)
+                self.screen.addstr(msg_area_y, x, h_char)
+            self.screen.addstr(msg_area_y, msg_width - 1, tr)
 
             # Draw message content area with borders
             for i in range(MESSAGE_LOG_SIZE + 1):  # +1 for header
@@ -362,23 +346,23 @@ class Renderer:
                     break
 
                 # Left border
-                self.stdscr.addstr(row_y, 0, v_char)
+                self.screen.addstr(row_y, 0, v_char)
                 # Right border
-                self.stdscr.addstr(row_y, msg_width - 1, v_char)
+                self.screen.addstr(row_y, msg_width - 1, v_char)
 
             # Draw bottom border
             bottom_y = msg_area_y + MESSAGE_LOG_SIZE + 2
             if bottom_y < max_y:
-                self.stdscr.addstr(bottom_y, 0, bl)
+                self.screen.addstr(bottom_y, 0, bl)
                 for x in range(1, msg_width - 1):
-                    self.stdscr.addstr(bottom_y, x, h_char)
-                self.stdscr.addstr(bottom_y, msg_width - 1, br)
+                    self.screen.addstr(bottom_y, x, h_char)
+                self.screen.addstr(bottom_y, msg_width - 1, br)
 
             # Draw header
             header_y = msg_area_y + 1
             if header_y < max_y:
                 header = " MESSAGES "
-                self.stdscr.addstr(header_y, 2, header)
+                self.screen.addstr(header_y, 2, header)
 
             # Draw messages
             content_width = msg_width - 4  # Account for borders and padding
@@ -392,7 +376,7 @@ class Renderer:
 
                 # Apply color coding based on message content
                 color = self._get_message_color(message)
-                self.stdscr.addstr(msg_y, 2, display_msg, color)
+                self.screen.addstr(msg_y, 2, display_msg, color)
 
         except curses.error:
             pass
@@ -404,7 +388,7 @@ class Renderer:
     def _render_ui_panel(self, player: Player, dungeon: Dungeon, enemies: List[Enemy],
                          items: List[Item]):
         """Render the UI panel on the right side (stats, minimap, inventory, controls)."""
-        renderer_ui_panel.render_ui_panel(self.stdscr, player, dungeon, enemies, items,
+        renderer_ui_panel.render_ui_panel(self.screen, player, dungeon, enemies, items,
                                            self.use_unicode, self._smart_truncate)
 
     def render_game_over(self, player: Player, death_info: dict = None):
@@ -1,7 +1,8 @@
-"""World rendering functions for dungeon tiles, terrain, and entities.
+"""World rendering functions for hazards and entities.
 
-Handles rendering of dungeon floors, terrain features, decorations, hazards, traps,
-items, enemies, and player within the viewport.
+Handles rendering of hazards, traps, items, enemies, and player within the
+viewport. Dungeon tiles, terrain, zone evidence and decorations are drawn
+from the cached floor layer (floor_layer.py).
 """
 import curses
 from typing import List, TYPE_CHECKING
@@ -14,91 +15,6 @@ if TYPE_CHECKING:
     from ..items import Item
 
 
-def render_dungeon(stdscr, dungeon: 'Dungeon', vp_x: int, vp_y: int, vp_w: int, vp_h: int, use_unicode: bool):
-    """Render the dungeon tiles within the viewport."""
-    for screen_y in range(vp_h):
-        for screen_x in range(vp_w):
-            world_x = vp_x + screen_x
-            world_y = vp_y + screen_y
-
-            if not (0 <= world_x < dungeon.width and 0 <= world_y < dungeon.height):
-                continue
-
-            try:
-                if not dungeon.explored[world_y][world_x]:
-                    continue
-
-                visual_char = dungeon.get_visual_char(world_x, world_y, use_unicode)
-
-                if dungeon.visible[world_y][world_x]:
-                    stdscr.addstr(screen_y, screen_x, visual_char)
-                else:
-                    if curses.has_colors():
-                        stdscr.addstr(screen_y, screen_x, visual_char, curses.color_pair(7))
-                    else:
-                        stdscr.addstr(screen_y, screen_x, visual_char)
-            except curses.error:
-                pass
-
-
-def render_terrain(stdscr, dungeon: 'Dungeon', vp_x: int, vp_y: int, vp_w: int, vp_h: int, is_in_viewport_func, world_to_screen_func):
-    """Render terrain features (water, blood, grass) in explored/visible tiles."""
-    for world_x, world_y, char, color_pair in dungeon.terrain_features:
-        if not (0 <= world_y < dungeon.height and 0 <= world_x < dungeon.width):
-            continue
-
-        if not dungeon.explored[world_y][world_x]:
-            continue
-
-        if not is_in_viewport_func(world_x, world_y, vp_x, vp_y, vp_w, vp_h):
-            continue
-
-        screen_x, screen_y = world_to_screen_func(world_x, world_y, vp_x, vp_y)
-
-        try:
-            if dungeon.visible[world_y][world_x]:
-                if curses.has_colors():
-                    stdscr.addstr(screen_y, screen_x, char, curses.color_pair(color_pair))
-                else:
-                    stdscr.addstr(screen_y, screen_x, char)
-            else:
-                if curses.has_colors():
-                    stdscr.addstr(screen_y, screen_x, char, curses.color_pair(7))
-                else:
-                    stdscr.addstr(screen_y, screen_x, char)
-        except curses.error:
-            pass
-
-
-def render_zone_evidence(stdscr, dungeon: 'Dungeon', vp_x: int, vp_y: int, vp_w: int, vp_h: int, is_in_viewport_func, world_to_screen_func):
-    """Render zone evidence (trail tells, lore markers) in explored/visible tiles."""
-    for world_x, world_y, char, color_pair, evidence_type in dungeon.zone_evidence:
-        if not (0 <= world_y < dungeon.height and 0 <= world_x < dungeon.width):
-            continue
-
-        if not dungeon.explored[world_y][world_x]:
-            continue
-
-        if not is_in_viewport_func(world_x, world_y, vp_x, vp_y, vp_w, vp_h):
-            continue
-
-        screen_x, screen_y = world_to_screen_func(world_x, world_y, vp_x, vp_y)
-
-        try:
-            if dungeon.visible[world_y][world_x]:
-                if curses.has_colors():
-                    stdscr.addstr(screen_y, screen_x, char, curses.color_pair(color_pair))
-                else:
-                    stdscr.addstr(screen_y, screen_x, char)
-            else:
-                if curses.has_colors():
-                    stdscr.addstr(screen_y, screen_x, char, curses.color_pair(7))
-                else:
-                    stdscr.addstr(screen_y, screen_x, char)
-        except curses.error:
-            pass
-
-
 def render_hazards(stdscr, hazards: List['Hazard'], dungeon: 'Dungeon', vp_x: int, vp_y: int, vp_w: int, vp_h: int, is_in_viewport_func, world_to_screen_func):
     """Render environmental hazards (lava, ice, poison gas, deep water)."""
     for hazard in hazards:
@@ -159,35 +75,6 @@ def render_traps(stdscr, visible_traps: List['Trap'], dungeon: 'Dungeon', vp_x:
             pass
 
 
-def render_decorations(stdscr, dungeon: 'Dungeon', vp_x: int, vp_y: int, vp_w: int, vp_h: int, is_in_viewport_func, world_to_screen_func):
-    """Render decorations in explored/visible tiles."""
-    for world_x, world_y, char, color_pair in dungeon.decorations:
-        if not (0 <= world_y < dungeon.height and 0 <= world_x < dungeon.width):
-            continue
-
-        if not dungeon.explored[world_y][world_x]:
-            continue
-
-        if not is_in_viewport_func(world_x, world_y, vp_x, vp_y, vp_w, vp_h):
-            continue
-
-        screen_x, screen_y = world_to_screen_func(world_x, world_y, vp_x, vp_y)
-
-        try:
-            if dungeon.visible[world_y][world_x]:
-                if curses.has_colors():
-                    stdscr.addstr(screen_y, screen_x, char, curses.color_pair(color_pair))
-                else:
-                    stdscr.addstr(screen_y, screen_x, char)
-            else:
-                if curses.has_colors():
-                    stdscr.addstr(screen_y, screen_x, char, curses.color_pair(7))
-                else:
-                    stdscr.addstr(screen_y, screen_x, char)
-        except curses.error:
-            pass
-
-
 def render_items(stdscr, items: List['Item'], dungeon: 'Dungeon', vp_x: int, vp_y: int, vp_w: int, vp_h: int, is_in_viewport_func, world_to_screen_func):
     """Render all items on the ground (only if visible)."""
     from ..core.constants import ITEM_RARITY_COLORS
@@ -0,0 +1,114 @@
+"""Double-buffered curses screen for the map view.
+
+Renderer.render used to stdscr.clear() and redraw every cell each frame,
+so curses compared (and often re-sent) the whole screen even when only
+the player moved. ScreenBuffer stands in for stdscr while a frame is
+drawn: the render functions write (char, attr) cells into a back buffer,
+and present() diffs it against the frame on the terminal and writes only
+the runs of cells that changed, then flushes with noutrefresh/doupdate.
+
+Anything that draws on stdscr directly (full-screen menus, dialogs, the
+battle view) leaves the terminal out of step with the front buffer, so
+it must call invalidate(); the next present() then repaints in full.
+"""
+import curses
+from typing import List, Optional, Sequence, Tuple
+
+Cell = Tuple[str, int]
+
+BLANK: Cell = (' ', 0)
+
+
+class ScreenBuffer:
+    """Back/front cell buffers over a curses window."""
+
+    def __init__(self, stdscr):
+        self.stdscr = stdscr
+        self.height, self.width = stdscr.getmaxyx()
+        self._back: List[List[Cell]] = self._blank_rows()
+        self._front: Optional[List[List[Cell]]] = None  # None: terminal contents unknown
+        self.last_writes = 0  # addstr calls made by the last present()
+
+    def _blank_rows(self) -> List[List[Cell]]:
+        return [[BLANK] * self.width for _ in range(self.height)]
+
+    def invalidate(self):
+        """Forget what is on the terminal; the next present() repaints everything."""
+        self._front = None
+
+    def begin(self):
+        """Start a frame with an empty back buffer (picks up terminal resizes)."""
+        size = self.stdscr.getmaxyx()
+        if size != (self.height, self.width):
+            self.height, self.width = size
+            self.invalidate()
+        self._back = self._blank_rows()
+
+    # =========================================================================
+    # stdscr subset used by the render functions
+    # =========================================================================
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self.height, self.width
+
+    def addstr(self, y: int, x: int, text: str, attr: int = 0):
+        """Write text at (y, x), clipped to the row.
+
+        Raises curses.error when (y, x) is off screen, like the real call.
+        """
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise curses.error(f"addstr() at ({y}, {x}) is off screen")
+        row = self._back[y]
+        for ch in text[:self.width - x]:
+            row[x] = (ch, attr)
+            x += 1
+
+    def blit(self, y: int, x: int, cells: Sequence[Cell]):
+        """Copy prebuilt cells into row y starting at column x (clipped)."""
+        if not 0 <= y < self.height or x >= self.width:
+            return
+        if x < 0:
+            cells = cells[-x:]
+            x = 0
+        cells = cells[:self.width - x]
+        self._back[y][x:x + len(cells)] = cells
+
+    # =========================================================================
+    # Output
+    # =========================================================================
+
+    def present(self):
+        """Write the cells that differ from the last frame and update the terminal."""
+        stdscr = self.stdscr
+        front = self._front
+        if front is None:
+            stdscr.clear()
+            front = self._blank_rows()
+
+        writes = 0
+        width = self.width
+        for y, row in enumerate(self._back):
+            old = front[y]
+            if row == old:
+                continue
+            x = 0
+            while x < width:
+                if row[x] == old[x]:
+                    x += 1
+                    continue
+                # One write per run of changed cells sharing an attribute
+                start, attr = x, row[x][1]
+                chars = []
+                while x < width and row[x] != old[x] and row[x][1] == attr:
+                    chars.append(row[x][0])
+                    x += 1
+                try:
+                    stdscr.addstr(y, start, ''.join(chars), attr)
+                except curses.error:
+                    pass  # Writing the bottom-right cell always reports an error
+                writes += 1
+
+        self._front = self._back
+        self.last_writes = writes
+        stdscr.noutrefresh()
+        curses.doupdate()
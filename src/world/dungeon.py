@@ -16,6 +16,8 @@ from ..core.constants import (
     InteractiveTile, TileVisual,
 )
 from .dungeon_bsp import Room, BSPNode
+from .dungeon_index import FloorIndex, WALKABLE_TILES, NO_ROOM
+from .generation_profile import GenerationProfile, NULL_PROFILE
 from .traps import TrapManager
 from .hazards import HazardManager
 from .secrets import SecretDoorManager
@@ -23,12 +25,14 @@ from .torches import TorchManager
 from . import feature_generation
 from . import dungeon_zones
 from . import dungeon_visual
+from ..core.rng import rng, use_rng
 
 
 class Dungeon:
     """Represents the game dungeon with procedural generation."""
 
-    def __init__(self, width: int = DUNGEON_WIDTH, height: int = DUNGEON_HEIGHT, seed: int = None, level: int = 1, has_stairs_up: bool = False, puzzle_manager=None):
+    def __init__(self, width: int = DUNGEON_WIDTH, height: int = DUNGEON_HEIGHT, seed: int = None, level: int = 1, has_stairs_up: bool = False, puzzle_manager=None,
+                 profile: Optional[GenerationProfile] = None, rng: Optional[random.Random] = None):
         self.width = width
         self.height = height
         self.level = level
@@ -41,12 +45,21 @@ class Dungeon:
         # v7.0: Optional puzzle manager for zone layouts to register puzzles
         self.puzzle_manager = puzzle_manager
 
+        # Optional stage timings (see generation_profile.py)
+        self.profile = profile or NULL_PROFILE
+
         # Visual variety
         self.theme = LEVEL_THEMES.get(level, DungeonTheme.STONE)
         self.decorations = []  # List of (x, y, char, color_pair) tuples
         self.terrain_features = []  # List of (x, y, char, color_pair) for water, blood, etc.
         self.zone_evidence = []  # List of (x, y, char, color_pair, evidence_type) for zone tells
 
+        # Bumped by the mutators below so cached renders (ui/floor_layer.py) know to rebuild
+        self.revision = 0
+
+        # Position lookups (room grid, walkable tiles, feature maps)
+        self.index = FloorIndex(width, height)
+
         # FOV tracking arrays
         self.explored = [[False for _ in range(width)] for _ in range(height)]
         self.visible = [[False for _ in range(width)] for _ in range(height)]
@@ -57,52 +70,71 @@ class Dungeon:
         # Visual elevation data (v7.0 Sprint 3)
         self.tile_visuals: dict[tuple[int, int], TileVisual] = {}
 
-        if seed is not None:
-            random.seed(seed)
+        # Generation draws from the run's generator when the engine passes it,
+        # or from a private one for a standalone seeded floor (see core/rng.py)
+        if rng is None and seed is not None:
+            rng = random.Random(seed)
+        self.rng = rng
 
-        self._generate()
+        with use_rng(self.rng):
+            self._generate()
+        with self.profile.stage("build_index"):
+            self.index.build(self)
 
     def _generate(self):
         """Generate the dungeon using BSP algorithm."""
+        stage = self.profile.stage
+
         # Create root BSP node
         root = BSPNode(0, 0, self.width, self.height)
 
         # Split the space recursively
-        self._split_node(root)
+        with stage("bsp_split"):
+            self._split_node(root)
 
         # Create rooms in leaf nodes
-        self._create_rooms(root)
+        with stage("create_rooms"):
+            self._create_rooms(root)
 
-        # Get all rooms
-        self.rooms = root.get_rooms()
+            # Get all rooms
+            self.rooms = root.get_rooms()
 
         # Carve out rooms
-        for room in self.rooms:
-            self._carve_room(room)
+        with stage("carve_rooms"):
+            for room in self.rooms:
+                self._carve_room(room)
 
         # Connect rooms with corridors
-        self._create_corridors(root)
+        with stage("corridors"):
+            self._create_corridors(root)
 
         # Classify room types
-        self._classify_rooms()
+        with stage("classify_rooms"):
+            self._classify_rooms()
 
         # Assign zone identities (drives decorations, spawns, lore)
-        self._assign_zones()
+        with stage("assign_zones"):
+            self._assign_zones()
 
         # Apply zone-specific layout modifications (interior walls, special tiles)
-        self._apply_zone_layouts()
+        with stage("zone_layouts"):
+            self._apply_zone_layouts()
 
         # Place zone evidence (boss trail tells, lore props)
-        self._place_zone_evidence()
+        with stage("zone_evidence"):
+            self._place_zone_evidence()
 
         # Place stairs
-        self._place_stairs()
+        with stage("stairs"):
+            self._place_stairs()
 
         # Place decorations
-        self._place_decorations()
+        with stage("decorations"):
+            self._place_decorations()
 
         # Place terrain features
-        self._place_terrain()
+        with stage("terrain"):
+            self._place_terrain()
 
     def _split_node(self, node: BSPNode):
         """Recursively split a BSP node."""
@@ -138,14 +170,14 @@ class Dungeon:
 
             if left_rooms and right_rooms:
                 # Connect centers of random rooms from each side
-                left_room = random.choice(left_rooms)
-                right_room = random.choice(right_rooms)
+                left_room = rng.choice(left_rooms)
+                right_room = rng.choice(right_rooms)
 
                 left_center = left_room.center()
                 right_center = right_room.center()
 
                 # Create L-shaped corridor
-                if random.choice([True, False]):
+                if rng.choice([True, False]):
                     self._carve_horizontal_corridor(left_center[0], right_center[0], left_center[1])
                     self._carve_vertical_corridor(left_center[1], right_center[1], right_center[0])
                 else:
@@ -199,7 +231,7 @@ class Dungeon:
             # Small to medium rooms get special types
             elif area >= 30:
                 # 20% chance for special room types
-                rand = random.random()
+                rand = rng.random()
                 if rand < 0.1:
                     room.room_type = RoomType.SHRINE
                 elif rand < 0.2:
@@ -248,6 +280,65 @@ class Dungeon:
         """Add a blood stain at the specified location (for when enemies die)."""
         dungeon_visual.add_blood_stain(self, x, y)
 
+    # Indexed feature placement (keeps FloorIndex maps in sync with the lists)
+
+    def add_decoration(self, x: int, y: int, char: str, color_pair: int):
+        """Place a decoration at (x, y)."""
+        self.decorations.append((x, y, char, color_pair))
+        self.index.add_decoration(x, y)
+        self.revision += 1
+
+    def has_decoration_at(self, x: int, y: int) -> bool:
+        """Check if any decoration occupies (x, y)."""
+        return self.index.has_decoration(x, y)
+
+    def add_terrain_feature(self, x: int, y: int, char: str, color_pair: int):
+        """Place a terrain feature (water, blood, etc.) at (x, y)."""
+        entry = (x, y, char, color_pair)
+        self.terrain_features.append(entry)
+        self.index.add_terrain(entry)
+        self.revision += 1
+
+    def get_terrain_at(self, x: int, y: int) -> Optional[tuple]:
+        """Get the topmost terrain feature at (x, y), if any."""
+        return self.index.terrain_at.get((x, y))
+
+    def add_zone_evidence(self, x: int, y: int, char: str, color_pair: int, evidence_type: str):
+        """Place a zone evidence tell at (x, y)."""
+        entry = (x, y, char, color_pair, evidence_type)
+        self.zone_evidence.append(entry)
+        self.index.add_evidence(entry)
+        self.revision += 1
+
+    def get_zone_evidence_at(self, x: int, y: int) -> Optional[tuple]:
+        """Get the zone evidence at (x, y), if any."""
+        return self.index.evidence_at.get((x, y))
+
+    def pop_zone_evidence_at(self, x: int, y: int) -> Optional[tuple]:
+        """Remove and return the zone evidence at (x, y), if any."""
+        entry = self.index.pop_evidence(x, y)
+        if entry is None:
+            return None
+        self.zone_evidence.remove(entry)
+        self.revision += 1
+        # Expose any other evidence stacked on the same tile
+        for other in self.zone_evidence:
+            if other[0] == x and other[1] == y:
+                self.index.add_evidence(other)
+                break
+        return entry
+
+    def set_tile(self, x: int, y: int, tile: TileType):
+        """Change a tile after generation, keeping the walkable index current."""
+        self.tiles[y][x] = tile
+        self.index.set_walkable(x, y, tile in WALKABLE_TILES)
+        self.revision += 1
+
+    def rebuild_index(self):
+        """Rebuild the room grid and walkable list (after replacing tiles wholesale)."""
+        self.index.build(self)
+        self.revision += 1
+
     def is_walkable(self, x: int, y: int) -> bool:
         """Check if a position is walkable.
 
@@ -256,18 +347,7 @@ class Dungeon:
         """
         if not (0 <= x < self.width and 0 <= y < self.height):
             return False
-        tile = self.tiles[y][x]
-        walkable_tiles = (
-            TileType.FLOOR,
-            TileType.STAIRS_DOWN,
-            TileType.STAIRS_UP,
-            # Hazard tiles are walkable but dangerous
-            TileType.LAVA,
-            TileType.ICE,
-            TileType.DEEP_WATER,
-            TileType.POISON_GAS,
-        )
-        return tile in walkable_tiles
+        return self.tiles[y][x] in WALKABLE_TILES
 
     def get_visual_char(self, x: int, y: int, use_unicode: bool = True) -> str:
         """
@@ -307,19 +387,14 @@ class Dungeon:
 
     def get_random_floor_position(self) -> Tuple[int, int]:
         """Return a random walkable floor position."""
-        while True:
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
-            if self.is_walkable(x, y):
-                return (x, y)
+        return self.index.random_walkable()
 
     def get_room_at(self, x: int, y: int) -> Optional[Room]:
         """Return the Room containing position (x, y), or None if not in a room."""
-        for room in self.rooms:
-            if (room.x <= x < room.x + room.width and
-                room.y <= y < room.y + room.height):
-                return room
-        return None
+        room_index = self.index.room_index_at(x, y)
+        if room_index == NO_ROOM:
+            return None
+        return self.rooms[room_index]
 
     def get_zone_at(self, x: int, y: int) -> str:
         """Return the zone name for position (x, y)."""
@@ -577,16 +652,20 @@ class Dungeon:
 
     def generate_traps(self, trap_manager: TrapManager, player_x: int, player_y: int):
         """Generate traps for this dungeon level."""
-        feature_generation.generate_traps(self, trap_manager, player_x, player_y)
+        with self.profile.stage("traps"):
+            feature_generation.generate_traps(self, trap_manager, player_x, player_y)
 
     def generate_hazards(self, hazard_manager: HazardManager, player_x: int, player_y: int):
         """Generate environmental hazards for this dungeon level."""
-        feature_generation.generate_hazards(self, hazard_manager, player_x, player_y)
+        with self.profile.stage("hazards"):
+            feature_generation.generate_hazards(self, hazard_manager, player_x, player_y)
 
     def generate_secret_doors(self, secret_door_manager: SecretDoorManager, player_x: int, player_y: int):
         """Generate secret doors for this dungeon level."""
-        feature_generation.generate_secret_doors(self, secret_door_manager, player_x, player_y)
+        with self.profile.stage("secret_doors"):
+            feature_generation.generate_secret_doors(self, secret_door_manager, player_x, player_y)
 
     def generate_torches(self, torch_manager: TorchManager, player_x: int, player_y: int):
         """Generate torches for this dungeon level."""
-        feature_generation.generate_torches(self, torch_manager, player_x, player_y)
+        with self.profile.stage("torches"):
+            feature_generation.generate_torches(self, torch_manager, player_x, player_y)
@@ -3,7 +3,6 @@
 Contains the Room dataclass and BSPNode class used during procedural
 dungeon generation.
 """
-import random
 from dataclasses import dataclass
 from typing import List, Tuple
 
@@ -11,6 +10,7 @@ from ..core.constants import (
     RoomType,
     MIN_ROOM_SIZE, MAX_ROOM_SIZE, MAX_BSP_DEPTH,
 )
+from ..core.rng import rng
 
 
 @dataclass
@@ -75,14 +75,14 @@ class BSPNode:
         elif can_split_vertically and not can_split_horizontally:
             split_horizontally = False
         else:
-            split_horizontally = random.choice([True, False])
+            split_horizontally = rng.choice([True, False])
 
         # Determine split position
         if split_horizontally:
             max_split = self.height - MIN_ROOM_SIZE
             if max_split <= MIN_ROOM_SIZE:
                 return False
-            split_pos = random.randint(MIN_ROOM_SIZE, max_split)
+            split_pos = rng.randint(MIN_ROOM_SIZE, max_split)
 
             self.left_child = BSPNode(self.x, self.y, self.width, split_pos, self.depth + 1)
             self.right_child = BSPNode(self.x, self.y + split_pos,
@@ -91,7 +91,7 @@ class BSPNode:
             max_split = self.width - MIN_ROOM_SIZE
             if max_split <= MIN_ROOM_SIZE:
                 return False
-            split_pos = random.randint(MIN_ROOM_SIZE, max_split)
+            split_pos = rng.randint(MIN_ROOM_SIZE, max_split)
 
             self.left_child = BSPNode(self.x, self.y, split_pos, self.height, self.depth + 1)
             self.right_child = BSPNode(self.x + split_pos, self.y,
@@ -110,17 +110,17 @@ class BSPNode:
             room_width = self.width
             room_x = self.x
         else:
-            room_width = random.randint(MIN_ROOM_SIZE, max_room_width)
+            room_width = rng.randint(MIN_ROOM_SIZE, max_room_width)
             max_x_offset = max(0, self.width - room_width - 1)
-            room_x = self.x + (random.randint(0, max_x_offset) if max_x_offset > 0 else 0)
+            room_x = self.x + (rng.randint(0, max_x_offset) if max_x_offset > 0 else 0)
 
         if max_room_height < MIN_ROOM_SIZE:
             room_height = self.height
             room_y = self.y
         else:
-            room_height = random.randint(MIN_ROOM_SIZE, max_room_height)
+            room_height = rng.randint(MIN_ROOM_SIZE, max_room_height)
             max_y_offset = max(0, self.height - room_height - 1)
-            room_y = self.y + (random.randint(0, max_y_offset) if max_y_offset > 0 else 0)
+            room_y = self.y + (rng.randint(0, max_y_offset) if max_y_offset > 0 else 0)
 
         self.room = Room(room_x, room_y, room_width, room_height)
 
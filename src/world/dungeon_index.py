@@ -0,0 +1,164 @@
+"""Per-floor lookup index for Dungeon.
+
+Replaces per-call scans with precomputed structures:
+- room_grid: room index for every tile (get_room_at / get_zone_at in O(1))
+- walkable: list of walkable tiles for O(1) uniform random sampling
+- regions: connected walkable region for every tile (reachability checks)
+- decoration / terrain / evidence maps keyed by (x, y)
+
+The position maps are filled as features are placed during generation.
+The room grid and walkable list are built once generation finishes and
+kept current by Dungeon.set_tile(). Region labels are flood-filled on
+first use and again after any tile changes walkability.
+"""
+from collections import deque
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from ..core.constants import TileType
+from ..core.rng import rng
+
+if TYPE_CHECKING:
+    from .dungeon import Dungeon
+
+WALKABLE_TILES = frozenset((
+    TileType.FLOOR,
+    TileType.STAIRS_DOWN,
+    TileType.STAIRS_UP,
+    # Hazard tiles are walkable but dangerous
+    TileType.LAVA,
+    TileType.ICE,
+    TileType.DEEP_WATER,
+    TileType.POISON_GAS,
+))
+
+NO_ROOM = -1
+NO_REGION = -1
+
+# Enemies and the player move diagonally, so regions are 8-connected
+_NEIGHBOURS = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+class FloorIndex:
+    """Precomputed spatial lookups for one dungeon floor."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+        # Filled after generation (see build)
+        self.room_grid: List[int] = []
+        self.walkable: List[Tuple[int, int]] = []
+        self._walkable_slot: Dict[Tuple[int, int], int] = {}
+        self._regions: Optional[List[int]] = None  # Built lazily (see region_at)
+
+        # Filled incrementally as features are placed
+        self.decoration_positions: Set[Tuple[int, int]] = set()
+        self.terrain_at: Dict[Tuple[int, int], tuple] = {}
+        self.evidence_at: Dict[Tuple[int, int], tuple] = {}
+
+    # =========================================================================
+    # Grids (built once after generation)
+    # =========================================================================
+
+    def build(self, dungeon: 'Dungeon'):
+        """Build the room grid and walkable list from the generated floor."""
+        width, height = self.width, self.height
+
+        # Paint rooms last-to-first so the first room listed wins on overlap,
+        # matching the old linear scan in get_room_at
+        grid = [NO_ROOM] * (width * height)
+        for room_index in range(len(dungeon.rooms) - 1, -1, -1):
+            room = dungeon.rooms[room_index]
+            x0, x1 = max(room.x, 0), min(room.x + room.width, width)
+            for y in range(max(room.y, 0), min(room.y + room.height, height)):
+                row = y * width
+                grid[row + x0:row + x1] = [room_index] * max(0, x1 - x0)
+        self.room_grid = grid
+
+        self.walkable = [
+            (x, y)
+            for y, row in enumerate(dungeon.tiles)
+            for x, tile in enumerate(row)
+            if tile in WALKABLE_TILES
+        ]
+        self._walkable_slot = {pos: i for i, pos in enumerate(self.walkable)}
+        self._regions = None
+
+    def room_index_at(self, x: int, y: int) -> int:
+        """Index into dungeon.rooms for (x, y), or NO_ROOM."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return NO_ROOM
+        return self.room_grid[y * self.width + x]
+
+    def set_walkable(self, x: int, y: int, walkable: bool):
+        """Add or remove a tile from the walkable list."""
+        pos = (x, y)
+        slot = self._walkable_slot.get(pos)
+        if walkable != (slot is not None):
+            self._regions = None
+        if walkable and slot is None:
+            self._walkable_slot[pos] = len(self.walkable)
+            self.walkable.append(pos)
+        elif not walkable and slot is not None:
+            # Swap-remove keeps the list dense
+            last = self.walkable.pop()
+            del self._walkable_slot[pos]
+            if last != pos:
+                self.walkable[slot] = last
+                self._walkable_slot[last] = slot
+
+    def random_walkable(self) -> Tuple[int, int]:
+        """Uniformly sample a walkable tile."""
+        return rng.choice(self.walkable)
+
+    def region_at(self, x: int, y: int) -> int:
+        """Connected walkable region containing (x, y), or NO_REGION.
+
+        Two tiles share a region iff a walk between them exists.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return NO_REGION
+        if self._regions is None:
+            self._regions = self._flood_regions()
+        return self._regions[y * self.width + x]
+
+    def _flood_regions(self) -> List[int]:
+        width = self.width
+        regions = [NO_REGION] * (width * self.height)
+        walkable = set(self.walkable)
+        label = 0
+        for start in self.walkable:
+            if regions[start[1] * width + start[0]] != NO_REGION:
+                continue
+            regions[start[1] * width + start[0]] = label
+            queue = deque((start,))
+            while queue:
+                cx, cy = queue.popleft()
+                for dx, dy in _NEIGHBOURS:
+                    nx, ny = cx + dx, cy + dy
+                    if (nx, ny) in walkable and regions[ny * width + nx] == NO_REGION:
+                        regions[ny * width + nx] = label
+                        queue.append((nx, ny))
+            label += 1
+        return regions
+
+    # =========================================================================
+    # Feature maps
+    # =========================================================================
+
+    def add_decoration(self, x: int, y: int):
+        self.decoration_positions.add((x, y))
+
+    def has_decoration(self, x: int, y: int) -> bool:
+        return (x, y) in self.decoration_positions
+
+    def add_terrain(self, entry: tuple):
+        # Later features (e.g. blood) draw over earlier ones
+        self.terrain_at[(entry[0], entry[1])] = entry
+
+    def add_evidence(self, entry: tuple):
+        # First evidence placed at a tile is the one the player finds
+        self.evidence_at.setdefault((entry[0], entry[1]), entry)
+
+    def pop_evidence(self, x: int, y: int) -> Optional[tuple]:
+        return self.evidence_at.pop((x, y), None)
@@ -2,13 +2,13 @@
 
 Handles assigning zone identities to rooms and placing zone evidence.
 """
-import random
 from typing import List, Tuple, TYPE_CHECKING
 
 from ..core.constants import TileType
 from .zone_config import get_floor_config, FloorZoneConfig
 from .zone_layouts import apply_zone_layout
 from .zone_evidence import get_evidence_config
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from .dungeon import Dungeon, Room
@@ -110,7 +110,7 @@ def assign_zones(dungeon: 'Dungeon'):
     for room in remaining:
         eligible_zones = _get_eligible_zones(room, config)
         if eligible_zones:
-            chosen = random.choice(eligible_zones)
+            chosen = rng.choice(eligible_zones)
             room.zone = chosen
         else:
             room.zone = config.fallback_zone
@@ -201,7 +201,7 @@ def place_zone_evidence(dungeon: 'Dungeon'):
             # Cap trail tells based on room capacity
             max_tells = min(2, room_max - current_count)  # Reduced from 2-3 to max 2
             if max_tells > 0:
-                num_tells = min(random.randint(1, 2), max_tells)
+                num_tells = min(rng.randint(1, 2), max_tells)
                 placed_count = _place_evidence_in_room(dungeon, room, trail_tells, num_tells, placed, "trail_tell")
                 for _ in range(placed_count):
                     record_placement(room)
@@ -253,8 +253,8 @@ def _place_evidence_in_room(
         attempts += 1
 
         # Pick a position inside the room (1 tile from edges)
-        x = random.randint(room.x + 1, room.x + room.width - 2)
-        y = random.randint(room.y + 1, room.y + room.height - 2)
+        x = rng.randint(room.x + 1, room.x + room.width - 2)
+        y = rng.randint(room.y + 1, room.y + room.height - 2)
 
         # Skip if already placed or not walkable floor
         if (x, y) in placed:
@@ -267,12 +267,12 @@ def _place_evidence_in_room(
             continue
 
         # Skip existing decorations
-        if any(dx == x and dy == y for dx, dy, _, _ in dungeon.decorations):
+        if dungeon.has_decoration_at(x, y):
             continue
 
         # Pick random evidence from list
-        char, color = random.choice(evidence_list)
-        dungeon.zone_evidence.append((x, y, char, color, evidence_type))
+        char, color = rng.choice(evidence_list)
+        dungeon.add_zone_evidence(x, y, char, color, evidence_type)
         placed.add((x, y))
         placed_count += 1
 
@@ -2,13 +2,14 @@
 
 Contains generation logic extracted from Dungeon class.
 """
-import random
 from typing import TYPE_CHECKING, List, Tuple
 
 from ..core.constants import (
     TileType, DungeonTheme, HazardType, TrapType,
     THEME_TORCH_COUNTS, TORCH_DEFAULT_RADIUS, TORCH_DEFAULT_INTENSITY
 )
+from .generation_profile import get_profile
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from .dungeon import Dungeon, Room
@@ -71,7 +72,7 @@ def generate_traps(dungeon: 'Dungeon', trap_manager: 'TrapManager', player_x: in
             continue
 
         # Avoid placing on decorations
-        if any(dx == pos[0] and dy == pos[1] for dx, dy, _, _ in dungeon.decorations):
+        if dungeon.has_decoration_at(pos[0], pos[1]):
             continue
 
         # Prefer corridors and doorways for traps
@@ -83,11 +84,11 @@ def generate_traps(dungeon: 'Dungeon', trap_manager: 'TrapManager', player_x: in
 
         # 70% chance for corridor placement (2-3 adjacent floors)
         # 30% chance for room placement
-        if adjacent_floors > 3 and random.random() > 0.3:
+        if adjacent_floors > 3 and rng.random() > 0.3:
             continue
 
         # Create and place trap
-        trap_type = random.choice(available_traps)
+        trap_type = rng.choice(available_traps)
         trap = Trap(x=pos[0], y=pos[1], trap_type=trap_type)
         trap_manager.add_trap(trap)
         avoid_positions.add(pos)
@@ -103,17 +104,21 @@ def generate_hazards(dungeon: 'Dungeon', hazard_manager: 'HazardManager', player
         hazard_manager: The HazardManager to add hazards to
         player_x, player_y: Player position to avoid placing hazards there
     """
+    stage = get_profile(dungeon).stage
+
     # First, sync any hazard tiles painted by zone layouts into Hazard objects
-    _sync_tile_hazards(dungeon, hazard_manager, player_x, player_y)
+    with stage("hazards.sync_tile_hazards"):
+        _sync_tile_hazards(dungeon, hazard_manager, player_x, player_y)
 
     # Then add additional random hazards based on dungeon theme
     hazard_config = _get_hazard_config(dungeon)
     if not hazard_config:
         return
 
-    for hazard_type, (min_count, max_count) in hazard_config.items():
-        num_hazards = random.randint(min_count, max_count)
-        _place_hazard_zone(dungeon, hazard_manager, hazard_type, num_hazards, player_x, player_y)
+    with stage("hazards.place_zones"):
+        for hazard_type, (min_count, max_count) in hazard_config.items():
+            num_hazards = rng.randint(min_count, max_count)
+            _place_hazard_zone(dungeon, hazard_manager, hazard_type, num_hazards, player_x, player_y)
 
 
 def _sync_tile_hazards(dungeon: 'Dungeon', hazard_manager: 'HazardManager', player_x: int, player_y: int):
@@ -172,15 +177,10 @@ def _ensure_hazard_fairness(dungeon: 'Dungeon', hazard_manager: 'HazardManager',
 
     # Clear hazards from critical positions
     for x, y in critical_positions:
-        if hazard_manager.has_hazard_at(x, y):
-            # Remove hazard from manager
-            hazard_manager.hazards = [
-                h for h in hazard_manager.hazards if not (h.x == x and h.y == y)
-            ]
-            hazard_manager._positions.discard((x, y))
+        if hazard_manager.remove_hazard(x, y) is not None:
             # Reset tile to floor
             if 0 <= x < dungeon.width and 0 <= y < dungeon.height:
-                dungeon.tiles[y][x] = TileType.FLOOR
+                dungeon.set_tile(x, y, TileType.FLOOR)
 
     # For each room, ensure at least one safe path exists
     for room in dungeon.rooms:
@@ -213,12 +213,8 @@ def _ensure_room_safe_path(dungeon: 'Dungeon', room: 'Room', hazard_manager: 'Ha
 
         # Clear horizontal lane
         for x in range(room.x + 1, room.x + room.width - 1):
-            if hazard_manager.has_hazard_at(x, cy):
-                hazard_manager.hazards = [
-                    h for h in hazard_manager.hazards if not (h.x == x and h.y == cy)
-                ]
-                hazard_manager._positions.discard((x, cy))
-                dungeon.tiles[cy][x] = TileType.FLOOR
+            if hazard_manager.remove_hazard(x, cy) is not None:
+                dungeon.set_tile(x, cy, TileType.FLOOR)
 
 
 def _get_hazard_config(dungeon: 'Dungeon') -> dict:
@@ -235,11 +231,11 @@ def _get_hazard_config(dungeon: 'Dungeon') -> dict:
 
     # Poison gas can appear anywhere after level 2
     if dungeon.level >= 2:
-        if random.random() < 0.3:  # 30% chance
+        if rng.random() < 0.3:  # 30% chance
             config[HazardType.POISON_GAS] = (1, 2)
 
     # Deep water can appear in any theme
-    if random.random() < 0.2:  # 20% chance
+    if rng.random() < 0.2:  # 20% chance
         config[HazardType.DEEP_WATER] = (3, 6)
 
     return config
@@ -265,7 +261,7 @@ def _place_hazard_zone(
     if not valid_rooms:
         valid_rooms = dungeon.rooms
 
-    room = random.choice(valid_rooms)
+    room = rng.choice(valid_rooms)
 
     # Positions to avoid
     avoid_positions = {(player_x, player_y)}
@@ -279,15 +275,15 @@ def _place_hazard_zone(
     max_attempts = count * 10
 
     # Start position for the zone (cluster hazards together)
-    start_x = random.randint(room.x + 1, room.x + room.width - 2)
-    start_y = random.randint(room.y + 1, room.y + room.height - 2)
+    start_x = rng.randint(room.x + 1, room.x + room.width - 2)
+    start_y = rng.randint(room.y + 1, room.y + room.height - 2)
 
     while placed < count and attempts < max_attempts:
         attempts += 1
 
         # Spread from start position
-        offset_x = random.randint(-2, 2)
-        offset_y = random.randint(-2, 2)
+        offset_x = rng.randint(-2, 2)
+        offset_y = rng.randint(-2, 2)
         pos = (start_x + offset_x, start_y + offset_y)
 
         # Check bounds
@@ -368,7 +364,7 @@ def generate_secret_doors(dungeon: 'Dungeon', secret_door_manager: 'SecretDoorMa
         return
 
     # Shuffle and pick positions
-    random.shuffle(valid_positions)
+    rng.shuffle(valid_positions)
 
     # Avoid positions too close to player start
     avoid_near_player = []
@@ -410,7 +406,7 @@ def generate_torches(dungeon: 'Dungeon', torch_manager: 'TorchManager', player_x
         dungeon.theme,
         (4, 8)  # Default fallback
     )
-    num_torches = random.randint(min_torches, max_torches)
+    num_torches = rng.randint(min_torches, max_torches)
 
     # Find all valid torch positions (wall tiles adjacent to floor)
     valid_positions = _find_torch_positions(dungeon)
@@ -426,8 +422,7 @@ def generate_torches(dungeon: 'Dungeon', torch_manager: 'TorchManager', player_x
         avoid_positions.add(dungeon.stairs_down_pos)
 
     # Add decoration positions to avoid
-    for dx, dy, _, _ in dungeon.decorations:
-        avoid_positions.add((dx, dy))
+    avoid_positions |= dungeon.index.decoration_positions
 
     # Priority placement: near stairs (landmark lighting)
     priority_positions = []
@@ -457,7 +452,7 @@ def generate_torches(dungeon: 'Dungeon', torch_manager: 'TorchManager', player_x
             regular_positions.append(pos)
 
     # Shuffle regular positions
-    random.shuffle(regular_positions)
+    rng.shuffle(regular_positions)
 
     # Combine: priority first, then regular
     all_positions = priority_positions + regular_positions
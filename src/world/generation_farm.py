@@ -0,0 +1,317 @@
+"""Parallel multi-seed dungeon generation farm.
+
+Fans (floor, seed) jobs across a process pool and collects per-seed stats:
+zone distribution, generation time, room count and connectivity. Used for
+large pre-release validation runs (thousands of seeds per floor) and by
+zone_validation.validate_floor(workers=N).
+
+Dungeon(seed=...) generates from its own seeded RNG (see core/rng.py), and
+the profiled feature passes continue from it, so results depend only on
+(floor, seed) and never on job scheduling.
+
+Run from repo root:
+    python scripts/dungeon_farm.py --floors 1-8 --seeds 2000 --workers 8 --out farm.json.gz
+
+Add --profile to also run the feature passes and report average per-stage
+time and the most expensive zone layouts (see generation_profile.py).
+
+Or from Python:
+    from src.world.generation_farm import run_farm
+    report = run_farm([1, 2], seeds=500, workers=4)
+"""
+import gzip
+import json
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..core.rng import use_rng
+from ..core.constants import DUNGEON_WIDTH, DUNGEON_HEIGHT, TileType
+from .dungeon import Dungeon
+from .generation_profile import GenerationProfile
+from .hazards import HazardManager
+from .secrets import SecretDoorManager
+from .torches import TorchManager
+from .traps import TrapManager
+from .zone_config import get_floor_config
+from .zone_validation import check_zone_counts, aggregate_zone_stats
+
+RESULTS_FORMAT_VERSION = 1
+
+# Doors block walking but not connectivity (they open)
+PASSABLE_EXTRA = (TileType.DOOR_LOCKED, TileType.DOOR_UNLOCKED)
+
+# Row layout of the compact results file
+RESULT_COLUMNS = ("floor", "seed", "gen_ms", "rooms", "reach_pct", "stairs_ok", "zones", "errors")
+
+
+def _connectivity(dungeon: Dungeon) -> Tuple[float, int, bool]:
+    """Flood fill from the start room.
+
+    Returns:
+        (% of walkable tiles reachable, rooms reached, stairs down reachable)
+    """
+    if not dungeon.rooms:
+        return 0.0, 0, False
+
+    start = dungeon.stairs_up_pos or dungeon.rooms[0].center()
+    width, height = dungeon.width, dungeon.height
+    tiles = dungeon.tiles
+
+    def passable(x: int, y: int) -> bool:
+        return dungeon.is_walkable(x, y) or tiles[y][x] in PASSABLE_EXTRA
+
+    seen = {start}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (nx, ny) not in seen and 0 <= nx < width and 0 <= ny < height and passable(nx, ny):
+                seen.add((nx, ny))
+                queue.append((nx, ny))
+
+    walkable = dungeon.index.walkable
+    reached = sum(1 for pos in walkable if pos in seen)
+    reach_pct = 100.0 * reached / len(walkable) if walkable else 0.0
+
+    rooms_reached = sum(
+        1 for room in dungeon.rooms
+        if any(pos in seen for pos in _room_tiles(room))
+    )
+    stairs_ok = dungeon.stairs_down_pos is None or dungeon.stairs_down_pos in seen
+    return reach_pct, rooms_reached, stairs_ok
+
+
+def _room_tiles(room) -> Iterable[Tuple[int, int]]:
+    for y in range(room.y, room.y + room.height):
+        for x in range(room.x, room.x + room.width):
+            yield (x, y)
+
+
+def run_feature_passes(dungeon: Dungeon):
+    """Run the four feature generation passes the engine runs on a new floor.
+
+    Uses throwaway managers and the start room center as the player
+    position; mainly useful to profile the passes (they mutate tiles).
+    """
+    if not dungeon.rooms:
+        return
+    x, y = dungeon.stairs_up_pos or dungeon.rooms[0].center()
+    dungeon.generate_traps(TrapManager(), x, y)
+    dungeon.generate_hazards(HazardManager(), x, y)
+    dungeon.generate_secret_doors(SecretDoorManager(), x, y)
+    dungeon.generate_torches(TorchManager(), x, y)
+
+
+def generate_floor_stats(job: Tuple) -> dict:
+    """
+    Generate one floor and measure it. Runs inside a worker process.
+
+    Args:
+        job: (floor, seed, width, height[, profile]) where profile also
+            runs the feature passes and records per-stage timings
+
+    Returns:
+        Plain dict of stats for the seed (see RESULT_COLUMNS)
+    """
+    level, seed, width, height = job[:4]
+    profile = GenerationProfile() if len(job) > 4 and job[4] else None
+    started = time.perf_counter()
+    dungeon = Dungeon(width=width, height=height, level=level, seed=seed, profile=profile)
+    gen_ms = (time.perf_counter() - started) * 1000
+    reach_pct, rooms_reached, stairs_ok = _connectivity(dungeon)
+    if profile:
+        with use_rng(dungeon.rng):
+            run_feature_passes(dungeon)
+
+    zones = Counter(room.zone for room in dungeon.rooms)
+    errors: List[str] = []
+    warnings: List[str] = []
+    config = get_floor_config(level)
+    if config and config.zones:
+        errors, warnings = check_zone_counts(config, seed, zones)
+    if not stairs_ok:
+        errors.append(f"Seed {seed}: Stairs down unreachable from start")
+    if rooms_reached < len(dungeon.rooms):
+        warnings.append(f"Seed {seed}: {len(dungeon.rooms) - rooms_reached} room(s) unreachable")
+
+    result = {
+        "floor": level,
+        "seed": seed,
+        "gen_ms": round(gen_ms, 3),
+        "rooms": len(dungeon.rooms),
+        "rooms_reached": rooms_reached,
+        "reach_pct": round(reach_pct, 2),
+        "stairs_ok": stairs_ok,
+        "zones": dict(zones),
+        "errors": errors,
+        "warnings": warnings,
+    }
+    if profile:
+        result["profile"] = profile.to_dict()
+    return result
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize_profiles(profiles: List[dict], top: int = 15) -> dict:
+    """Average stage times and rank zone layouts across profiled seeds."""
+    count = len(profiles)
+    stages: Dict[str, float] = {}
+    layouts: Dict[str, List[float]] = {}
+    for profile in profiles:
+        for name, stats in profile["stages"].items():
+            stages[name] = stages.get(name, 0.0) + stats["total_ms"]
+        for name, stats in profile["layouts"].items():
+            entry = layouts.setdefault(name, [0.0, 0, 0.0])
+            entry[0] += stats["total_ms"]
+            entry[1] += stats["calls"]
+            entry[2] = max(entry[2], stats["max_ms"])
+
+    ranked = sorted(layouts.items(), key=lambda item: -item[1][0])
+    return {
+        "seeds": count,
+        "avg_stage_ms": {name: round(total / count, 3) for name, total in stages.items()},
+        "top_layouts": {
+            name: {
+                "total_ms": round(total, 3),
+                "calls": calls,
+                "avg_ms": round(total / calls, 3),
+                "max_ms": round(max_ms, 3),
+            }
+            for name, (total, calls, max_ms) in ranked[:top]
+        },
+    }
+
+
+def summarize_floor(results: List[dict]) -> dict:
+    """Aggregate one floor's per-seed results."""
+    gen_ms = sorted(r["gen_ms"] for r in results)
+    rooms = [r["rooms"] for r in results]
+    reach = [r["reach_pct"] for r in results]
+    failed = [r for r in results if r["errors"]]
+
+    summary = {
+        "seeds": len(results),
+        "passed": not failed,
+        "failed_seeds": len(failed),
+        "error_count": sum(len(r["errors"]) for r in results),
+        "warning_count": sum(len(r["warnings"]) for r in results),
+        "gen_ms": {
+            "avg": round(sum(gen_ms) / len(gen_ms), 3),
+            "p50": _percentile(gen_ms, 50),
+            "p95": _percentile(gen_ms, 95),
+            "max": gen_ms[-1],
+        },
+        "rooms": {
+            "avg": round(sum(rooms) / len(rooms), 2),
+            "min": min(rooms),
+            "max": max(rooms),
+        },
+        "connectivity": {
+            "avg_reach_pct": round(sum(reach) / len(reach), 2),
+            "min_reach_pct": min(reach),
+            "stairs_unreachable": sum(1 for r in results if not r["stairs_ok"]),
+            "seeds_with_unreachable_rooms": sum(
+                1 for r in results if r["rooms_reached"] < r["rooms"]
+            ),
+        },
+        "zones": aggregate_zone_stats([Counter(r["zones"]) for r in results]),
+    }
+    profiles = [r["profile"] for r in results if "profile" in r]
+    if profiles:
+        summary["profile"] = summarize_profiles(profiles)
+    return summary
+
+
+@dataclass
+class FarmReport:
+    """Results of a farm run, in (floor, seed) order."""
+    results: List[dict]
+    floors: Dict[int, dict] = field(default_factory=dict)
+    elapsed_seconds: float = 0.0
+    workers: int = 1
+
+    @property
+    def passed(self) -> bool:
+        return all(summary["passed"] for summary in self.floors.values())
+
+    @property
+    def seeds_per_second(self) -> float:
+        return len(self.results) / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        """Compact form: per-floor summaries plus one row per seed."""
+        return {
+            "version": RESULTS_FORMAT_VERSION,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "workers": self.workers,
+            "floors": {str(level): summary for level, summary in self.floors.items()},
+            "columns": list(RESULT_COLUMNS),
+            "rows": [[r[column] for column in RESULT_COLUMNS] for r in self.results],
+        }
+
+    def write(self, path: str):
+        """Write the compact results file (gzipped if path ends in .gz)."""
+        data = json.dumps(self.to_dict(), separators=(",", ":")).encode("utf-8")
+        if path.endswith(".gz"):
+            data = gzip.compress(data)
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+def run_farm(
+    levels: Iterable[int],
+    seeds: int = 100,
+    workers: Optional[int] = None,
+    seed_start: int = 0,
+    width: int = DUNGEON_WIDTH,
+    height: int = DUNGEON_HEIGHT,
+    profile: bool = False,
+) -> FarmReport:
+    """
+    Generate every (floor, seed) combination and collect stats.
+
+    Args:
+        levels: Floors to generate
+        seeds: Seeds per floor
+        workers: Worker processes (default: CPU count; 1 runs in-process)
+        seed_start: First seed (seeds run seed_start..seed_start+seeds-1)
+        width: Dungeon width
+        height: Dungeon height
+        profile: Also run feature passes and collect per-stage timings
+
+    Returns:
+        FarmReport with per-seed results and per-floor summaries
+    """
+    levels = list(levels)
+    workers = workers or os.cpu_count() or 1
+    jobs = [
+        (level, seed, width, height, profile)
+        for level in levels
+        for seed in range(seed_start, seed_start + seeds)
+    ]
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = [generate_floor_stats(job) for job in jobs]
+    else:
+        chunksize = max(1, len(jobs) // (workers * 8))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(generate_floor_stats, jobs, chunksize=chunksize))
+    elapsed = time.perf_counter() - started
+
+    report = FarmReport(results=results, elapsed_seconds=elapsed, workers=workers)
+    for level in levels:
+        floor_results = [r for r in results if r["floor"] == level]
+        if floor_results:
+            report.floors[level] = summarize_floor(floor_results)
+    return report
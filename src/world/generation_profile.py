@@ -0,0 +1,149 @@
+"""Optional per-stage timing for dungeon generation.
+
+Pass a GenerationProfile to Dungeon(profile=...) to record how long each
+stage of Dungeon._generate, each zone layout handler and each feature
+generation pass takes. With track_allocations=True it also records net
+and peak allocated bytes per stage via tracemalloc (noticeably slower).
+
+    profile = GenerationProfile()
+    dungeon = Dungeon(level=3, seed=42, profile=profile)
+    dungeon.generate_hazards(HazardManager(), *dungeon.rooms[0].center())
+    print(profile.to_dict())
+
+Without a profile, Dungeon uses NULL_PROFILE and stages cost one no-op
+context manager each.
+"""
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, List
+
+
+class StageStats:
+    """Accumulated cost of one named stage."""
+
+    __slots__ = ("calls", "total_ms", "max_ms", "alloc_bytes", "peak_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.alloc_bytes = 0
+        self.peak_bytes = 0
+
+    def record(self, elapsed_ms: float, alloc_bytes: int = 0, peak_bytes: int = 0):
+        self.calls += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.alloc_bytes += alloc_bytes
+        self.peak_bytes = max(self.peak_bytes, peak_bytes)
+
+    def to_dict(self) -> dict:
+        data = {
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+        if self.alloc_bytes or self.peak_bytes:
+            data["alloc_bytes"] = self.alloc_bytes
+            data["peak_bytes"] = self.peak_bytes
+        return data
+
+
+class GenerationProfile:
+    """Collects stage, zone layout and feature pass timings for one floor."""
+
+    enabled = True
+
+    def __init__(self, track_allocations: bool = False):
+        self.track_allocations = track_allocations
+        # Insertion order follows the pipeline, which keeps reports readable
+        self.stages: Dict[str, StageStats] = {}
+        self.layouts: Dict[str, StageStats] = {}
+        # Per open stage, the highest traced total seen before a nested
+        # stage reset tracemalloc's peak (reset_peak is process-wide)
+        self._outer_peaks: List[int] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a pipeline stage (nested stages are timed independently)."""
+        with self._measure(self.stages, name):
+            yield
+
+    @contextmanager
+    def layout(self, name: str) -> Iterator[None]:
+        """Time one zone layout handler call."""
+        with self._measure(self.layouts, name):
+            yield
+
+    @contextmanager
+    def _measure(self, table: Dict[str, StageStats], name: str) -> Iterator[None]:
+        stats = table.get(name)
+        if stats is None:
+            stats = table[name] = StageStats()
+
+        started_tracing = False
+        if self.track_allocations:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            before, peak_so_far = tracemalloc.get_traced_memory()
+            if self._outer_peaks:
+                self._outer_peaks[-1] = max(self._outer_peaks[-1], peak_so_far)
+            tracemalloc.reset_peak()
+            self._outer_peaks.append(before)
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            alloc = peak = 0
+            if self.track_allocations:
+                after, peak_total = tracemalloc.get_traced_memory()
+                peak_total = max(peak_total, self._outer_peaks.pop())
+                if self._outer_peaks:
+                    self._outer_peaks[-1] = max(self._outer_peaks[-1], peak_total)
+                alloc = after - before
+                peak = peak_total - before
+                if started_tracing:
+                    tracemalloc.stop()
+            stats.record(elapsed_ms, alloc, peak)
+
+    @property
+    def total_ms(self) -> float:
+        """Time across top-level generation stages and feature passes."""
+        return sum(s.total_ms for name, s in self.stages.items() if "." not in name)
+
+    def top_layouts(self, limit: int = 10) -> Dict[str, dict]:
+        """Most expensive zone layouts by total time."""
+        ranked = sorted(self.layouts.items(), key=lambda item: -item[1].total_ms)
+        return {name: stats.to_dict() for name, stats in ranked[:limit]}
+
+    def to_dict(self) -> dict:
+        return {
+            "total_ms": round(self.total_ms, 3),
+            "track_allocations": self.track_allocations,
+            "stages": {name: s.to_dict() for name, s in self.stages.items()},
+            "layouts": {name: s.to_dict() for name, s in self.layouts.items()},
+        }
+
+
+class _NullProfile:
+    """Stand-in used when profiling is off."""
+
+    enabled = False
+
+    def stage(self, name: str):
+        return nullcontext()
+
+    def layout(self, name: str):
+        return nullcontext()
+
+
+NULL_PROFILE = _NullProfile()
+
+
+def get_profile(dungeon) -> "GenerationProfile":
+    """The dungeon's profile, or NULL_PROFILE (also for test doubles)."""
+    return getattr(dungeon, "profile", None) or NULL_PROFILE
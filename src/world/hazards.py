@@ -4,12 +4,12 @@ Hazards are terrain features that apply continuous effects to entities.
 Integrates D&D-style saving throws for damage reduction (v6.12).
 """
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional, List, Set, Tuple
-import random
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, List, Set, Tuple
 
 from ..core.constants import HazardType, HAZARD_STATS, StatusEffectType
 from ..combat.dnd_combat import make_saving_throw, SavingThrow
 from ..core.dice import calculate_ability_modifier
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from ..entities.entities import Entity, Player
@@ -154,7 +154,7 @@ class Hazard:
                 # Save success prevents drowning check
                 if save_success:
                     result['message'] = "You struggle but stay afloat! (CON save succeeded)"
-                elif random.random() < stats['drown_chance']:
+                elif rng.random() < stats['drown_chance']:
                     result['drown'] = True
                     result['message'] = "You're drowning in the deep water!"
 
@@ -177,31 +177,85 @@ class Hazard:
         return (entry_dx, entry_dy)
 
 
+# Chance per turn that a frontier cell of a spreading hazard spreads
+SPREAD_CHANCE = 0.1
+
+_NEIGHBOURS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
 class HazardManager:
-    """Manages all hazards on a dungeon level."""
+    """Manages all hazards on a dungeon level.
+
+    Hazards live in a position-keyed grid, so lookups are O(1). Spreading
+    hazards that can still grow (intensity above 1 with a free neighbour)
+    are kept in a separate frontier, so tick_spreading costs scale with the
+    frontier rather than the total hazard count.
+
+    A frontier cell whose free neighbours are all walls (gas against a
+    corridor edge) is set aside as dormant the first time it fails to
+    spread. Dormant cells rejoin the frontier when a neighbouring hazard is
+    removed, or when the dungeon revision passed to tick_spreading changes
+    (Dungeon.set_tile opening up a wall).
+    """
 
     def __init__(self):
-        self.hazards: List[Hazard] = []
-        self._positions: Set[Tuple[int, int]] = set()
+        self._grid: Dict[Tuple[int, int], Hazard] = {}
+        # Insertion-ordered set (dict keys) so spreading order is deterministic
+        self._frontier: Dict[Tuple[int, int], None] = {}
+        self._dormant: Dict[Tuple[int, int], None] = {}
+        self._tiles_revision: Optional[int] = None
         self.amplification: float = 1.0  # Field pulse amplification
 
+    @property
+    def hazards(self) -> List[Hazard]:
+        """All hazards, in the order they were added."""
+        return list(self._grid.values())
+
+    @property
+    def frontier_size(self) -> int:
+        return len(self._frontier)
+
+    def _can_spread(self, hazard: Hazard) -> bool:
+        if hazard.intensity <= 1 or not hazard.stats.get('spreads', False):
+            return False
+        return any((hazard.x + dx, hazard.y + dy) not in self._grid for dx, dy in _NEIGHBOURS)
+
+    def _refresh_frontier(self, x: int, y: int):
+        """Re-check a cell's frontier membership after its neighbourhood changed."""
+        self._dormant.pop((x, y), None)
+        hazard = self._grid.get((x, y))
+        if hazard is not None and self._can_spread(hazard):
+            self._frontier.setdefault((x, y), None)
+        else:
+            self._frontier.pop((x, y), None)
+
     def add_hazard(self, hazard: Hazard):
-        """Add a hazard to the level."""
-        self.hazards.append(hazard)
-        self._positions.add((hazard.x, hazard.y))
+        """Add a hazard to the level (replacing any hazard on that tile)."""
+        pos = (hazard.x, hazard.y)
+        self._grid.pop(pos, None)
+        self._grid[pos] = hazard
+        self._refresh_frontier(*pos)
+        for dx, dy in _NEIGHBOURS:
+            if (hazard.x + dx, hazard.y + dy) in self._frontier:
+                self._refresh_frontier(hazard.x + dx, hazard.y + dy)
+
+    def remove_hazard(self, x: int, y: int) -> Optional[Hazard]:
+        """Remove and return the hazard at position, if any."""
+        hazard = self._grid.pop((x, y), None)
+        if hazard is not None:
+            self._frontier.pop((x, y), None)
+            self._dormant.pop((x, y), None)
+            for dx, dy in _NEIGHBOURS:
+                self._refresh_frontier(x + dx, y + dy)
+        return hazard
 
     def get_hazard_at(self, x: int, y: int) -> Optional[Hazard]:
         """Get hazard at position, if any."""
-        if (x, y) not in self._positions:
-            return None
-        for hazard in self.hazards:
-            if hazard.x == x and hazard.y == y:
-                return hazard
-        return None
+        return self._grid.get((x, y))
 
     def has_hazard_at(self, x: int, y: int) -> bool:
         """Check if there's a hazard at position."""
-        return (x, y) in self._positions
+        return (x, y) in self._grid
 
     def process_entity_at(self, entity: 'Entity', x: int, y: int) -> Optional[dict]:
         """
@@ -212,7 +266,7 @@ class HazardManager:
         Returns:
             Effect result if hazard present, None otherwise
         """
-        hazard = self.get_hazard_at(x, y)
+        hazard = self._grid.get((x, y))
         if hazard:
             return hazard.affect_entity(entity, self.amplification)
         return None
@@ -221,36 +275,57 @@ class HazardManager:
         """Set the hazard damage amplification from field pulses."""
         self.amplification = value
 
-    def tick_spreading(self, is_walkable_func) -> List[Hazard]:
+    def tick_spreading(self, is_walkable_func, tiles_revision: Optional[int] = None) -> List[Hazard]:
         """
         Process spreading hazards (poison gas).
 
+        Each frontier cell has a small chance to spread into one free,
+        walkable neighbour at one lower intensity. A cell with no such
+        neighbour goes dormant instead of rolling every turn.
+
+        Args:
+            is_walkable_func: (x, y) -> whether gas can enter the tile
+            tiles_revision: Dungeon.revision; when it changes, dormant
+                cells are checked again
+
         Returns:
             List of newly created hazards
         """
-        new_hazards = []
+        if tiles_revision != self._tiles_revision:
+            self._tiles_revision = tiles_revision
+            for x, y in list(self._dormant):
+                self._refresh_frontier(x, y)
 
-        for hazard in self.hazards:
-            if hazard.stats.get('spreads', False):
-                # Small chance to spread each turn
-                if random.random() < 0.1:  # 10% spread chance per turn
-                    # Try to spread to adjacent tile
-                    directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-                    random.shuffle(directions)
-
-                    for dx, dy in directions:
-                        nx, ny = hazard.x + dx, hazard.y + dy
-                        if (is_walkable_func(nx, ny) and
-                            not self.has_hazard_at(nx, ny)):
-                            new_hazard = Hazard(
-                                x=nx,
-                                y=ny,
-                                hazard_type=hazard.hazard_type,
-                                intensity=hazard.intensity - 1
-                            )
-                            if new_hazard.intensity > 0:
-                                new_hazards.append(new_hazard)
-                            break
+        new_hazards = []
+        claimed: Set[Tuple[int, int]] = set()
+
+        for x, y in list(self._frontier):
+            if rng.random() >= SPREAD_CHANCE:
+                continue
+            hazard = self._grid[(x, y)]
+            directions = list(_NEIGHBOURS)
+            rng.shuffle(directions)
+
+            walled_in = True
+            for dx, dy in directions:
+                nx, ny = x + dx, y + dy
+                if (nx, ny) in self._grid or not is_walkable_func(nx, ny):
+                    continue
+                walled_in = False
+                if (nx, ny) in claimed:
+                    continue
+                new_hazards.append(Hazard(
+                    x=nx,
+                    y=ny,
+                    hazard_type=hazard.hazard_type,
+                    intensity=hazard.intensity - 1
+                ))
+                claimed.add((nx, ny))
+                break
+
+            if walled_in:
+                del self._frontier[(x, y)]
+                self._dormant[(x, y)] = None
 
         # Add new hazards
         for hazard in new_hazards:
@@ -260,26 +335,74 @@ class HazardManager:
 
     def is_ice_at(self, x: int, y: int) -> bool:
         """Check if there's ice at position."""
-        hazard = self.get_hazard_at(x, y)
+        hazard = self._grid.get((x, y))
         return hazard is not None and hazard.hazard_type == HazardType.ICE
 
     def is_deep_water_at(self, x: int, y: int) -> bool:
         """Check if there's deep water at position."""
-        hazard = self.get_hazard_at(x, y)
+        hazard = self._grid.get((x, y))
         return hazard is not None and hazard.hazard_type == HazardType.DEEP_WATER
 
     def get_movement_cost(self, x: int, y: int) -> int:
         """Get movement cost for position (1 = normal, 2 = slowed)."""
-        hazard = self.get_hazard_at(x, y)
+        hazard = self._grid.get((x, y))
         if hazard and hazard.stats.get('slows_movement', False):
             return 2
         return 1
 
+    # =========================================================================
+    # Serialization
+    # =========================================================================
+
+    def to_compact(self, positions: Optional[Iterable[Tuple[int, int]]] = None) -> Dict[str, List[int]]:
+        """
+        Compact form: hazard type name -> flat [x, y, intensity, ...] list.
+
+        Args:
+            positions: Only include hazards at these positions (e.g. the
+                tiles in view); all hazards when omitted
+        """
+        if positions is None:
+            hazards = self._grid.values()
+        else:
+            hazards = [h for h in map(self._grid.get, positions) if h is not None]
+        compact: Dict[str, List[int]] = {}
+        for hazard in hazards:
+            compact.setdefault(hazard.hazard_type.name, []).extend(
+                (hazard.x, hazard.y, hazard.intensity)
+            )
+        return compact
+
+    def load_compact(self, compact: Dict[str, List[int]]):
+        """Replace all hazards with those from to_compact()."""
+        self._grid.clear()
+        self._frontier.clear()
+        self._dormant.clear()
+        for type_name, cells in compact.items():
+            hazard_type = HazardType[type_name]
+            for i in range(0, len(cells) - 2, 3):
+                self.add_hazard(Hazard(x=cells[i], y=cells[i + 1],
+                                       hazard_type=hazard_type, intensity=cells[i + 2]))
+
+    def get_state(self) -> dict:
+        """Serialize hazards for saving."""
+        return {
+            'amplification': self.amplification,
+            'hazards': self.to_compact(),
+        }
+
+    def load_state(self, state: dict):
+        """Restore hazards from get_state()."""
+        self.load_compact(state.get('hazards', {}))
+        self.amplification = state.get('amplification', 1.0)
+
     def clear(self):
         """Remove all hazards and reset amplification."""
-        self.hazards.clear()
-        self._positions.clear()
+        self._grid.clear()
+        self._frontier.clear()
+        self._dormant.clear()
+        self._tiles_revision = None
         self.amplification = 1.0
 
     def __len__(self) -> int:
-        return len(self.hazards)
+        return len(self._grid)
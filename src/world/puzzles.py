@@ -229,7 +229,7 @@ class PuzzleManager:
                 tx, ty = reward.target_pos
                 # Change wall to floor
                 if 0 <= tx < dungeon.width and 0 <= ty < dungeon.height:
-                    dungeon.tiles[ty][tx] = TileType.FLOOR
+                    dungeon.set_tile(tx, ty, TileType.FLOOR)
                     # Update interactive tile state if exists
                     interactive = dungeon.get_interactive_at(tx, ty)
                     if interactive:
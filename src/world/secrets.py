@@ -5,7 +5,9 @@ Once revealed, they become passable.
 """
 from dataclasses import dataclass
 from typing import Optional, List, Tuple
-import random
+
+from .spatial_hash import SpatialHash
+from ..core.rng import rng
 
 
 @dataclass
@@ -69,7 +71,7 @@ class SecretDoor:
 
         # Base DC 15 for secret doors, harder than traps
         detection_dc = 15
-        roll = random.randint(1, 20) + perception
+        roll = rng.randint(1, 20) + perception
 
         if roll >= detection_dc:
             self.hidden = False
@@ -82,23 +84,22 @@ class SecretDoorManager:
 
     def __init__(self):
         self.doors: List[SecretDoor] = []
+        self._index: SpatialHash[SecretDoor] = SpatialHash()
 
     def add_door(self, door: SecretDoor):
         """Add a secret door to the level."""
         self.doors.append(door)
+        self._index.insert(door)
 
     def add_at(self, x: int, y: int, dx: int = 0, dy: int = 0) -> SecretDoor:
         """Create and add a secret door at position."""
         door = SecretDoor(x=x, y=y, dx=dx, dy=dy)
-        self.doors.append(door)
+        self.add_door(door)
         return door
 
     def get_door_at(self, x: int, y: int) -> Optional[SecretDoor]:
         """Get secret door at position, if any."""
-        for door in self.doors:
-            if door.x == x and door.y == y:
-                return door
-        return None
+        return self._index.first_at(x, y)
 
     def is_secret_wall(self, x: int, y: int) -> bool:
         """Check if position has a hidden secret door (looks like wall)."""
@@ -125,13 +126,9 @@ class SecretDoorManager:
             List of doors that were detected
         """
         detected = []
-        for door in self.doors:
-            if door.hidden:
-                # Check Manhattan distance
-                dist = abs(door.x - x) + abs(door.y - y)
-                if dist <= radius:
-                    if door.detect(perception):
-                        detected.append(door)
+        for door in self._index.query_radius(x, y, radius):
+            if door.hidden and door.detect(perception):
+                detected.append(door)
         return detected
 
     def get_hidden_doors(self) -> List[SecretDoor]:
@@ -149,6 +146,7 @@ class SecretDoorManager:
     def clear(self):
         """Remove all secret doors."""
         self.doors.clear()
+        self._index.clear()
 
     def __len__(self) -> int:
         return len(self.doors)
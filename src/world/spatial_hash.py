@@ -0,0 +1,162 @@
+"""Spatial hash for floor features with integer x/y positions.
+
+Shared by the trap, secret door, torch and ghost managers so that
+position, radius and rectangle queries cost proportionally to the area
+queried rather than the number of features on the floor:
+- at / first_at / has: exact tile, O(1)
+- query_rect / query_radius: only the buckets overlapping the query
+
+Results are returned in insertion order, the same order the managers'
+lists iterate in, so callers that roll dice per result (trap detection,
+door searches) draw from the RNG exactly as a full scan would.
+
+Objects are tracked by identity and need not be hashable. Objects that
+move must be re-indexed with update() (see GhostManager.tick).
+"""
+from typing import Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# Bucket edge in tiles; most queries are radius 1-8
+DEFAULT_CELL_SIZE = 8
+
+
+class _Entry:
+    __slots__ = ('obj', 'x', 'y', 'seq')
+
+    def __init__(self, obj, x: int, y: int, seq: int):
+        self.obj = obj
+        self.x = x
+        self.y = y
+        self.seq = seq
+
+
+class SpatialHash(Generic[T]):
+    """Buckets objects by position for tile, radius and rectangle queries."""
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[_Entry]] = {}
+        self._tiles: Dict[Tuple[int, int], List[_Entry]] = {}
+        self._entries: Dict[int, _Entry] = {}  # id(obj) -> entry
+        self._next_seq = 0
+
+    def _cell(self, x: int, y: int) -> Tuple[int, int]:
+        return (x // self.cell_size, y // self.cell_size)
+
+    def _link(self, entry: _Entry):
+        self._cells.setdefault(self._cell(entry.x, entry.y), []).append(entry)
+        self._tiles.setdefault((entry.x, entry.y), []).append(entry)
+
+    def _unlink(self, entry: _Entry):
+        for index, key in ((self._cells, self._cell(entry.x, entry.y)),
+                           (self._tiles, (entry.x, entry.y))):
+            bucket = index[key]
+            bucket.remove(entry)
+            if not bucket:
+                del index[key]
+
+    # =========================================================================
+    # Updates
+    # =========================================================================
+
+    def insert(self, obj: T):
+        """Index obj at (obj.x, obj.y)."""
+        if id(obj) in self._entries:
+            self.update(obj)
+            return
+        entry = _Entry(obj, obj.x, obj.y, self._next_seq)
+        self._next_seq += 1
+        self._entries[id(obj)] = entry
+        self._link(entry)
+
+    def remove(self, obj: T) -> bool:
+        entry = self._entries.pop(id(obj), None)
+        if entry is None:
+            return False
+        self._unlink(entry)
+        return True
+
+    def update(self, obj: T) -> bool:
+        """Re-index obj if it moved (inserting it if new). Returns True if it did."""
+        entry = self._entries.get(id(obj))
+        if entry is None:
+            self.insert(obj)
+            return True
+        if entry.x == obj.x and entry.y == obj.y:
+            return False
+        self._unlink(entry)
+        entry.x, entry.y = obj.x, obj.y
+        self._link(entry)
+        return True
+
+    def clear(self):
+        self._cells.clear()
+        self._tiles.clear()
+        self._entries.clear()
+        self._next_seq = 0
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def at(self, x: int, y: int) -> List[T]:
+        """Objects on tile (x, y)."""
+        return [entry.obj for entry in self._tiles.get((x, y), ())]
+
+    def first_at(self, x: int, y: int) -> Optional[T]:
+        """Earliest inserted object on tile (x, y), if any."""
+        bucket = self._tiles.get((x, y))
+        return bucket[0].obj if bucket else None
+
+    def has(self, x: int, y: int) -> bool:
+        return (x, y) in self._tiles
+
+    def _in_cells(self, x0: int, y0: int, x1: int, y1: int) -> Iterator[_Entry]:
+        cx0, cy0 = self._cell(x0, y0)
+        cx1, cy1 = self._cell(x1, y1)
+        cells = self._cells
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    yield from bucket
+
+    def query_rect(self, x0: int, y0: int, x1: int, y1: int) -> List[T]:
+        """Objects with x0 <= x <= x1 and y0 <= y <= y1, in insertion order."""
+        found = [
+            entry for entry in self._in_cells(x0, y0, x1, y1)
+            if x0 <= entry.x <= x1 and y0 <= entry.y <= y1
+        ]
+        found.sort(key=lambda entry: entry.seq)
+        return [entry.obj for entry in found]
+
+    def query_radius(self, x: int, y: int, radius: int) -> List[T]:
+        """Objects within Manhattan distance radius, in insertion order."""
+        found = [
+            entry for entry in self._in_cells(x - radius, y - radius, x + radius, y + radius)
+            if abs(entry.x - x) + abs(entry.y - y) <= radius
+        ]
+        found.sort(key=lambda entry: entry.seq)
+        return [entry.obj for entry in found]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, obj) -> bool:
+        return id(obj) in self._entries
+
+    def __iter__(self) -> Iterator[T]:
+        return (entry.obj for entry in sorted(self._entries.values(), key=lambda e: e.seq))
+
+    # =========================================================================
+    # Copying (entries are keyed by id(), so rebuild rather than copy keys)
+    # =========================================================================
+
+    def __getstate__(self) -> dict:
+        return {'cell_size': self.cell_size, 'objects': list(self)}
+
+    def __setstate__(self, state: dict):
+        self.__init__(state['cell_size'])
+        for obj in state['objects']:
+            self.insert(obj)
@@ -7,6 +7,8 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional, List, Set, Tuple, Dict
 import math
 
+from .spatial_hash import SpatialHash
+
 if TYPE_CHECKING:
     from .dungeon import Dungeon
 
@@ -52,7 +54,7 @@ class TorchManager:
 
     def __init__(self):
         self.torches: List[Torch] = []
-        self._positions: Set[Tuple[int, int]] = set()  # Fast position lookup
+        self._index: SpatialHash[Torch] = SpatialHash()  # Position/range lookup
         # Cached lighting data
         self._lit_tiles: Dict[Tuple[int, int], float] = {}
         self._dirty: bool = True  # Needs recalculation
@@ -60,30 +62,24 @@ class TorchManager:
     def add_torch(self, torch: Torch) -> None:
         """Add a torch to the level."""
         self.torches.append(torch)
-        self._positions.add((torch.x, torch.y))
+        self._index.insert(torch)
         self._dirty = True
 
     def get_torch_at(self, x: int, y: int) -> Optional[Torch]:
         """Get torch at position, if any."""
-        if (x, y) not in self._positions:
-            return None
-        for torch in self.torches:
-            if torch.x == x and torch.y == y:
-                return torch
-        return None
+        return self._index.first_at(x, y)
 
     def has_torch_at(self, x: int, y: int) -> bool:
         """Quick check if position has a torch."""
-        return (x, y) in self._positions
+        return self._index.has(x, y)
 
     def get_torches_in_range(self, x: int, y: int, radius: int) -> List[Torch]:
-        """Get all torches within radius of a position."""
-        result = []
-        for torch in self.torches:
-            dist = abs(torch.x - x) + abs(torch.y - y)
-            if dist <= radius:
-                result.append(torch)
-        return result
+        """Get all torches within radius (Manhattan) of a position."""
+        return self._index.query_radius(x, y, radius)
+
+    def get_torches_in_rect(self, x0: int, y0: int, x1: int, y1: int) -> List[Torch]:
+        """Get all torches inside an inclusive rectangle."""
+        return self._index.query_rect(x0, y0, x1, y1)
 
     def is_tile_lit(self, x: int, y: int) -> bool:
         """Check if a tile is illuminated by any torch."""
@@ -226,7 +222,7 @@ class TorchManager:
     def clear(self) -> None:
         """Remove all torches."""
         self.torches.clear()
-        self._positions.clear()
+        self._index.clear()
         self._lit_tiles.clear()
         self._dirty = True
 
@@ -5,11 +5,12 @@ Integrates D&D-style saving throws for damage reduction (v6.10).
 """
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional, List, Tuple
-import random
 
 from ..core.constants import TrapType, TRAP_STATS, StatusEffectType
 from ..combat.dnd_combat import make_saving_throw, SavingThrow
 from ..core.dice import calculate_ability_modifier
+from .spatial_hash import SpatialHash
+from ..core.rng import rng
 
 
 # Status effect saving throw DCs
@@ -69,7 +70,7 @@ class Trap:
             return False  # Already visible
 
         detection_dc = self.stats['detection_dc']
-        roll = random.randint(1, 20) + perception
+        roll = rng.randint(1, 20) + perception
 
         if roll >= detection_dc:
             self.hidden = False
@@ -98,7 +99,7 @@ class Trap:
         # Calculate base damage
         damage_min = self.stats['damage_min']
         damage_max = self.stats['damage_max']
-        base_damage = random.randint(damage_min, damage_max)
+        base_damage = rng.randint(damage_min, damage_max)
 
         # Check for D&D-style saving throw
         saving_throw = None
@@ -196,17 +197,16 @@ class TrapManager:
 
     def __init__(self):
         self.traps: List[Trap] = []
+        self._index: SpatialHash[Trap] = SpatialHash()
 
     def add_trap(self, trap: Trap):
         """Add a trap to the level."""
         self.traps.append(trap)
+        self._index.insert(trap)
 
     def get_trap_at(self, x: int, y: int) -> Optional[Trap]:
         """Get trap at position, if any."""
-        for trap in self.traps:
-            if trap.x == x and trap.y == y:
-                return trap
-        return None
+        return self._index.first_at(x, y)
 
     def check_and_trigger(self, entity: 'Entity', x: int, y: int) -> Optional[dict]:
         """
@@ -233,14 +233,15 @@ class TrapManager:
             List of traps that were detected
         """
         detected = []
-        for trap in self.traps:
-            if trap.hidden:
-                dist = abs(trap.x - x) + abs(trap.y - y)
-                if dist <= radius:
-                    if trap.detect(perception):
-                        detected.append(trap)
+        for trap in self._index.query_radius(x, y, radius):
+            if trap.hidden and trap.detect(perception):
+                detected.append(trap)
         return detected
 
+    def get_traps_in_rect(self, x0: int, y0: int, x1: int, y1: int) -> List[Trap]:
+        """Get traps inside an inclusive rectangle."""
+        return self._index.query_rect(x0, y0, x1, y1)
+
     def get_visible_traps(self) -> List[Trap]:
         """Get all visible (non-hidden) traps."""
         return [trap for trap in self.traps if not trap.hidden]
@@ -248,6 +249,7 @@ class TrapManager:
     def clear(self):
         """Remove all traps."""
         self.traps.clear()
+        self._index.clear()
 
     def __len__(self) -> int:
         return len(self.traps)
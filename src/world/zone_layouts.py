@@ -9,6 +9,8 @@ Layouts are split by floor range:
 """
 from typing import Callable, Dict, Tuple, TYPE_CHECKING
 
+from .generation_profile import get_profile
+
 if TYPE_CHECKING:
     from .dungeon import Dungeon, Room
 
@@ -30,7 +32,8 @@ def apply_zone_layout(dungeon: 'Dungeon', room: 'Room'):
     key = (dungeon.level, room.zone)
     handler = ZONE_LAYOUTS.get(key)
     if handler:
-        handler(dungeon, room)
+        with get_profile(dungeon).layout(handler.__name__):
+            handler(dungeon, room)
 
 
 # Import layout modules to trigger registration via @register_layout decorators
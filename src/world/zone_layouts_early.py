@@ -2,10 +2,10 @@
 
 Stone Dungeon, Sewers, Forest Depths, Mirror Valdris.
 """
-import random
 from typing import TYPE_CHECKING
 
 from .zone_layouts import register_layout
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from .dungeon import Dungeon, Room
@@ -46,7 +46,7 @@ def layout_cell_blocks(dungeon: 'Dungeon', room: 'Room'):
 
         door_y = cell_y + cell_height // 2
         if door_y < room.y + room.height - 1 and left_wall_x >= room.x:
-            if random.random() < 0.3:
+            if rng.random() < 0.3:
                 dungeon.tiles[door_y][left_wall_x] = TileType.DOOR_LOCKED
             else:
                 dungeon.tiles[door_y][left_wall_x] = TileType.DOOR_UNLOCKED
@@ -71,7 +71,7 @@ def layout_cell_blocks(dungeon: 'Dungeon', room: 'Room'):
 
         door_y = cell_y + cell_height // 2
         if door_y < room.y + room.height - 1 and right_wall_x < room.x + room.width:
-            if random.random() < 0.3:
+            if rng.random() < 0.3:
                 dungeon.tiles[door_y][right_wall_x] = TileType.DOOR_LOCKED
             else:
                 dungeon.tiles[door_y][right_wall_x] = TileType.DOOR_UNLOCKED
@@ -100,9 +100,9 @@ def layout_cell_blocks(dungeon: 'Dungeon', room: 'Room'):
         if dungeon.tiles[room.y][x] == TileType.WALL:
             clue_candidates.append((x, room.y, WallFace.SOUTH))
 
-    if clue_candidates and random.random() < 0.7:
-        cx, cy, face = random.choice(clue_candidates)
-        message = random.choice(tally_messages)
+    if clue_candidates and rng.random() < 0.7:
+        cx, cy, face = rng.choice(clue_candidates)
+        message = rng.choice(tally_messages)
         inscription = InteractiveTile.inscription(
             wall_face=face,
             examine_text=message,
@@ -279,7 +279,7 @@ def layout_waste_channels(dungeon: 'Dungeon', room: 'Room'):
         for x in range(room.x + 1, room.x + room.width - 1):
             if channel_y > room.y + 1 and channel_y < room.y + room.height - 2:
                 dungeon.tiles[channel_y][x] = TileType.DEEP_WATER
-                if room.height >= 6 and random.random() < 0.5:
+                if room.height >= 6 and rng.random() < 0.5:
                     if channel_y + 1 < room.y + room.height - 2:
                         dungeon.tiles[channel_y + 1][x] = TileType.DEEP_WATER
     else:
@@ -287,7 +287,7 @@ def layout_waste_channels(dungeon: 'Dungeon', room: 'Room'):
         for y in range(room.y + 1, room.y + room.height - 1):
             if channel_x > room.x + 1 and channel_x < room.x + room.width - 2:
                 dungeon.tiles[y][channel_x] = TileType.DEEP_WATER
-                if room.width >= 6 and random.random() < 0.5:
+                if room.width >= 6 and rng.random() < 0.5:
                     if channel_x + 1 < room.x + room.width - 2:
                         dungeon.tiles[y][channel_x + 1] = TileType.DEEP_WATER
 
@@ -298,14 +298,14 @@ def layout_waste_channels(dungeon: 'Dungeon', room: 'Room'):
         "A torn boot lies near the water's edge. The laces are still tied.",
     ]
 
-    if random.random() < 0.5:
+    if rng.random() < 0.5:
         # Place on a wall near the water
         wall_y = room.y
         wall_x = room.x + room.width // 2
         if 0 <= wall_x < dungeon.width and dungeon.tiles[wall_y][wall_x] == TileType.WALL:
             inscription = InteractiveTile.inscription(
                 wall_face=WallFace.SOUTH,
-                examine_text=random.choice(bloodstain_messages),
+                examine_text=rng.choice(bloodstain_messages),
             )
             dungeon.add_interactive(wall_x, wall_y, inscription)
 
@@ -337,10 +337,10 @@ def layout_carrier_nests(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 5 or room.height < 5:
         return
 
-    num_patches = random.randint(1, 2)
+    num_patches = rng.randint(1, 2)
     for _ in range(num_patches):
-        px = random.randint(room.x + 1, room.x + room.width - 2)
-        py = random.randint(room.y + 1, room.y + room.height - 2)
+        px = rng.randint(room.x + 1, room.x + room.width - 2)
+        py = rng.randint(room.y + 1, room.y + room.height - 2)
         if dungeon.tiles[py][px] == TileType.FLOOR:
             dungeon.tiles[py][px] = TileType.DEEP_WATER
 
@@ -353,10 +353,10 @@ def layout_seal_drifts(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 5 or room.height < 5:
         return
 
-    num_patches = random.randint(2, 3)
+    num_patches = rng.randint(2, 3)
     for _ in range(num_patches):
-        px = random.randint(room.x + 1, room.x + room.width - 2)
-        py = random.randint(room.y + 1, room.y + room.height - 2)
+        px = rng.randint(room.x + 1, room.x + room.width - 2)
+        py = rng.randint(room.y + 1, room.y + room.height - 2)
         if dungeon.tiles[py][px] == TileType.FLOOR:
             dungeon.tiles[py][px] = TileType.DEEP_WATER
 
@@ -391,9 +391,9 @@ def layout_maintenance_tunnels(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 6 and room.height < 6:
         return
 
-    if random.random() < 0.3:
-        px = random.randint(room.x + 1, room.x + room.width - 2)
-        py = random.randint(room.y + 1, room.y + room.height - 2)
+    if rng.random() < 0.3:
+        px = rng.randint(room.x + 1, room.x + room.width - 2)
+        py = rng.randint(room.y + 1, room.y + room.height - 2)
         if dungeon.tiles[py][px] == TileType.FLOOR:
             dungeon.tiles[py][px] = TileType.DEEP_WATER
 
@@ -434,12 +434,12 @@ def layout_root_warrens(dungeon: 'Dungeon', room: 'Room'):
     if room.width > room.height:
         partition_x = room.x + room.width // 2
         for y in range(room.y + 3, room.y + room.height - 3):
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 dungeon.tiles[y][partition_x] = TileType.WALL
     else:
         partition_y = room.y + room.height // 2
         for x in range(room.x + 3, room.x + room.width - 3):
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 dungeon.tiles[partition_y][x] = TileType.WALL
 
 
@@ -451,8 +451,8 @@ def layout_canopy_halls(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 8 or room.height < 8:
         return
 
-    if random.random() < 0.5:
-        corner = random.choice(['nw', 'ne', 'sw', 'se'])
+    if rng.random() < 0.5:
+        corner = rng.choice(['nw', 'ne', 'sw', 'se'])
         if corner == 'nw':
             px, py = room.x + 1, room.y + 1
         elif corner == 'ne':
@@ -479,10 +479,10 @@ def layout_webbed_gardens(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 6 or room.height < 6:
         return
 
-    num_traps = random.randint(1, 3)
+    num_traps = rng.randint(1, 3)
     for _ in range(num_traps):
-        tx = random.randint(room.x + 2, room.x + room.width - 3)
-        ty = random.randint(room.y + 2, room.y + room.height - 3)
+        tx = rng.randint(room.x + 2, room.x + room.width - 3)
+        ty = rng.randint(room.y + 2, room.y + room.height - 3)
         if dungeon.tiles[ty][tx] == TileType.FLOOR:
             dungeon.tiles[ty][tx] = TileType.DEEP_WATER
 
@@ -495,21 +495,21 @@ def layout_the_nursery(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 8 or room.height < 8:
         return
 
-    num_hazards = random.randint(2, 4)
+    num_hazards = rng.randint(2, 4)
     for _ in range(num_hazards):
-        edge = random.choice(['n', 's', 'e', 'w'])
+        edge = rng.choice(['n', 's', 'e', 'w'])
         if edge == 'n':
-            tx = random.randint(room.x + 2, room.x + room.width - 3)
+            tx = rng.randint(room.x + 2, room.x + room.width - 3)
             ty = room.y + 1
         elif edge == 's':
-            tx = random.randint(room.x + 2, room.x + room.width - 3)
+            tx = rng.randint(room.x + 2, room.x + room.width - 3)
             ty = room.y + room.height - 2
         elif edge == 'e':
             tx = room.x + room.width - 2
-            ty = random.randint(room.y + 2, room.y + room.height - 3)
+            ty = rng.randint(room.y + 2, room.y + room.height - 3)
         else:
             tx = room.x + 1
-            ty = random.randint(room.y + 2, room.y + room.height - 3)
+            ty = rng.randint(room.y + 2, room.y + room.height - 3)
 
         if dungeon.tiles[ty][tx] == TileType.FLOOR:
             dungeon.tiles[ty][tx] = TileType.DEEP_WATER
@@ -579,10 +579,10 @@ def layout_druid_ring(dungeon: 'Dungeon', room: 'Room'):
     wall_x = room.x + room.width // 2
     wall_y = room.y
     if 0 <= wall_x < dungeon.width and dungeon.tiles[wall_y][wall_x] == TileType.WALL:
-        if random.random() < 0.6:
+        if rng.random() < 0.6:
             inscription = InteractiveTile.inscription(
                 wall_face=WallFace.SOUTH,
-                examine_text=random.choice(weapon_messages),
+                examine_text=rng.choice(weapon_messages),
             )
             dungeon.add_interactive(wall_x, wall_y, inscription)
 
@@ -649,7 +649,7 @@ def layout_courtyard_squares(dungeon: 'Dungeon', room: 'Room'):
     cx = room.x + room.width // 2
     cy = room.y + room.height // 2
 
-    if random.random() < 0.6:
+    if rng.random() < 0.6:
         for dx in range(-1, 2):
             for dy in range(-1, 2):
                 px = cx + dx
@@ -674,7 +674,7 @@ def layout_seal_chambers(dungeon: 'Dungeon', room: 'Room'):
         (room.x + 2, room.y + room.height - 3),
         (room.x + room.width - 3, room.y + room.height - 3),
     ]
-    for x, y in random.sample(corners, min(3, len(corners))):
+    for x, y in rng.sample(corners, min(3, len(corners))):
         if dungeon.tiles[y][x] == TileType.FLOOR:
             dungeon.tiles[y][x] = TileType.DEEP_WATER
 
@@ -695,12 +695,12 @@ def layout_record_vaults(dungeon: 'Dungeon', room: 'Room'):
     if room.width > room.height:
         for x in range(room.x + 3, room.x + room.width - 3, 4):
             for y in range(room.y + 2, room.y + room.height - 2):
-                if random.random() < 0.4:
+                if rng.random() < 0.4:
                     dungeon.tiles[y][x] = TileType.WALL
     else:
         for y in range(room.y + 3, room.y + room.height - 3, 4):
             for x in range(room.x + 2, room.x + room.width - 2):
-                if random.random() < 0.4:
+                if rng.random() < 0.4:
                     dungeon.tiles[y][x] = TileType.WALL
 
     # Add faded map inscription (secret room clue)
@@ -718,10 +718,10 @@ def layout_record_vaults(dungeon: 'Dungeon', room: 'Room'):
     wall_y = room.y + room.height // 2
     if 0 <= wall_x < dungeon.width and 0 <= wall_y < dungeon.height:
         if dungeon.tiles[wall_y][wall_x] == TileType.WALL:
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 inscription = InteractiveTile.inscription(
                     wall_face=WallFace.WEST,
-                    examine_text=random.choice(map_messages),
+                    examine_text=rng.choice(map_messages),
                 )
                 dungeon.add_interactive(wall_x, wall_y, inscription)
 
@@ -762,6 +762,6 @@ def layout_mausoleum_district(dungeon: 'Dungeon', room: 'Room'):
 
     for y in range(room.y + 2, room.y + room.height - 2, 3):
         for x in range(room.x + 2, room.x + room.width - 2, 3):
-            if random.random() < 0.3:
+            if rng.random() < 0.3:
                 if dungeon.tiles[y][x] == TileType.FLOOR:
                     dungeon.tiles[y][x] = TileType.DEEP_WATER
@@ -2,11 +2,11 @@
 
 Ice Cavern, Ancient Library, Volcanic Depths, Crystal Cave.
 """
-import random
 from typing import TYPE_CHECKING
 
 from .zone_layouts import register_layout
 from .puzzles import create_pressure_plate_puzzle
+from ..core.rng import rng
 
 if TYPE_CHECKING:
     from .dungeon import Dungeon, Room
@@ -132,7 +132,7 @@ def layout_ice_tombs(dungeon: 'Dungeon', room: 'Room'):
         (room.x + 1, room.y + room.height - 2),
         (room.x + room.width - 2, room.y + room.height - 2),
     ]
-    for x, y in random.sample(corners, min(2, len(corners))):
+    for x, y in rng.sample(corners, min(2, len(corners))):
         if dungeon.tiles[y][x] == TileType.FLOOR:
             dungeon.tiles[y][x] = TileType.ICE
 
@@ -151,10 +151,10 @@ def layout_ice_tombs(dungeon: 'Dungeon', room: 'Room'):
     wall_y = room.y + room.height // 2
     if 0 <= wall_x < dungeon.width and 0 <= wall_y < dungeon.height:
         if dungeon.tiles[wall_y][wall_x] == TileType.WALL:
-            if random.random() < 0.5:
+            if rng.random() < 0.5:
                 inscription = InteractiveTile.inscription(
                     wall_face=WallFace.WEST,
-                    examine_text=random.choice(corpse_messages),
+                    examine_text=rng.choice(corpse_messages),
                 )
                 dungeon.add_interactive(wall_x, wall_y, inscription)
 
@@ -170,7 +170,7 @@ def layout_crystal_grottos(dungeon: 'Dungeon', room: 'Room'):
     cx = room.x + room.width // 2
     cy = room.y + room.height // 2
 
-    if random.random() < 0.5:
+    if rng.random() < 0.5:
         offsets = [(-1, 0), (1, 0), (0, -1), (0, 1)]
         for dx, dy in offsets:
             px, py = cx + dx, cy + dy
@@ -188,10 +188,10 @@ def layout_suspended_laboratories(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 6 or room.height < 6:
         return
 
-    num_patches = random.randint(1, 2)
+    num_patches = rng.randint(1, 2)
     for _ in range(num_patches):
-        px = random.randint(room.x + 2, room.x + room.width - 3)
-        py = random.randint(room.y + 2, room.y + room.height - 3)
+        px = rng.randint(room.x + 2, room.x + room.width - 3)
+        py = rng.randint(room.y + 2, room.y + room.height - 3)
         if dungeon.tiles[py][px] == TileType.FLOOR:
             dungeon.tiles[py][px] = TileType.ICE
 
@@ -204,8 +204,8 @@ def layout_breathing_chamber(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 10 or room.height < 8:
         return
 
-    if random.random() < 0.6:
-        edge = random.choice(['n', 's'])
+    if rng.random() < 0.6:
+        edge = rng.choice(['n', 's'])
         if edge == 'n':
             y = room.y + 1
             for x in range(room.x + 2, room.x + room.width - 2):
@@ -263,18 +263,18 @@ def layout_forbidden_stacks(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 6 or room.height < 6:
         return
 
-    num_partitions = random.randint(1, 2)
+    num_partitions = rng.randint(1, 2)
     for _ in range(num_partitions):
-        if random.random() < 0.5:
-            py = random.randint(room.y + 2, room.y + room.height - 3)
-            start_x = random.randint(room.x + 2, room.x + room.width - 4)
+        if rng.random() < 0.5:
+            py = rng.randint(room.y + 2, room.y + room.height - 3)
+            start_x = rng.randint(room.x + 2, room.x + room.width - 4)
             length = min(3, room.x + room.width - 2 - start_x)
             for x in range(start_x, start_x + length):
                 if dungeon.tiles[py][x] == TileType.FLOOR:
                     dungeon.tiles[py][x] = TileType.WALL
         else:
-            px = random.randint(room.x + 2, room.x + room.width - 3)
-            start_y = random.randint(room.y + 2, room.y + room.height - 4)
+            px = rng.randint(room.x + 2, room.x + room.width - 3)
+            start_y = rng.randint(room.y + 2, room.y + room.height - 4)
             length = min(3, room.y + room.height - 2 - start_y)
             for y in range(start_y, start_y + length):
                 if dungeon.tiles[y][px] == TileType.FLOOR:
@@ -295,10 +295,10 @@ def layout_forbidden_stacks(dungeon: 'Dungeon', room: 'Room'):
     wall_y = room.y
     if 0 <= wall_x < dungeon.width and 0 <= wall_y < dungeon.height:
         if dungeon.tiles[wall_y][wall_x] == TileType.WALL:
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 inscription = InteractiveTile.inscription(
                     wall_face=WallFace.SOUTH,
-                    examine_text=random.choice(riddle_messages),
+                    examine_text=rng.choice(riddle_messages),
                 )
                 dungeon.add_interactive(wall_x, wall_y, inscription)
 
@@ -331,7 +331,7 @@ def layout_indexing_heart(dungeon: 'Dungeon', room: 'Room'):
         if (room.x + 1 <= px < room.x + room.width - 1 and
             room.y + 1 <= py < room.y + room.height - 1):
             if dungeon.tiles[py][px] == TileType.FLOOR:
-                if random.random() < 0.4:
+                if rng.random() < 0.4:
                     dungeon.tiles[py][px] = TileType.DEEP_WATER
 
 
@@ -343,10 +343,10 @@ def layout_experiment_archives(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 6 or room.height < 6:
         return
 
-    num_markers = random.randint(1, 2)
+    num_markers = rng.randint(1, 2)
     for _ in range(num_markers):
-        px = random.randint(room.x + 2, room.x + room.width - 3)
-        py = random.randint(room.y + 2, room.y + room.height - 3)
+        px = rng.randint(room.x + 2, room.x + room.width - 3)
+        py = rng.randint(room.y + 2, room.y + room.height - 3)
         if dungeon.tiles[py][px] == TileType.FLOOR:
             dungeon.tiles[py][px] = TileType.DEEP_WATER
 
@@ -368,7 +368,7 @@ def layout_boss_approach_library(dungeon: 'Dungeon', room: 'Room'):
     cx = room.x + room.width // 2
     cy = room.y + room.height // 2
 
-    if random.random() < 0.5:
+    if rng.random() < 0.5:
         if dungeon.tiles[cy][cx - 1] == TileType.FLOOR:
             dungeon.tiles[cy][cx - 1] = TileType.DEEP_WATER
 
@@ -390,14 +390,14 @@ def layout_forge_halls(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 7 or room.height < 7:
         return
 
-    if random.random() < 0.5:
+    if rng.random() < 0.5:
         if room.width > room.height:
             px = room.x + room.width // 3
-            py = random.choice([room.y + 2, room.y + room.height - 3])
+            py = rng.choice([room.y + 2, room.y + room.height - 3])
             if dungeon.tiles[py][px] == TileType.FLOOR:
                 dungeon.tiles[py][px] = TileType.WALL
         else:
-            px = random.choice([room.x + 2, room.x + room.width - 3])
+            px = rng.choice([room.x + 2, room.x + room.width - 3])
             py = room.y + room.height // 3
             if dungeon.tiles[py][px] == TileType.FLOOR:
                 dungeon.tiles[py][px] = TileType.WALL
@@ -417,10 +417,10 @@ def layout_forge_halls(dungeon: 'Dungeon', room: 'Room'):
     wall_y = room.y + room.height // 2
     if 0 <= wall_x < dungeon.width and 0 <= wall_y < dungeon.height:
         if dungeon.tiles[wall_y][wall_x] == TileType.WALL:
-            if random.random() < 0.6:
+            if rng.random() < 0.6:
                 inscription = InteractiveTile.inscription(
                     wall_face=WallFace.EAST,
-                    examine_text=random.choice(forge_messages),
+                    examine_text=rng.choice(forge_messages),
                 )
                 dungeon.add_interactive(wall_x, wall_y, inscription)
 
@@ -453,10 +453,10 @@ def layout_cooling_chambers(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 6 or room.height < 6:
         return
 
-    num_troughs = random.randint(1, 2)
+    num_troughs = rng.randint(1, 2)
     for _ in range(num_troughs):
-        px = random.randint(room.x + 2, room.x + room.width - 3)
-        py = random.randint(room.y + 2, room.y + room.height - 3)
+        px = rng.randint(room.x + 2, room.x + room.width - 3)
+        py = rng.randint(room.y + 2, room.y + room.height - 3)
         if dungeon.tiles[py][px] == TileType.FLOOR:
             dungeon.tiles[py][px] = TileType.DEEP_WATER
 
@@ -469,14 +469,14 @@ def layout_slag_pits(dungeon: 'Dungeon', room: 'Room'):
     if room.width < 5 or room.height < 5:
         return
 
-    num_puddles = random.randint(1, 3)
+    num_puddles = rng.randint(1, 3)
     corners = [
         (room.x + 1, room.y + 1),
         (room.x + room.width - 2, room.y + 1),
         (room.x + 1, room.y + room.height - 2),
         (room.x + room.width - 2, room.y + room.height - 2),
     ]
-    for i, (px, py) in enumerate(random.sample(corners, min(num_puddles, len(corners)))):
+    for i, (px, py) in enumerate(rng.sample(corners, min(num_puddles, len(corners)))):
         if dungeon.tiles[py][px] == TileType.FLOOR:
             dungeon.tiles[py][px] = TileType.LAVA
 
@@ -492,7 +492,7 @@ def layout_rune_press(dungeon: 'Dungeon', room: 'Room'):
     cx = room.x + room.width // 2
     cy = room.y + room.height // 2
 
-    if random.random() < 0.4:
+    if rng.random() < 0.4:
         if dungeon.tiles[cy - 2][cx] == TileType.FLOOR:
             dungeon.tiles[cy - 2][cx] = TileType.WALL
         if dungeon.tiles[cy + 2][cx] == TileType.FLOOR:
@@ -515,13 +515,13 @@ def layout_crucible_heart(dungeon: 'Dungeon', room: 'Room'):
 
     for x in range(room.x + 1, room.x + room.width - 1):
         for y in [room.y + 1, room.y + room.height - 2]:
-            if random.random() < 0.2:
+            if rng.random() < 0.2:
                 if dungeon.tiles[y][x] == TileType.FLOOR:
                     dungeon.tiles[y][x] = TileType.LAVA
 
     for y in range(room.y + 2, room.y + room.height - 2):
         for x in [room.x + 1, room.x + room.width - 2]:
-            if random.random() < 0.2:
+            if rng.random() < 0.2:
                 if dungeon.tiles[y][x] == TileType.FLOOR:
                     dungeon.tiles[y][x] = TileType.LAVA
 
@@ -536,10 +536,10 @@ def layout_boss_approach_volcanic(dungeon: 'Dungeon', room: 'Room'):
         return
 
     # Add lava hazards
-    if random.random() < 0.5:
-        wall_y = random.choice([room.y + 1, room.y + room.height - 2])
+    if rng.random() < 0.5:
+        wall_y = rng.choice([room.y + 1, room.y + room.height - 2])
         for x in range(room.x + 2, room.x + room.width - 2, 3):
-            if random.random() < 0.3:
+            if rng.random() < 0.3:
                 if dungeon.tiles[wall_y][x] == TileType.FLOOR:
                     dungeon.tiles[wall_y][x] = TileType.LAVA
 
@@ -604,7 +604,7 @@ def layout_seal_chambers_floor8(dungeon: 'Dungeon', room: 'Room'):
         if (room.x + 1 <= px < room.x + room.width - 1 and
             room.y + 1 <= py < room.y + room.height - 1):
             if dungeon.tiles[py][px] == TileType.FLOOR:
-                if random.random() < 0.5:
+                if rng.random() < 0.5:
                     dungeon.tiles[py][px] = TileType.DEEP_WATER
 
 
@@ -644,7 +644,7 @@ def layout_vault_antechamber(dungeon: 'Dungeon', room: 'Room'):
         if dungeon.tiles[wall_y][wall_x] == TileType.WALL:
             inscription = InteractiveTile.inscription(
                 wall_face=WallFace.NORTH,
-                examine_text=random.choice(boss_messages),
+                examine_text=rng.choice(boss_messages),
             )
             dungeon.add_interactive(wall_x, wall_y, inscription)
 
@@ -683,14 +683,14 @@ def layout_boss_approach_crystal(dungeon: 'Dungeon', room: 'Room'):
     cy = room.y + room.height // 2
 
     # Add water features
-    if random.random() < 0.5:
+    if rng.random() < 0.5:
         offsets = [(-2, 0), (2, 0), (0, -2), (0, 2)]
         for dx, dy in offsets:
             px, py = cx + dx, cy + dy
             if (room.x + 1 <= px < room.x + room.width - 1 and
                 room.y + 1 <= py < room.y + room.height - 1):
                 if dungeon.tiles[py][px] == TileType.FLOOR:
-                    if random.random() < 0.3:
+                    if rng.random() < 0.3:
                         dungeon.tiles[py][px] = TileType.DEEP_WATER
 
     # v7.0 Sprint 3: Add descent toward crystal boss lair
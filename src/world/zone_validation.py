@@ -5,6 +5,9 @@ Run from repo root:
 
 Or run all floors:
     python -c "from src.world.zone_validation import validate_all; validate_all()"
+
+For thousands of seeds, use the parallel farm (src/world/generation_farm.py):
+    python scripts/dungeon_farm.py --seeds 2000 --workers 8
 """
 from collections import Counter
 from typing import Dict, List, Optional, Set, Tuple
@@ -13,13 +16,97 @@ from .dungeon import Dungeon
 from .zone_config import get_floor_config, FloorZoneConfig
 
 
-def validate_floor(level: int, seeds: int = 20, verbose: bool = True) -> Dict:
+def check_zone_counts(config: FloorZoneConfig, seed: int,
+                      zone_counter: Counter) -> Tuple[List[str], List[str]]:
+    """Check one generated floor's zone distribution against its config.
+
+    Returns:
+        (errors, warnings) for this seed
+    """
+    errors = []
+    warnings = []
+    required_counts = {z.zone_id: z.required_count for z in config.zones if z.required_count > 0}
+
+    # Check required zones are present
+    for zone_id, expected in required_counts.items():
+        actual = zone_counter.get(zone_id, 0)
+        if actual < expected:
+            errors.append(f"Seed {seed}: Required zone '{zone_id}' has {actual}/{expected} rooms")
+
+    # Check start zone exists
+    if zone_counter.get(config.start_zone, 0) == 0:
+        errors.append(f"Seed {seed}: Start zone '{config.start_zone}' not found")
+
+    # Check for degenerate distribution
+    total_rooms = sum(zone_counter.values())
+    for zone_id, count in zone_counter.items():
+        pct = count / total_rooms if total_rooms > 0 else 0
+        # Non-fallback zones should not exceed 70%
+        if pct > 0.7 and zone_id != config.fallback_zone and zone_id != "generic":
+            errors.append(f"Seed {seed}: Zone '{zone_id}' dominates ({count}/{total_rooms} = {100*pct:.0f}%)")
+        # Fallback zone exceeding 80% suggests config problems
+        elif pct > 0.8 and zone_id == config.fallback_zone:
+            warnings.append(f"Seed {seed}: Fallback '{zone_id}' overused ({count}/{total_rooms} = {100*pct:.0f}%)")
+
+    return errors, warnings
+
+
+def aggregate_zone_stats(all_zone_counts: List[Counter]) -> Dict:
+    """Aggregate per-seed zone counts into distribution stats."""
+    seeds = len(all_zone_counts)
+    zone_totals = Counter()
+    zone_appearances = Counter()  # How many seeds each zone appeared in
+    zone_min: Dict[str, int] = {}
+    zone_max: Dict[str, int] = {}
+
+    for zone_counter in all_zone_counts:
+        for zone_id, count in zone_counter.items():
+            zone_totals[zone_id] += count
+            zone_appearances[zone_id] += 1
+            if zone_id not in zone_min or count < zone_min[zone_id]:
+                zone_min[zone_id] = count
+            if zone_id not in zone_max or count > zone_max[zone_id]:
+                zone_max[zone_id] = count
+
+    # Set min to 0 for zones that didn't appear in every seed
+    for zone_id in zone_totals:
+        if zone_appearances[zone_id] < seeds:
+            zone_min[zone_id] = 0
+
+    stats = {
+        'total_seeds': seeds,
+        'zone_totals': dict(zone_totals),
+        'zone_appearances': dict(zone_appearances),
+        'avg_per_seed': {z: zone_totals[z] / max(seeds, 1) for z in zone_totals},
+        'min_per_seed': zone_min,
+        'max_per_seed': zone_max,
+    }
+
+    return stats
+
+
+def _generate_zone_counts(level: int, seeds: int, workers: int) -> List[Counter]:
+    """Zone counts for seeds 0..seeds-1, in seed order."""
+    if workers > 1:
+        from .generation_farm import run_farm
+        report = run_farm([level], seeds=seeds, workers=workers, width=80, height=40)
+        return [Counter(result['zones']) for result in report.results]
+
+    counts = []
+    for seed in range(seeds):
+        dungeon = Dungeon(width=80, height=40, level=level, seed=seed)
+        counts.append(Counter(room.zone for room in dungeon.rooms))
+    return counts
+
+
+def validate_floor(level: int, seeds: int = 20, verbose: bool = True, workers: int = 1) -> Dict:
     """Validate zone assignment for a floor across multiple seeds.
 
     Args:
         level: Floor level to validate
         seeds: Number of seeds to test
         verbose: Print detailed output
+        workers: Generate seeds across this many processes (see generation_farm)
 
     Returns:
         Dict with validation results:
@@ -43,7 +130,6 @@ def validate_floor(level: int, seeds: int = 20, verbose: bool = True) -> Dict:
     warnings = []
     all_zone_counts: List[Counter] = []
     required_zones = {z.zone_id for z in config.zones if z.required_count > 0}
-    required_counts = {z.zone_id: z.required_count for z in config.zones if z.required_count > 0}
 
     if verbose:
         print(f"\n{'='*60}")
@@ -54,68 +140,21 @@ def validate_floor(level: int, seeds: int = 20, verbose: bool = True) -> Dict:
         print(f"Fallback zone: {config.fallback_zone}")
         print(f"Testing {seeds} seeds...\n")
 
-    for seed in range(seeds):
-        dungeon = Dungeon(width=80, height=40, level=level, seed=seed)
-        zone_counter = Counter()
-
-        for room in dungeon.rooms:
-            zone_counter[room.zone] += 1
-
+    for seed, zone_counter in enumerate(_generate_zone_counts(level, seeds, workers)):
         all_zone_counts.append(zone_counter)
 
-        # Check required zones are present
-        for zone_id in required_zones:
-            expected = required_counts[zone_id]
-            actual = zone_counter.get(zone_id, 0)
-            if actual < expected:
-                errors.append(f"Seed {seed}: Required zone '{zone_id}' has {actual}/{expected} rooms")
-
-        # Check start zone exists
-        if zone_counter.get(config.start_zone, 0) == 0:
-            errors.append(f"Seed {seed}: Start zone '{config.start_zone}' not found")
-
-        # Check for degenerate distribution
-        total_rooms = sum(zone_counter.values())
-        for zone_id, count in zone_counter.items():
-            pct = count / total_rooms if total_rooms > 0 else 0
-            # Non-fallback zones should not exceed 70%
-            if pct > 0.7 and zone_id != config.fallback_zone and zone_id != "generic":
-                errors.append(f"Seed {seed}: Zone '{zone_id}' dominates ({count}/{total_rooms} = {100*pct:.0f}%)")
-            # Fallback zone exceeding 80% suggests config problems
-            elif pct > 0.8 and zone_id == config.fallback_zone:
-                warnings.append(f"Seed {seed}: Fallback '{zone_id}' overused ({count}/{total_rooms} = {100*pct:.0f}%)")
+        seed_errors, seed_warnings = check_zone_counts(config, seed, zone_counter)
+        errors.extend(seed_errors)
+        warnings.extend(seed_warnings)
 
         if verbose and seed < 5:  # Show first 5 seeds in detail
             print(f"Seed {seed}: {dict(zone_counter)}")
 
-    # Compute aggregate stats with min/max
-    zone_totals = Counter()
-    zone_appearances = Counter()  # How many seeds each zone appeared in
-    zone_min: Dict[str, int] = {}
-    zone_max: Dict[str, int] = {}
-
-    for zone_counter in all_zone_counts:
-        for zone_id, count in zone_counter.items():
-            zone_totals[zone_id] += count
-            zone_appearances[zone_id] += 1
-            if zone_id not in zone_min or count < zone_min[zone_id]:
-                zone_min[zone_id] = count
-            if zone_id not in zone_max or count > zone_max[zone_id]:
-                zone_max[zone_id] = count
-
-    # Set min to 0 for zones that didn't appear in every seed
-    for zone_id in zone_totals:
-        if zone_appearances[zone_id] < seeds:
-            zone_min[zone_id] = 0
-
-    stats = {
-        'total_seeds': seeds,
-        'zone_totals': dict(zone_totals),
-        'zone_appearances': dict(zone_appearances),
-        'avg_per_seed': {z: zone_totals[z] / seeds for z in zone_totals},
-        'min_per_seed': zone_min,
-        'max_per_seed': zone_max,
-    }
+    stats = aggregate_zone_stats(all_zone_counts)
+    zone_totals = Counter(stats['zone_totals'])
+    zone_appearances = stats['zone_appearances']
+    zone_min = stats['min_per_seed']
+    zone_max = stats['max_per_seed']
 
     passed = len(errors) == 0
 
@@ -154,7 +193,7 @@ def validate_floor(level: int, seeds: int = 20, verbose: bool = True) -> Dict:
     }
 
 
-def validate_all(seeds: int = 20, verbose: bool = True) -> bool:
+def validate_all(seeds: int = 20, verbose: bool = True, workers: int = 1) -> bool:
     """Validate all implemented floors.
 
     Returns True if all floors pass validation.
@@ -171,7 +210,7 @@ def validate_all(seeds: int = 20, verbose: bool = True) -> bool:
                 print(f"\nSkipping Floor {level} (placeholder config)")
             continue
 
-        result = validate_floor(level, seeds=seeds, verbose=verbose)
+        result = validate_floor(level, seeds=seeds, verbose=verbose, workers=workers)
         results[level] = result
         if not result['passed']:
             all_passed = False
@@ -0,0 +1,94 @@
+"""Tests for compiled arena templates.
+
+Verifies:
+- Templates compile once; each battle gets fresh mutable copies
+- The neighbour table and hazard map match a direct tile scan
+- Battles restored from a save rebuild the same shared grid
+- Shared grids are read-only, and copied or pickled battles reuse them
+- is_tile_walkable agrees with the grid's walkable set
+"""
+import copy
+import pickle
+
+import pytest
+
+from src.combat.arena_templates import (
+    TEMPLATES, compile_template, get_compiled_template, get_arena_grid,
+)
+from src.combat.battle_types import BattleState
+from src.combat.ai_scoring_hazards import HAZARD_COST
+
+
+@pytest.mark.parametrize("key", list(TEMPLATES))
+def test_compiled_grid_matches_tiles(key):
+    """Grid lookups agree with scanning the compiled tiles."""
+    template = TEMPLATES[key]
+    compiled = compile_template(template, seed=1)
+    tiles = compiled['tiles']
+    grid = compiled['grid']
+
+    for y in range(template.height):
+        for x in range(template.width):
+            expected = [
+                (x + dx, y + dy) for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0))
+                if 0 <= x + dx < template.width and 0 <= y + dy < template.height
+                and tiles[y + dy][x + dx] != '#'
+            ]
+            assert list(grid.open_neighbors(x, y)) == expected
+            assert grid.hazard_at(x, y) == (tiles[y][x] if tiles[y][x] in HAZARD_COST else '')
+            assert ((x, y) in grid.walkable) == (tiles[y][x] in ('.', '>', '<'))
+
+
+def test_compile_returns_fresh_copies():
+    """The base is cached; tiles and spawn lists are per-battle copies."""
+    template = next(iter(TEMPLATES.values()))
+    assert get_compiled_template(template) is get_compiled_template(template)
+
+    first = compile_template(template, seed=1)
+    second = compile_template(template, seed=2)
+    assert first['tiles'] == second['tiles']
+    first['tiles'][1][1] = '~'
+    first['enemy_spawn'].clear()
+    assert second['tiles'][1][1] != '~'
+    assert compile_template(template, seed=3)['enemy_spawn']
+    assert first['grid'] is second['grid']
+
+
+def test_restored_battle_shares_grid():
+    """from_dict drops the grid; get_arena_grid rebuilds the cached one."""
+    template = next(iter(TEMPLATES.values()))
+    compiled = compile_template(template, seed=1)
+    battle = BattleState(
+        arena_width=compiled['width'],
+        arena_height=compiled['height'],
+        arena_tiles=compiled['tiles'],
+        biome='STONE',
+        arena_grid=compiled['grid'],
+    )
+    restored = BattleState.from_dict(battle.to_dict())
+    assert restored.arena_grid is None
+    assert get_arena_grid(restored) is compiled['grid']
+
+
+def test_copied_battle_shares_read_only_grid():
+    """Grids can't be edited in place and survive deepcopy and pickling."""
+    template = next(iter(TEMPLATES.values()))
+    compiled = compile_template(template, seed=1)
+    battle = BattleState(
+        arena_width=compiled['width'],
+        arena_height=compiled['height'],
+        arena_tiles=compiled['tiles'],
+        biome='STONE',
+        arena_grid=compiled['grid'],
+    )
+    with pytest.raises(TypeError):
+        battle.arena_grid.hazards[(0, 0)] = '~'
+
+    for clone in (copy.deepcopy(battle), pickle.loads(pickle.dumps(battle))):
+        assert clone.arena_grid is compiled['grid']
+
+    tiles = compiled['tiles']
+    for y in range(-1, compiled['height'] + 1):
+        for x in range(-1, compiled['width'] + 1):
+            inside = 0 <= x < compiled['width'] and 0 <= y < compiled['height']
+            assert battle.is_tile_walkable(x, y) == (inside and tiles[y][x] in ('.', '>', '<'))
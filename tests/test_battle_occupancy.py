@@ -0,0 +1,113 @@
+"""Tests for the battle occupancy grid.
+
+Verifies:
+- get_entity_at matches a brute-force footprint scan through moves,
+  deaths, revivals and reinforcement arrivals
+- Multi-tile footprints are covered and move as a whole
+- The grid is rebuilt after a to_dict/from_dict round trip or a deepcopy
+"""
+import copy
+import random
+
+from src.combat.battle_types import BattleState, BattleEntity
+
+
+def make_entity(entity_id, x, y, is_player=False, size=1, hp=10):
+    return BattleEntity(
+        entity_id=entity_id, is_player=is_player, arena_x=x, arena_y=y,
+        world_x=0, world_y=0, hp=hp, max_hp=10, attack=3, defense=0,
+        size_width=size, size_height=size,
+    )
+
+
+def make_battle(width=11, height=9):
+    tiles = [['.'] * width for _ in range(height)]
+    battle = BattleState(arena_width=width, arena_height=height, arena_tiles=tiles, biome='STONE')
+    battle.player = make_entity('player', 5, 7, is_player=True)
+    battle.enemies.append(make_entity('boss', 4, 1, size=2))
+    battle.enemies.append(make_entity('rat', 1, 1))
+    return battle
+
+
+def scan(battle, x, y):
+    """The pre-grid get_entity_at scan."""
+    if battle.player and battle.player.occupies_tile(x, y):
+        return battle.player
+    for enemy in battle.enemies:
+        if enemy.hp > 0 and enemy.occupies_tile(x, y):
+            return enemy
+    return None
+
+
+def assert_matches_scan(battle):
+    for y in range(battle.arena_height):
+        for x in range(battle.arena_width):
+            assert battle.get_entity_at(x, y) is scan(battle, x, y), (x, y)
+
+
+def test_grid_follows_moves_deaths_and_arrivals():
+    """Random moves, deaths, revivals and spawns never desync the grid."""
+    rng = random.Random(3)
+    battle = make_battle()
+    assert battle.get_entity_at(5, 2) is battle.enemies[0]
+    assert battle.is_enemy_at(5, 2)
+    assert not battle.is_enemy_at(5, 7)
+
+    for step in range(300):
+        entities = [battle.player] + battle.enemies
+        entity = rng.choice(entities)
+        roll = rng.random()
+        if roll < 0.6:
+            entity.arena_x = rng.randrange(battle.arena_width - 1)
+            entity.arena_y = rng.randrange(battle.arena_height - 1)
+        elif roll < 0.8:
+            entity.hp = rng.choice([0, -2, 4])
+        elif roll < 0.9:
+            entity.size_width = entity.size_height = rng.choice([1, 2])
+        else:
+            battle.enemies.append(make_entity(f"reinforcement_{step}", rng.randrange(9), 1))
+        assert_matches_scan(battle)
+
+
+def test_grid_survives_round_trip():
+    """A restored battle indexes its combatants, including multi-tile ones."""
+    battle = make_battle()
+    battle.enemies[1].hp = 0
+    restored = BattleState.from_dict(battle.to_dict())
+    assert_matches_scan(restored)
+    assert restored.get_entity_at(5, 2).entity_id == 'boss'
+    assert restored.get_entity_at(1, 1) is None
+
+    restored.enemies[0].arena_x = 7
+    assert restored.get_entity_at(4, 1) is None
+    assert restored.get_entity_at(8, 2).entity_id == 'boss'
+
+
+def test_grid_survives_deepcopy():
+    """A deep-copied battle indexes its own combatants, not the original's."""
+    battle = make_battle()
+    battle.get_entity_at(0, 0)
+    clone = copy.deepcopy(battle)
+
+    rat = clone.enemies[1]
+    rat.arena_x, rat.arena_y = 8, 5
+    assert clone.get_entity_at(1, 1) is None
+    assert clone.get_entity_at(8, 5) is rat
+    assert_matches_scan(clone)
+
+    # The original is untouched by moves in the copy
+    assert battle.get_entity_at(1, 1) is battle.enemies[1]
+    assert_matches_scan(battle)
+
+
+def test_replaced_combatants_rebuild_grid():
+    """Swapping the enemies list or player re-indexes from scratch."""
+    battle = make_battle()
+    old_boss = battle.enemies[0]
+    battle.enemies = [make_entity('goblin', 2, 2)]
+    battle.player = make_entity('player', 3, 3, is_player=True)
+    assert_matches_scan(battle)
+
+    # Entities from the old roster no longer touch the grid
+    old_boss.arena_x = 2
+    assert battle.get_entity_at(2, 2).entity_id == 'goblin'
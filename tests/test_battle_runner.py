@@ -0,0 +1,42 @@
+"""Tests for the headless batch battle runner.
+
+Verifies:
+- Every battle reaches an outcome and records AI decisions
+- Results depend only on the spec, not on worker count or order
+- A baseline compared against itself shows no drift
+"""
+from src.combat.battle_runner import BattleSpec, make_specs, run_battle, run_battles, compare_reports
+
+
+def test_battles_finish_with_decisions():
+    """Each battle ends (or times out) and reports its action stream."""
+    report = run_battles(make_specs([1, 3], battles=6, max_rounds=30), workers=1)
+    assert len(report.results) == 12
+    for result in report.results:
+        assert result["outcome"] in ("VICTORY", "DEFEAT", "FLEE", "TIMEOUT")
+        assert result["rounds"] <= 30
+        assert result["decisions"] == sum(result["actions"].values())
+    assert sum(r["decisions"] for r in report.results) > 0
+    assert set(report.floors) == {1, 3}
+
+
+def test_results_independent_of_scheduling():
+    """Same specs give identical battles in-process, in a pool, or reordered."""
+    specs = make_specs([2], battles=6, max_rounds=30)
+    serial = run_battles(specs, workers=1)
+    pooled = run_battles(specs, workers=2)
+    reversed_results = [run_battle(spec) for spec in reversed(specs)][::-1]
+
+    fingerprints = [r["fingerprint"] for r in serial.results]
+    assert [r["fingerprint"] for r in pooled.results] == fingerprints
+    assert [r["fingerprint"] for r in reversed_results] == fingerprints
+    assert [r["outcome"] for r in pooled.results] == [r["outcome"] for r in serial.results]
+
+
+def test_self_comparison_has_no_drift():
+    """Comparing a report to itself finds no changed battles."""
+    data = run_battles([BattleSpec(floor=1, enemies=("GOBLIN", "elite:RAT"), seed=5)], workers=1).to_dict()
+    drift = compare_reports(data, data)
+    assert drift["compared"] == 1
+    assert drift["changed"] == []
+    assert drift["floors"]["1"]["action_kind_distance"] == 0.0
@@ -0,0 +1,69 @@
+"""Tests for the per-floor Dungeon lookup index.
+
+Verifies:
+- Room/zone lookups match a linear scan over rooms
+- The walkable list matches is_walkable and tracks set_tile changes
+- Feature maps agree with the decoration/evidence lists
+"""
+import random
+
+from src.core.constants import TileType
+from src.world.dungeon import Dungeon
+
+
+def scan_room_at(dungeon, x, y):
+    for room in dungeon.rooms:
+        if room.x <= x < room.x + room.width and room.y <= y < room.y + room.height:
+            return room
+    return None
+
+
+def test_room_grid_matches_scan():
+    """get_room_at returns the same room as scanning every room."""
+    for level in (1, 4, 8):
+        dungeon = Dungeon(seed=level * 31, level=level)
+        for y in range(-1, dungeon.height + 1):
+            for x in range(-1, dungeon.width + 1):
+                assert dungeon.get_room_at(x, y) is scan_room_at(dungeon, x, y)
+
+
+def test_walkable_index_tracks_tiles():
+    """Walkable list equals the set of walkable tiles, before and after edits."""
+    dungeon = Dungeon(seed=1234, level=2)
+
+    def expected():
+        return {
+            (x, y)
+            for y in range(dungeon.height)
+            for x in range(dungeon.width)
+            if dungeon.is_walkable(x, y)
+        }
+
+    assert set(dungeon.index.walkable) == expected()
+    assert len(dungeon.index.walkable) == len(expected())
+
+    rng = random.Random(5)
+    for _ in range(200):
+        x, y = rng.randrange(dungeon.width), rng.randrange(dungeon.height)
+        dungeon.set_tile(x, y, rng.choice([TileType.FLOOR, TileType.WALL, TileType.LAVA]))
+    assert set(dungeon.index.walkable) == expected()
+
+    for _ in range(50):
+        x, y = dungeon.get_random_floor_position()
+        assert dungeon.is_walkable(x, y)
+
+
+def test_feature_maps_match_lists():
+    """Decoration and evidence lookups agree with the placement lists."""
+    dungeon = Dungeon(seed=77, level=1)
+
+    decorated = {(x, y) for x, y, _, _ in dungeon.decorations}
+    for y in range(dungeon.height):
+        for x in range(dungeon.width):
+            assert dungeon.has_decoration_at(x, y) == ((x, y) in decorated)
+
+    for entry in list(dungeon.zone_evidence):
+        x, y = entry[0], entry[1]
+        if dungeon.get_zone_evidence_at(x, y) == entry:
+            assert dungeon.pop_zone_evidence_at(x, y) == entry
+            assert entry not in dungeon.zone_evidence
@@ -0,0 +1,81 @@
+"""Tests for enemy activity tiers in exploration turns.
+
+Verifies:
+- Walkable region labels split on walls and follow set_walkable changes
+- Enemies out of chase range or walled off from the player sleep
+- Sleeping enemies still take damage over time and count down cooldowns,
+  but don't move; awake enemies keep chasing
+"""
+from types import SimpleNamespace
+
+from src.core.constants import EnemyType, StatusEffectType
+from src.core.engine import GameEngine
+from src.entities import Enemy
+from src.managers.enemy_activity import ActivityTier, EnemyTurnBatch
+from src.world.dungeon_index import NO_REGION, FloorIndex
+
+
+def corridor(width=20, wall_x=10):
+    """A one-row corridor split by a wall at wall_x."""
+    index = FloorIndex(width, 1)
+    for x in range(width):
+        if x != wall_x:
+            index.set_walkable(x, 0, True)
+    return index
+
+
+def test_regions_follow_walls():
+    index = corridor()
+    assert index.region_at(0, 0) == index.region_at(9, 0) != index.region_at(11, 0)
+    assert index.region_at(10, 0) == NO_REGION == index.region_at(-1, 0)
+
+    index.set_walkable(10, 0, True)
+    assert index.region_at(0, 0) == index.region_at(19, 0)
+
+
+def test_tiers():
+    dungeon = SimpleNamespace(index=corridor(width=40))
+    player = SimpleNamespace(x=5, y=0)
+    near = Enemy(8, 0, EnemyType.SKELETON)
+    walled_off = Enemy(12, 0, EnemyType.SKELETON)
+    far = Enemy(30, 0, EnemyType.SKELETON)
+    dead = Enemy(6, 0, EnemyType.SKELETON)
+    dead.health = 0
+
+    batch = EnemyTurnBatch([near, walled_off, far, dead], player, dungeon)
+    assert batch.enemies == [near, walled_off, far]
+    assert batch.tiers == [ActivityTier.AWAKE, ActivityTier.ASLEEP, ActivityTier.ASLEEP]
+    assert batch.awake() == [(near, False)]
+
+    # Without region data only distance matters
+    batch = EnemyTurnBatch([near, walled_off, far], player, SimpleNamespace())
+    assert batch.count(ActivityTier.AWAKE) == 2
+
+
+def test_sleeping_enemies_still_tick():
+    engine = GameEngine()
+    engine.headless = True
+    engine.start_new_game(seed=99)
+    player, dungeon = engine.player, engine.dungeon
+    home = dungeon.index.region_at(player.x, player.y)
+
+    def tile(min_dist, max_dist):
+        for x, y in dungeon.index.walkable:
+            dist = ((x - player.x) ** 2 + (y - player.y) ** 2) ** 0.5
+            if min_dist <= dist <= max_dist and dungeon.index.region_at(x, y) == home:
+                return x, y
+
+    sleeper = Enemy(*tile(20, 999), EnemyType.SKELETON)
+    sleeper.apply_status_effect(StatusEffectType.POISON)
+    sleeper.ability_cooldowns = {'dark_bolt': 2}
+    chaser = Enemy(*tile(3, 6), EnemyType.SKELETON)
+    engine.entity_manager.enemies = [sleeper, chaser]
+
+    sleeper_pos, chaser_dist = (sleeper.x, sleeper.y), chaser.distance_to(player.x, player.y)
+    sleeper_hp = sleeper.health
+    engine.combat_manager.process_enemy_turns()
+
+    assert (sleeper.x, sleeper.y) == sleeper_pos
+    assert sleeper.health < sleeper_hp and sleeper.ability_cooldowns == {'dark_bolt': 1}
+    assert chaser.distance_to(player.x, player.y) < chaser_dist
+    assert engine.combat_manager.last_activity == {'awake': 1, 'asleep': 1}
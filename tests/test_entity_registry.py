@@ -0,0 +1,98 @@
+"""Tests for stable enemy ids.
+
+Verifies:
+- Ids are assigned once, never reused, and resolve enemies appended to the
+  list directly (summons, ghosts) as well as removed ones no longer resolving
+- Copies sharing an id get a fresh one
+- Ids and the id counter survive a SaveManager round trip
+- Enemies on a new floor resolve even when it has as many as the last one
+"""
+import copy
+
+from src.core.constants import EnemyType
+from src.core.engine import GameEngine
+from src.core.rng import use_rng
+from src.entities import Enemy
+from src.managers import EntityManager
+from src.managers import serialization
+
+
+def test_ids_are_stable_and_unique():
+    manager = EntityManager()
+    a, b = Enemy(1, 1, EnemyType.SKELETON), Enemy(2, 2, EnemyType.SKELETON)
+    manager.enemies.extend([a, b])
+    id_a, id_b = manager.enemy_id(a), manager.enemy_id(b)
+    assert id_a != id_b and manager.enemy_id(a) == id_a
+
+    summon = Enemy(3, 3, EnemyType.SKELETON)
+    manager.enemies.append(summon)
+    assert manager.get_enemy_by_id(manager.enemy_id(summon)) is summon
+    assert manager.get_enemy_by_id(id_a) is a and manager.get_enemy_by_id('player') is None
+
+    assert manager.remove_enemy(a)
+    manager.enemies.append(copy.copy(b))  # Same length as before, shares b's id
+    assert manager.get_enemy_by_id(id_a) is None
+    assert manager.get_enemy_by_id(id_b) is b
+    ids = {manager.enemy_id(enemy) for enemy in manager.enemies}
+    assert len(ids) == 3 and id_a not in ids
+
+    # Not yet on the floor: gets an id that resolves once added
+    late = Enemy(4, 4, EnemyType.SKELETON)
+    late_id = manager.enemy_id(late)
+    assert manager.get_enemy_by_id(late_id) is None
+    manager.enemies.append(late)
+    assert manager.get_enemy_by_id(late_id) is late
+
+
+def test_ids_survive_save_round_trip(monkeypatch):
+    saved = {}
+    monkeypatch.setattr(serialization, 'save_game', lambda state: saved.update(state) or True)
+
+    engine = GameEngine()
+    engine.headless = True
+    engine.start_new_game(seed=1234)
+    enemies = engine.entity_manager.enemies
+    ids = {engine.entity_manager.enemy_id(enemy): (enemy.x, enemy.y) for enemy in enemies}
+    engine.entity_manager.remove_enemy(enemies[0])
+    assert engine.save_manager.save_game()
+
+    restored = GameEngine()
+    restored.headless = True
+    assert restored.save_manager.load_game_state(saved)
+    manager = restored.entity_manager
+    for enemy_id, pos in ids.items():
+        enemy = manager.get_enemy_by_id(enemy_id)
+        if enemy is not None:
+            assert (enemy.x, enemy.y) == pos
+    assert sum(manager.get_enemy_by_id(enemy_id) is not None for enemy_id in ids) == len(ids) - 1
+
+    newcomer = Enemy(0, 0, EnemyType.SKELETON)
+    manager.enemies.append(newcomer)
+    assert int(manager.enemy_id(newcomer)) > max(int(enemy_id) for enemy_id in ids)
+
+
+def test_ids_follow_a_new_floor():
+    """Descending refills the enemy list in place; its enemies still resolve."""
+    engine = GameEngine()
+    engine.headless = True
+    engine.start_new_game(seed=9)  # Floors 1 and 2 both have 14 enemies
+    manager = engine.entity_manager
+    enemies = manager.enemies
+    old_ids = [manager.enemy_id(enemy) for enemy in enemies]
+    old_count = len(enemies)
+
+    with use_rng(engine.rng):
+        engine.level_manager._descend_level()
+    assert manager.enemies is enemies and len(enemies) == old_count
+    assert all(manager.get_enemy_by_id(enemy_id) is None for enemy_id in old_ids)
+    for enemy in enemies:
+        assert manager.get_enemy_by_id(manager.enemy_id(enemy)) is enemy
+
+    target = enemies[0]
+    battle = engine.battle_manager.start_battle([manager.enemy_id(target)], target.x, target.y, seed=1)
+    assert len(battle.enemies) == 1
+
+    # A same-length refill that skips clear() is still noticed
+    enemies[:] = [Enemy(enemy.x, enemy.y, EnemyType.SKELETON) for enemy in enemies]
+    for enemy in enemies:
+        assert manager.get_enemy_by_id(manager.enemy_id(enemy)) is enemy
@@ -0,0 +1,61 @@
+"""Tests for the parallel dungeon generation farm.
+
+Verifies:
+- Results depend only on (floor, seed), not on worker count
+- Generation leaves the caller's random state untouched
+- Profiling records stages without changing the generated floor
+- A nested stage doesn't hide allocations the enclosing stage made before it
+"""
+import random
+
+from src.world.dungeon import Dungeon
+from src.world.generation_farm import run_farm, generate_floor_stats
+from src.world.generation_profile import GenerationProfile
+
+
+def test_parallel_matches_serial():
+    """A pooled run produces the same per-seed stats as an in-process run."""
+    serial = run_farm([1, 3], seeds=6, workers=1)
+    parallel = run_farm([1, 3], seeds=6, workers=2)
+
+    strip = lambda results: [{k: v for k, v in r.items() if k != "gen_ms"} for r in results]
+    assert strip(serial.results) == strip(parallel.results)
+    assert set(serial.floors) == {1, 3}
+
+
+def test_generation_restores_random_state():
+    """Dungeon seeding inside a job doesn't leak into the caller's RNG."""
+    random.seed(99)
+    expected = random.random()
+
+    random.seed(99)
+    generate_floor_stats((2, 12345, 80, 40))
+    assert random.random() == expected
+
+
+def test_profile_records_stages():
+    """A profiled dungeon matches an unprofiled one and times every stage."""
+    profile = GenerationProfile()
+    profiled = Dungeon(level=3, seed=4242, profile=profile)
+    plain = Dungeon(level=3, seed=4242)
+    assert profiled.tiles == plain.tiles
+
+    for name in ("bsp_split", "corridors", "zone_layouts", "build_index"):
+        assert profile.stages[name].calls == 1
+    assert profile.layouts
+    assert profile.to_dict()["total_ms"] > 0
+
+
+def test_nested_stage_keeps_outer_peak():
+    """The outer stage's peak covers memory freed before a nested stage ran."""
+    profile = GenerationProfile(track_allocations=True)
+    with profile.stage("outer"):
+        spike = bytearray(4_000_000)
+        del spike
+        with profile.stage("outer.inner"):
+            small = bytearray(1000)
+        del small
+
+    stages = profile.to_dict()["stages"]
+    assert stages["outer"]["peak_bytes"] >= 4_000_000
+    assert stages["outer.inner"]["peak_bytes"] < 4_000_000
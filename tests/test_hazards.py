@@ -0,0 +1,93 @@
+"""Tests for the hazard grid and spreading frontier.
+
+Verifies:
+- Only spreading hazards with intensity to spare and a free neighbour are
+  on the frontier, and membership follows adds and removals
+- Spreading never stacks two hazards on one tile and decays intensity
+- Gas walled in by unwalkable tiles leaves the frontier, and rejoins it
+  when the dungeon revision changes
+- The compact form round-trips, and can be limited to given positions
+"""
+import random
+
+from src.core.constants import HazardType
+from src.world.hazards import Hazard, HazardManager
+
+
+def gas(x, y, intensity=3):
+    return Hazard(x=x, y=y, hazard_type=HazardType.POISON_GAS, intensity=intensity)
+
+
+def test_frontier_membership():
+    manager = HazardManager()
+    manager.add_hazard(Hazard(x=0, y=0, hazard_type=HazardType.LAVA))
+    manager.add_hazard(gas(5, 5, intensity=1))
+    assert manager.frontier_size == 0  # Lava doesn't spread; intensity 1 can't
+
+    manager.add_hazard(gas(10, 10))
+    assert manager.frontier_size == 1
+    for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+        manager.add_hazard(Hazard(x=10 + dx, y=10 + dy, hazard_type=HazardType.ICE))
+    assert manager.frontier_size == 0  # Enclosed
+
+    manager.remove_hazard(11, 10)
+    assert manager.frontier_size == 1
+    assert manager.get_hazard_at(11, 10) is None and len(manager) == 6
+
+
+def test_spreading_decays_without_stacking():
+    random.seed(3)
+    manager = HazardManager()
+    manager.add_hazard(gas(20, 20, intensity=4))
+    manager.add_hazard(gas(22, 20, intensity=4))
+
+    for _ in range(400):
+        manager.tick_spreading(lambda x, y: 0 <= x < 40 and 0 <= y < 40)
+
+    positions = [(h.x, h.y) for h in manager.hazards]
+    assert len(positions) == len(set(positions)) > 2
+    assert min(h.intensity for h in manager.hazards) == 1
+    # The frontier is exactly the cells that could still spread
+    expected = [h for h in manager.hazards if h.intensity > 1 and any(
+        not manager.has_hazard_at(h.x + dx, h.y + dy)
+        for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0))
+    )]
+    assert manager.frontier_size == len(expected)
+
+
+def test_walled_in_gas_goes_dormant():
+    """In a corridor only the advancing ends keep rolling to spread."""
+    random.seed(5)
+    walkable = {(x, 5) for x in range(30)}
+    manager = HazardManager()
+    manager.add_hazard(gas(15, 5, intensity=6))
+
+    for _ in range(400):
+        manager.tick_spreading(lambda x, y: (x, y) in walkable, tiles_revision=0)
+    spreading = [h for h in manager.hazards if h.intensity > 1]
+    assert len(spreading) > 2
+    assert manager.frontier_size == 0  # Every cell is walled in or at full reach
+
+    # Opening a side passage wakes the cells next to it
+    walkable.add((15, 6))
+    for _ in range(400):
+        manager.tick_spreading(lambda x, y: (x, y) in walkable, tiles_revision=1)
+    assert manager.has_hazard_at(15, 6)
+
+
+def test_compact_round_trip():
+    manager = HazardManager()
+    manager.add_hazard(gas(1, 2))
+    manager.add_hazard(Hazard(x=3, y=4, hazard_type=HazardType.LAVA))
+    manager.add_hazard(gas(5, 6, intensity=2))
+    manager.set_amplification(1.5)
+
+    assert manager.to_compact() == {'POISON_GAS': [1, 2, 3, 5, 6, 2], 'LAVA': [3, 4, 1]}
+    assert manager.to_compact([(3, 4), (9, 9)]) == {'LAVA': [3, 4, 1]}
+
+    restored = HazardManager()
+    restored.load_state(manager.get_state())
+    assert restored.amplification == 1.5
+    assert sorted((h.x, h.y, h.hazard_type, h.intensity) for h in restored.hazards) == \
+        sorted((h.x, h.y, h.hazard_type, h.intensity) for h in manager.hazards)
+    assert restored.frontier_size == manager.frontier_size == 2
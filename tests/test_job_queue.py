@@ -0,0 +1,260 @@
+"""Tests for the 3D generation job queue.
+
+Verifies:
+- Concurrent workers claim every job exactly once, highest priority first
+- Lapsed leases are reclaimed, stale lease holders can't finish the job,
+  and jobs fail once out of attempts
+- Only one active job per asset; legacy JSON job files are imported
+- Batch claims, stage timings merging, and upgrading an old queue.db
+- The container worker processes a claimed job end to end with the stub model,
+  and resubmitted concept art is served from the result cache
+- Rewriting a job's files after a cache hit leaves the cache entry intact,
+  and a job failing before preprocessing doesn't strand the rest of its batch
+"""
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools", "3d-pipeline"))
+
+import pytest
+
+import container_worker
+from job_queue import DuplicateJobError, JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(tmp_path / "queue.db")
+
+
+def test_concurrent_claims_are_exclusive(queue):
+    """Six workers drain 60 jobs with no job claimed twice."""
+    for i in range(60):
+        queue.enqueue(f"asset{i}", f"concept_art/asset{i}.png", priority=i % 3)
+
+    claimed = []
+    lock = threading.Lock()
+
+    def work(worker_id):
+        worker_queue = JobQueue(queue.path)
+        while True:
+            job = worker_queue.claim(worker_id)
+            if job is None:
+                return
+            with lock:
+                claimed.append(job["job_id"])
+            assert worker_queue.complete(job["job_id"], worker_id, result_path="out.glb")
+
+    threads = [threading.Thread(target=work, args=(f"w{n}",)) for n in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(claimed) == len(set(claimed)) == 60
+    assert queue.counts()["completed"] == 60
+
+
+def test_priority_then_age(queue):
+    low = queue.enqueue("low", "a.png", priority=-1)
+    first = queue.enqueue("first", "b.png")
+    high = queue.enqueue("high", "c.png", priority=1)
+    second = queue.enqueue("second", "d.png")
+    order = [queue.claim("w")["job_id"] for _ in range(4)]
+    assert order == [high["job_id"], first["job_id"], second["job_id"], low["job_id"]]
+    assert queue.claim("w") is None
+
+
+def test_lease_expiry_and_attempts(tmp_path):
+    queue = JobQueue(tmp_path / "queue.db", visibility_timeout=0.2)
+    job = queue.enqueue("goblin", "goblin.png", max_attempts=2)
+    assert queue.claim("dead")["attempts"] == 1
+    time.sleep(0.25)
+
+    reclaimed = queue.claim("alive")
+    assert reclaimed["job_id"] == job["job_id"] and reclaimed["attempts"] == 2
+    assert not queue.complete(job["job_id"], "dead", result_path="x")
+
+    # Progress from the lease holder keeps the job leased
+    time.sleep(0.15)
+    queue.update(job["job_id"], worker_id="alive", progress="Meshing", log_line="step")
+    time.sleep(0.1)
+    assert queue.claim("other") is None
+    assert queue.get(job["job_id"])["worker_id"] == "alive"
+
+    time.sleep(0.25)
+    assert queue.claim("other") is None  # Lease lapsed, attempts used up -> failed
+    failed = queue.get(job["job_id"])
+    assert failed["status"] == "failed" and "expired" in failed["error"]
+
+
+def test_retry_and_duplicates(queue, tmp_path):
+    job = queue.enqueue("rat", "rat.png")
+    with pytest.raises(DuplicateJobError):
+        queue.enqueue("rat", "rat.png")
+
+    claimed = queue.claim("w")
+    assert queue.fail(claimed["job_id"], "w", "flaky", retry=True)
+    assert queue.get(job["job_id"])["status"] == "pending"
+    claimed = queue.claim("w")
+    assert queue.fail(claimed["job_id"], "w", "broken")
+    assert queue.get(job["job_id"])["logs"] == ["Error: broken"]
+    queue.enqueue("rat", "rat.png")  # Finished jobs don't block a new one
+
+    legacy = tmp_path / "abc12345.json"
+    legacy.write_text(json.dumps({
+        "job_id": "abc12345", "asset_id": "bat", "status": "processing",
+        "source_image": "concept_art/bat.png", "logs": ["old"],
+    }))
+    assert queue.import_json_jobs(tmp_path) == 1
+    assert not legacy.exists()
+    imported = queue.get("abc12345")
+    assert imported["status"] == "pending" and imported["logs"] == ["old"]
+
+
+def test_wait_wakes_on_enqueue(queue):
+    threading.Timer(0.1, lambda: JobQueue(queue.path).enqueue("ogre", "ogre.png")).start()
+    start = time.monotonic()
+    assert queue.wait(5)
+    assert time.monotonic() - start < 2
+
+
+def test_claim_batch_and_timings(queue):
+    for name, priority in [("a", 0), ("b", 2), ("c", 0), ("d", 1)]:
+        queue.enqueue(name, f"{name}.png", priority=priority)
+    batch = queue.claim_batch("w", 3)
+    assert [job["asset_id"] for job in batch] == ["b", "d", "a"]
+    assert [job["asset_id"] for job in queue.claim_batch("w", 3)] == ["c"]
+
+    job_id = batch[0]["job_id"]
+    queue.update(job_id, timings={"rembg_ms": 12.5})
+    job = queue.update(job_id, timings={"inference_ms": 900.0}, cache_key="abc", cache_hit=False)
+    assert job["timings"] == {"rembg_ms": 12.5, "inference_ms": 900.0}
+    assert job["cache_key"] == "abc" and job["cache_hit"] is False
+
+
+def test_upgrades_old_database(tmp_path):
+    path = tmp_path / "queue.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE jobs (job_id TEXT PRIMARY KEY, asset_id TEXT NOT NULL, status TEXT NOT NULL, "
+        "priority INTEGER NOT NULL DEFAULT 0, created_at TEXT NOT NULL, updated_at TEXT NOT NULL, "
+        "available_at REAL NOT NULL, lease_expires REAL, worker_id TEXT, "
+        "attempts INTEGER NOT NULL DEFAULT 0, max_attempts INTEGER NOT NULL DEFAULT 3, "
+        "source_image TEXT NOT NULL, output_dir TEXT, texture_resolution INTEGER NOT NULL DEFAULT 1024, "
+        "device TEXT NOT NULL DEFAULT 'cpu', error TEXT, result_path TEXT, progress TEXT, "
+        "progress_pct INTEGER, logs TEXT NOT NULL DEFAULT '[]')"
+    )
+    conn.execute(
+        "INSERT INTO jobs (job_id, asset_id, status, created_at, updated_at, available_at, source_image) "
+        "VALUES ('old', 'bat', 'pending', '2026-01-01', '2026-01-01', 0, 'bat.png')"
+    )
+    conn.commit()
+    conn.close()
+
+    job = JobQueue(path).claim("w")
+    assert job["job_id"] == "old" and job["timings"] == {} and job["cache_hit"] is False
+
+
+@pytest.fixture
+def worker_dirs(tmp_path, monkeypatch):
+    concept_art = tmp_path / "concept_art"
+    concept_art.mkdir()
+    monkeypatch.setattr(container_worker, "CONCEPT_ART_DIR", concept_art)
+    monkeypatch.setattr(container_worker, "OUTPUT_BASE_DIR", tmp_path / "models")
+    monkeypatch.setattr(container_worker, "CACHE_DIR", tmp_path / "cache")
+    return concept_art
+
+
+def test_container_worker_with_stub_model(queue, tmp_path, worker_dirs):
+    """A claimed job runs through the worker and produces a GLB."""
+    (worker_dirs / "slime.png").write_bytes(b"\x89PNG fake")
+
+    queue.enqueue("slime", "concept_art/slime.png")
+    queue.enqueue("missing", "concept_art/missing.png")
+    while True:
+        job = queue.claim("stub-worker")
+        if job is None:
+            break
+        container_worker.process_job(queue, job, "stub-worker", container_worker.StubBackend())
+
+    done = queue.list(status="completed")
+    assert [job["asset_id"] for job in done] == ["slime"]
+    assert done[0]["progress_pct"] == 100
+    assert (tmp_path / "models" / "slime" / "slime.glb").read_bytes()[:4] == b"glTF"
+    assert queue.list(status="failed")[0]["asset_id"] == "missing"
+
+
+def test_resubmitted_art_is_served_from_cache(queue, tmp_path, worker_dirs):
+    """Identical source + parameters skip preprocessing and inference."""
+    for name in ("goblin", "goblin_copy", "goblin_hires"):
+        (worker_dirs / f"{name}.png").write_bytes(b"\x89PNG goblin")
+    backend = container_worker.StubBackend()
+
+    queue.enqueue("goblin", "concept_art/goblin.png")
+    queue.enqueue("goblin_copy", "concept_art/goblin_copy.png")
+    queue.enqueue("goblin_hires", "concept_art/goblin_hires.png", texture_resolution=2048)
+    container_worker.process_batch(queue, queue.claim_batch("w", 3), "w", backend)
+
+    jobs = {job["asset_id"]: job for job in queue.list(status="completed")}
+    assert len(jobs) == 3
+    assert backend.inferences == 2  # The copy reused the first result
+    first, copy, hires = jobs["goblin"], jobs["goblin_copy"], jobs["goblin_hires"]
+    assert not first["cache_hit"] and copy["cache_hit"] and not hires["cache_hit"]
+    assert copy["cache_key"] == first["cache_key"] != hires["cache_key"]
+    assert set(first["timings"]) >= {"rembg_ms", "load_ms", "inference_ms", "mesh_export_ms", "total_ms"}
+    assert "inference_ms" not in copy["timings"] and "cache_ms" in copy["timings"]
+    assert (tmp_path / "models" / "goblin_copy" / "goblin_copy.glb").read_bytes()[:4] == b"glTF"
+
+    # Resubmitting later completes without touching the model
+    queue.enqueue("goblin", "concept_art/goblin.png")
+    container_worker.process_job(queue, queue.claim("w"), "w", backend)
+    assert backend.inferences == 2
+    assert queue.list(status="completed", limit=1)[0]["cache_hit"]
+
+
+def test_cache_entries_survive_rewrites(queue, tmp_path, worker_dirs):
+    """Files served from the cache are copies, not links into the entry."""
+    backend = container_worker.StubBackend()
+    art = worker_dirs / "a.png"
+
+    def generate(asset_id):
+        queue.enqueue(asset_id, f"concept_art/{asset_id}.png")
+        container_worker.process_job(queue, queue.claim("w"), "w", backend)
+
+    art.write_bytes(b"ART-V1")
+    generate("a")
+    generate("a")  # Cache hit
+    art.write_bytes(b"ART-V2")
+    generate("a")  # Rewrites a/input.png and a/a.glb in place
+
+    (worker_dirs / "b.png").write_bytes(b"ART-V1")
+    generate("b")
+    assert (tmp_path / "models" / "b" / "input.png").read_bytes() == b"ART-V1"
+    assert queue.list(status="completed", limit=1)[0]["cache_hit"]
+
+
+def test_stage_one_error_fails_only_that_job(queue, worker_dirs, monkeypatch):
+    """An exception while resolving one source fails it; the batch carries on."""
+    for name in ("ok", "broken"):
+        (worker_dirs / f"{name}.png").write_bytes(b"\x89PNG " + name.encode())
+        queue.enqueue(name, f"concept_art/{name}.png")
+
+    find = container_worker.find_source_image
+
+    def flaky_find(asset_id):
+        if asset_id == "broken":
+            raise PermissionError("unreadable")
+        return find(asset_id)
+
+    monkeypatch.setattr(container_worker, "find_source_image", flaky_find)
+    container_worker.process_batch(queue, queue.claim_batch("w", 2), "w", container_worker.StubBackend())
+
+    assert [job["asset_id"] for job in queue.list(status="completed")] == ["ok"]
+    failed = queue.list(status="failed")
+    assert [job["asset_id"] for job in failed] == ["broken"] and "unreadable" in failed[0]["error"]
+    assert queue.counts().get("processing", 0) == 0
@@ -0,0 +1,64 @@
+"""Tests for the ring-buffer message log.
+
+Verifies:
+- The log keeps the newest MAX_MESSAGES in order with increasing seqs
+- Category/importance lookups match filtering the retained messages
+- Recent views are cached until the next add
+- get_since returns only newer messages, across drops and clear()
+"""
+from src.core.messages import MessageCategory, MessageImportance, MessageLog
+
+CATEGORIES = list(MessageCategory)
+IMPORTANCES = list(MessageImportance)
+
+
+def fill(log, count, start=0):
+    for i in range(start, start + count):
+        log.add(f"m{i}", CATEGORIES[i % len(CATEGORIES)], IMPORTANCES[i % 7 % len(IMPORTANCES)])
+
+
+def test_ring_keeps_newest():
+    log = MessageLog(capacity=10)
+    fill(log, 25)
+    assert len(log) == 10 and len(log.messages) == 10
+    assert [m.text for m in log.get_all()] == [f"m{i}" for i in range(15, 25)]
+    assert [m.seq for m in log.get_all()] == list(range(16, 26))
+    assert log.first_seq == 16 and log.latest_seq == 25
+
+    for category in CATEGORIES:
+        assert log.get_by_category(category) == [m for m in log.get_all() if m.category == category]
+    for importance in IMPORTANCES:
+        assert log.get_by_importance(importance) == [m for m in log.get_all() if m.importance == importance]
+
+
+def test_recent_views_cached_until_add():
+    log = MessageLog()
+    fill(log, 3)
+    recent = log.get_recent(5)
+    assert [m.text for m in recent] == ["m0", "m1", "m2"]
+    assert log.get_recent(5) is recent and log.recent_texts(2) is log.recent_texts(2)
+
+    log.add("new")
+    assert log.get_recent(5) is not recent
+    assert log.recent_texts(2) == ["m2", "new"]
+    assert log.get_recent(0) == []
+
+
+def test_cursor():
+    log = MessageLog(capacity=5)
+    fill(log, 3)
+    cursor = log.latest_seq
+    assert log.get_since(cursor) == []
+
+    fill(log, 2, start=3)
+    assert [m.text for m in log.get_since(cursor)] == ["m3", "m4"]
+
+    fill(log, 6, start=5)  # Messages after the cursor fall off the ring
+    missed = log.get_since(cursor)
+    assert missed[0].seq == log.first_seq > cursor + 1 and len(missed) == 5
+
+    cursor = log.latest_seq
+    log.clear()
+    assert len(log) == 0 and log.get_all() == [] and log.get_by_category(CATEGORIES[0]) == []
+    log.add("after clear")
+    assert [m.seq for m in log.get_since(cursor)] == [cursor + 1]
@@ -0,0 +1,75 @@
+"""Tests for the compiled player stat sheet.
+
+Verifies:
+- Sheet values match the list-based feat aggregators in player_feats
+- add_feat, equip/unequip and level up rebuild the sheet
+- Direct feat list edits are still picked up
+"""
+import pytest
+
+from src.core.constants import Race, PlayerClass, EquipmentSlot
+from src.entities.entity import Player
+from src.entities.entity import player_feats
+from src.items.item.equipment import WoodenShield
+
+
+FEAT_IDS = ['weapon_master', 'berserker', 'deadly_precision', 'life_leech',
+            'evasion', 'shield_expert', 'thorns', 'eagle_eye', 'fast_learner', 'healer']
+
+
+@pytest.mark.parametrize("race,player_class", [
+    (Race.HALFLING, PlayerClass.ROGUE),
+    (Race.ELF, PlayerClass.MAGE),
+    (Race.HUMAN, PlayerClass.WARRIOR),
+])
+def test_sheet_matches_feat_aggregators(race, player_class):
+    """Every cached feat total equals the per-call aggregator result."""
+    player = Player(0, 0, race, player_class)
+    for feat_id in FEAT_IDS:
+        player.add_feat(feat_id)
+        feats = player.feats
+        assert player.get_total_damage_multiplier() == pytest.approx(player_feats.get_total_damage_multiplier(feats))
+        assert player.get_total_crit_bonus() == pytest.approx(player_feats.get_total_crit_bonus(feats))
+        assert player.get_total_dodge_bonus() == pytest.approx(player_feats.get_total_dodge_bonus(feats))
+        assert player.get_total_block_bonus() == pytest.approx(player_feats.get_total_block_bonus(feats))
+        assert player.get_total_resistance() == pytest.approx(player_feats.get_total_resistance(feats))
+        assert player.get_life_steal() == pytest.approx(player_feats.get_life_steal(feats))
+        assert player.get_thorns_damage() == pytest.approx(player_feats.get_thorns_damage(feats))
+        assert player.get_vision_feat_bonus() == player_feats.get_vision_feat_bonus(feats)
+        assert player.get_heal_bonus() == pytest.approx(player_feats.get_heal_bonus(feats))
+        assert player.has_first_strike() == player_feats.has_first_strike(feats)
+        assert [f['id'] for f in player.get_feat_info()] == feats
+        assert player.get_dodge_chance() <= 0.50
+        assert player.get_crit_chance() <= 0.75
+
+
+def test_sheet_rebuilds_on_changes():
+    """Equipment, feats and level changes are reflected on the next read."""
+    player = Player(0, 0, Race.DWARF, PlayerClass.WARRIOR)
+    base_ac = player.armor_class
+    assert player.stats.block_chance == 0.0
+
+    shield = WoodenShield(0, 0)
+    player.inventory.add_item(shield)
+    player.equip(shield)
+    assert player.stats.block_chance == pytest.approx(0.10)
+    assert player.armor_class == base_ac + getattr(shield, 'shield_ac_bonus', 0)
+
+    player.add_feat('shield_expert')
+    assert player.stats.block_chance == pytest.approx(0.10 + player_feats.get_total_block_bonus(['shield_expert']))
+
+    player.unequip(EquipmentSlot.OFF_HAND)
+    assert player.stats.block_chance == pytest.approx(player_feats.get_total_block_bonus(['shield_expert']))
+
+    sheet = player.stats
+    player.gain_xp(player.xp_to_next_level)
+    assert player.stats is not sheet
+    assert player.stats.level == player.level
+
+
+def test_direct_feat_edit_is_seen():
+    """Appending to feats without add_feat still refreshes the sheet."""
+    player = Player(0, 0, Race.ORC, PlayerClass.WARRIOR)
+    assert player.get_life_steal() == 0
+    player.feats.append('life_leech')
+    assert player.get_life_steal() == pytest.approx(player_feats.get_life_steal(['life_leech']))
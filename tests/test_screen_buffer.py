@@ -0,0 +1,135 @@
+"""Tests for the diffing screen buffer and the cached floor layer.
+
+Verifies:
+- present() repaints in full first, then writes only runs of changed cells,
+  and repaints in full again after invalidate() or a resize
+- The floor layer stacks tiles, terrain, evidence and decorations like the
+  old per-layer draws, dimming explored tiles out of view
+- FOV moves recompose only the cells whose visibility changed, and floor
+  edits drop the cache
+"""
+import curses
+
+from src.core.constants import TileType
+from src.core.engine import GameEngine
+from src.ui.floor_layer import FloorLayer
+from src.ui.screen_buffer import BLANK, ScreenBuffer
+
+
+class FakeScreen:
+    """Records what reaches the terminal."""
+
+    def __init__(self, height=5, width=10):
+        self.size = (height, width)
+        self.writes = []
+        self.clears = 0
+
+    def getmaxyx(self):
+        return self.size
+
+    def addstr(self, y, x, text, attr=0):
+        self.writes.append((y, x, text, attr))
+
+    def clear(self):
+        self.clears += 1
+
+    def noutrefresh(self):
+        pass
+
+
+def frame(screen, draws):
+    screen.begin()
+    for y, x, text, attr in draws:
+        screen.addstr(y, x, text, attr)
+    screen.stdscr.writes.clear()
+    screen.present()
+    return screen.stdscr.writes
+
+
+def test_present_writes_changed_runs(monkeypatch):
+    monkeypatch.setattr(curses, 'doupdate', lambda: None)
+    screen = ScreenBuffer(FakeScreen())
+    draws = [(0, 0, "#####", 0), (1, 2, "@", 1)]
+
+    assert frame(screen, draws) == [(0, 0, "#####", 0), (1, 2, "@", 1)]
+    assert screen.stdscr.clears == 1
+    assert frame(screen, draws) == []
+
+    # Player moves right: old cell blanked, new one drawn, wall untouched
+    assert frame(screen, [(0, 0, "#####", 0), (1, 3, "@", 1)]) == [(1, 2, " ", 0), (1, 3, "@", 1)]
+    assert frame(screen, [(0, 0, "#.###", 0), (1, 3, "@", 1)]) == [(0, 1, ".", 0)]
+
+    screen.invalidate()
+    assert len(frame(screen, draws)) == 2 and screen.stdscr.clears == 2
+
+    screen.stdscr.size = (6, 12)
+    assert len(frame(screen, draws)) == 2 and screen.stdscr.clears == 3
+    assert screen.getmaxyx() == (6, 12)
+
+
+def test_addstr_clips_like_curses():
+    screen = ScreenBuffer(FakeScreen(height=2, width=4))
+    screen.addstr(0, 2, "abcdef")
+    assert screen._back[0] == [BLANK, BLANK, ('a', 0), ('b', 0)]
+    for y, x in ((2, 0), (0, 4), (-1, 0)):
+        try:
+            screen.addstr(y, x, "x")
+        except curses.error:
+            continue
+        raise AssertionError(f"({y}, {x}) should be off screen")
+
+
+def expected_cell(dungeon, x, y):
+    """The cell the old per-layer draws would have left at (x, y)."""
+    if not dungeon.explored[y][x]:
+        return BLANK
+    char, pair = dungeon.get_visual_char(x, y, True), 0
+    for layer in (dungeon.terrain_features, dungeon.zone_evidence, dungeon.decorations):
+        for entry in layer:
+            if (entry[0], entry[1]) == (x, y):
+                char, pair = entry[2], entry[3]
+    if not dungeon.visible[y][x]:
+        return (char, 7)
+    return (char, pair)
+
+
+def test_floor_layer_follows_fov(monkeypatch):
+    monkeypatch.setattr(curses, 'color_pair', lambda n: n)
+    engine = GameEngine()
+    engine.headless = True
+    engine.start_new_game(seed=4321)
+    dungeon, player = engine.dungeon, engine.player
+    width, height = dungeon.width, dungeon.height
+
+    screen = ScreenBuffer(FakeScreen(height=height, width=width))
+    layer = FloorLayer(use_unicode=True, use_color=True)
+
+    def render():
+        screen.begin()
+        layer.render(screen, dungeon, 0, 0, width, height)
+        for y in range(height):
+            assert screen._back[y] == [expected_cell(dungeon, x, y) for x in range(width)]
+
+    render()
+    assert layer.rebuilt == width * height
+    render()
+    assert layer.rebuilt == 0
+
+    # Walk to another floor tile: only cells whose FOV state changed are rebuilt
+    before = [(row[:], seen[:]) for row, seen in zip(dungeon.visible, dungeon.explored)]
+    x, y = next(pos for pos in dungeon.index.walkable if abs(pos[0] - player.x) > 10)
+    dungeon.update_fov(x, y)
+    changed = sum(
+        vis != dungeon.visible[cy][cx] or exp != dungeon.explored[cy][cx]
+        for cy, (vis_row, exp_row) in enumerate(before)
+        for cx, (vis, exp) in enumerate(zip(vis_row, exp_row))
+    )
+    render()
+    assert 0 < layer.rebuilt == changed
+
+    # Opening up a wall in view is picked up through Dungeon.revision
+    wall = next((cx, cy) for cy in range(height) for cx in range(width)
+                if dungeon.visible[cy][cx] and dungeon.tiles[cy][cx] == TileType.WALL)
+    dungeon.set_tile(*wall, TileType.FLOOR)
+    render()
+    assert layer.rebuilt == width * height
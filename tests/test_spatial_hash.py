@@ -0,0 +1,103 @@
+"""Tests for the shared spatial hash and the managers built on it.
+
+Verifies:
+- Radius and rectangle queries match a full scan, in insertion order
+- Moved objects are re-indexed by update(); copies rebuild their index
+- Trap detection draws from the RNG exactly as the old full scan did
+- Ghost lookups follow ghosts that move or are replaced
+"""
+import copy
+import random
+from dataclasses import dataclass
+
+from src.core.constants import TrapType
+from src.entities.ghosts import Ghost, GhostManager, GhostType
+from src.world.spatial_hash import SpatialHash
+from src.world.traps import Trap, TrapManager
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+def make_points(count, seed=5):
+    rng = random.Random(seed)
+    return [Point(rng.randint(-10, 60), rng.randint(-10, 60)) for _ in range(count)]
+
+
+def test_queries_match_scan():
+    points = make_points(300)
+    index = SpatialHash()
+    for point in points:
+        index.insert(point)
+
+    for x, y, radius in ((0, 0, 3), (25, 30, 8), (59, -5, 12), (100, 100, 4)):
+        expected = [p for p in points if abs(p.x - x) + abs(p.y - y) <= radius]
+        assert index.query_radius(x, y, radius) == expected
+
+    expected = [p for p in points if 5 <= p.x <= 20 and -3 <= p.y <= 17]
+    assert index.query_rect(5, -3, 20, 17) == expected
+    assert index.at(points[0].x, points[0].y)[0] is points[0]
+    assert len(index) == 300 and list(index) == points
+
+
+def test_update_and_copy():
+    a, b = Point(1, 1), Point(2, 2)
+    index = SpatialHash(cell_size=4)
+    index.insert(a)
+    index.insert(b)
+
+    a.x, a.y = 30, 30
+    assert index.update(a) and not index.update(b)
+    assert index.first_at(1, 1) is None and index.first_at(30, 30) is a
+    assert index.query_radius(0, 0, 5) == [b]
+
+    points = copy.deepcopy([a, b, index])
+    copied = points[2]
+    assert copied.first_at(30, 30) is points[0]
+    assert copied.query_rect(0, 0, 40, 40) == points[:2]
+
+    index.remove(a)
+    assert not index.has(30, 30) and len(index) == 1 and a not in index
+
+
+def test_trap_detection_matches_full_scan():
+    rng = random.Random(11)
+    traps = [Trap(x=rng.randint(0, 40), y=rng.randint(0, 40), trap_type=TrapType.SPIKE)
+             for _ in range(80)]
+    manager = TrapManager()
+    for trap in traps:
+        manager.add_trap(copy.copy(trap))
+
+    random.seed(9)
+    expected = []
+    for trap in traps:
+        if trap.hidden and abs(trap.x - 20) + abs(trap.y - 20) <= 6:
+            if trap.detect(12):
+                expected.append((trap.x, trap.y))
+    after_scan = random.random()
+
+    random.seed(9)
+    detected = manager.detect_nearby(20, 20, perception=12, radius=6)
+    assert [(trap.x, trap.y) for trap in detected] == expected
+    assert random.random() == after_scan
+
+
+def test_ghost_index_follows_moves():
+    manager = GhostManager()
+    manager.ghosts = [Ghost(GhostType.ECHO, 5, 5), Ghost(GhostType.SILENCE, 30, 30)]
+    assert manager.get_ghost_at(5, 5) is manager.ghosts[0]
+
+    echo = manager.ghosts[0]
+    echo.x, echo.y = 28, 29
+    manager._ghost_index().update(echo)
+    assert manager.get_ghost_at(5, 5) is None
+    assert manager.get_visible_ghosts(30, 30, view_distance=4) == manager.ghosts
+
+    manager.ghosts[1].active = False
+    assert manager.get_visible_ghosts(30, 30, view_distance=4) == [echo]
+
+    manager.clear()
+    assert manager.get_visible_ghosts(30, 30) == []
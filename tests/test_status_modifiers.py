@@ -0,0 +1,69 @@
+"""Tests for cached status effect modifiers.
+
+Verifies:
+- StatusEffectManager getters follow apply, tick, expiry and clear
+- BattleEntity modifiers follow add/remove/tick of effect dicts
+- Move enumeration honours slow/stun effects stored on battle entities
+"""
+from src.combat.battle_actions import create_status_effect, get_valid_move_tiles
+from src.combat.battle_types import BattleState, BattleEntity
+from src.combat.round_processing import RoundProcessor
+from src.core.constants import StatusEffectType
+from src.entities.status_effects import StatusEffectManager
+
+
+def test_manager_modifiers_track_changes():
+    """Cached flags and totals are rebuilt whenever effects change."""
+    manager = StatusEffectManager()
+    assert not manager.is_stunned() and manager.get_movement_penalty() == 0.0
+
+    manager.apply_effect(StatusEffectType.FREEZE)
+    manager.apply_effect(StatusEffectType.POISON)
+    manager.apply_effect(StatusEffectType.POISON)
+    assert manager.is_frozen()
+    assert manager.get_movement_penalty() == 0.5
+    assert manager.modifiers.damage_per_turn == 4
+
+    manager.apply_effect(StatusEffectType.STUN)
+    assert manager.is_stunned()
+    manager.tick()  # Stun lasts one turn
+    assert not manager.is_stunned()
+    assert manager.is_frozen()
+
+    manager.remove_effect(StatusEffectType.FREEZE)
+    assert manager.get_movement_penalty() == 0.0
+    manager.clear_all()
+    assert manager.modifiers.damage_per_turn == 0
+
+
+def make_battle():
+    tiles = [['.'] * 9 for _ in range(7)]
+    battle = BattleState(arena_width=9, arena_height=7, arena_tiles=tiles, biome='STONE')
+    battle.player = BattleEntity('player', True, 1, 1, 0, 0, 20, 20, 4, 2)
+    battle.enemies.append(BattleEntity('goblin', False, 4, 3, 0, 0, 10, 10, 3, 4))
+    return battle
+
+
+def test_battle_modifiers_and_move_range():
+    """Slow halves move range; stun pins to one tile; expiry restores it."""
+    battle = make_battle()
+    goblin = battle.enemies[0]
+    full_range = len(get_valid_move_tiles(goblin, battle))
+
+    goblin.add_status(create_status_effect('freeze').to_dict())
+    goblin.add_status(create_status_effect('shield_wall').to_dict())
+    assert goblin.status_modifiers.speed_mod == 0.5
+    assert goblin.get_effective_defense() == 8
+    assert len(get_valid_move_tiles(goblin, battle)) < full_range
+
+    goblin.add_status(create_status_effect('stun').to_dict())
+    assert goblin.status_modifiers.is_stunned
+    assert len(get_valid_move_tiles(goblin, battle)) <= 4
+
+    processor = RoundProcessor(engine=None)
+    processor.tick_status_effects(goblin)  # Stun expires
+    assert not goblin.status_modifiers.is_stunned
+    goblin.remove_status('freeze')
+    goblin.remove_status('shield_wall')
+    assert goblin.get_effective_defense() == 4
+    assert len(get_valid_move_tiles(goblin, battle)) == full_range
@@ -2,18 +2,36 @@
 """
 Container Worker - Processes 3D generation jobs inside Docker container.
 
-Polls the /jobs directory and processes pending jobs using TripoSR.
+Claims jobs from the queue in /jobs (see job_queue.py) and processes them
+using TripoSR. Several workers, in one container (--workers) or many, can
+share the queue; each job is claimed by exactly one of them.
+
+Each worker claims a small batch of jobs (--batch-size) and runs them in
+stages, recording per-stage timings on the job:
+
+1. Cache lookup: outputs are cached by a hash of the source image plus the
+   generation parameters (see result_cache.py), so resubmitted concept art
+   completes without running either model.
+2. Background removal over the whole batch with the shared rembg session.
+   Preprocessed inputs are cached too, keyed by the source image alone.
+3. TripoSR inference and mesh export, one job at a time.
+
+Pass --stub to swap TripoSR for a stand-in that writes a placeholder GLB,
+for exercising the queue without the model.
 """
 
 import argparse
 import json
 import logging
-import os
+import multiprocessing
+import struct
 import sys
 import time
-from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+from job_queue import DB_FILENAME, JobQueue, default_worker_id
+from result_cache import ResultCache, cache_key
 
 # Configure logging
 logging.basicConfig(
@@ -27,6 +45,15 @@ JOBS_DIR = Path("/jobs")
 CONCEPT_ART_DIR = Path("/concept_art")
 OUTPUT_BASE_DIR = Path("/web_assets/models")  # Mounted to web/public/assets/models
 TRIPOSR_DIR = Path("/app/TripoSR")
+CACHE_DIR = JOBS_DIR / "cache"
+
+SOURCE_EXTENSIONS = [".png", ".jpg", ".jpeg", ".webp"]
+DEFAULT_BATCH_SIZE = 4
+
+# TripoSR settings that change the output (part of the cache key)
+TRIPOSR_MODEL = "stabilityai/TripoSR"
+FOREGROUND_RATIO = 0.85
+MESH_RESOLUTION = 256
 
 # Global model (loaded once)
 _model = None
@@ -42,7 +69,7 @@ def get_model():
         from tsr.system import TSR
 
         _model = TSR.from_pretrained(
-            "stabilityai/TripoSR",
+            TRIPOSR_MODEL,
             config_name="config.yaml",
             weight_name="model.ckpt",
         )
@@ -61,207 +88,328 @@ def get_rembg_session():
     return _rembg_session
 
 
-def update_job(job_id: str, **updates):
-    """Update a job file."""
-    job_file = JOBS_DIR / f"{job_id}.json"
-    if not job_file.exists():
-        return
+def get_queue() -> JobQueue:
+    """Open the shared job queue, importing any legacy JSON job files."""
+    queue = JobQueue(JOBS_DIR / DB_FILENAME)
+    imported = queue.import_json_jobs(JOBS_DIR)
+    if imported:
+        logger.info(f"Imported {imported} legacy job file(s) into the queue")
+    return queue
 
-    try:
-        with open(job_file, "r") as f:
-            job = json.load(f)
 
-        job.update(updates)
-        job["updated_at"] = datetime.utcnow().isoformat()
+class TripoSRBackend:
+    """Background removal and image-to-mesh with TripoSR."""
 
-        # Handle log_line specially
-        if "log_line" in updates:
-            if "logs" not in job:
-                job["logs"] = []
-            job["logs"].append(updates["log_line"])
-            job["logs"] = job["logs"][-20:]
-            del job["log_line"]
+    name = "TripoSR"
+    # Everything besides the source image that affects each stage's output
+    preprocess_params = {"rembg": "u2net", "foreground_ratio": FOREGROUND_RATIO}
+    mesh_params = {"model": TRIPOSR_MODEL, "resolution": MESH_RESOLUTION, "vertex_color": True}
 
-        with open(job_file, "w") as f:
-            json.dump(job, f, indent=2)
-    except Exception as e:
-        logger.error(f"Failed to update job {job_id}: {e}")
+    def preprocess(self, source_path: Path):
+        import numpy as np
+        from PIL import Image
 
+        sys.path.insert(0, str(TRIPOSR_DIR))
+        from tsr.utils import remove_background, resize_foreground
 
-def get_next_pending_job() -> Optional[dict]:
-    """Get the next pending job from the queue."""
-    if not JOBS_DIR.exists():
-        return None
+        image = Image.open(source_path)
+        image = remove_background(image, get_rembg_session())
+        image = resize_foreground(image, FOREGROUND_RATIO)
+        image = np.array(image).astype(np.float32) / 255.0
+        image = image[:, :, :3] * image[:, :, 3:4] + (1 - image[:, :, 3:4]) * 0.5
+        return Image.fromarray((image * 255.0).astype(np.uint8))
 
-    for job_file in sorted(JOBS_DIR.glob("*.json")):
-        if job_file.name.startswith("."):
-            continue
-        try:
-            with open(job_file, "r") as f:
-                job = json.load(f)
-            if job.get("status") == "pending":
-                return job
-        except Exception:
-            pass
-    return None
+    def load_input(self, input_path: Path):
+        """Read back a preprocessed input saved by save_input()."""
+        from PIL import Image
 
+        with Image.open(input_path) as image:
+            return image.convert("RGB")
 
-def process_job(job: dict):
-    """Process a single generation job using TripoSR."""
-    import numpy as np
-    import torch
-    from PIL import Image
+    def load(self):
+        get_model()
 
-    job_id = job["job_id"]
-    asset_id = job["asset_id"]
+    def infer(self, image):
+        import torch
 
-    logger.info(f"Processing job {job_id} for asset {asset_id}")
+        with torch.no_grad():
+            return get_model()([image], device="cpu")
 
-    # Update status
-    update_job(job_id, status="processing", progress="Starting...", progress_pct=0)
+    def export_mesh(self, scene_codes, mesh_path: Path) -> int:
+        """Write the mesh to mesh_path; returns its vertex count."""
+        # Use vertex colors (baking requires OpenGL display which isn't available in Docker)
+        meshes = get_model().extract_mesh(scene_codes, has_vertex_color=True, resolution=MESH_RESOLUTION)
+        meshes[0].export(str(mesh_path))
+        return len(meshes[0].vertices)
 
-    # Find source image
-    source_path = None
-    for ext in [".png", ".jpg", ".jpeg", ".webp"]:
-        candidate = CONCEPT_ART_DIR / f"{asset_id}{ext}"
-        if candidate.exists():
-            source_path = candidate
-            break
 
-    if not source_path:
-        update_job(
-            job_id,
-            status="failed",
-            error=f"Source image not found for {asset_id}",
-            progress="Failed",
-        )
-        return
+class StubBackend:
+    """Stand-in for TripoSR: copies the source and writes an empty GLB."""
 
-    update_job(job_id, progress="Loading source image...", progress_pct=5,
-               log_line=f"Source: {source_path}")
+    name = "stub"
+    preprocess_params = {"stub": True}
+    mesh_params = {"stub": True}
 
-    # Create output directory
-    output_dir = OUTPUT_BASE_DIR / asset_id
-    output_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(self):
+        self.inferences = 0
 
-    update_job(job_id, progress="Preparing output directory...", progress_pct=10,
-               log_line=f"Output: {output_dir}")
+    def preprocess(self, source_path: Path):
+        return Path(source_path).read_bytes()
 
-    try:
-        # Load and preprocess image
-        update_job(job_id, progress="Removing background...", progress_pct=15,
-                   log_line="Processing image with rembg...")
+    def load_input(self, input_path: Path):
+        return Path(input_path).read_bytes()
 
-        sys.path.insert(0, str(TRIPOSR_DIR))
-        from tsr.utils import remove_background, resize_foreground
+    def load(self):
+        pass
 
-        image = Image.open(source_path)
-        image = remove_background(image, get_rembg_session())
-        image = resize_foreground(image, 0.85)
-        image = np.array(image).astype(np.float32) / 255.0
-        image = image[:, :, :3] * image[:, :, 3:4] + (1 - image[:, :, 3:4]) * 0.5
-        image = Image.fromarray((image * 255.0).astype(np.uint8))
+    def infer(self, image):
+        self.inferences += 1
+        return image
+
+    def export_mesh(self, scene_codes, mesh_path: Path) -> int:
+        gltf = json.dumps({"asset": {"version": "2.0", "generator": "stub"}}).encode()
+        gltf += b" " * (-len(gltf) % 4)
+        body = struct.pack("<I4s", len(gltf), b"JSON") + gltf
+        mesh_path.write_bytes(struct.pack("<4sII", b"glTF", 2, 12 + len(body)) + body)
+        return 0
 
-        # Save processed input
-        input_path = output_dir / "input.png"
-        image.save(input_path)
-        update_job(job_id, progress="Background removed", progress_pct=25,
-                   log_line=f"Saved processed input: {input_path}")
 
-        # Load model
-        update_job(job_id, progress="Loading TripoSR model...", progress_pct=30,
-                   log_line="Loading model (may download on first run)...")
-        model = get_model()
+def save_input(image, input_path: Path):
+    if isinstance(image, bytes):
+        input_path.write_bytes(image)
+    else:
+        image.save(input_path)
 
-        # Run model
-        update_job(job_id, progress="Running 3D reconstruction...", progress_pct=40,
-                   log_line="Running TripoSR inference...")
 
-        with torch.no_grad():
-            scene_codes = model([image], device="cpu")
+def find_source_image(asset_id: str) -> Optional[Path]:
+    for ext in SOURCE_EXTENSIONS:
+        candidate = CONCEPT_ART_DIR / f"{asset_id}{ext}"
+        if candidate.exists():
+            return candidate
+    return None
 
-        update_job(job_id, progress="Model inference complete", progress_pct=60,
-                   log_line="Scene codes generated")
 
-        # Extract mesh
-        update_job(job_id, progress="Extracting mesh...", progress_pct=65,
-                   log_line="Running marching cubes...")
+class _Task:
+    """One claimed job moving through the batch stages."""
+
+    def __init__(self, job: dict):
+        self.job = job
+        self.job_id = job["job_id"]
+        self.asset_id = job["asset_id"]
+        self.output_dir = OUTPUT_BASE_DIR / self.asset_id
+        self.input_path = self.output_dir / "input.png"
+        self.mesh_path = self.output_dir / f"{self.asset_id}.glb"
+        self.source_path: Optional[Path] = None
+        self.preprocess_key = ""
+        self.mesh_key = ""
+        self.image = None
+        self.timings = {}
+        self.started = time.perf_counter()
+        self.done = False
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+def process_batch(queue: JobQueue, jobs: List[dict], worker_id: str, backend=None,
+                  cache: Optional[ResultCache] = None):
+    """Process a batch of claimed generation jobs through the staged pipeline."""
+    backend = backend or TripoSRBackend()
+    cache = cache or ResultCache(CACHE_DIR)
+    tasks = [_Task(job) for job in jobs]
+
+    def update_job(task: _Task, **updates):
+        # Progress from the lease holder also extends the lease
+        queue.update(task.job_id, worker_id=worker_id, **updates)
+
+    def fail(task: _Task, error: str):
+        task.done = True
+        update_job(task, timings=task.timings)
+        queue.fail(task.job_id, worker_id, error)
+
+    def finish(task: _Task, log_line: str):
+        task.done = True
+        task.timings["total_ms"] = _elapsed_ms(task.started)
+        update_job(task, timings=task.timings)
+        if queue.complete(task.job_id, worker_id, result_path=str(task.mesh_path), log_line=log_line):
+            logger.info(f"Job {task.job_id} completed: {task.mesh_path}")
+        else:
+            logger.warning(f"Job {task.job_id} finished after its lease was taken over")
+
+    def try_cache(task: _Task) -> bool:
+        """Complete the job from the mesh cache if an entry exists."""
+        start = time.perf_counter()
+        if not cache.materialize("mesh", task.mesh_key, "mesh.glb", task.mesh_path):
+            return False
+        cache.materialize("mesh", task.mesh_key, "input.png", task.input_path)
+        task.timings["cache_ms"] = _elapsed_ms(start)
+        update_job(task, cache_hit=True, progress="Cached result", progress_pct=95,
+                   log_line=f"Cache hit ({task.mesh_key[:12]}), skipping generation")
+        finish(task, "Generation complete (cached)")
+        return True
+
+    # Stage 1: resolve sources and serve cache hits
+    for task in tasks:
+        logger.info(f"Processing job {task.job_id} for asset {task.asset_id} ({backend.name})")
+        try:
+            update_job(task, progress="Starting...", progress_pct=0)
+            task.source_path = find_source_image(task.asset_id)
+            if not task.source_path:
+                fail(task, f"Source image not found for {task.asset_id}")
+                continue
+
+            task.output_dir.mkdir(parents=True, exist_ok=True)
+            source = task.source_path.read_bytes()
+            task.preprocess_key = cache_key(source, {"backend": backend.name, **backend.preprocess_params})
+            task.mesh_key = cache_key(source, {
+                "backend": backend.name,
+                "texture_resolution": task.job["texture_resolution"],
+                **backend.preprocess_params,
+                **backend.mesh_params,
+            })
+            update_job(task, cache_key=task.mesh_key, progress="Loading source image...", progress_pct=5,
+                       log_line=f"Source: {task.source_path}")
+            try_cache(task)
+        except Exception as e:
+            logger.exception(f"Job {task.job_id} failed")
+            fail(task, str(e))
 
-        # Use vertex colors (baking requires OpenGL display which isn't available in Docker)
-        meshes = model.extract_mesh(scene_codes, has_vertex_color=True, resolution=256)
+    # Stage 2: background removal over everything left, sharing one rembg session
+    for task in tasks:
+        if task.done:
+            continue
+        try:
+            update_job(task, progress="Removing background...", progress_pct=15,
+                       log_line="Processing image with rembg...")
+            start = time.perf_counter()
+            if cache.materialize("preprocess", task.preprocess_key, "input.png", task.input_path):
+                task.image = backend.load_input(task.input_path)
+                log_line = f"Reused processed input: {task.input_path}"
+            else:
+                task.image = backend.preprocess(task.source_path)
+                save_input(task.image, task.input_path)
+                cache.put("preprocess", task.preprocess_key, {"input.png": task.input_path})
+                log_line = f"Saved processed input: {task.input_path}"
+            task.timings["rembg_ms"] = _elapsed_ms(start)
+            update_job(task, progress="Background removed", progress_pct=25, log_line=log_line)
+        except Exception as e:
+            logger.exception(f"Job {task.job_id} failed")
+            fail(task, str(e))
 
-        update_job(job_id, progress="Mesh extracted", progress_pct=75,
-                   log_line=f"Vertices: {len(meshes[0].vertices)}")
+    # Stage 3: inference and mesh export, one job at a time
+    for index, task in enumerate(tasks):
+        if task.done:
+            continue
+        # Jobs later in the batch keep their leases while they wait
+        for waiting in tasks[index + 1:]:
+            if not waiting.done:
+                queue.heartbeat(waiting.job_id, worker_id)
+        try:
+            # An identical job earlier in this batch may have just filled the cache
+            if try_cache(task):
+                continue
+            update_job(task, progress="Loading TripoSR model...", progress_pct=30,
+                       log_line="Loading model (may download on first run)...")
+            start = time.perf_counter()
+            backend.load()
+            task.timings["load_ms"] = _elapsed_ms(start)
+
+            update_job(task, progress="Running 3D reconstruction...", progress_pct=40,
+                       log_line="Running TripoSR inference...")
+            start = time.perf_counter()
+            scene_codes = backend.infer(task.image)
+            task.timings["inference_ms"] = _elapsed_ms(start)
+            update_job(task, progress="Model inference complete", progress_pct=60,
+                       log_line="Scene codes generated")
+
+            # Extract and export the mesh (GLB format for web compatibility)
+            update_job(task, progress="Extracting mesh...", progress_pct=65,
+                       log_line="Running marching cubes...")
+            start = time.perf_counter()
+            vertices = backend.export_mesh(scene_codes, task.mesh_path)
+            task.timings["mesh_export_ms"] = _elapsed_ms(start)
+            task.image = None
+
+            cache.put("mesh", task.mesh_key, {"mesh.glb": task.mesh_path, "input.png": task.input_path})
+            update_job(task, progress="Mesh exported", progress_pct=95,
+                       log_line=f"Model saved: {task.mesh_path} ({vertices} vertices)")
+            finish(task, "Generation complete!")
 
-        # Export mesh with vertex colors (GLB format for web compatibility)
-        update_job(job_id, progress="Exporting mesh...", progress_pct=85,
-                   log_line="Exporting to GLB format with vertex colors...")
+        except Exception as e:
+            logger.exception(f"Job {task.job_id} failed")
+            fail(task, str(e))
 
-        mesh_path = output_dir / f"{asset_id}.glb"
-        meshes[0].export(str(mesh_path))
 
-        update_job(job_id, progress="Mesh exported", progress_pct=95,
-                   log_line=f"Model saved: {mesh_path}")
-
-        # Success
-        update_job(
-            job_id,
-            status="completed",
-            progress="Complete!",
-            progress_pct=100,
-            result_path=str(mesh_path),
-            log_line="Generation complete!",
-        )
-        logger.info(f"Job {job_id} completed: {mesh_path}")
-
-    except Exception as e:
-        logger.exception(f"Job {job_id} failed")
-        update_job(
-            job_id,
-            status="failed",
-            error=str(e),
-            progress="Failed",
-            log_line=f"Error: {e}",
-        )
+def process_job(queue: JobQueue, job: dict, worker_id: str, backend=None,
+                cache: Optional[ResultCache] = None):
+    """Process a single claimed generation job."""
+    process_batch(queue, [job], worker_id, backend, cache)
 
 
-def worker_loop(poll_interval: float = 3.0):
-    """Main worker loop."""
-    logger.info("3D Generation Worker started")
-    logger.info(f"Jobs directory: {JOBS_DIR}")
+def worker_loop(poll_interval: float = 3.0, stub: bool = False, batch_size: int = DEFAULT_BATCH_SIZE):
+    """Main worker loop: claim a batch, process it, and sleep until a job arrives."""
+    queue = get_queue()
+    backend = StubBackend() if stub else TripoSRBackend()
+    worker_id = default_worker_id()
+    logger.info(f"3D Generation Worker {worker_id} started ({backend.name})")
+    logger.info(f"Job queue: {queue.path}")
     logger.info(f"Concept art directory: {CONCEPT_ART_DIR}")
     logger.info(f"Output directory: {OUTPUT_BASE_DIR}")
+    logger.info(f"Result cache: {CACHE_DIR}")
+    cache = ResultCache(CACHE_DIR)
 
     while True:
         try:
-            job = get_next_pending_job()
-            if job:
-                process_job(job)
+            jobs = queue.claim_batch(worker_id, batch_size)
+            if jobs:
+                process_batch(queue, jobs, worker_id, backend, cache)
             else:
-                time.sleep(poll_interval)
+                # Wakes as soon as a job is enqueued; poll_interval is a backstop
+                queue.wait(poll_interval)
         except KeyboardInterrupt:
             logger.info("Worker stopped")
             break
         except Exception as e:
             logger.exception(f"Worker error: {e}")
-            time.sleep(poll_interval)
+            queue.wait(poll_interval)
 
 
 def main():
     parser = argparse.ArgumentParser(description="3D Generation Worker")
     parser.add_argument("--watch", action="store_true", help="Continuously watch for new jobs")
     parser.add_argument("--once", action="store_true", help="Process one job and exit")
-    parser.add_argument("--poll-interval", type=float, default=3.0, help="Seconds between job checks")
+    parser.add_argument("--poll-interval", type=float, default=3.0, help="Max seconds between queue checks")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes (each loads its own model)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Jobs claimed together for batched preprocessing")
+    parser.add_argument("--stub", action="store_true", help="Use a stub model instead of TripoSR")
     args = parser.parse_args()
 
     if args.once:
-        job = get_next_pending_job()
+        queue = get_queue()
+        worker_id = default_worker_id()
+        job = queue.claim(worker_id)
         if job:
-            process_job(job)
+            process_job(queue, job, worker_id, StubBackend() if args.stub else None)
         else:
             logger.info("No pending jobs")
+    elif args.workers > 1:
+        processes = [
+            multiprocessing.Process(target=worker_loop,
+                                    args=(args.poll_interval, args.stub, args.batch_size))
+            for _ in range(args.workers)
+        ]
+        for process in processes:
+            process.start()
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            logger.info("Workers stopped")
     else:
-        worker_loop(args.poll_interval)
+        worker_loop(args.poll_interval, args.stub, args.batch_size)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,495 @@
+"""
+3D Generation Job Queue
+
+SQLite-backed queue shared by the backend (server/app/api/assets.py), the
+container worker and the host job worker. Replaces the one-JSON-file-per-job
+directory that every worker re-globbed and re-parsed every few seconds.
+
+- Claims are atomic (``UPDATE ... RETURNING`` inside ``BEGIN IMMEDIATE``), so
+  any number of workers, in any number of processes or containers sharing the
+  jobs directory, never take the same job.
+- A claimed job is leased for ``visibility_timeout`` seconds. Progress updates
+  from the lease holder extend the lease; if a worker dies, the job becomes
+  claimable again once the lease lapses (up to ``max_attempts`` claims).
+- Higher ``priority`` jobs are claimed first, then oldest first.
+- ``wait()`` wakes as soon as a job is enqueued: immediately within a process,
+  and via SQLite's ``PRAGMA data_version`` (a counter read, no parsing)
+  across processes.
+
+Standard library only, so it can be copied into the worker image as-is.
+
+Usage:
+    queue = JobQueue(JOBS_DIR / "queue.db")
+    queue.enqueue(asset_id="goblin", source_image="concept_art/goblin.png")
+    job = queue.claim("worker-1")
+    queue.update(job["job_id"], progress="Meshing...", progress_pct=50)
+    queue.update(job["job_id"], timings={"inference_ms": 81250.0})
+    queue.complete(job["job_id"], "worker-1", result_path="...")
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+STATUSES = ("pending", "processing", "completed", "failed")
+
+DB_FILENAME = "queue.db"
+DEFAULT_VISIBILITY_TIMEOUT = 15 * 60  # CPU TripoSR takes ~2 minutes; be generous
+DEFAULT_MAX_ATTEMPTS = 3
+MAX_LOG_LINES = 20
+
+# How often wait() checks for commits from other processes
+CROSS_PROCESS_CHECK_INTERVAL = 0.25
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    asset_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    available_at REAL NOT NULL,
+    lease_expires REAL,
+    worker_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    source_image TEXT NOT NULL,
+    output_dir TEXT,
+    texture_resolution INTEGER NOT NULL DEFAULT 1024,
+    device TEXT NOT NULL DEFAULT 'cpu',
+    error TEXT,
+    result_path TEXT,
+    progress TEXT,
+    progress_pct INTEGER,
+    logs TEXT NOT NULL DEFAULT '[]',
+    cache_key TEXT,
+    cache_hit INTEGER NOT NULL DEFAULT 0,
+    timings TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, priority DESC, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created_at);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_active_asset
+    ON jobs (asset_id) WHERE status IN ('pending', 'processing');
+"""
+
+# Columns added after the first release: name -> definition for ALTER TABLE
+ADDED_COLUMNS = {
+    "cache_key": "TEXT",
+    "cache_hit": "INTEGER NOT NULL DEFAULT 0",
+    "timings": "TEXT NOT NULL DEFAULT '{}'",
+}
+
+# Fields a caller may set through update()
+UPDATABLE_FIELDS = (
+    "status", "error", "result_path", "progress", "progress_pct",
+    "cache_key", "cache_hit", "timings",
+)
+
+# Fields copied from legacy JSON job files
+LEGACY_FIELDS = (
+    "job_id", "asset_id", "status", "created_at", "updated_at", "source_image",
+    "output_dir", "texture_resolution", "device", "error", "result_path",
+    "progress", "progress_pct",
+)
+
+
+class DuplicateJobError(ValueError):
+    """The asset already has a pending or processing job."""
+
+    def __init__(self, asset_id: str, status: str):
+        super().__init__(f"Job already exists for asset '{asset_id}' (status: {status})")
+        self.asset_id = asset_id
+        self.status = status
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}-{threading.get_ident() % 10000}"
+
+
+def _now_iso() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _row_to_job(row: sqlite3.Row) -> dict:
+    job = dict(row)
+    job["logs"] = json.loads(job["logs"] or "[]")
+    job["timings"] = json.loads(job["timings"] or "{}")
+    job["cache_hit"] = bool(job["cache_hit"])
+    return job
+
+
+class JobQueue:
+    """Persistent generation job queue in a single SQLite file."""
+
+    # In-process wakeups, shared by every JobQueue on the same file
+    _conditions: Dict[str, threading.Condition] = {}
+    _conditions_lock = threading.Lock()
+
+    def __init__(self, path, visibility_timeout: float = DEFAULT_VISIBILITY_TIMEOUT):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.visibility_timeout = visibility_timeout
+        self._local = threading.local()
+        key = str(self.path.resolve())
+        with JobQueue._conditions_lock:
+            self._condition = JobQueue._conditions.setdefault(key, threading.Condition())
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        self._migrate(conn)
+
+    # -------------------------------------------------------------------------
+    # Connections
+    # -------------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread (sqlite3 connections aren't shareable)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit; transactions are opened explicitly. The default
+            # rollback journal is used rather than WAL, which needs shared
+            # memory that bind mounts into containers don't always provide.
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout = 30000")
+            self._local.conn = conn
+        return conn
+
+    def _migrate(self, conn: sqlite3.Connection):
+        """Add columns missing from a queue.db created by an older version."""
+        existing = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+        for name, definition in ADDED_COLUMNS.items():
+            if name not in existing:
+                try:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {definition}")
+                except sqlite3.OperationalError:
+                    pass  # Another process added it first
+
+    def _transaction(self):
+        return _Transaction(self._connect())
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _notify(self):
+        with self._condition:
+            self._condition.notify_all()
+
+    # -------------------------------------------------------------------------
+    # Producer side
+    # -------------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        asset_id: str,
+        source_image: str,
+        output_dir: Optional[str] = None,
+        texture_resolution: int = 1024,
+        device: str = "cpu",
+        priority: int = 0,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        job_id: Optional[str] = None,
+    ) -> dict:
+        """Add a pending job. Raises DuplicateJobError if the asset has one."""
+        now = _now_iso()
+        job_id = job_id or str(uuid4())[:8]
+        try:
+            with self._transaction() as conn:
+                row = conn.execute(
+                    """
+                    INSERT INTO jobs (
+                        job_id, asset_id, status, priority, created_at, updated_at,
+                        available_at, max_attempts, source_image, output_dir,
+                        texture_resolution, device
+                    ) VALUES (?, ?, 'pending', ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    RETURNING *
+                    """,
+                    (job_id, asset_id, priority, now, now, time.time(), max_attempts,
+                     source_image, output_dir, texture_resolution, device),
+                ).fetchall()[0]
+        except sqlite3.IntegrityError:
+            existing = self.find_active(asset_id)
+            raise DuplicateJobError(asset_id, existing["status"] if existing else "pending")
+        self._notify()
+        return _row_to_job(row)
+
+    # -------------------------------------------------------------------------
+    # Consumer side
+    # -------------------------------------------------------------------------
+
+    def claim(self, worker_id: str, visibility_timeout: Optional[float] = None) -> Optional[dict]:
+        """Atomically lease the next job, or return None if there is none.
+
+        Processing jobs whose lease lapsed are reclaimed; ones that have used
+        all their attempts are failed instead.
+        """
+        jobs = self.claim_batch(worker_id, 1, visibility_timeout)
+        return jobs[0] if jobs else None
+
+    def claim_batch(self, worker_id: str, limit: int, visibility_timeout: Optional[float] = None) -> List[dict]:
+        """Atomically lease up to ``limit`` jobs, in claim order.
+
+        Lets a worker run a preprocessing stage over several queued images at
+        once. Every job in the batch shares one lease deadline, so the caller
+        should heartbeat the jobs it hasn't reached yet.
+        """
+        now = time.time()
+        lease = visibility_timeout or self.visibility_timeout
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                UPDATE jobs
+                SET status = 'failed', worker_id = NULL, lease_expires = NULL,
+                    error = 'Worker lease expired ' || attempts || ' times', updated_at = ?
+                WHERE status = 'processing' AND lease_expires < ? AND attempts >= max_attempts
+                """,
+                (_now_iso(), now),
+            )
+            rows = conn.execute(
+                """
+                UPDATE jobs
+                SET status = 'processing', worker_id = ?, lease_expires = ?,
+                    attempts = attempts + 1, error = NULL, updated_at = ?
+                WHERE job_id IN (
+                    SELECT job_id FROM jobs
+                    WHERE (status = 'pending' AND available_at <= ?)
+                       OR (status = 'processing' AND lease_expires < ?)
+                    ORDER BY priority DESC, created_at, job_id
+                    LIMIT ?
+                )
+                RETURNING *
+                """,
+                (worker_id, now + lease, _now_iso(), now, now, max(1, limit)),
+            ).fetchall()
+            self._local.data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        # RETURNING order is unspecified
+        rows.sort(key=lambda row: (-row["priority"], row["created_at"], row["job_id"]))
+        return [_row_to_job(row) for row in rows]
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a job may be available (or timeout). Returns True if woken."""
+        conn = self._connect()
+        # Compare against the version seen at the last claim, so a job
+        # enqueued between claim() and wait() still wakes us
+        version = getattr(self._local, "data_version", None)
+        if version is None:
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            with self._condition:
+                if self._condition.wait(min(remaining, CROSS_PROCESS_CHECK_INTERVAL)):
+                    return True
+            if conn.execute("PRAGMA data_version").fetchone()[0] != version:
+                return True
+
+    def heartbeat(self, job_id: str, worker_id: str, visibility_timeout: Optional[float] = None) -> bool:
+        """Extend a lease. Returns False if the worker no longer holds it."""
+        lease = visibility_timeout or self.visibility_timeout
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ? "
+                "WHERE job_id = ? AND worker_id = ? AND status = 'processing'",
+                (time.time() + lease, job_id, worker_id),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str, result_path: str, log_line: Optional[str] = None) -> bool:
+        """Mark a leased job completed. Returns False if the lease was lost."""
+        return self._finish(job_id, worker_id, "completed", log_line,
+                            result_path=result_path, progress="Complete!", progress_pct=100)
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry: bool = False) -> bool:
+        """Mark a leased job failed, or put it back in the queue if ``retry``
+        and it has attempts left. Returns False if the lease was lost."""
+        if retry:
+            with self._transaction() as conn:
+                cursor = conn.execute(
+                    """
+                    UPDATE jobs
+                    SET status = 'pending', worker_id = NULL, lease_expires = NULL,
+                        error = ?, updated_at = ?, available_at = ?
+                    WHERE job_id = ? AND worker_id = ? AND status = 'processing'
+                      AND attempts < max_attempts
+                    """,
+                    (error, _now_iso(), time.time(), job_id, worker_id),
+                )
+            if cursor.rowcount == 1:
+                self._notify()
+                return True
+        return self._finish(job_id, worker_id, "failed", f"Error: {error}",
+                            error=error, progress="Failed")
+
+    def _finish(self, job_id: str, worker_id: str, status: str, log_line: Optional[str], **fields) -> bool:
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT logs FROM jobs WHERE job_id = ? AND worker_id = ? AND status = 'processing'",
+                (job_id, worker_id),
+            ).fetchone()
+            if row is None:
+                return False
+            fields.update(status=status, worker_id=None, lease_expires=None, updated_at=_now_iso())
+            if log_line:
+                fields["logs"] = json.dumps((json.loads(row["logs"]) + [log_line])[-MAX_LOG_LINES:])
+            assignments = ", ".join(f"{name} = ?" for name in fields)
+            conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE job_id = ?",
+                (*fields.values(), job_id),
+            )
+        return True
+
+    # -------------------------------------------------------------------------
+    # Reads and generic updates (API)
+    # -------------------------------------------------------------------------
+
+    def get(self, job_id: str) -> Optional[dict]:
+        row = self._connect().execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return _row_to_job(row) if row else None
+
+    def find_active(self, asset_id: str) -> Optional[dict]:
+        row = self._connect().execute(
+            "SELECT * FROM jobs WHERE asset_id = ? AND status IN ('pending', 'processing')",
+            (asset_id,),
+        ).fetchone()
+        return _row_to_job(row) if row else None
+
+    def list(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[dict]:
+        """Jobs newest first, optionally filtered by status."""
+        sql = "SELECT * FROM jobs"
+        params: list = []
+        if status:
+            sql += " WHERE status = ?"
+            params.append(status)
+        sql += " ORDER BY created_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [_row_to_job(row) for row in self._connect().execute(sql, params)]
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._connect().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+        counts = {status: 0 for status in STATUSES}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def update(self, job_id: str, worker_id: Optional[str] = None, log_line: Optional[str] = None, **updates) -> Optional[dict]:
+        """Set progress fields (and optionally append a log line).
+
+        ``timings`` is merged into the job's existing stage timings. If
+        ``worker_id`` holds the job's lease, the lease is extended too.
+        Returns the updated job, or None if it doesn't exist.
+        """
+        unknown = set(updates) - set(UPDATABLE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown job fields: {', '.join(sorted(unknown))}")
+        if updates.get("status") not in (None,) + STATUSES:
+            raise ValueError(f"Invalid status: {updates['status']}")
+
+        with self._transaction() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                return None
+            fields = {k: v for k, v in updates.items() if v is not None}
+            if "progress_pct" in fields:
+                fields["progress_pct"] = max(0, min(100, fields["progress_pct"]))
+            if "timings" in fields:
+                fields["timings"] = json.dumps({**json.loads(row["timings"]), **fields["timings"]})
+            if "cache_hit" in fields:
+                fields["cache_hit"] = int(bool(fields["cache_hit"]))
+            if fields.get("status") in ("pending", "completed", "failed"):
+                fields.update(worker_id=None, lease_expires=None)
+                if fields["status"] == "pending":
+                    fields["available_at"] = time.time()
+            elif worker_id is not None and row["worker_id"] == worker_id:
+                fields["lease_expires"] = time.time() + self.visibility_timeout
+            if log_line is not None:
+                fields["logs"] = json.dumps((json.loads(row["logs"]) + [log_line])[-MAX_LOG_LINES:])
+            fields["updated_at"] = _now_iso()
+            assignments = ", ".join(f"{name} = ?" for name in fields)
+            row = conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE job_id = ? RETURNING *",
+                (*fields.values(), job_id),
+            ).fetchall()[0]
+
+        if fields.get("status") == "pending":
+            self._notify()
+        return _row_to_job(row)
+
+    def delete(self, job_id: str) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        return cursor.rowcount == 1
+
+    # -------------------------------------------------------------------------
+    # Migration
+    # -------------------------------------------------------------------------
+
+    def import_json_jobs(self, jobs_dir) -> int:
+        """Move legacy ``<job_id>.json`` files into the queue.
+
+        Imported files are renamed to ``.json.migrated``. Jobs that were
+        processing under the old scheme go back to pending.
+        """
+        imported = 0
+        for job_file in sorted(Path(jobs_dir).glob("*.json")):
+            try:
+                with open(job_file, "r") as f:
+                    data = json.load(f)
+                job = {k: data.get(k) for k in LEGACY_FIELDS}
+                if job["status"] == "processing":
+                    job["status"] = "pending"
+                if job["status"] not in STATUSES or not job["job_id"] or not job["asset_id"]:
+                    continue
+                now = _now_iso()
+                job["created_at"] = job["created_at"] or now
+                job["updated_at"] = job["updated_at"] or now
+                job["texture_resolution"] = job["texture_resolution"] or 1024
+                job["device"] = job["device"] or "cpu"
+                job["source_image"] = job["source_image"] or ""
+                columns = list(job) + ["available_at", "logs"]
+                values = list(job.values()) + [
+                    time.time(), json.dumps(data.get("logs", [])[-MAX_LOG_LINES:]),
+                ]
+                with self._transaction() as conn:
+                    conn.execute(
+                        f"INSERT OR IGNORE INTO jobs ({', '.join(columns)}) "
+                        f"VALUES ({', '.join('?' for _ in columns)})",
+                        values,
+                    )
+                job_file.rename(job_file.with_name(job_file.name + ".migrated"))
+                imported += 1
+            except (OSError, ValueError, sqlite3.Error):
+                continue  # Leave unreadable files for a human to look at
+        if imported:
+            self._notify()
+        return imported
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT`` (or ``ROLLBACK`` on error).
+
+    IMMEDIATE takes the write lock up front, so two workers can't both read
+    the same pending row before either updates it.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
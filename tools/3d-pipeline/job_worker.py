@@ -2,8 +2,10 @@
 """
 3D Asset Generation Job Worker
 
-Polls the job queue and processes pending generation jobs using TripoSR.
-Run this on the host machine (not in Docker) for GPU access.
+Claims jobs from the shared queue (jobs/queue.db, see job_queue.py) and
+processes them using TripoSR. Run this on the host machine (not in Docker)
+for GPU access; it can run alongside the container worker without either
+taking the other's jobs.
 
 Usage:
     python tools/3d-pipeline/job_worker.py          # Process one job and exit
@@ -12,17 +14,14 @@ Usage:
 """
 
 import argparse
-import json
 import subprocess
 import sys
-import time
 from datetime import datetime
 from pathlib import Path
 
-import requests
+from job_queue import DB_FILENAME, JobQueue, default_worker_id
 
 # Configuration
-API_BASE = "http://localhost:8000"
 JOBS_DIR = Path(__file__).parent.parent.parent / "jobs"
 SCRIPT_DIR = Path(__file__).parent
 TRIPOSR_DIR = SCRIPT_DIR / "TripoSR"
@@ -49,78 +48,17 @@ def check_triposr():
     return True
 
 
-def get_pending_jobs() -> list[dict]:
-    """Fetch pending jobs from the API."""
-    try:
-        response = requests.get(f"{API_BASE}/api/assets/jobs", params={"status": "pending"})
-        if response.ok:
-            return response.json().get("jobs", [])
-    except requests.RequestException as e:
-        log(f"ERROR: Could not connect to API: {e}")
-    return []
-
-
-def update_job(
-    job_id: str,
-    status: str = None,
-    error: str = None,
-    result_path: str = None,
-    progress: str = None,
-    progress_pct: int = None,
-    log_line: str = None,
-):
-    """Update job via API."""
-    try:
-        data = {}
-        if status:
-            data["status"] = status
-        if error:
-            data["error"] = error
-        if result_path:
-            data["result_path"] = result_path
-        if progress:
-            data["progress"] = progress
-        if progress_pct is not None:
-            data["progress_pct"] = progress_pct
-        if log_line:
-            data["log_line"] = log_line
-
-        response = requests.patch(
-            f"{API_BASE}/api/assets/jobs/{job_id}",
-            json=data,
-            timeout=5,
-        )
-        return response.ok
-    except requests.RequestException:
-        # Fall back to updating file directly
-        job_file = JOBS_DIR / f"{job_id}.json"
-        if job_file.exists():
-            with open(job_file, "r") as f:
-                job = json.load(f)
-            if status:
-                job["status"] = status
-            if error:
-                job["error"] = error
-            if result_path:
-                job["result_path"] = result_path
-            if progress:
-                job["progress"] = progress
-            if progress_pct is not None:
-                job["progress_pct"] = progress_pct
-            if log_line:
-                if "logs" not in job:
-                    job["logs"] = []
-                job["logs"].append(log_line)
-                job["logs"] = job["logs"][-20:]
-            job["updated_at"] = datetime.utcnow().isoformat()
-            with open(job_file, "w") as f:
-                json.dump(job, f, indent=2)
-            return True
-    return False
-
-
-def process_job(job: dict) -> bool:
-    """Process a single generation job."""
+def get_queue() -> JobQueue:
+    """Open the shared job queue, importing any legacy JSON job files."""
+    queue = JobQueue(JOBS_DIR / DB_FILENAME)
+    imported = queue.import_json_jobs(JOBS_DIR)
+    if imported:
+        log(f"Imported {imported} legacy job file(s) into the queue")
+    return queue
+
+
+def process_job(queue: JobQueue, job: dict, worker_id: str) -> bool:
+    """Process a single claimed generation job."""
     job_id = job["job_id"]
     asset_id = job["asset_id"]
     source_image = PROJECT_ROOT / job["source_image"]
@@ -133,14 +71,20 @@ def process_job(job: dict) -> bool:
     log(f"  Output: {output_dir}")
     log(f"  Device: {device}, Texture: {texture_res}px")
 
+    def update_job(job_id: str, status: str = None, error: str = None, **updates):
+        # Progress from the lease holder also extends the lease
+        if status == "failed":
+            queue.fail(job_id, worker_id, error)
+        else:
+            queue.update(job_id, worker_id=worker_id, **updates)
+
     # Verify source exists
     if not source_image.exists():
         log(f"ERROR: Source image not found: {source_image}")
         update_job(job_id, status="failed", error=f"Source image not found: {source_image}")
         return False
 
-    # Mark as processing
-    update_job(job_id, status="processing", progress="Initializing...", progress_pct=0)
+    update_job(job_id, progress="Initializing...", progress_pct=0)
 
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -247,14 +191,8 @@ def process_job(job: dict) -> bool:
 
     log(f"SUCCESS: Generated {final_mesh}")
     result_rel_path = str(final_mesh.relative_to(PROJECT_ROOT))
-    update_job(
-        job_id,
-        status="completed",
-        result_path=result_rel_path,
-        progress="Complete!",
-        progress_pct=100,
-        log_line=f"Output: {result_rel_path}",
-    )
+    queue.complete(job_id, worker_id, result_path=result_rel_path,
+                   log_line=f"Output: {result_rel_path}")
 
     # Print next steps
     log("")
@@ -266,30 +204,31 @@ def process_job(job: dict) -> bool:
     return True
 
 
-def list_jobs():
+def list_jobs(queue: JobQueue):
     """List all pending jobs."""
-    jobs = get_pending_jobs()
+    jobs = queue.list(status="pending")
     if not jobs:
         log("No pending jobs")
         return
 
     log(f"Pending jobs ({len(jobs)}):")
     for job in jobs:
-        log(f"  [{job['job_id']}] {job['asset_id']} - {job['source_image']}")
+        log(f"  [{job['job_id']}] {job['asset_id']} - {job['source_image']} (priority {job['priority']})")
 
 
-def watch_jobs(interval: int = 5):
-    """Continuously watch for and process jobs."""
-    log(f"Watching for jobs (polling every {interval}s)... Press Ctrl+C to stop")
+def watch_jobs(queue: JobQueue, interval: int = 5):
+    """Continuously claim and process jobs."""
+    worker_id = default_worker_id()
+    log(f"Watching for jobs as {worker_id}... Press Ctrl+C to stop")
 
     try:
         while True:
-            jobs = get_pending_jobs()
-            if jobs:
-                log(f"Found {len(jobs)} pending job(s)")
-                for job in jobs:
-                    process_job(job)
-            time.sleep(interval)
+            job = queue.claim(worker_id)
+            if job:
+                process_job(queue, job, worker_id)
+            else:
+                # Wakes as soon as a job is enqueued; interval is a backstop
+                queue.wait(interval)
     except KeyboardInterrupt:
         log("Stopped")
 
@@ -298,7 +237,7 @@ def main():
     parser = argparse.ArgumentParser(description="3D Asset Generation Job Worker")
     parser.add_argument("--watch", action="store_true", help="Watch for jobs continuously")
     parser.add_argument("--list", action="store_true", help="List pending jobs")
-    parser.add_argument("--interval", type=int, default=5, help="Poll interval in seconds (default: 5)")
+    parser.add_argument("--interval", type=int, default=5, help="Max seconds between queue checks (default: 5)")
 
     args = parser.parse_args()
 
@@ -306,19 +245,20 @@ def main():
     if not args.list and not check_triposr():
         sys.exit(1)
 
+    queue = get_queue()
     if args.list:
-        list_jobs()
+        list_jobs(queue)
     elif args.watch:
-        watch_jobs(args.interval)
+        watch_jobs(queue, args.interval)
     else:
         # Process one job and exit
-        jobs = get_pending_jobs()
-        if not jobs:
+        worker_id = default_worker_id()
+        job = queue.claim(worker_id)
+        if not job:
             log("No pending jobs")
             sys.exit(0)
 
-        job = jobs[0]
-        success = process_job(job)
+        success = process_job(queue, job, worker_id)
         sys.exit(0 if success else 1)
 
 
@@ -0,0 +1,82 @@
+"""
+Content-Addressed Generation Cache
+
+Stores pipeline outputs under a key derived from the source image bytes and
+every parameter that affects the result, so resubmitting the same concept
+art resolves from disk instead of re-running rembg and TripoSR.
+
+Layout (inside the shared jobs directory):
+    cache/<stage>/<key[:2]>/<key>/<files...>
+
+Entries are written to a temporary directory and renamed into place, so a
+reader never sees a half-written entry and concurrent writers of the same
+key simply race to the same content.
+
+Standard library only, like job_queue.py.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+# Bump to invalidate every cached entry (e.g. after changing preprocessing)
+CACHE_VERSION = 1
+
+
+def cache_key(source: bytes, params: dict) -> str:
+    """SHA-256 over the source bytes and the canonical JSON of params."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({"version": CACHE_VERSION, **params}, sort_keys=True).encode())
+    digest.update(b"\0")
+    digest.update(source)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Directory of immutable cache entries, one per (stage, key)."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def entry_dir(self, stage: str, key: str) -> Path:
+        return self.root / stage / key[:2] / key
+
+    def get(self, stage: str, key: str, filename: str) -> Optional[Path]:
+        """Path of a cached file, or None if the entry doesn't exist."""
+        path = self.entry_dir(stage, key) / filename
+        return path if path.exists() else None
+
+    def put(self, stage: str, key: str, files: Dict[str, Path]) -> Path:
+        """Copy files (name -> source path) into a new entry; returns its dir."""
+        final = self.entry_dir(stage, key)
+        if final.exists():
+            return final
+        final.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{key[:8]}-", dir=final.parent))
+        try:
+            for name, source in files.items():
+                shutil.copy2(source, staging / name)
+            os.replace(staging, final)
+        except OSError:
+            # Another worker published the same key first
+            shutil.rmtree(staging, ignore_errors=True)
+            if not final.exists():
+                raise
+        return final
+
+    def materialize(self, stage: str, key: str, filename: str, dest: Path) -> bool:
+        """Copy a cached file to dest.
+
+        Always a copy, never a hard link: the pipeline later rewrites job
+        files in place (save_input, export_mesh), which through a shared
+        inode would silently change the cached entry too.
+        """
+        cached = self.get(stage, key, filename)
+        if cached is None:
+            return False
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(cached, dest)
+        return True
@@ -73,6 +73,11 @@ export function GameProvider({ children }: { children: ReactNode }) {
           if (data.recorded?.new_achievements?.length > 0) {
             setNewAchievements(data.recorded.new_achievements);
           }
+        } else if (data.type === 'game_recorded') {
+          // Result is written in the background after game_ended
+          if (data.recorded?.new_achievements?.length > 0) {
+            setNewAchievements(data.recorded.new_achievements);
+          }
         } else if (data.type === 'pong') {
           // Keep-alive response
         }
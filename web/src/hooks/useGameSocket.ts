@@ -389,6 +389,12 @@ export function useGameSocket(token: string | null): UseGameSocketResult {
           if (data.recorded?.new_achievements?.length > 0) {
             setNewAchievements(data.recorded.new_achievements);
           }
+        } else if (data.type === 'game_recorded') {
+          // Result is written in the background after game_ended
+          // Check for new achievements
+          if (data.recorded?.new_achievements?.length > 0) {
+            setNewAchievements(data.recorded.new_achievements);
+          }
         } else if (data.type === 'pong') {
           // Keep-alive response
         }